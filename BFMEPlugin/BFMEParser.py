@@ -1,174 +1,360 @@
 import sublime
 import sublime_plugin
 import os
+import html
 import re
-import csv
+import functools
 import threading
-from .behaviors_data import behaviors
-
-bfme_index = {}
-bfme_strings_index = {}
-
-bfme_pattern = re.compile(
-    r"^(AudioEvent|MappedImage|Object|ChildObject|ObjectCreationList|ModifierList|FXList|FXParticleSystem|Locomotor|Upgrade|Science|StanceTemplate|CommandSet|CommandButton|Weapon|Armor|SpecialPower)\s+([\w+\-]+)",
-    re.I,
+import time
+import collections
+
+from .bfme_core import (
+    DEFAULT_EXCLUDE_FOLDERS,
+    IndexIgnoreRules,
+    ProjectRegistry,
+    include_pattern,
+    behavior_pattern,
+    build_project_index,
+    load_base_layer,
+    symbol_browser_items,
+    reindex_changed_files,
+    get_behaviors,
+    get_behavior_table,
+    resolve_include,
+    find_behavior_context,
+    find_used_symbols,
+    value_type,
+    completion_candidates,
+    schema_completions,
+    perf,
+    profiling,
+    memory_report,
+    format_memory_report,
+    validate_project,
+    validate_lines,
+    validate_rows,
+    file_duplicate_diagnostics,
+    format_diagnostic,
+    ERROR,
+    WARNING,
 )
-macro_pattern = re.compile(r"^\s*#define\s+([\w+\-]+)\s+([^;]+)", re.I)
-include_pattern = re.compile(r'#include\s+"([^"]+)"', re.I)
-behavior_pattern = re.compile(r'^\s*Behavior\s*=\s*(\w+)', re.I)
-
-
-def read_string_names(path):
-    global bfme_strings_index
-    bfme_strings_index.clear()
-    try:
-        with open(path, "r", encoding="latin-1", errors="ignore") as f:
-            reader = csv.reader(f, delimiter=";")
-            for i, row in enumerate(reader):
-                if row:
-                    name = row[0].strip().lower()
-                    if name:
-                        bfme_strings_index[name] = (path, i + 1, "string", tuple())
-        print("[BFME Plugin] Indexed strings from {path}".format(path=path))
-    except Exception as e:
-        print("[BFME Plugin] Failed to read {path}: {e}".format(path=path, e=e))
-
-
-def index_bfme_files(window):
-    """Index all BFME symbols in the opened folders."""
-    global bfme_index
-    bfme_index.clear()
-    folders = window.folders()
-
-    for folder in folders:
-        for root, _, files in os.walk(folder):
-            for fn in files:
-                fn = fn.lower()
-                if fn.endswith((".ini", ".inc")) and fn != "map.ini":
-                    path = os.path.join(root, fn)
-                    try:
-                        with open(path, "r", encoding="latin-1", errors="ignore") as f:
-                            for i, line in enumerate(f):
-                                m = bfme_pattern.match(line)
-                                if m:
-                                    kind, name = m.groups()
-                                    if name in bfme_index:
-                                        existing = bfme_index[name]
-                                        if isinstance(existing[0], list):
-                                            existing[0].append(path)
-                                            existing[1].append(i + 1)
-                                        else:
-                                            bfme_index[name] = (
-                                                [existing[0], path],
-                                                [existing[1], i + 1],
-                                                kind.lower(),
-                                                tuple(),
-                                            )
-                                        print(
-                                            "[BFME Plugin] Duplicate symbol found: {name} (now has {count} definitions)".format(
-                                                name=name, count=len(bfme_index[name][0])
-                                            )
-                                        )
-                                    else:
-                                        bfme_index[name] = (path, i + 1, kind.lower(), tuple())
-
-                                mm = macro_pattern.match(line)
-                                if mm:
-                                    macro_name = mm.group(1)
-                                    if macro_name in bfme_index:
-                                        existing = bfme_index[macro_name]
-                                        if isinstance(existing[0], list):
-                                            existing[0].append(path)
-                                            existing[1].append(i + 1)
-                                            existing[3] = existing[3] + (mm.group(2),)
-                                        else:
-                                            bfme_index[macro_name] = (
-                                                [existing[0], path],
-                                                [existing[1], i + 1],
-                                                "macro",
-                                                existing[3] + (mm.group(2),),
-                                            )
-                                        print(
-                                            "[BFME Plugin] Duplicate macro found: {macro_name} (now has {count} definitions)".format(
-                                                macro_name=macro_name,
-                                                count=len(bfme_index[macro_name][0]),
-                                            )
-                                        )
-                                    else:
-                                        bfme_index[macro_name] = (
-                                            path,
-                                            i + 1,
-                                            "macro",
-                                            (mm.group(2),),
-                                        )
-                    except Exception as e:
-                        print("[BFME Plugin] Failed to read {path}: {e}".format(path=path, e=e))
-                if fn == "lotr.csv":
-                    read_string_names(os.path.join(root, fn))
-
-    print("[BFME Plugin] Indexed {index} symbols".format(index=len(bfme_index)))
+
+BROWSER_SEPARATOR = "   ⟶   "
+LOOKUP_SEPARATOR = " "
+HOVER_CACHE_SIZE = 64
+RECENT_REQUESTS_SIZE = 50
+SCHEMA_COMPLETION_KINDS = {
+    "module": sublime.KIND_TYPE,
+    "tag": sublime.KIND_NAVIGATION,
+    "field": sublime.KIND_VARIABLE,
+    "value": sublime.KIND_KEYWORD,
+}
+
+# Windows opened on the same folders share one ProjectIndex, it is released
+# once the last of those windows is closed.
+registry = ProjectRegistry()
+_watcher_stop = threading.Event()
+# (description, callable) of the latest completions and hovers, replayed by
+# BfmeProfileCommand
+recent_requests = collections.deque(maxlen=RECENT_REQUESTS_SIZE)
+# window id -> stop event of the project validation running in that window
+validation_runs = {}
+# buffer id -> LiveDiagnostics of the files checked as they are edited
+live_diagnostics = {}
+DIAGNOSTICS_DELAY_MS = 250
+DIAGNOSTIC_REGION_FLAGS = sublime.DRAW_SQUIGGLY_UNDERLINE | sublime.DRAW_NO_FILL | sublime.DRAW_NO_OUTLINE
+
+
+BEHAVIOR_DOC_STYLE = """
+    <style>
+        body {
+            font-family: system;
+            margin: 0;
+            padding: 20px;
+            background-color: var(--background);
+            color: var(--foreground);
+            line-height: 1.4;
+        }
+        h1 {
+            color: var(--orangish);
+            margin: 0 0 15px 0;
+            font-size: 18px;
+            border-bottom: 2px solid var(--orangish);
+            padding-bottom: 8px;
+        }
+        .param-count {
+            color: var(--orangish);
+            font-size: 14px;
+            margin-bottom: 20px;
+            font-style: italic;
+            background-color: color(var(--background) blend(var(--bluish) 10%));
+            padding: 8px 12px;
+            border-radius: 4px;
+            border: 1px solid var(--bluish);
+        }
+        .param-list {
+            width: 100%;
+        }
+        .param-item {
+            display: flex;
+            padding: 4px 0;
+            border-bottom: 1px solid color(var(--background) blend(var(--foreground) 15%));
+            margin-bottom: 2px;
+            line-height: 1.3;
+            white-space: nowrap;
+        }
+        .param-name {
+            font-weight: bold;
+            color: var(--bluish);
+            font-family: monospace;
+            font-size: 13px;
+            flex: 0 0 250px;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+        .param-type {
+            color: var(--greenish);
+            font-family: monospace;
+            font-size: 13px;
+            flex: 1;
+            margin-left: 10px;
+        }
+        .param-row:hover {
+            background-color: color(var(--background) blend(var(--foreground) 5%));
+        }
+        .no-params {
+            color: var(--foreground);
+            font-style: italic;
+            text-align: center;
+            padding: 20px;
+        }
+        .common-params {
+            margin-bottom: 20px;
+        }
+        .section-header {
+            color: var(--orangish);
+            font-weight: bold;
+            margin: 20px 0 10px 0;
+            font-size: 14px;
+        }
+    </style>
+"""
+
+# Rendered in the background after load so the first popups are instant.
+COMMON_BEHAVIORS = [
+    "AIUpdateInterface",
+    "PhysicsBehavior",
+    "SlowDeathBehavior",
+    "AutoHealBehavior",
+    "HordeContain",
+    "StancesBehavior",
+    "ProductionUpdate",
+    "DefaultProductionExitUpdate",
+    "SpecialPowerModule",
+    "SpecialAbilityUpdate",
+    "OCLSpecialPower",
+    "AttributeModifierUpgrade",
+    "ModelConditionUpgrade",
+    "WeaponSetUpgrade",
+    "CommandSetUpgrade",
+    "ExperienceLevelCreate",
+    "CreateObjectDie",
+    "FXListDie",
+    "DestroyDie",
+    "LifetimeUpdate",
+]
+
+
+@functools.lru_cache(maxsize=128)
+def render_behavior_doc(behavior_name, color_scheme=None):
+    """Render the documentation popup of a behavior.
+
+    The color scheme is part of the cache key only, the popup follows it
+    through CSS variables.
+    """
+    behavior_params = get_behaviors()[behavior_name]
+    parts = ['<body id="behavior-doc">', BEHAVIOR_DOC_STYLE, "<h1>Behavior: ", behavior_name, "</h1>"]
+
+    if behavior_params:
+        parts.append(
+            '<div class="param-count">📋 {count} parameters available</div>'.format(count=len(behavior_params))
+        )
+        parts.append('<div class="param-list">')
+        for param_name, param_type in sorted(behavior_params.items()):
+            parts.extend((
+                '<div class="param-item"><span class="param-name">',
+                param_name,
+                '\t\t</span><span class="param-type">',
+                param_type,
+                "</span></div>",
+            ))
+        parts.append("</div>")
+    else:
+        parts.append('<div class="no-params">No parameters defined for this behavior.</div>')
+
+    parts.append("</body>")
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=128)
+def render_behavior_summary(behavior_name):
+    """Render the short hover popup shown on a Behavior = ... line."""
+    behavior_params = get_behaviors()[behavior_name]
+    parts = [
+        "<b>Behavior: {name}</b><br/>".format(name=behavior_name),
+        "<i>Parameters ({count}):</i><br/>".format(count=len(behavior_params)),
+    ]
+    for param_name, param_type in list(behavior_params.items())[:8]:
+        parts.append("• {param} ({type})<br/>".format(param=param_name, type=param_type))
+    if len(behavior_params) > 8:
+        parts.append("• ... and {more} more<br/>".format(more=len(behavior_params) - 8))
+    return "".join(parts)
+
+
+def warm_behavior_docs():
+    color_scheme = sublime.load_settings("Preferences.sublime-settings").get("color_scheme")
+    behaviors = get_behaviors()
+    for behavior_name in COMMON_BEHAVIORS:
+        if behavior_name in behaviors:
+            render_behavior_doc(behavior_name, color_scheme)
+            render_behavior_summary(behavior_name)
+
+
+def get_setting(window, name, default=None):
+    """Read a setting, preferring a "bfme_"-prefixed project setting."""
+    view = window.active_view() if window else None
+    if view:
+        value = view.settings().get("bfme_" + name)
+        if value is not None:
+            return value
+    return sublime.load_settings("BFME.sublime-settings").get(name, default)
+
+
+def load_ignore_rules(window):
+    return IndexIgnoreRules(
+        get_setting(window, "index_exclude_folders", DEFAULT_EXCLUDE_FOLDERS),
+        get_setting(window, "index_exclude_patterns", []),
+    )
+
+
+def cache_dir():
+    return os.path.join(sublime.cache_path(), "BFMEPlugin")
+
+
+def get_project_index(window):
+    """Return the index shared by all windows opened on window's folders."""
+    if window is None:
+        return None
+    return registry.acquire(window.id(), window.folders())
+
+
+def release_project_index(window_id):
+    registry.release(window_id)
+
+
+def project_status(project, message):
+    """Show message in the status bar of every window using project."""
+    window_ids = registry.owners_of(project)
+
+    def show():
+        for window in sublime.windows():
+            if window.id() in window_ids:
+                window.status_message(message)
+
+    sublime.set_timeout(show, 0)
+
+
+def ensure_project_index(window):
+    """Return the window's project index, starting the first indexing if needed."""
+    project = get_project_index(window)
+    if project is not None and not project.indexed and not project.indexing:
+        index_bfme_files_async(window)
+    return project
+
+
+def index_bfme_files(window, project=None, rebuild=False):
+    """Index all BFME symbols in the opened folders, see build_project_index."""
+    project = project or get_project_index(window)
+    started = time.monotonic()
+    project.ignore = load_ignore_rules(window)
+    file_count = build_project_index(
+        project,
+        base_path=get_setting(window, "base_game_path"),
+        cache_dir=cache_dir(),
+        report=lambda message: project_status(project, message),
+        rebuild=rebuild,
+    )
+    project_status(
+        project,
+        "BFME: Indexing complete, {files} files in {seconds:.1f}s".format(
+            files=file_count, seconds=time.monotonic() - started
+        ),
+    )
 
 
 def index_bfme_files_async(window):
+    """Index window's project in the background, returns False if already running."""
+    project = get_project_index(window)
+    with registry.lock:
+        if project is None or project.indexing:
+            return False
+        project.indexing = True
+
     def worker():
-        index_bfme_files(window)
-        sublime.set_timeout(lambda: sublime.status_message("BFME: Indexing complete"), 0)
+        try:
+            index_bfme_files(window, project)
+        finally:
+            project.indexing = False
+        sublime.set_timeout(functools.partial(refresh_live_diagnostics, project), 0)
+        symbol_browser_items(project, BROWSER_SEPARATOR)
 
     threading.Thread(target=worker, daemon=True).start()
+    return True
+
+
+def watch_projects():
+    """Poll the indexed projects for files changed outside of the editor."""
+    while True:
+        interval = sublime.load_settings("BFME.sublime-settings").get("watch_interval", 2)
+        if _watcher_stop.wait(interval if interval and interval > 0 else 5):
+            return
+        if not interval or interval <= 0:
+            continue
+
+        for project in registry.all():
+            if project.indexed and not project.indexing:
+                try:
+                    if reindex_changed_files(project):
+                        sublime.set_timeout(functools.partial(refresh_live_diagnostics, project), 0)
+                except Exception as e:
+                    print("[BFME Plugin] Failed to refresh index: {e}".format(e=e))
 
 
 def get_current_behavior_context(view, location):
     """Find the current behavior block we're in and return behavior name."""
-    current_line = view.line(location).begin()
-    
-    behavior_name = None
-    indent_level = None
-    
-    while current_line > 0:
-        line_region = sublime.Region(current_line, view.line(current_line).end())
-        line_text = view.substr(line_region)
-        
-        stripped = line_text.strip()
-        if stripped.lower() == 'end':
-            end_indent = len(line_text) - len(line_text.lstrip())
-            if indent_level is None or end_indent <= indent_level:
-                break
-        
-        behavior_match = behavior_pattern.match(line_text)
-        if behavior_match:
-            current_indent = len(line_text) - len(line_text.lstrip())
-            if indent_level is None:
-                target_line = view.line(location)
-                target_text = view.substr(target_line)
-                target_indent = len(target_text) - len(target_text.lstrip())
-                
-                if target_indent > current_indent:
-                    behavior_name = behavior_match.group(1)
-                    indent_level = current_indent
-                break
-            elif current_indent < indent_level:
-                behavior_name = behavior_match.group(1)
-                break
-        
-        if current_line == 0:
-            break
-        current_line = view.line(current_line - 1).begin()
-    
-    return behavior_name
+    row, _ = view.rowcol(location)
+    return find_behavior_context(lambda r: view.substr(view.line(view.text_point(r, 0))), row)
 
 
-def is_behavior_declaration_line(view, location):
-    """Check if we're on a line declaring a behavior (Behavior = ...)."""
-    line_region = view.line(location)
-    line_text = view.substr(line_region)
-    
-    return re.match(r'^\s*Behavior\s*=\s*', line_text, re.I) is not None
+class BfmeIndexProjectCommand(sublime_plugin.WindowCommand):
+    def run(self):
+        if not index_bfme_files_async(self.window):
+            sublime.status_message("BFME: Indexing already in progress")
 
 
-class BfmeIndexProjectCommand(sublime_plugin.WindowCommand):
+class BfmeRebuildBaseIndexCommand(sublime_plugin.WindowCommand):
     def run(self):
-        index_bfme_files_async(self.window)
-        sublime.status_message("BFME: Indexing complete")
+        base_path = get_setting(self.window, "base_game_path")
+        if not base_path or not os.path.isdir(base_path):
+            sublime.status_message("BFME: No base game folder configured")
+            return
+
+        def worker():
+            load_base_layer(base_path, cache_dir(), rebuild=True)
+            index_bfme_files_async(self.window)
+            sublime.set_timeout(lambda: sublime.status_message("BFME: Base game index rebuilt"), 0)
+
+        threading.Thread(target=worker, daemon=True).start()
 
 
 class ShowBehaviorDocCommand(sublime_plugin.TextCommand):
@@ -187,113 +373,18 @@ class ShowBehaviorDocCommand(sublime_plugin.TextCommand):
             sublime.status_message("BFME: No behavior name selected")
             return
             
-        if behavior_name not in behaviors:
+        canonical_name = get_behavior_table().behavior(behavior_name)
+        if canonical_name is None:
             sublime.status_message("BFME: Unknown behavior '{behavior_name}'".format(behavior_name=behavior_name))
             return
             
-        self.show_behavior_documentation(behavior_name)
+        self.show_behavior_documentation(canonical_name)
     
 
 
     def show_behavior_documentation(self, behavior_name):
-        behavior_params = behaviors[behavior_name]
-        
-        html_content = """
-        <body id="behavior-doc">
-            <style>
-                body {{
-                    font-family: system;
-                    margin: 0;
-                    padding: 20px;
-                    background-color: var(--background);
-                    color: var(--foreground);
-                    line-height: 1.4;
-                }}
-                h1 {{
-                    color: var(--orangish);
-                    margin: 0 0 15px 0;
-                    font-size: 18px;
-                    border-bottom: 2px solid var(--orangish);
-                    padding-bottom: 8px;
-                }}
-                .param-count {{
-                    color: var(--orangish);
-                    font-size: 14px;
-                    margin-bottom: 20px;
-                    font-style: italic;
-                    background-color: color(var(--background) blend(var(--bluish) 10%));
-                    padding: 8px 12px;
-                    border-radius: 4px;
-                    border: 1px solid var(--bluish);
-                }}
-                .param-list {{
-                    width: 100%;
-                }}
-                .param-item {{
-                    display: flex;
-                    padding: 4px 0;
-                    border-bottom: 1px solid color(var(--background) blend(var(--foreground) 15%));
-                    margin-bottom: 2px;
-                    line-height: 1.3;
-                    white-space: nowrap;
-                }}
-                .param-name {{
-                    font-weight: bold;
-                    color: var(--bluish);
-                    font-family: monospace;
-                    font-size: 13px;
-                    flex: 0 0 250px;
-                    overflow: hidden;
-                    text-overflow: ellipsis;
-                }}
-                .param-type {{
-                    color: var(--greenish);
-                    font-family: monospace;
-                    font-size: 13px;
-                    flex: 1;
-                    margin-left: 10px;
-                }}
-                .param-row:hover {{
-                    background-color: color(var(--background) blend(var(--foreground) 5%));
-                }}
-                .no-params {{
-                    color: var(--foreground);
-                    font-style: italic;
-                    text-align: center;
-                    padding: 20px;
-                }}
-                .common-params {{
-                    margin-bottom: 20px;
-                }}
-                .section-header {{
-                    color: var(--orangish);
-                    font-weight: bold;
-                    margin: 20px 0 10px 0;
-                    font-size: 14px;
-                }}
-            </style>
-            <h1>Behavior: {behavior_name}</h1>
-        """.format(behavior_name=behavior_name)
-        
-        if behavior_params:
-            html_content += '<div class="param-count">📋 {count} parameters available</div>'.format(count=len(behavior_params))    
-            sorted_params = sorted(behavior_params.items())            
-            html_content += '<div class="param-list">'
-            
-            for param_name, param_type in sorted_params:
-                html_content += '<div class="param-item">'
-                html_content += '<span class="param-name">{param_name}\t\t</span>'.format(param_name=param_name)
-                html_content += '<span class="param-type">{param_type}</span>'.format(param_type=param_type)
-                html_content += '</div>'
-            
-            html_content += '</div>'
-        else:
-            html_content += '<div class="no-params">No parameters defined for this behavior.</div>'
-        
-        html_content += """
-        </body>
-        """
-        
+        html_content = render_behavior_doc(behavior_name, self.view.settings().get("color_scheme"))
+
         self.view.show_popup(
             html_content,
             flags=sublime.HIDE_ON_MOUSE_MOVE_AWAY | sublime.COOPERATE_WITH_AUTO_COMPLETE,
@@ -317,8 +408,13 @@ class ShowBehaviorDocCommand(sublime_plugin.TextCommand):
 
 class GotoBfmeDefinitionCommand(sublime_plugin.TextCommand):
     def run(self, edit):
-        if not bfme_index and not bfme_strings_index:
-            index_bfme_files_async(self.view.window())
+        with perf.span("goto_definition"):
+            self.goto_definition()
+
+    def goto_definition(self):
+        project = ensure_project_index(self.view.window())
+        if project is None:
+            return
 
         sel = self.view.sel()[0]
 
@@ -331,14 +427,7 @@ class GotoBfmeDefinitionCommand(sublime_plugin.TextCommand):
             current_file = self.view.file_name()
 
             if current_file:
-                current_dir = os.path.dirname(current_file)
-                include_path_normalized = include_path.replace("\\", os.sep)
-                if include_path_normalized.startswith(os.sep):
-                    include_path_normalized = include_path_normalized[1:]
-
-                full_include_path = os.path.normpath(
-                    os.path.join(current_dir, include_path_normalized)
-                )
+                full_include_path = resolve_include(current_file, include_path)
 
                 if os.path.exists(full_include_path):
                     self.view.window().open_file(full_include_path)
@@ -373,8 +462,8 @@ class GotoBfmeDefinitionCommand(sublime_plugin.TextCommand):
         lookup = self.view.substr(full_region)
 
         if lookup:
-            if lookup in bfme_index:
-                path, line, kind, _ = bfme_index[lookup]
+            if lookup in project.symbols:
+                path, line, kind, _ = project.symbols[lookup]
 
                 if isinstance(path, list):
                     if len(path) == 1:
@@ -410,8 +499,8 @@ class GotoBfmeDefinitionCommand(sublime_plugin.TextCommand):
                     sublime.status_message("BFME: Jumped to {lookup}".format(lookup=lookup))
                 return
 
-            if lookup.lower() in bfme_strings_index:
-                path, line, _, _ = bfme_strings_index[lookup.lower()]
+            if lookup.lower() in project.strings:
+                path, line, _, _ = project.strings[lookup.lower()]
                 self.view.window().open_file(
                     "{path}:{line}".format(path=path, line=line), sublime.ENCODED_POSITION
                 )
@@ -429,13 +518,60 @@ class BfmeHoverListener(sublime_plugin.ViewEventListener):
             ext in syntax.lower() for ext in ["ini", "inc", "bfmehighlighter", "plain text"]
         )
 
+    def __init__(self, view):
+        super().__init__(view)
+        # (change count, word begin, word end, index generation) -> popup text
+        self.hover_cache = {}
+        # id of the latest hover, results of older hovers are dropped
+        self.hover_request = 0
+
+    def on_modified(self):
+        self.hover_cache.clear()
+
     def on_hover(self, point, hover_zone):
-        if not bfme_index and not bfme_strings_index:
-            index_bfme_files_async(self.view.window())
+        project = ensure_project_index(self.view.window())
+        if project is None:
+            return
 
         if hover_zone != sublime.HOVER_TEXT:
             return
 
+        self.hover_request += 1
+        request = self.hover_request
+        word_region = self.view.word(point)
+        key = (self.view.change_count(), word_region.begin(), word_region.end(), project.generation)
+        if key in self.hover_cache:
+            self.show_hover(self.hover_cache[key], point)
+            return
+
+        def worker():
+            if request != self.hover_request:
+                return
+            with perf.span("hover"):
+                popup_text = self.hover_content(project, point, word_region)
+            recent_requests.append((
+                "hover at {point}".format(point=point),
+                lambda: self.hover_content(project, point, word_region),
+            ))
+            if len(self.hover_cache) >= HOVER_CACHE_SIZE:
+                self.hover_cache.clear()
+            self.hover_cache[key] = popup_text
+            sublime.set_timeout(lambda: self.show_hover(popup_text, point, request), 0)
+
+        sublime.set_timeout_async(worker, 0)
+
+    def show_hover(self, popup_text, point, request=None):
+        if not popup_text or (request is not None and request != self.hover_request):
+            return
+        self.view.show_popup(
+            popup_text,
+            flags=sublime.HIDE_ON_MOUSE_MOVE_AWAY,
+            location=point,
+            max_width=600,
+        )
+
+    def hover_content(self, project, point, word_region):
+        """Return the popup text for a hover at point, or None. Runs on the async thread."""
         line_region = self.view.line(point)
         line_text = self.view.substr(line_region)
         include_match = include_pattern.search(line_text)
@@ -445,14 +581,7 @@ class BfmeHoverListener(sublime_plugin.ViewEventListener):
             current_file = self.view.file_name()
 
             if current_file:
-                current_dir = os.path.dirname(current_file)
-                include_path_normalized = include_path.replace("\\", os.sep)
-                if include_path_normalized.startswith(os.sep):
-                    include_path_normalized = include_path_normalized[1:]
-
-                full_include_path = os.path.normpath(
-                    os.path.join(current_dir, include_path_normalized)
-                )
+                full_include_path = resolve_include(current_file, include_path)
 
                 popup_text = "<b>Include:</b> {path}<br/>".format(path=include_path)
 
@@ -462,61 +591,30 @@ class BfmeHoverListener(sublime_plugin.ViewEventListener):
                     popup_text += "<i style='color: red;'>File not found:</i> {full_path}".format(
                         full_path=full_include_path
                     )
+                return popup_text
 
-                self.view.show_popup(
-                    popup_text,
-                    flags=sublime.HIDE_ON_MOUSE_MOVE_AWAY,
-                    location=point,
-                    max_width=600,
-                )
-                return
-
-        word_region = self.view.word(point)
         word = self.view.substr(word_region)
 
         behavior_match = behavior_pattern.match(line_text)
         if behavior_match:
-            behavior_name = behavior_match.group(1)
-            if behavior_name in behaviors:
-                behavior_params = behaviors[behavior_name]
-                popup_text = "<b>Behavior: {name}</b><br/>".format(name=behavior_name)
-                popup_text += "<i>Parameters ({count}):</i><br/>".format(count=len(behavior_params))
-                
-                param_list = list(behavior_params.items())[:8] 
-                for param_name, param_type in param_list:
-                    popup_text += "• {param} ({type})<br/>".format(param=param_name, type=param_type)
-                
-                if len(behavior_params) > 8:
-                    popup_text += "• ... and {more} more<br/>".format(more=len(behavior_params) - 8)
-                
-                self.view.show_popup(
-                    popup_text,
-                    flags=sublime.HIDE_ON_MOUSE_MOVE_AWAY,
-                    location=point,
-                    max_width=600,
-                )
-                return
-
-        current_behavior = get_current_behavior_context(self.view, point)
-        if current_behavior and current_behavior in behaviors:
-            behavior_params = behaviors[current_behavior]
+            behavior_name = get_behavior_table().behavior(behavior_match.group(1))
+            if behavior_name is not None:
+                return render_behavior_summary(behavior_name)
+
+        table = get_behavior_table()
+        current_behavior = table.behavior(get_current_behavior_context(self.view, point))
+        if current_behavior is not None:
+            param = table.parameter(current_behavior, word)
             
-            if word in behavior_params:
-                param_type = behavior_params[word]
-                popup_text = "<b>{param}</b><br/>".format(param=word)
+            if param is not None:
+                param_name, param_type = param
+                popup_text = "<b>{param}</b><br/>".format(param=param_name)
                 popup_text += "<i>{behavior} parameter</i><br/>".format(behavior=current_behavior)
                 popup_text += "Type: {type}".format(type=param_type)
-                
-                self.view.show_popup(
-                    popup_text,
-                    flags=sublime.HIDE_ON_MOUSE_MOVE_AWAY,
-                    location=point,
-                    max_width=600,
-                )
-                return
+                return popup_text
 
-        if word in bfme_index:
-            path, line, kind, extra = bfme_index[word]
+        if word in project.symbols:
+            path, line, kind, extra = project.symbols[word]
             if kind == "macro":
                 try:
                     if isinstance(path, list):
@@ -527,42 +625,20 @@ class BfmeHoverListener(sublime_plugin.ViewEventListener):
                             )
                     else:
                         popup_text = "<b>{word}</b> = {extra[0]}".format(word=word, extra=extra)
-
-                    self.view.show_popup(
-                        popup_text,
-                        flags=sublime.HIDE_ON_MOUSE_MOVE_AWAY,
-                        location=point,
-                        max_width=600,
-                    )
+                    return popup_text
                 except Exception as e:
                     print("[BFME Plugin] Failed to read macro {word}: {e}".format(word=word, e=e))
 
+        return None
+
 
 class BfmeQuickLookupCommand(sublime_plugin.WindowCommand):
     def run(self):
-        if not bfme_index and not bfme_strings_index:
-            index_bfme_files_async(self.window)
-
-        self.items = []
-        for name, (path, line, kind, *_) in bfme_index.items():
-            if isinstance(path, list):
-                for i, (p, line_num) in enumerate(zip(path, line)):
-                    display = "{name} [{kind}] - {fullpath}".format(
-                        name=name, kind=kind, fullpath=p
-                    )
-                    self.items.append((display, p, line_num))
-            else:
-                display = "{name} [{kind}]".format(name=name, kind=kind)
-                self.items.append((display, path, line))
-
-        for name, (path, line, kind, *_) in bfme_strings_index.items():
-            display = "{name} [string]".format(name=name)
-            self.items.append((display, path, line))
-
-        self.items.sort(key=lambda x: x[0].lower())
+        project = ensure_project_index(self.window)
+        self.items, displays = symbol_browser_items(project, LOOKUP_SEPARATOR)
 
         self.window.show_quick_panel(
-            [item[0] for item in self.items],
+            displays,
             self.on_done,
             sublime.KEEP_OPEN_ON_FOCUS_LOST,
             0,
@@ -587,6 +663,11 @@ class BfmeQuickLookupCommand(sublime_plugin.WindowCommand):
 
 
 class BfmeCompletionListener(sublime_plugin.EventListener):
+    def __init__(self):
+        super().__init__()
+        # view id -> id of the latest completion request, older ones are dropped
+        self.requests = {}
+
     def on_query_completions(self, view, prefix, locations):
         syntax = view.settings().get("syntax") or ""
         if not any(
@@ -598,74 +679,64 @@ class BfmeCompletionListener(sublime_plugin.EventListener):
         if any(s in scope for s in ["string", "comment"]):
             return None
 
-        if not bfme_index and not bfme_strings_index:
-            index_bfme_files_async(view.window())
+        project = ensure_project_index(view.window())
+        if project is None or (not project.symbols and not project.strings):
             return None
 
-        location = locations[0]
+        request = self.requests.get(view.id(), 0) + 1
+        self.requests[view.id()] = request
+        completion_list = sublime.CompletionList()
+        flags = sublime.INHIBIT_WORD_COMPLETIONS | sublime.INHIBIT_EXPLICIT_COMPLETIONS
+
+        def worker():
+            if self.requests.get(view.id()) != request:
+                completion_list.set_completions([], flags)
+                return
+            with perf.span("completion"):
+                completions = self.query_completions(view, project, prefix, locations[0])
+            recent_requests.append((
+                "completion of {prefix!r} at {point}".format(prefix=prefix, point=locations[0]),
+                lambda: self.query_completions(view, project, prefix, locations[0]),
+            ))
+            if self.requests.get(view.id()) != request:
+                completions = []
+            completion_list.set_completions(completions, flags)
+
+        sublime.set_timeout_async(worker, 0)
+        return completion_list
+
+    def on_close(self, view):
+        self.requests.pop(view.id(), None)
+
+    def query_completions(self, view, project, prefix, location):
+        """Return the completions for prefix at location, runs on the async thread."""
         line_region = view.line(location)
         line_text = view.substr(line_region)
 
         completions = []
+        with perf.span("completion.context"):
+            row, _ = view.rowcol(location)
+            line_before = view.substr(sublime.Region(line_region.begin(), location))
+            get_line = lambda r: view.substr(view.line(view.text_point(r, 0)))
+            schema_items = schema_completions(get_line, row, line_before, prefix)
+            declared_type = value_type(get_line, row, line_before)
+
+        for label, insert, category, detail in schema_items:
+            completion = sublime.CompletionItem(
+                trigger=label,
+                completion=insert,
+                kind=SCHEMA_COMPLETION_KINDS[category],
+                details="<b>{label}</b><br/><i>{detail}</i>".format(label=label, detail=detail),
+            )
+            completions.append(completion)
 
-        if is_behavior_declaration_line(view, location):
-            for behavior_name in behaviors.keys():
-                if behavior_name.lower().startswith(prefix.lower()):
-                    param_count = len(behaviors[behavior_name])
-                    completion = sublime.CompletionItem(
-                        trigger=behavior_name,
-                        completion=behavior_name,
-                        kind=sublime.KIND_TYPE,
-                        details="<b>{name}</b><br/><i>Behavior ({count} parameters)</i>".format(
-                            name=behavior_name, count=param_count
-                        ),
-                    )
-                    completions.append(completion)
-        else:
-            current_behavior = get_current_behavior_context(view, location)
-            
-            if current_behavior and current_behavior in behaviors:
-                behavior_params = behaviors[current_behavior]
-                for param_name, param_type in behavior_params.items():
-                    if param_name.lower().startswith(prefix.lower()):
-                        completion = sublime.CompletionItem(
-                            trigger=param_name,
-                            completion=param_name + " = ",
-                            kind=sublime.KIND_VARIABLE,
-                            details="<b>{param}</b><br/><i>{behavior} parameter ({type})</i>".format(
-                                param=param_name, behavior=current_behavior, type=param_type
-                            ),
-                        )
-                        completions.append(completion)
-
-        context_filter = None
-
-        if any(
-            keyword in line_text.lower()
-            for keyword in ["primaryweapon", "secondaryweapon", "weapon"]
-        ):
-            context_filter = "weapon"
-        elif any(keyword in line_text.lower() for keyword in ["armor", "armorset"]):
-            context_filter = "armor"
-        elif any(keyword in line_text.lower() for keyword in ["locomotor", "locomotorset"]):
-            context_filter = "locomotor"
-        elif any(keyword in line_text.lower() for keyword in ["commandset", "commandbutton"]):
-            context_filter = ["commandset", "commandbutton"]
-        elif any(keyword in line_text.lower() for keyword in ["audioevent", "sound"]):
-            context_filter = "audioevent"
-        elif any(keyword in line_text.lower() for keyword in ["upgrade", "science"]):
-            context_filter = ["upgrade", "science"]
-
-        for name, (path, line_num, kind, extra) in bfme_index.items():
-            if name.lower().startswith(prefix.lower()):
-                if context_filter:
-                    if isinstance(context_filter, list):
-                        if kind not in context_filter:
-                            continue
-                    else:
-                        if kind != context_filter:
-                            continue
+        with perf.span("completion.candidates"):
+            symbol_candidates, string_candidates = completion_candidates(
+                project, prefix, line_text, declared_type
+            )
 
+        with perf.span("completion.items"):
+            for name, (path, line_num, kind, extra) in symbol_candidates:
                 if isinstance(path, list):
                     first_file = os.path.basename(path[0])
                     detail = "{kind} ({count} definitions) - {file}...".format(
@@ -693,22 +764,17 @@ class BfmeCompletionListener(sublime_plugin.EventListener):
                 )
                 completions.append(completion)
 
-        if not context_filter or any(
-            keyword in line_text.lower()
-            for keyword in ["displayname", "description", "tooltip", "string"]
-        ):
-            for name, (path, line_num, kind, _) in bfme_strings_index.items():
-                if name.lower().startswith(prefix.lower()):
-                    filename = os.path.basename(path)
-                    completion = sublime.CompletionItem(
-                        trigger=name,
-                        completion=name,
-                        kind=sublime.KIND_MARKUP,
-                        details="<b>{name}</b><br/><i>String - {file}</i>".format(
-                            name=name, file=filename
-                        ),
-                    )
-                    completions.append(completion)
+            for name, (path, line_num, kind, _) in string_candidates:
+                filename = os.path.basename(path)
+                completion = sublime.CompletionItem(
+                    trigger=name,
+                    completion=name,
+                    kind=sublime.KIND_MARKUP,
+                    details="<b>{name}</b><br/><i>String - {file}</i>".format(
+                        name=name, file=filename
+                    ),
+                )
+                completions.append(completion)
 
         def sort_key(completion):
             name = completion.trigger
@@ -721,10 +787,7 @@ class BfmeCompletionListener(sublime_plugin.EventListener):
 
         completions.sort(key=sort_key)
 
-        return sublime.CompletionList(
-            completions[:100],
-            flags=sublime.INHIBIT_WORD_COMPLETIONS | sublime.INHIBIT_EXPLICIT_COMPLETIONS,
-        )
+        return completions[:100]
 
 
 class BfmeCurrentFileSymbolsCommand(sublime_plugin.TextCommand):
@@ -734,23 +797,9 @@ class BfmeCurrentFileSymbolsCommand(sublime_plugin.TextCommand):
             sublime.status_message("No file currently open")
             return
             
-        if not bfme_index and not bfme_strings_index:
-            index_bfme_files_async(self.view.window())
-
-        current_file_symbols = []
-        for name, (path, line, kind, *_) in bfme_index.items():
-            if isinstance(path, list):
-                for i, (p, line_num) in enumerate(zip(path, line)):
-                    if p == current_file:
-                        current_file_symbols.append((name, line_num, kind))
-            else:
-                if path == current_file:
-                    current_file_symbols.append((name, line, kind))
-        
-        for name, (path, line, kind, *_) in bfme_strings_index.items():
-            if path == current_file:
-                current_file_symbols.append((name, line, kind))
-        
+        project = ensure_project_index(self.view.window())
+
+        current_file_symbols = list(project.file_symbols(current_file))
         if not current_file_symbols:
             sublime.status_message("No symbols found in current file")
             return
@@ -797,64 +846,15 @@ class BfmeUsedSymbolsCommand(sublime_plugin.TextCommand):
             sublime.status_message("No file currently open")
             return
             
-        if not bfme_index and not bfme_strings_index:
-            index_bfme_files_async(self.view.window())
+        project = ensure_project_index(self.view.window())
 
         file_content = self.view.substr(sublime.Region(0, self.view.size()))
-        lines = file_content.split('\n')
-        
-        external_symbols = {}
-        for symbol_name, (symbol_path, symbol_line, symbol_kind, *_) in bfme_index.items():
-            if isinstance(symbol_path, list):
-                if current_file in symbol_path:
-                    continue
-            elif symbol_path == current_file:
-                continue
-            
-            if isinstance(symbol_path, list):
-                def_path = symbol_path[0]
-                def_line = symbol_line[0] if isinstance(symbol_line, list) else symbol_line
-            else:
-                def_path = symbol_path
-                def_line = symbol_line
-            
-            external_symbols[symbol_name] = (symbol_kind, def_path, def_line)
-        
-        for symbol_name, (symbol_path, symbol_line, symbol_kind, *_) in bfme_strings_index.items():
-            if symbol_path != current_file:
-                external_symbols[symbol_name] = (symbol_kind, symbol_path, symbol_line)
-        
-        used_symbols = []
-        symbol_patterns = {}
-        
-        for line_num, line in enumerate(lines, 1):
-            stripped_line = line.strip()
-            if not stripped_line or stripped_line.startswith(';') or stripped_line.startswith('//'):
-                continue
-            
-            for symbol_name, (symbol_kind, def_path, def_line) in external_symbols.items():
-                if symbol_name in line:
-                    if symbol_name not in symbol_patterns:
-                        symbol_patterns[symbol_name] = re.compile(r'\b' + re.escape(symbol_name) + r'\b', re.IGNORECASE)
-                    
-                    if symbol_patterns[symbol_name].search(line):
-                        used_symbols.append((
-                            symbol_name, 
-                            line_num, 
-                            symbol_kind, 
-                            def_path, 
-                            def_line,
-                            stripped_line
-                        ))
-                        del external_symbols[symbol_name]
-                        break
-        
+        used_symbols = find_used_symbols(file_content, current_file, project.symbols, project.strings)
+
         if not used_symbols:
             sublime.status_message("No external symbols used in current file")
             return
         
-        used_symbols.sort(key=lambda x: x[1])
-        
         self.items = []
         for symbol_name, used_line, symbol_kind, def_path, def_line, context in used_symbols:
             def_file = os.path.basename(def_path)
@@ -920,30 +920,11 @@ class BfmeUsedSymbolsCommand(sublime_plugin.TextCommand):
 
 class BfmeSymbolBrowserCommand(sublime_plugin.WindowCommand):
     def run(self):
-        if not bfme_index and not bfme_strings_index:
-            index_bfme_files_async(self.window)
-
-        self.items = []
-
-        for name, (path, line, kind, *_) in bfme_index.items():
-            if isinstance(path, list):
-                for i, (p, line_num) in enumerate(zip(path, line)):
-                    display = "{name}   ⟶   [{kind}] - {fullpath}".format(
-                        name=name, kind=kind, fullpath=p
-                    )
-                    self.items.append((display, p, line_num))
-            else:
-                display = "{name}   ⟶   [{kind}]".format(name=name, kind=kind)
-                self.items.append((display, path, line))
-
-        for name, (path, line, kind, *_) in bfme_strings_index.items():
-            display = "{name}   ⟶   [string]".format(name=name)
-            self.items.append((display, path, line))
-
-        self.items.sort(key=lambda x: x[0].lower())
+        project = ensure_project_index(self.window)
+        self.items, displays = symbol_browser_items(project, BROWSER_SEPARATOR)
 
         self.window.show_quick_panel(
-            [item[0] for item in self.items],
+            displays,
             self.on_done,
             sublime.KEEP_OPEN_ON_FOCUS_LOST,
             0,
@@ -965,3 +946,411 @@ class BfmeSymbolBrowserCommand(sublime_plugin.WindowCommand):
                 "{path}:{line}".format(path=path, line=line),
                 sublime.ENCODED_POSITION | sublime.TRANSIENT,
             )
+
+
+class BfmeShowPerformanceStatsCommand(sublime_plugin.WindowCommand):
+    def run(self, reset=False):
+        if reset:
+            perf.reset()
+            sublime.status_message("BFME: Performance stats reset")
+            return
+
+        text = perf.format_stats()
+        if not perf.is_enabled():
+            text += "\nTimings are off, set \"perf_stats\" to true in the BFME settings.\n"
+        show_output_panel(self.window, "bfme_perf", text)
+
+
+class BfmeMemoryReportCommand(sublime_plugin.WindowCommand):
+    def run(self):
+        project = get_project_index(self.window)
+        if project is None or not project.indexed:
+            sublime.status_message("BFME: Project is not indexed yet")
+            return
+
+        def worker():
+            text = format_memory_report(memory_report(project))
+            sublime.set_timeout(lambda: show_output_panel(self.window, "bfme_memory", text), 0)
+
+        sublime.status_message("BFME: Measuring index memory...")
+        threading.Thread(target=worker, daemon=True).start()
+
+
+class BfmeProfileCommand(sublime_plugin.WindowCommand):
+    """Profile a full reindex or a replay of the recent completions and hovers.
+
+    The report is written to the cache folder and opened when done.
+    """
+
+    def run(self, mode="reindex"):
+        report_file = os.path.join(
+            cache_dir(), "profile-{mode}-{stamp}.txt".format(mode=mode, stamp=time.strftime("%Y%m%d-%H%M%S"))
+        )
+        if mode == "replay":
+            requests = list(recent_requests)
+            if not requests:
+                sublime.status_message("BFME: No completions or hovers to replay yet")
+                return
+            title = "BFME profile: replay of {count} recent completions and hovers".format(count=len(requests))
+            work = lambda: self.replay(requests)
+        else:
+            project = get_project_index(self.window)
+            if project is None:
+                sublime.status_message("BFME: No project folder is open")
+                return
+            with registry.lock:
+                if project.indexing:
+                    sublime.status_message("BFME: Indexing already in progress")
+                    return
+                project.indexing = True
+            title = "BFME profile: reindex of {folders}".format(folders=", ".join(project.folders))
+            work = lambda: self.reindex(project)
+
+        def worker():
+            sublime.set_timeout(lambda: sublime.status_message("BFME: Profiling..."), 0)
+            profiling.profile(work, title, report_file)
+            sublime.set_timeout(lambda: self.window.open_file(report_file), 0)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def reindex(self, project):
+        # without rebuild a project not indexed yet would only restore its cache
+        try:
+            index_bfme_files(self.window, project, rebuild=True)
+        finally:
+            project.indexing = False
+
+    def replay(self, requests):
+        for description, request in requests:
+            try:
+                request()
+            except Exception as e:
+                print("[BFME Plugin] Failed to replay {request}: {e}".format(request=description, e=e))
+
+
+class BfmeValidateProjectCommand(sublime_plugin.WindowCommand):
+    """Check the whole mod in the background, streaming problems into an output panel."""
+
+    def run(self):
+        project = get_project_index(self.window)
+        if project is None or not project.indexed:
+            sublime.status_message("BFME: Project is not indexed yet")
+            return
+
+        previous = validation_runs.pop(self.window.id(), None)
+        if previous is not None:
+            previous.set()
+        stop = threading.Event()
+        validation_runs[self.window.id()] = stop
+
+        panel = self.window.create_output_panel("bfme_validation")
+        panel.settings().set("result_file_regex", r"^(.+?):(\d+):(\d+): (.*)$")
+        panel.set_read_only(True)
+        self.window.run_command("show_panel", {"panel": "output.bfme_validation"})
+        append = lambda text: sublime.set_timeout(
+            lambda: panel.run_command("append", {"characters": text, "force": True, "scroll_to_end": True}), 0
+        )
+        if project.symbols.base is None:
+            append("No base game index, names defined by the base game are reported as undefined.\n\n")
+
+        def report(diagnostics):
+            if diagnostics and not stop.is_set():
+                append("".join(format_diagnostic(diagnostic) + "\n" for diagnostic in diagnostics))
+
+        def worker():
+            started = time.monotonic()
+            totals = validate_project(project, report, stop=stop)
+            if stop.is_set():
+                return
+            validation_runs.pop(self.window.id(), None)
+            summary = "{errors} errors, {warnings} warnings in {files} files ({seconds:.1f}s)".format(
+                seconds=time.monotonic() - started, **totals
+            )
+            append("\n" + summary + "\n")
+            sublime.set_timeout(lambda: sublime.status_message("BFME: Validation done, " + summary), 0)
+
+        sublime.status_message("BFME: Validating project...")
+        threading.Thread(target=worker, daemon=True).start()
+
+
+class LiveDiagnostics(object):
+    """Diagnostics of one buffer by row, kept in step with its edits.
+
+    Edits only shift the rows holding diagnostics and mark the edited rows
+    dirty; the next check validates the dirty rows and the block bodies
+    under them instead of the whole file.
+    """
+
+    def __init__(self):
+        # row -> [(start column, end column, severity, message)]
+        self.rows = {}
+        self.dirty = set()
+        # set when the whole buffer needs checking again
+        self.full = True
+        # project generation of the last full check
+        self.generation = None
+        # id of the latest scheduled check, older ones are dropped
+        self.request = 0
+        # request -> dirty rows taken by a check still running, shifted
+        # like the others so they can be handed back if the check is stale
+        self.checks = {}
+
+    def shift(self, first_row, last_row, inserted_rows):
+        """Record an edit replacing rows first_row..last_row with inserted_rows + 1 rows."""
+        delta = inserted_rows - (last_row - first_row)
+
+        def moved(rows):
+            return set(row if row < first_row else row + delta for row in rows if not first_row <= row <= last_row)
+
+        self.rows = dict(
+            (row if row < first_row else row + delta, diagnostics)
+            for row, diagnostics in self.rows.items()
+            if not first_row <= row <= last_row
+        )
+        self.dirty = moved(self.dirty)
+        self.dirty.update(range(first_row, first_row + inserted_rows + 1))
+        for request, rows in list(self.checks.items()):
+            self.checks[request] = moved(rows)
+
+
+def live_diagnostics_project(view):
+    """Return the project whose diagnostics view shows, or None if it is not checked as it is edited."""
+    window = view.window()
+    if window is None or not view.file_name() or not get_setting(window, "live_diagnostics", True):
+        return None
+    project = get_project_index(window)
+    if project is None or not project.indexed:
+        return None
+    return project
+
+
+def block_rows(lines, rows):
+    """Return rows and the rows of the blocks they open, whose context an edit may have changed."""
+    checked = set()
+    for row in sorted(rows):
+        if row in checked or row >= len(lines):
+            continue
+        checked.add(row)
+        indent = len(lines[row]) - len(lines[row].lstrip())
+        body = row + 1
+        while body < len(lines):
+            text = lines[body]
+            stripped = text.lstrip()
+            if stripped and len(text) - len(stripped) <= indent:
+                break
+            checked.add(body)
+            body += 1
+    return sorted(checked)
+
+
+def schedule_live_diagnostics(view, delay=DIAGNOSTICS_DELAY_MS):
+    """Check view's buffer once it has not been edited for delay milliseconds."""
+    state = live_diagnostics.setdefault(view.buffer_id(), LiveDiagnostics())
+    state.request += 1
+    request = state.request
+    sublime.set_timeout(lambda: start_live_diagnostics(view, state, request), delay)
+
+
+def start_live_diagnostics(view, state, request):
+    """Snapshot what needs checking on the main thread and check it on the async one."""
+    if request != state.request or not view.is_valid():
+        return
+    project = live_diagnostics_project(view)
+    if project is None:
+        return
+    full = state.full or state.generation != project.generation
+    if not full and not state.dirty:
+        return
+    rows = state.dirty
+    state.dirty = set()
+    state.full = False
+    state.checks[request] = rows
+    generation = project.generation
+    change_count = view.change_count()
+    path = view.file_name()
+    # duplicates come from the index, their lines only match the buffer once it is saved
+    duplicates = full and not view.is_dirty()
+
+    def worker():
+        lines = view.substr(sublime.Region(0, view.size())).split("\n")
+        try:
+            if full:
+                with perf.span("diagnostics.full"):
+                    diagnostics = validate_lines(project, path, lines)
+                    if duplicates:
+                        diagnostics += file_duplicate_diagnostics(project, path)
+                checked = None
+            else:
+                with perf.span("diagnostics.incremental"):
+                    checked = block_rows(lines, rows)
+                    diagnostics = validate_rows(project, path, lines.__getitem__, checked)
+        except Exception as e:
+            print("[BFME Plugin] Failed to check {path}: {e}".format(path=path, e=e))
+            state.checks.pop(request, None)
+            return
+        sublime.set_timeout(
+            lambda: apply_live_diagnostics(view, state, request, change_count, generation, checked, diagnostics), 0
+        )
+
+    sublime.set_timeout_async(worker, 0)
+
+
+def apply_live_diagnostics(view, state, request, change_count, generation, checked, diagnostics):
+    """Store the diagnostics of the checked rows (all rows if None) and draw them."""
+    rows = state.checks.pop(request, set())
+    if not view.is_valid():
+        return
+    if view.change_count() != change_count:
+        # the buffer was edited while it was checked, so the results no longer
+        # match its rows: the rows it took, shifted by those edits, are due again
+        if checked is None:
+            state.full = True
+        state.dirty.update(rows)
+        schedule_live_diagnostics(view)
+        return
+    if checked is None:
+        state.rows = {}
+        state.generation = generation
+    else:
+        for row in checked:
+            state.rows.pop(row, None)
+    for _, line, start, end, severity, message in diagnostics:
+        state.rows.setdefault(line - 1, []).append((start, end, severity, message))
+    for each_view in view.buffer().views():
+        draw_live_diagnostics(each_view, state)
+
+
+def draw_live_diagnostics(view, state):
+    regions = {ERROR: [], WARNING: []}
+    annotations = {ERROR: [], WARNING: []}
+    for row, diagnostics in state.rows.items():
+        line_start = view.text_point(row, 0)
+        for start, end, severity, message in diagnostics:
+            if start == end:
+                region = view.line(line_start)
+            else:
+                region = sublime.Region(line_start + start, line_start + end)
+            regions[severity].append(region)
+            annotations[severity].append(html.escape(message))
+    for severity, key, scope in (
+        (ERROR, "bfme_diagnostics_error", "region.redish"),
+        (WARNING, "bfme_diagnostics_warning", "region.yellowish"),
+    ):
+        view.add_regions(
+            key, regions[severity], scope, "", DIAGNOSTIC_REGION_FLAGS, annotations=annotations[severity]
+        )
+
+
+def refresh_live_diagnostics(project):
+    """Check the open files of project again after its index changed."""
+    window_ids = registry.owners_of(project)
+    for window in sublime.windows():
+        if window.id() in window_ids:
+            for view in window.views():
+                if view.buffer_id() in live_diagnostics:
+                    schedule_live_diagnostics(view, 0)
+
+
+def erase_live_diagnostics(view):
+    view.erase_regions("bfme_diagnostics_error")
+    view.erase_regions("bfme_diagnostics_warning")
+
+
+class BfmeDiagnosticsListener(sublime_plugin.ViewEventListener):
+    """Check INI files as they are opened and edited, underlining the problems found."""
+
+    @classmethod
+    def is_applicable(cls, settings):
+        return BfmeHoverListener.is_applicable(settings)
+
+    def on_load(self):
+        self.check(full=True)
+
+    def on_activated(self):
+        self.check(full=False)
+
+    def on_post_save(self):
+        # index the saved file before checking it, its duplicates may have changed
+        project = live_diagnostics_project(self.view)
+        if project is None:
+            return
+
+        def worker():
+            if not project.indexing:
+                reindex_changed_files(project)
+            sublime.set_timeout(lambda: self.check(full=True), 0)
+
+        sublime.set_timeout_async(worker, 0)
+
+    def on_close(self):
+        if not any(view.is_valid() for view in self.view.buffer().views()):
+            live_diagnostics.pop(self.view.buffer_id(), None)
+
+    def check(self, full):
+        if live_diagnostics_project(self.view) is None:
+            erase_live_diagnostics(self.view)
+            return
+        state = live_diagnostics.setdefault(self.view.buffer_id(), LiveDiagnostics())
+        state.full = state.full or full
+        schedule_live_diagnostics(self.view, 0 if state.full else DIAGNOSTICS_DELAY_MS)
+
+
+class BfmeDiagnosticsChangeListener(sublime_plugin.TextChangeListener):
+    """Track the rows edited in a buffer, so only those are checked again."""
+
+    @classmethod
+    def is_applicable(cls, buffer):
+        view = buffer.primary_view()
+        return view is not None and BfmeHoverListener.is_applicable(view.settings())
+
+    def on_text_changed(self, changes):
+        view = self.buffer.primary_view()
+        state = live_diagnostics.get(self.buffer.id())
+        if view is None or state is None:
+            return
+        for change in changes:
+            state.shift(change.a.row, change.b.row, change.str.count("\n"))
+        schedule_live_diagnostics(view)
+
+
+class BfmeWindowListener(sublime_plugin.EventListener):
+    def on_pre_close_window(self, window):
+        release_project_index(window.id())
+        stop = validation_runs.pop(window.id(), None)
+        if stop is not None:
+            stop.set()
+
+
+def show_output_panel(window, name, text):
+    panel = window.create_output_panel(name)
+    panel.set_read_only(False)
+    panel.run_command("append", {"characters": text})
+    panel.set_read_only(True)
+    window.run_command("show_panel", {"panel": "output." + name})
+
+
+def load_perf_setting():
+    perf.set_enabled(sublime.load_settings("BFME.sublime-settings").get("perf_stats", True))
+
+
+def plugin_loaded():
+    load_perf_setting()
+    sublime.load_settings("BFME.sublime-settings").add_on_change("bfme_perf_stats", load_perf_setting)
+    _watcher_stop.clear()
+    threading.Thread(target=watch_projects, daemon=True).start()
+    sublime.set_timeout_async(warm_behavior_docs, 1000)
+
+
+def plugin_unloaded():
+    _watcher_stop.set()
+    for stop in validation_runs.values():
+        stop.set()
+    validation_runs.clear()
+    live_diagnostics.clear()
+    for window in sublime.windows():
+        for view in window.views():
+            erase_live_diagnostics(view)
+    sublime.load_settings("BFME.sublime-settings").clear_on_change("bfme_perf_stats")
+    render_behavior_doc.cache_clear()
+    render_behavior_summary.cache_clear()
+    registry.clear()
@@ -1,6620 +0,0 @@
-# Generated behaviors data
-# This file contains all behaviors and their parameters
-
-behaviors = {
-    "AutoHealBehavior": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "StartsActive": "Boolean",
-        "ButtonTriggered": "Boolean",
-        "SingleBurst": "Boolean",
-        "HealingAmount": "SignedInteger",
-        "HealingDelay": "UnsignedInteger",
-        "Radius": "SignedInteger",
-        "KindOf": "KindofList",
-        "UnitHealPulseFX": "FXList",
-        "StartHealingDelay": "UnsignedInteger",
-        "AffectsWholePlayer": "Boolean",
-        "AffectsContained": "Boolean",
-        "HealOnlyIfNotUnderAttack": "Boolean",
-        "HealOnlyIfNotInCombat": "Boolean",
-        "HealOnlyOthers": "Boolean",
-        "NonStackable": "Boolean",
-        "RespawnNearbyHordeMembers": "Boolean",
-        "RespawnFXList": "FXList",
-        "RespawnMinimumDelay": "UnsignedInteger"
-    },
-    "WallHubBehavior": {
-        "SegmentTemplateName": "Strings",
-        "DefaultSegmentTemplateName": "String",
-        "HubCapTemplateName": "String",
-        "CliffCapTemplateName": "String",
-        "ShoreCapTemplateName": "String",
-        "BorderCapTemplateName": "String",
-        "ElevatedSegmentTemplateName": "String",
-        "StaggeredBuildFactor": "SignedInteger",
-        "BuilderRadius": "FloatingPoint",
-        "MaxBuildoutDistance": "FloatingPoint",
-        "Options": "Options"
-    },
-    "GettingBuiltBehavior": {
-        "WorkerName": "String",
-        "EvilWorkerName": "String",
-        "TestFaction": "Boolean",
-        "SpawnTimer": "FloatingPoint",
-        "RebuildWhenDead": "Boolean",
-        "HealWeapon": "Weapon",
-        "RebuildTimeSeconds": "FloatingPoint",
-        "SelfBuildingLoop": "AudioEvent",
-        "SelfRepairFromDamageLoop": "AudioEvent",
-        "SelfRepairFromRubbleLoop": "AudioEvent",
-        "PercentOfBuildCostToRebuildPristine": "Percentage",
-        "PercentOfBuildCostToRebuildDamaged": "Percentage",
-        "PercentOfBuildCostToRebuildReallyDamaged": "Percentage",
-        "PercentOfBuildCostToRebuildRubble": "Percentage",
-        "DisallowRebuildFilter": "ObjectFilter",
-        "DisallowRebuildRange": "FloatingPoint",
-        "UseSpawnTimerWithoutWorker": "Boolean"
-    },
-    "CastleBehavior": {
-        "RepairHealthPercentPerSecond": "Percentage",
-        "BuildVariation": "SignedInteger",
-        "CastleToUnpackForFaction": "UnpackBase",
-        "FilterValidOwnedEntries": "ObjectFilter",
-        "FilterCrew": "ObjectFilter",
-        "FactionDecal": "UnpackDecal",
-        "PreBuiltList": "PreBuiltObjectLocation",
-        "PreBuiltPlyr": "String",
-        "DecalName": "String",
-        "DecalSize": "FloatingPoint",
-        "FadeTime": "FloatingPoint",
-        "UnpackDelayTime": "FloatingPoint",
-        "BuildTime": "FloatingPoint",
-        "ScanDistance": "FloatingPoint",
-        "MaxCastleRadius": "FloatingPoint",
-        "CrewPrepareTime": "UnsignedInteger",
-        "InstantUnpack": "Boolean",
-        "KeepDeathKillsEverything": "Boolean",
-        "CrewReleaseFX": "FXList",
-        "CrewPrepareFX": "FXList",
-        "CrewPrepareInterval": "UnsignedInteger",
-        "DisableStructureRotation": "Boolean",
-        "EvaEnemyCastleSightedEvent": "EvaEvent",
-        "Summoned": "Boolean",
-        "TransferFoundationHealthToCastleUponUnpack": "Boolean"
-    },
-    "CastleMemberBehavior": {
-        "CampDestroyedOwnerEvaEvent": "EvaEvent",
-        "CampDestroyedAllyEvaEvent": "EvaEvent",
-        "CampDestroyedAttackerEvaEvent": "EvaEvent",
-        "BeingBuiltSound": "AudioEvent",
-        "StoreUpgradePrice": "Boolean",
-        "CountsForEvaCastleBreached": "Boolean"
-    },
-    "BuildingBehavior": {
-        "NightWindowName": "Strings",
-        "FireWindowName": "Strings",
-        "GlowWindowName": "Strings",
-        "FireName": "Strings"
-    },
-    "BridgeScaffoldBehavior": {},
-    "BridgeTowerBehavior": {},
-    "RampageBehavior": {
-        "RampageHealthThreshold": "FloatingPoint",
-        "RampageLifeTimer": "SignedInteger",
-        "RampageAngryLifeTimer": "SignedInteger",
-        "RampageResetTimer": "SignedInteger",
-        "RampageEnemyCheckRange": "FloatingPoint",
-        "RampageEnemyThreshold": "SignedInteger",
-        "RequiredUpgrade": "Strings"
-    },
-    "EnragedBehavior": {
-        "EnragedLifeTimer": "FloatingPoint"
-    },
-    "EntEnragedUpdate": {
-        "ScanDelayTime": "UnsignedInteger",
-        "EnragedTime": "UnsignedInteger",
-        "TimeUntilCanRageAgain": "UnsignedInteger",
-        "ScanDistance": "FloatingPoint",
-        "HatedObjectFilter": "ObjectFilter",
-        "FriendlyDeadFilter": "ObjectFilter",
-        "EnragedTransitionTime": "UnsignedInteger",
-        "EnragedTransitionFX": "FXList",
-        "EnragedOnBuffFX": "FXList",
-        "EnragedOffBuffFX": "FXList"
-    },
-    "AIGateUpdate": {
-        "TriggerWidthX": "FloatingPoint",
-        "TriggerWidthY": "FloatingPoint"
-    },
-    "HitReactionBehavior": {
-        "HitReactionLifeTimer1": "UnsignedInteger",
-        "HitReactionLifeTimer2": "UnsignedInteger",
-        "HitReactionLifeTimer3": "UnsignedInteger",
-        "HitReactionThreshold1": "FloatingPoint",
-        "HitReactionThreshold2": "FloatingPoint",
-        "HitReactionThreshold3": "FloatingPoint",
-        "FastHitsResetReaction": "Boolean",
-        "HitsParalyze": "Boolean"
-    },
-    "ClickReactionBehavior": {
-        "ClickReactionTimer": "SignedInteger",
-        "ReactionFrames1": "SignedInteger",
-        "ReactionFrames2": "SignedInteger",
-        "ReactionFrames3": "SignedInteger",
-        "ReactionFrames4": "SignedInteger",
-        "ReactionFrames5": "SignedInteger"
-    },
-    "SiegeDockingBehavior": {
-        "DUMMY": "SignedInteger"
-    },
-    "AutoAbilityBehavior": {
-        "SpecialAbility": "String",
-        "MaxScanRange": "FloatingPoint",
-        "MinScanRange": "FloatingPoint",
-        "WorkingRadius": "FloatingPoint",
-        "StartsActive": "Boolean",
-        "BaseMaxRangeFromStartPos": "Boolean",
-        "AdjustAttackMeleePosition": "Boolean",
-        "Query": "AmountAndObjectFilter",
-        "AllowSelf": "Boolean",
-        "IdleTimeSeconds": "FloatingPoint",
-        "ForbiddenStatus": "ObjectStatus"
-    },
-    "DualWeaponBehavior": {
-        "SwitchWeaponOnCloseRangeDistance": "FloatingPoint",
-        "UseCloseRangeWhileMounted": "Boolean",
-        "MinimumSwitchTime": "UnsignedInteger",
-        "UseHordeRangeWeapon": "Boolean",
-        "UseRealVictimRange": "Boolean"
-    },
-    "AimWeaponBehavior": {
-        "AimLowThreshold": "FloatingPoint",
-        "AimHighThreshold": "FloatingPoint",
-        "AimNearDistance": "FloatingPoint",
-        "AimFarDistance": "FloatingPoint"
-    },
-    "BezierProjectileBehavior": {
-        "TumbleRandomly": "Boolean",
-        "DetonateCallsKill": "Boolean",
-        "OrientToFlightPath": "Boolean",
-        "FirstHeight": "FloatingPoint",
-        "SecondHeight": "FloatingPoint",
-        "FirstPercentIndent": "Percentage",
-        "SecondPercentIndent": "Percentage",
-        "CrushStyle": "Boolean",
-        "DieOnImpact": "Boolean",
-        "FinalStuckTime": "UnsignedInteger",
-        "PreLandingStateTime": "UnsignedInteger",
-        "BounceCount": "SignedInteger",
-        "BounceDistance": "FloatingPoint",
-        "BounceFirstHeight": "FloatingPoint",
-        "BounceSecondHeight": "FloatingPoint",
-        "BounceFirstPercentIndent": "Percentage",
-        "BounceSecondPercentIndent": "Percentage",
-        "GarrisonHitKillRequiredKindOf": "KindofList",
-        "GarrisonHitKillForbiddenKindOf": "KindofList",
-        "GarrisonHitKillCount": "UnsignedInteger",
-        "GarrisonHitKillFX": "FXList",
-        "GroundHitFX": "FXList",
-        "GroundBounceFX": "FXList",
-        "GroundHitWeapon": "Weapon",
-        "GroundBounceWeapon": "Weapon",
-        "FlightPathAdjustDistPerSecond": "FloatingPoint",
-        "IgnoreTerrainHeight": "Boolean",
-        "FirstPercentHeight": "Percentage",
-        "SecondPercentHeight": "Percentage",
-        "CurveFlattenMinDist": "FloatingPoint",
-        "PreLandingEmotion": "EmotionNuggetType",
-        "PreLandingEmotionRadius": "FloatingPoint",
-        "InvisibleFrames": "UnsignedInteger",
-        "FadeInTime": "UnsignedInteger",
-        "PostLandingStateTime": "UnsignedInteger",
-        "PostLandingEmotion": "EmotionNuggetType",
-        "PostLandingEmotionRadius": "FloatingPoint"
-    },
-    "MissileUpdate": {
-        "TumbleRandomly": "Boolean",
-        "DetonateCallsKill": "Boolean",
-        "OrientToFlightPath": "Boolean",
-        "FirstHeight": "FloatingPoint",
-        "SecondHeight": "FloatingPoint",
-        "FirstPercentIndent": "Percentage",
-        "SecondPercentIndent": "Percentage",
-        "CrushStyle": "Boolean",
-        "DieOnImpact": "Boolean",
-        "FinalStuckTime": "UnsignedInteger",
-        "PreLandingStateTime": "UnsignedInteger",
-        "BounceCount": "SignedInteger",
-        "BounceDistance": "FloatingPoint",
-        "BounceFirstHeight": "FloatingPoint",
-        "BounceSecondHeight": "FloatingPoint",
-        "BounceFirstPercentIndent": "Percentage",
-        "BounceSecondPercentIndent": "Percentage",
-        "GarrisonHitKillRequiredKindOf": "KindofList",
-        "GarrisonHitKillForbiddenKindOf": "KindofList",
-        "GarrisonHitKillCount": "UnsignedInteger",
-        "GarrisonHitKillFX": "FXList",
-        "GroundHitFX": "FXList",
-        "GroundBounceFX": "FXList",
-        "GroundHitWeapon": "Weapon",
-        "GroundBounceWeapon": "Weapon",
-        "FlightPathAdjustDistPerSecond": "FloatingPoint",
-        "IgnoreTerrainHeight": "Boolean",
-        "FirstPercentHeight": "Percentage",
-        "SecondPercentHeight": "Percentage",
-        "CurveFlattenMinDist": "FloatingPoint",
-        "PreLandingEmotion": "EmotionNuggetType",
-        "PreLandingEmotionRadius": "FloatingPoint",
-        "InvisibleFrames": "UnsignedInteger",
-        "FadeInTime": "UnsignedInteger",
-        "PostLandingStateTime": "UnsignedInteger",
-        "PostLandingEmotion": "EmotionNuggetType",
-        "PostLandingEmotionRadius": "FloatingPoint",
-        "FuelLifetime": "UnsignedInteger",
-        "IgnitionDelay": "UnsignedInteger",
-        "DistanceToTravelBeforeTurning": "FloatingPoint",
-        "DistanceToTargetBeforeDiving": "FloatingPoint",
-        "IgnitionFX": "FXList",
-        "DetonateOnNoFuel": "Boolean",
-        "ExhaustTemplate": "String"
-    },
-    "PhysicsBehavior": {
-        "TumbleRandomly": "Boolean",
-        "AllowBouncing": "Boolean",
-        "KillWhenRestingOnGround": "Boolean",
-        "GravityMult": "FloatingPoint",
-        "OrientToFlightPath": "Boolean",
-        "ShockStunnedTimeLow": "UnsignedInteger",
-        "ShockStunnedTimeHigh": "UnsignedInteger",
-        "ShockStandingTime": "UnsignedInteger",
-        "FirstHeight": "FloatingPoint",
-        "SecondHeight": "FloatingPoint",
-        "FirstPercentIndent": "Percentage",
-        "SecondPercentIndent": "Percentage",
-        "BounceCount": "SignedInteger",
-        "BounceFirstHeight": "FloatingPoint",
-        "BounceSecondHeight": "FloatingPoint",
-        "BounceFirstPercentIndent": "Percentage",
-        "BounceSecondPercentIndent": "Percentage",
-        "GroundHitFX": "FXList",
-        "GroundBounceFX": "FXList",
-        "IgnoreTerrainHeight": "Boolean",
-        "FirstPercentHeight": "Percentage",
-        "SecondPercentHeight": "Percentage",
-        "CurveFlattenMinDist": "FloatingPoint"
-    },
-    "InstantDeathBehavior": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "FX": "FXList",
-        "OCL": "ObjectCreationList",
-        "Weapon": "Weapon",
-        "Sound": "MomentSound"
-    },
-    "SlowDeathBehavior": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "SinkRate": "FloatingPoint",
-        "ProbabilityModifier": "SignedInteger",
-        "ModifierBonusPerOverkillPercent": "Percentage",
-        "SinkDelay": "UnsignedInteger",
-        "SinkDelayVariance": "UnsignedInteger",
-        "DestructionDelay": "UnsignedInteger",
-        "DestructionDelayVariance": "UnsignedInteger",
-        "DecayBeginTime": "UnsignedInteger",
-        "FX": "MomentFXList",
-        "OCL": "MomentOCL",
-        "Weapon": "MomentWeapon",
-        "Sound": "MomentSound"
-    },
-    "ShipSlowDeathBehavior": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "SinkRate": "FloatingPoint",
-        "ProbabilityModifier": "SignedInteger",
-        "ModifierBonusPerOverkillPercent": "Percentage",
-        "SinkDelay": "UnsignedInteger",
-        "SinkDelayVariance": "UnsignedInteger",
-        "DestructionDelay": "UnsignedInteger",
-        "DestructionDelayVariance": "UnsignedInteger",
-        "DecayBeginTime": "UnsignedInteger",
-        "FX": "MomentFXList",
-        "OCL": "MomentOCL",
-        "Weapon": "MomentWeapon",
-        "Sound": "MomentSound"
-    },
-    "SpawnBehavior": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "SpawnNumber": "SignedInteger",
-        "SpawnReplaceDelay": "UnsignedInteger",
-        "OneShot": "Boolean",
-        "CanReclaimOrphans": "Boolean",
-        "AggregateHealth": "Boolean",
-        "ExitByBudding": "Boolean",
-        "SpawnTemplateName": "Strings",
-        "SpawnedRequireSpawner": "Boolean",
-        "PropagateDamageTypesToSlavesWhenExisting": "DamageTypeFilter",
-        "InitialBurst": "SignedInteger",
-        "RespectCommandLimit": "Boolean",
-        "FadeInTime": "UnsignedInteger",
-        "KillSpawnsBasedOnModelConditionState": "Boolean",
-        "ShareUpgrades": "Boolean",
-        "SpawnInsideBuilding": "Boolean"
-    },
-    "GiantBirdSlowDeathBehavior": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "SinkRate": "FloatingPoint",
-        "ProbabilityModifier": "SignedInteger",
-        "ModifierBonusPerOverkillPercent": "Percentage",
-        "SinkDelay": "UnsignedInteger",
-        "SinkDelayVariance": "UnsignedInteger",
-        "DestructionDelay": "UnsignedInteger",
-        "DestructionDelayVariance": "UnsignedInteger",
-        "DecayBeginTime": "UnsignedInteger",
-        "FX": "MomentFXList",
-        "OCL": "MomentOCL",
-        "Weapon": "MomentWeapon",
-        "Sound": "MomentSound",
-        "FXHitGround": "FXList",
-        "OCLHitGround": "ObjectCreationList",
-        "DelayFromGroundToFinalDeath": "UnsignedInteger",
-        "CrashAvoidKindOfs": "KindofList",
-        "CrashAvoidRadius": "FloatingPoint",
-        "CrashAvoidStrength": "FloatingPoint",
-        "NeedToMaintainFlailingHeight": "Boolean"
-    },
-    "CaveContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "CaveIndex": "SignedInteger"
-    },
-    "OpenContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees"
-    },
-    "SpawnUnitBehavior": {
-        "UnitName": "String",
-        "UnitCommand": "String",
-        "SpawnOnce": "Boolean"
-    },
-    "WargBehavior": {},
-    "DynamicPortalBehaviour": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "BonePrefix": "String",
-        "NumberOfBones": "SignedInteger",
-        "WayPoint": "DynamicPortalWaypoint",
-        "Link": "DynamicPortalLink",
-        "WallBoundsMesh": "String",
-        "GenerateNow": "Boolean",
-        "AboveWall": "UnsignedInteger",
-        "TopAttackPos": "Vector3",
-        "TopAttackRadius": "FloatingPoint",
-        "AllowEnemies": "Boolean",
-        "ActivationDelaySeconds": "FloatingPoint",
-        "ObjectFilter": "ObjectFilter"
-    },
-    "FakePathfindPortalBehaviour": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "AllowEnemies": "Boolean",
-        "AllowNonSkirmishAIUnits": "Boolean"
-    },
-    "MineshaftPortalBehaviour": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "AllowEnemies": "Boolean",
-        "AllowNonSkirmishAIUnits": "Boolean"
-    },
-    "CritterEmitterUpdate": {
-        "FX": "FXList",
-        "ReloadTime": "UnsignedInteger"
-    },
-    "StancesBehavior": {
-        "StanceTemplate": "Stance"
-    },
-    "HealContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "TimeForFullHeal": "UnsignedInteger"
-    },
-    "HordeContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "Slots": "SignedInteger",
-        "ScatterNearbyOnExit": "Boolean",
-        "OrientLikeContainerOnExit": "Boolean",
-        "GoAggressiveOnExit": "Boolean",
-        "ResetMoodCheckTimeOnExit": "Boolean",
-        "DestroyRidersWhoAreNotFreeToExit": "Boolean",
-        "ExitBone": "String",
-        "ExitPitchRate": "FloatingPoint",
-        "InitialPayload": "Payload",
-        "HealthRegen_PerSec": "FloatingPoint",
-        "ExitDelay": "UnsignedInteger",
-        "TypeOneForWeaponSet": "KindofList",
-        "TypeTwoForWeaponSet": "KindofList",
-        "TypeOneForWeaponState": "KindofList",
-        "TypeTwoForWeaponState": "KindofList",
-        "TypeThreeForWeaponState": "KindofList",
-        "ForceOrientationContainer": "Boolean",
-        "CanGrabStructure": "Boolean",
-        "GrabWeapon": "Weapon",
-        "FireGrabWeaponOnVictim": "Boolean",
-        "ConditionForEntry": "ContainCondition",
-        "ShouldThrowOutPassengers": "Boolean",
-        "ThrowOutPassengersDelay": "UnsignedInteger",
-        "ThrowOutPassengersVelocity": "Vector3",
-        "ThrowOutPassengersLandingWarhead": "Weapon",
-        "FadeFilter": "ObjectFilter",
-        "FadePassengerOnEnter": "Boolean",
-        "FadePassengerOnExit": "Boolean",
-        "EnterFadeTime": "FloatingPoint",
-        "ExitFadeTime": "FloatingPoint",
-        "FadeReverse": "Boolean",
-        "ReleaseSnappyness": "FloatingPoint",
-        "UpgradeCreationTrigger": "UpgradeObjectAmount",
-        "ThisFormationIsTheMainFormation": "Boolean",
-        "RankInfo": "RankInfo",
-        "RanksThatStopAdvance": "UnsignedInteger",
-        "RanksToReleaseWhenAttacking": "UnsignedIntegerList",
-        "RanksToJustFreeWhenAttacking": "UnsignedIntegerList",
-        "ComboHorde": "ComboHorde",
-        "AlternateFormation": "String",
-        "RandomOffset": "Vector2",
-        "LeaderPosition": "Vector3",
-        "LeadersAllowed": "Strings",
-        "BannerCarrierPosition": "ObjectPosition",
-        "BannerCarriersAllowed": "Strings",
-        "BannerCarrierDestroyHordeOnDeath": "Boolean",
-        "BannerCarrierHordeDeathType": "DeathTypeFilter",
-        "LeaderRank": "SignedInteger",
-        "BackUpMinDelayTime": "UnsignedInteger",
-        "BackUpMaxDelayTime": "UnsignedInteger",
-        "BackUpMinDistance": "FloatingPoint",
-        "BackUpMaxDistance": "FloatingPoint",
-        "BackupPercentage": "Percentage",
-        "CowerRadius": "FloatingPoint",
-        "AttributeModifiers": "Strings",
-        "IsPorcupineFormation": "Boolean",
-        "ForcedLocomotorSet": "LocomotorSetType",
-        "MachineAllowed": "Boolean",
-        "MachineType": "String",
-        "UseSlowHordeMovement": "Boolean",
-        "SplitHorde": "SplitHorde",
-        "MeleeAttackLeashDistance": "FloatingPoint",
-        "EvaEventLastMemberDeath": "EvaEvent",
-        "RankSplit": "Boolean",
-        "SplitHordeNumber": "SignedInteger",
-        "NotComboFormation": "Boolean",
-        "UseMarchingAnims": "Boolean",
-        "FrontAngle": "FloatingPoint",
-        "FlankedDelay": "UnsignedInteger",
-        "FlankedDuration": "UnsignedInteger",
-        "MeleeBehavior": "MeleeBehavior",
-        "MinimumHordeSize": "UnsignedInteger",
-        "VisionRearOverride": "Percentage",
-        "VisionSideOverride": "Percentage",
-        "BannerCarrierMinLevel": "UnsignedInteger",
-        "LivingWorldOverloadTemplate": "String"
-    },
-    "HorseHordeContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "Slots": "SignedInteger",
-        "ScatterNearbyOnExit": "Boolean",
-        "OrientLikeContainerOnExit": "Boolean",
-        "GoAggressiveOnExit": "Boolean",
-        "ResetMoodCheckTimeOnExit": "Boolean",
-        "DestroyRidersWhoAreNotFreeToExit": "Boolean",
-        "ExitBone": "String",
-        "ExitPitchRate": "FloatingPoint",
-        "InitialPayload": "Payload",
-        "HealthRegen_PerSec": "FloatingPoint",
-        "ExitDelay": "UnsignedInteger",
-        "TypeOneForWeaponSet": "KindofList",
-        "TypeTwoForWeaponSet": "KindofList",
-        "TypeOneForWeaponState": "KindofList",
-        "TypeTwoForWeaponState": "KindofList",
-        "TypeThreeForWeaponState": "KindofList",
-        "ForceOrientationContainer": "Boolean",
-        "CanGrabStructure": "Boolean",
-        "GrabWeapon": "Weapon",
-        "FireGrabWeaponOnVictim": "Boolean",
-        "ConditionForEntry": "ContainCondition",
-        "ShouldThrowOutPassengers": "Boolean",
-        "ThrowOutPassengersDelay": "UnsignedInteger",
-        "ThrowOutPassengersVelocity": "Vector3",
-        "ThrowOutPassengersLandingWarhead": "Weapon",
-        "FadeFilter": "ObjectFilter",
-        "FadePassengerOnEnter": "Boolean",
-        "FadePassengerOnExit": "Boolean",
-        "EnterFadeTime": "FloatingPoint",
-        "ExitFadeTime": "FloatingPoint",
-        "FadeReverse": "Boolean",
-        "ReleaseSnappyness": "FloatingPoint",
-        "UpgradeCreationTrigger": "UpgradeObjectAmount",
-        "ThisFormationIsTheMainFormation": "Boolean",
-        "RankInfo": "RankInfo",
-        "RanksThatStopAdvance": "UnsignedInteger",
-        "RanksToReleaseWhenAttacking": "UnsignedIntegerList",
-        "RanksToJustFreeWhenAttacking": "UnsignedIntegerList",
-        "ComboHorde": "ComboHorde",
-        "AlternateFormation": "String",
-        "RandomOffset": "Vector2",
-        "LeaderPosition": "Vector3",
-        "LeadersAllowed": "Strings",
-        "BannerCarrierPosition": "ObjectPosition",
-        "BannerCarriersAllowed": "Strings",
-        "BannerCarrierDestroyHordeOnDeath": "Boolean",
-        "BannerCarrierHordeDeathType": "DeathTypeFilter",
-        "LeaderRank": "SignedInteger",
-        "BackUpMinDelayTime": "UnsignedInteger",
-        "BackUpMaxDelayTime": "UnsignedInteger",
-        "BackUpMinDistance": "FloatingPoint",
-        "BackUpMaxDistance": "FloatingPoint",
-        "BackupPercentage": "Percentage",
-        "CowerRadius": "FloatingPoint",
-        "AttributeModifiers": "Strings",
-        "IsPorcupineFormation": "Boolean",
-        "ForcedLocomotorSet": "LocomotorSetType",
-        "MachineAllowed": "Boolean",
-        "MachineType": "String",
-        "UseSlowHordeMovement": "Boolean",
-        "SplitHorde": "SplitHorde",
-        "MeleeAttackLeashDistance": "FloatingPoint",
-        "EvaEventLastMemberDeath": "EvaEvent",
-        "RankSplit": "Boolean",
-        "SplitHordeNumber": "SignedInteger",
-        "NotComboFormation": "Boolean",
-        "UseMarchingAnims": "Boolean",
-        "FrontAngle": "FloatingPoint",
-        "FlankedDelay": "UnsignedInteger",
-        "FlankedDuration": "UnsignedInteger",
-        "MeleeBehavior": "MeleeBehavior",
-        "MinimumHordeSize": "UnsignedInteger",
-        "VisionRearOverride": "Percentage",
-        "VisionSideOverride": "Percentage",
-        "BannerCarrierMinLevel": "UnsignedInteger",
-        "LivingWorldOverloadTemplate": "String"
-    },
-    "GarrisonContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "MobileGarrison": "Boolean",
-        "HealObjects": "Boolean",
-        "TimeForFullHeal": "UnsignedInteger",
-        "InitialRoster": "Payload",
-        "ImmuneToClearBuildingAttacks": "Boolean"
-    },
-    "TransportContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "Slots": "SignedInteger",
-        "ScatterNearbyOnExit": "Boolean",
-        "OrientLikeContainerOnExit": "Boolean",
-        "GoAggressiveOnExit": "Boolean",
-        "ResetMoodCheckTimeOnExit": "Boolean",
-        "DestroyRidersWhoAreNotFreeToExit": "Boolean",
-        "ExitBone": "String",
-        "ExitPitchRate": "FloatingPoint",
-        "InitialPayload": "Payload",
-        "HealthRegen_PerSec": "FloatingPoint",
-        "ExitDelay": "UnsignedInteger",
-        "TypeOneForWeaponSet": "KindofList",
-        "TypeTwoForWeaponSet": "KindofList",
-        "TypeOneForWeaponState": "KindofList",
-        "TypeTwoForWeaponState": "KindofList",
-        "TypeThreeForWeaponState": "KindofList",
-        "ForceOrientationContainer": "Boolean",
-        "CanGrabStructure": "Boolean",
-        "GrabWeapon": "Weapon",
-        "FireGrabWeaponOnVictim": "Boolean",
-        "ConditionForEntry": "ContainCondition",
-        "ShouldThrowOutPassengers": "Boolean",
-        "ThrowOutPassengersDelay": "UnsignedInteger",
-        "ThrowOutPassengersVelocity": "Vector3",
-        "ThrowOutPassengersLandingWarhead": "Weapon",
-        "FadeFilter": "ObjectFilter",
-        "FadePassengerOnEnter": "Boolean",
-        "FadePassengerOnExit": "Boolean",
-        "EnterFadeTime": "FloatingPoint",
-        "ExitFadeTime": "FloatingPoint",
-        "FadeReverse": "Boolean",
-        "ReleaseSnappyness": "FloatingPoint",
-        "UpgradeCreationTrigger": "UpgradeObjectAmount"
-    },
-    "SiegeEngineContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "Slots": "SignedInteger",
-        "ScatterNearbyOnExit": "Boolean",
-        "OrientLikeContainerOnExit": "Boolean",
-        "GoAggressiveOnExit": "Boolean",
-        "ResetMoodCheckTimeOnExit": "Boolean",
-        "DestroyRidersWhoAreNotFreeToExit": "Boolean",
-        "ExitBone": "String",
-        "ExitPitchRate": "FloatingPoint",
-        "InitialPayload": "Payload",
-        "HealthRegen_PerSec": "FloatingPoint",
-        "ExitDelay": "UnsignedInteger",
-        "TypeOneForWeaponSet": "KindofList",
-        "TypeTwoForWeaponSet": "KindofList",
-        "TypeOneForWeaponState": "KindofList",
-        "TypeTwoForWeaponState": "KindofList",
-        "TypeThreeForWeaponState": "KindofList",
-        "ForceOrientationContainer": "Boolean",
-        "CanGrabStructure": "Boolean",
-        "GrabWeapon": "Weapon",
-        "FireGrabWeaponOnVictim": "Boolean",
-        "ConditionForEntry": "ContainCondition",
-        "ShouldThrowOutPassengers": "Boolean",
-        "ThrowOutPassengersDelay": "UnsignedInteger",
-        "ThrowOutPassengersVelocity": "Vector3",
-        "ThrowOutPassengersLandingWarhead": "Weapon",
-        "FadeFilter": "ObjectFilter",
-        "FadePassengerOnEnter": "Boolean",
-        "FadePassengerOnExit": "Boolean",
-        "EnterFadeTime": "FloatingPoint",
-        "ExitFadeTime": "FloatingPoint",
-        "FadeReverse": "Boolean",
-        "ReleaseSnappyness": "FloatingPoint",
-        "UpgradeCreationTrigger": "UpgradeObjectAmount",
-        "CrewFilter": "ObjectFilter",
-        "CrewMax": "SignedInteger",
-        "InitialCrew": "Payload",
-        "SpeedPercentPerCrew": "Percentage",
-        "CrewAllowedToFire": "Boolean",
-        "ObjectStatusOfCrew": "ObjectStatus",
-        "TransferSelection": "Boolean"
-    },
-    "HordeSiegeEngineContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "Slots": "SignedInteger",
-        "ScatterNearbyOnExit": "Boolean",
-        "OrientLikeContainerOnExit": "Boolean",
-        "GoAggressiveOnExit": "Boolean",
-        "ResetMoodCheckTimeOnExit": "Boolean",
-        "DestroyRidersWhoAreNotFreeToExit": "Boolean",
-        "ExitBone": "String",
-        "ExitPitchRate": "FloatingPoint",
-        "InitialPayload": "Payload",
-        "HealthRegen_PerSec": "FloatingPoint",
-        "ExitDelay": "UnsignedInteger",
-        "TypeOneForWeaponSet": "KindofList",
-        "TypeTwoForWeaponSet": "KindofList",
-        "TypeOneForWeaponState": "KindofList",
-        "TypeTwoForWeaponState": "KindofList",
-        "TypeThreeForWeaponState": "KindofList",
-        "ForceOrientationContainer": "Boolean",
-        "CanGrabStructure": "Boolean",
-        "GrabWeapon": "Weapon",
-        "FireGrabWeaponOnVictim": "Boolean",
-        "ConditionForEntry": "ContainCondition",
-        "ShouldThrowOutPassengers": "Boolean",
-        "ThrowOutPassengersDelay": "UnsignedInteger",
-        "ThrowOutPassengersVelocity": "Vector3",
-        "ThrowOutPassengersLandingWarhead": "Weapon",
-        "FadeFilter": "ObjectFilter",
-        "FadePassengerOnEnter": "Boolean",
-        "FadePassengerOnExit": "Boolean",
-        "EnterFadeTime": "FloatingPoint",
-        "ExitFadeTime": "FloatingPoint",
-        "FadeReverse": "Boolean",
-        "ReleaseSnappyness": "FloatingPoint",
-        "UpgradeCreationTrigger": "UpgradeObjectAmount",
-        "CrewFilter": "ObjectFilter",
-        "CrewMax": "SignedInteger",
-        "InitialCrew": "Payload",
-        "SpeedPercentPerCrew": "Percentage",
-        "CrewAllowedToFire": "Boolean",
-        "ObjectStatusOfCrew": "ObjectStatus"
-    },
-    "TunnelContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "MobileGarrison": "Boolean",
-        "HealObjects": "Boolean",
-        "TimeForFullHeal": "UnsignedInteger",
-        "InitialRoster": "Payload",
-        "ImmuneToClearBuildingAttacks": "Boolean",
-        "ExitDelay": "UnsignedInteger",
-        "EntryOffset": "Vector3",
-        "EntryPosition": "Vector3",
-        "ExitOffset": "Vector3"
-    },
-    "HordeTransportContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "Slots": "SignedInteger",
-        "ScatterNearbyOnExit": "Boolean",
-        "OrientLikeContainerOnExit": "Boolean",
-        "GoAggressiveOnExit": "Boolean",
-        "ResetMoodCheckTimeOnExit": "Boolean",
-        "DestroyRidersWhoAreNotFreeToExit": "Boolean",
-        "ExitBone": "String",
-        "ExitPitchRate": "FloatingPoint",
-        "InitialPayload": "Payload",
-        "HealthRegen_PerSec": "FloatingPoint",
-        "ExitDelay": "UnsignedInteger",
-        "TypeOneForWeaponSet": "KindofList",
-        "TypeTwoForWeaponSet": "KindofList",
-        "TypeOneForWeaponState": "KindofList",
-        "TypeTwoForWeaponState": "KindofList",
-        "TypeThreeForWeaponState": "KindofList",
-        "ForceOrientationContainer": "Boolean",
-        "CanGrabStructure": "Boolean",
-        "GrabWeapon": "Weapon",
-        "FireGrabWeaponOnVictim": "Boolean",
-        "ConditionForEntry": "ContainCondition",
-        "ShouldThrowOutPassengers": "Boolean",
-        "ThrowOutPassengersDelay": "UnsignedInteger",
-        "ThrowOutPassengersVelocity": "Vector3",
-        "ThrowOutPassengersLandingWarhead": "Weapon",
-        "FadeFilter": "ObjectFilter",
-        "FadePassengerOnEnter": "Boolean",
-        "FadePassengerOnExit": "Boolean",
-        "EnterFadeTime": "FloatingPoint",
-        "ExitFadeTime": "FloatingPoint",
-        "FadeReverse": "Boolean",
-        "ReleaseSnappyness": "FloatingPoint",
-        "UpgradeCreationTrigger": "UpgradeObjectAmount"
-    },
-    "HordeGarrisonContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "MobileGarrison": "Boolean",
-        "HealObjects": "Boolean",
-        "TimeForFullHeal": "UnsignedInteger",
-        "InitialRoster": "Payload",
-        "ImmuneToClearBuildingAttacks": "Boolean",
-        "ExitDelay": "UnsignedInteger",
-        "EntryOffset": "Vector3",
-        "EntryPosition": "Vector3",
-        "ExitOffset": "Vector3"
-    },
-    "RiderChangeContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "Slots": "SignedInteger",
-        "ScatterNearbyOnExit": "Boolean",
-        "OrientLikeContainerOnExit": "Boolean",
-        "GoAggressiveOnExit": "Boolean",
-        "ResetMoodCheckTimeOnExit": "Boolean",
-        "DestroyRidersWhoAreNotFreeToExit": "Boolean",
-        "ExitBone": "String",
-        "ExitPitchRate": "FloatingPoint",
-        "InitialPayload": "Payload",
-        "HealthRegen_PerSec": "FloatingPoint",
-        "ExitDelay": "UnsignedInteger",
-        "TypeOneForWeaponSet": "KindofList",
-        "TypeTwoForWeaponSet": "KindofList",
-        "TypeOneForWeaponState": "KindofList",
-        "TypeTwoForWeaponState": "KindofList",
-        "TypeThreeForWeaponState": "KindofList",
-        "ForceOrientationContainer": "Boolean",
-        "CanGrabStructure": "Boolean",
-        "GrabWeapon": "Weapon",
-        "FireGrabWeaponOnVictim": "Boolean",
-        "ConditionForEntry": "ContainCondition",
-        "ShouldThrowOutPassengers": "Boolean",
-        "ThrowOutPassengersDelay": "UnsignedInteger",
-        "ThrowOutPassengersVelocity": "Vector3",
-        "ThrowOutPassengersLandingWarhead": "Weapon",
-        "FadeFilter": "ObjectFilter",
-        "FadePassengerOnEnter": "Boolean",
-        "FadePassengerOnExit": "Boolean",
-        "EnterFadeTime": "FloatingPoint",
-        "ExitFadeTime": "FloatingPoint",
-        "FadeReverse": "Boolean",
-        "ReleaseSnappyness": "FloatingPoint",
-        "UpgradeCreationTrigger": "UpgradeObjectAmount",
-        "CrewFilter": "ObjectFilter",
-        "CrewMax": "SignedInteger",
-        "InitialCrew": "Payload",
-        "SpeedPercentPerCrew": "Percentage",
-        "CrewAllowedToFire": "Boolean",
-        "ObjectStatusOfCrew": "ObjectStatus",
-        "TransferSelection": "Boolean"
-    },
-    "SlaughterHordeContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "MobileGarrison": "Boolean",
-        "HealObjects": "Boolean",
-        "TimeForFullHeal": "UnsignedInteger",
-        "InitialRoster": "Payload",
-        "ImmuneToClearBuildingAttacks": "Boolean",
-        "ExitDelay": "UnsignedInteger",
-        "EntryOffset": "Vector3",
-        "EntryPosition": "Vector3",
-        "ExitOffset": "Vector3",
-        "CashBackPercent": "Percentage",
-        "CanAlwaysEnter": "ObjectFilter",
-        "StatusRequiredForCanAlwaysEnter": "ObjectStatus"
-    },
-    "CitadelSlaughterHordeContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "MobileGarrison": "Boolean",
-        "HealObjects": "Boolean",
-        "TimeForFullHeal": "UnsignedInteger",
-        "InitialRoster": "Payload",
-        "ImmuneToClearBuildingAttacks": "Boolean",
-        "ExitDelay": "UnsignedInteger",
-        "EntryOffset": "Vector3",
-        "EntryPosition": "Vector3",
-        "ExitOffset": "Vector3",
-        "CashBackPercent": "Percentage",
-        "CanAlwaysEnter": "ObjectFilter",
-        "StatusRequiredForCanAlwaysEnter": "ObjectStatus",
-        "StatusForRingEntry": "ObjectStatus",
-        "UpgradeForRingEntry": "Strings",
-        "ObjectToDestroyForRingEntry": "ObjectFilter",
-        "FXForRingEntry": "FXList"
-    },
-    "ProductionQueueHordeContain": {
-        "ContainMax": "SignedInteger",
-        "EnterSound": "AudioEvent",
-        "ExitSound": "AudioEvent",
-        "DamagePercentToUnits": "Percentage",
-        "PassengerFilter": "ObjectFilter",
-        "ManualPickUpFilter": "ObjectFilter",
-        "PassengersTestCollisionHeight": "FloatingPoint",
-        "PassengersInTurret": "Boolean",
-        "NumberOfExitPaths": "SignedInteger",
-        "DoorOpenTime": "UnsignedInteger",
-        "AllowOwnPlayerInsideOverride": "Boolean",
-        "AllowAlliesInside": "Boolean",
-        "AllowEnemiesInside": "Boolean",
-        "AllowNeutralInside": "Boolean",
-        "ShowPips": "Boolean",
-        "CollidePickup": "Boolean",
-        "PassengerBonePrefix": "PassengerBoneKindof",
-        "BoneSpecificConditionState": "IndexAnimationState",
-        "EjectPassengersOnDeath": "Boolean",
-        "KillPassengersOnDeath": "Boolean",
-        "Enabled": "Boolean",
-        "ObjectStatusOfContained": "ObjectStatus",
-        "ModifierToGiveOnExit": "Strings",
-        "ModifierRequiredTime": "UnsignedInteger",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "MobileGarrison": "Boolean",
-        "HealObjects": "Boolean",
-        "TimeForFullHeal": "UnsignedInteger",
-        "InitialRoster": "Payload",
-        "ImmuneToClearBuildingAttacks": "Boolean",
-        "ExitDelay": "UnsignedInteger",
-        "EntryOffset": "Vector3",
-        "EntryPosition": "Vector3",
-        "ExitOffset": "Vector3",
-        "DestinationTemplate": "ObjectObjectFilter"
-    },
-    "PropagandaTowerBehavior": {
-        "Radius": "FloatingPoint",
-        "DelayBetweenUpdates": "UnsignedInteger",
-        "HealPercentEachSecond": "Percentage",
-        "UpgradedHealPercentEachSecond": "Percentage",
-        "PulseFX": "FXList",
-        "UpgradeRequired": "String",
-        "UpgradedPulseFX": "FXList"
-    },
-    "TerrainResourceBehavior": {
-        "Radius": "FloatingPoint",
-        "MaxIncome": "SignedInteger",
-        "IncomeInterval": "UnsignedInteger",
-        "HighPriority": "Boolean",
-        "Visible": "Boolean",
-        "Upgrade": "Upgrade",
-        "UpgradeBonusPercent": "Percentage",
-        "UpgradeMustBePresent": "ObjectFilter"
-    },
-    "FireWeaponWhenDamagedBehavior": {
-        "StartsActive": "Boolean",
-        "ReactionWeaponPristine": "Weapon",
-        "ReactionWeaponDamaged": "Weapon",
-        "ReactionWeaponReallyDamaged": "Weapon",
-        "ReactionWeaponRubble": "Weapon",
-        "ContinuousWeaponPristine": "Weapon",
-        "ContinuousWeaponDamaged": "Weapon",
-        "ContinuousWeaponReallyDamaged": "Weapon",
-        "ContinuousWeaponRubble": "Weapon",
-        "DamageTypes": "DamageTypeFilter",
-        "DamageAmount": "FloatingPoint",
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean"
-    },
-    "FireWeaponWhenDeadBehavior": {
-        "StartsActive": "Boolean",
-        "ActiveDuringConstruction": "Boolean",
-        "DelayTime": "UnsignedInteger",
-        "DeathWeapon": "Weapon",
-        "WeaponOffset": "Vector3",
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees"
-    },
-    "PoisonedBehavior": {
-        "PoisonDamageInterval": "UnsignedInteger"
-    },
-    "RebuildHoleBehavior": {
-        "WorkerObjectName": "String",
-        "WorkerRespawnDelay": "UnsignedInteger",
-        "HoleHealthRegen_PerSecond": "Percentage"
-    },
-    "SupplyWarehouseCripplingBehavior": {
-        "SelfHealSupression": "UnsignedInteger",
-        "SelfHealDelay": "UnsignedInteger",
-        "SelfHealAmount": "FloatingPoint"
-    },
-    "ClearanceTestingSlowDeathBehavior": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "SinkRate": "FloatingPoint",
-        "ProbabilityModifier": "SignedInteger",
-        "ModifierBonusPerOverkillPercent": "Percentage",
-        "SinkDelay": "UnsignedInteger",
-        "SinkDelayVariance": "UnsignedInteger",
-        "DestructionDelay": "UnsignedInteger",
-        "DestructionDelayVariance": "UnsignedInteger",
-        "DecayBeginTime": "UnsignedInteger",
-        "FX": "MomentFXList",
-        "OCL": "MomentOCL",
-        "Weapon": "MomentWeapon",
-        "Sound": "MomentSound",
-        "ClearanceGeometry": "Unknown",
-        "ClearanceGeometryMajorRadius": "FloatingPoint",
-        "ClearanceGeometryMinorRadius": "FloatingPoint",
-        "ClearanceGeometryRotationAnchorOffset": "Vector3",
-        "ClearanceGeometryHeight": "FloatingPoint",
-        "ClearanceGeometryIsSmall": "Boolean",
-        "ClearanceGeometryOffset": "Vector3",
-        "ClearanceMaxHeight": "FloatingPoint",
-        "ClearanceMaxHeightFraction": "FloatingPoint",
-        "ClearanceMinHeight": "FloatingPoint",
-        "ClearanceMinHeightFraction": "FloatingPoint"
-    },
-    "RunOffMapBehavior": {
-        "RunToLocation": "Vector2",
-        "RequiresSpecificTrigger": "Boolean",
-        "RunOffMapWaypointName": "String",
-        "DieOnMap": "Boolean"
-    },
-    "ReplenishUnitsBehavior": {
-        "StartsActive": "Boolean",
-        "ReplenishDelay": "UnsignedInteger",
-        "ReplenishRadius": "FloatingPoint",
-        "NoReplenishIfEnemyWithinRadius": "FloatingPoint",
-        "ReplenishFXList": "FXList",
-        "ReplenishStatii": "ObjectStatus",
-        "ReplenishHordeMembersOnly": "Boolean",
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean"
-    },
-    "SlaveWatcherBehavior": {
-        "RemoveUpgrade": "String",
-        "GrantUpgrade": "String",
-        "ShareUpgrades": "Boolean",
-        "LetSlaveLive": "Boolean"
-    },
-    "AnnounceBirthAndDeathBehavior": {},
-    "DestroyDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees"
-    },
-    "FXListDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "DeathFX": "FXList",
-        "OrientToObject": "Boolean"
-    },
-    "CrushDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "TotalCrushSound": "AudioEvent",
-        "BackEndCrushSound": "AudioEvent",
-        "FrontEndCrushSound": "AudioEvent",
-        "TotalCrushSoundPercent": "SignedInteger",
-        "BackEndCrushSoundPercent": "SignedInteger",
-        "FrontEndCrushSoundPercent": "SignedInteger"
-    },
-    "HeroDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "SpecialPowerTemplate": "SpecialPower"
-    },
-    "CreateCrateDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "CrateData": "Crate"
-    },
-    "RefundDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "UpgradeRequired": "Upgrade",
-        "BuildingRequired": "ObjectFilter",
-        "RefundPercent": "Percentage"
-    },
-    "CreateObjectDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "CreationList": "ObjectCreationList",
-        "DebrisPortionOfSelf": "String",
-        "UpgradeRequired": "Strings"
-    },
-    "CreateObjectDieIfEldestKindof": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "CreationList": "ObjectCreationList",
-        "DebrisPortionOfSelf": "String",
-        "UpgradeRequired": "Strings",
-        "ObjectFilter": "ObjectFilter"
-    },
-    "DamageFilteredCreateObjectDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "CreationList": "ObjectCreationList",
-        "DamageTypeTriggersInstantly": "DamageTypes",
-        "DamageTypeTriggersForDuration": "DamageTypes",
-        "PostFilterTriggeredDuration": "UnsignedInteger"
-    },
-    "SpecialPowerCompletionDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "SpecialPowerTemplate": "SpecialPower"
-    },
-    "RebuildHoleExposeDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "HoleName": "String",
-        "HoleMaxHealth": "FloatingPoint",
-        "TransferAttackers": "Boolean",
-        "FadeInTimeSeconds": "FloatingPoint"
-    },
-    "UpgradeDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "UpgradeToRemove": "String"
-    },
-    "KeepObjectDie": {
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "CollapsingTime": "UnsignedInteger",
-        "StayOnRadar": "Boolean"
-    },
-    "AssistedTargetingUpdate": {
-        "AssistingClipSize": "SignedInteger",
-        "AssistingWeaponSlot": "SlotTypes",
-        "LaserFromAssisted": "Object",
-        "LaserToTarget": "Object"
-    },
-    "AutoFindHealingUpdate": {
-        "ScanRate": "UnsignedInteger",
-        "ScanRange": "FloatingPoint",
-        "NeverHeal": "FloatingPoint",
-        "AlwaysHeal": "FloatingPoint"
-    },
-    "StealthDetectorUpdate": {
-        "DetectionRate": "UnsignedInteger",
-        "DetectionRange": "FloatingPoint",
-        "InitiallyDisabled": "Boolean",
-        "PingSound": "AudioEvent",
-        "LoudPingSound": "AudioEvent",
-        "IRBeaconParticleSysName": "ParticleSystem",
-        "IRParticleSysName": "ParticleSystem",
-        "IRBrightParticleSysName": "ParticleSystem",
-        "IRGridParticleSysName": "ParticleSystem",
-        "IRParticleSysBone": "String",
-        "ExtraRequiredKindOf": "KindofList",
-        "ExtraForbiddenKindOf": "KindofList",
-        "CanDetectWhileGarrisoned": "Boolean",
-        "CanDetectWhileContained": "Boolean",
-        "CancelOneRingEffect": "Boolean",
-        "RequiredUpgrade": "String"
-    },
-    "BroadcastStealthUpdate": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "AllowKindOf": "KindofList",
-        "Radius": "FloatingPoint",
-        "DelayBetweenUpdates": "SignedInteger",
-        "PersistantConditions": "Conditions"
-    },
-    "StealthUpdate": {
-        "StealthDelay": "UnsignedInteger",
-        "MoveThresholdSpeed": "FloatingPoint",
-        "StealthForbiddenConditions": "Conditions",
-        "RemoveTerrainRestrictionOnUpgrade": "Strings",
-        "HintDetectableConditions": "ObjectStatus",
-        "FriendlyOpacityMin": "Percentage",
-        "FriendlyOpacityMax": "Percentage",
-        "PulseFrequency": "UnsignedInteger",
-        "DisguisesAsTeam": "Boolean",
-        "RevealDistanceFromTarget": "FloatingPoint",
-        "OrderIdleEnemiesToAttackMeUponReveal": "Boolean",
-        "DisguiseFX": "FXList",
-        "DisguiseRevealFX": "FXList",
-        "DisguiseTransitionTime": "UnsignedInteger",
-        "DisguiseRevealTransitionTime": "UnsignedInteger",
-        "StartsActive": "Boolean",
-        "InnateStealth": "Boolean",
-        "DetectedByFriendliesOnly": "Boolean",
-        "DetectedByAnyoneRange": "FloatingPoint",
-        "BecomeStealthedFX": "FXList",
-        "ExitStealthFX": "FXList",
-        "RevealWeaponSets": "WeaponsetFlags",
-        "VoiceMoveToStealthyArea": "AudioEvent",
-        "VoiceEnterStateMoveToStealthyArea": "AudioEvent",
-        "OneRingDelayOn": "UnsignedInteger",
-        "OneRingDelayOff": "UnsignedInteger",
-        "RingAnimTimeOn": "UnsignedInteger",
-        "RingAnimTimeOff": "UnsignedInteger",
-        "RingDelayAfterRemoving": "UnsignedInteger",
-        "BecomeStealthedOneRingFX": "FXList",
-        "ExitStealthOneRingFX": "FXList",
-        "EvaEventDetectedEnemy": "EvaEvent",
-        "EvaEventDetectedAlly": "EvaEvent",
-        "EvaEventDetectedOwner": "EvaEvent",
-        "RequiredUpgradeNames": "Strings",
-        "ForbiddenUpgradeNames": "Strings"
-    },
-    "EvaAnnounceClientCreate": {
-        "AnnouncementEventEnemy": "EvaEvent",
-        "AnnouncementEventAlly": "EvaEvent",
-        "AnnouncementEventOwner": "EvaEvent",
-        "DelayBeforeAnnouncementMS": "UnsignedInteger",
-        "OnlyIfVisible": "Boolean",
-        "CountAsFirstSightedAnnoucement": "Boolean",
-        "UseObjectsPosition": "Boolean",
-        "CreateFakeRadarEvent": "Boolean"
-    },
-    "TerrainResourceClientBehavior": {},
-    "ModelConditionAudioLoopClientBehavior": {
-        "ModelCondition": "ModelConditionAudio"
-    },
-    "RandomSoundSelectorClientBehavior": {
-        "Chance": "Percentage",
-        "RerollOnEveryFrame": "Boolean",
-        "UnitSpecificSounds": "UnitSpecificSounds",
-        "VoicePriority": "UnsignedInteger",
-        "VoiceSelect": "AudioEvent",
-        "VoiceSelectUnderConstruction": "AudioEvent",
-        "VoiceSelectBattle": "AudioEvent",
-        "VoiceMove": "AudioEvent",
-        "VoiceMoveToHigherGround": "AudioEvent",
-        "VoiceMoveOverWalls": "AudioEvent",
-        "VoiceAttack": "AudioEvent",
-        "VoiceAttackCharge": "AudioEvent",
-        "VoiceFear": "AudioEvent",
-        "VoiceCreated": "AudioEvent",
-        "VoiceTaskComplete": "AudioEvent",
-        "VoiceDefect": "AudioEvent",
-        "VoiceAttackAir": "AudioEvent",
-        "VoiceGuard": "AudioEvent",
-        "VoiceAlert": "AudioEvent",
-        "VoiceFullyCreated": "AudioEvent",
-        "VoiceRetreatToCastle": "AudioEvent",
-        "VoiceMoveToCamp": "AudioEvent",
-        "VoiceAttackStructure": "AudioEvent",
-        "VoiceAttackMachine": "AudioEvent",
-        "VoiceMoveWhileAttacking": "AudioEvent",
-        "VoiceCombineWithHorde": "AudioEvent",
-        "VoiceEnterStateAttack": "AudioEvent",
-        "VoiceEnterStateAttackCharge": "AudioEvent",
-        "VoiceEnterStateAttackAir": "AudioEvent",
-        "VoiceEnterStateAttackStructure": "AudioEvent",
-        "VoiceEnterStateAttackMachine": "AudioEvent",
-        "VoiceEnterStateMove": "AudioEvent",
-        "VoiceEnterStateMoveToHigherGround": "AudioEvent",
-        "VoiceEnterStateMoveOverWalls": "AudioEvent",
-        "VoiceEnterStateRetreatToCastle": "AudioEvent",
-        "VoiceEnterStateMoveToCamp": "AudioEvent",
-        "VoiceEnterStateMoveWhileAttacking": "AudioEvent",
-        "SoundMoveStart": "AudioEvent",
-        "SoundMoveStartDamaged": "AudioEvent",
-        "SoundMoveLoop": "AudioEvent",
-        "SoundMoveLoopDamaged": "AudioEvent",
-        "SoundAmbient": "AudioEvent",
-        "SoundAmbientDamaged": "AudioEvent",
-        "SoundAmbientReallyDamaged": "AudioEvent",
-        "SoundAmbientRubble": "AudioEvent",
-        "SoundAmbientBattle": "AudioEvent",
-        "SoundStealthOn": "AudioEvent",
-        "SoundStealthOff": "AudioEvent",
-        "SoundCreated": "AudioEvent",
-        "SoundOnDamaged": "AudioEvent",
-        "SoundOnReallyDamaged": "AudioEvent",
-        "SoundEnter": "AudioEvent",
-        "SoundExit": "AudioEvent",
-        "SoundPromotedVeteran": "AudioEvent",
-        "SoundPromotedElite": "AudioEvent",
-        "SoundPromotedHero": "AudioEvent",
-        "SoundFallingFromPlane": "AudioEvent",
-        "SoundImpact": "AudioEvent",
-        "SoundImpactCyclonic": "AudioEvent",
-        "SoundCrushing": "AudioEvent"
-    },
-    "UpgradeSoundSelectorClientBehavior": {},
-    "ModelConditionSoundSelectorClientBehavior": {},
-    "AnimationSoundClientBehavior": {},
-    "RadarMarkerClientUpdate": {
-        "MarkerType": "String"
-    },
-    "BeaconClientUpdate": {
-        "RadarPulseFrequency": "UnsignedInteger",
-        "RadarPulseDuration": "UnsignedInteger"
-    },
-    "SwayClientUpdate": {},
-    "AnimatedParticleSysBoneClientUpdate": {},
-    "HordeDispatchSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint"
-    },
-    "CombineHordeSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "ScanRange": "FloatingPoint"
-    },
-    "RepairSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint"
-    },
-    "SplitHordeSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint"
-    },
-    "DevastateSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "Radius": "FloatingPoint",
-        "FX": "FXList",
-        "TreeValueMultiplier": "Percentage",
-        "TreeValueTotalCap": "FloatingPoint",
-        "FireWeapon": "String"
-    },
-    "PlayerHealSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "HealAmount": "FloatingPoint",
-        "HealAsPercent": "Boolean",
-        "HealAffects": "KindofList",
-        "HealRadius": "FloatingPoint",
-        "HealFX": "FXList",
-        "HealOCL": "ObjectCreationList"
-    },
-    "PlayerUpgradeSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "UpgradeName": "Upgrade"
-    },
-    "UntamedAllegianceSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint"
-    },
-    "ManTheWallsSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint"
-    },
-    "FellBeastSwoopPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "SpecialWeapon": "Weapon",
-        "WhichSpecialWeapon": "SignedInteger"
-    },
-    "WoundArrowUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "FleeDistance": "FloatingPoint",
-        "ForbiddenConditions": "SpecialPowerForbiddenUnpackConditions"
-    },
-    "StopSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "StopPowerTemplate": "SpecialPower"
-    },
-    "SiegeDeployHordeSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "InitiateSound": "AudioEvent",
-        "StartsPaused": "Boolean",
-        "HordeDeploy": "Boolean"
-    },
-    "SiegeDeploySpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "InitiateSound": "AudioEvent",
-        "StartsPaused": "Boolean",
-        "LowerDelay": "UnsignedInteger",
-        "RaiseDelay": "UnsignedInteger",
-        "EvacuatePassengersOnDeploy": "Boolean",
-        "EvacuateCrewOnDeploy": "Boolean",
-        "SkipAdjustPosition": "Boolean",
-        "WallSearchDistance": "FloatingPoint",
-        "AwayFromWallWaitDist": "FloatingPoint",
-        "ExtraWallDistance": "FloatingPoint"
-    },
-    "DeflectSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "InitiateSound": "AudioEvent",
-        "StartsPaused": "Boolean"
-    },
-    "GrabPassengerSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "GrabRadius": "FloatingPoint",
-        "AllowTree": "Boolean"
-    },
-    "DarknessSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "DarknessRadius": "FloatingPoint",
-        "DarknessFX": "FXList"
-    },
-    "FreezingRainSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "FreezingRainRadius": "FloatingPoint",
-        "FreezingRainFX": "FXList",
-        "BurnRateModifier": "SignedInteger"
-    },
-    "TaintSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "TaintObject": "String",
-        "TaintRadius": "FloatingPoint",
-        "TaintFX": "FXList",
-        "TaintOCL": "ObjectCreationList"
-    },
-    "CloudBreakSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "CloudBreakRadius": "FloatingPoint",
-        "CloudBreakFX": "FXList",
-        "SunbeamObject": "String",
-        "ObjectSpacing": "FloatingPoint"
-    },
-    "ScavengerSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "BountyPercent": "FloatingPoint"
-    },
-    "WeaponChangeSpecialPowerModule": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "FlagsUsedForToggle": "WeaponsetFlags",
-        "ToggleOnSleepFrames": "SignedInteger",
-        "ToggleOffSleepFrames": "SignedInteger",
-        "ToggleOnAttributeModifier": "String",
-        "ToggleOffAttributeModifier": "String"
-    },
-    "ElvenWoodSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "ElvenGroveObject": "String",
-        "ElvenNumObjects": "SignedInteger",
-        "ElvenWoodObject": "Unknown",
-        "ElvenWoodRadius": "FloatingPoint",
-        "ElvenWoodFX": "FXList",
-        "ElvenWoodOCL": "ObjectCreationList"
-    },
-    "SpecialPowerTimerRefreshSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint"
-    },
-    "OCLSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "UpgradeOCL": "Upgrade",
-        "OCL": "ObjectCreationList",
-        "CreateLocation": "CreateAtLocation",
-        "UpgradeName": "Upgrade",
-        "NearestSecondaryObjectFilter": "ObjectFilter"
-    },
-    "ProductionSpeedBonus": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "NumberOfFrames": "SignedInteger",
-        "SpeedMulitplier": "FloatingPoint",
-        "Type": "Strings"
-    },
-    "LevelGrantSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "Experience": "SignedInteger",
-        "RadiusEffect": "FloatingPoint",
-        "LevelFX": "FXList",
-        "AcceptanceFilter": "ObjectFilter"
-    },
-    "DefectorSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "FatCursorRadius": "FloatingPoint"
-    },
-    "CashHackSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "UpgradeMoneyAmount": "Unknown",
-        "MoneyAmount": "SignedInteger"
-    },
-    "InvisibilitySpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint",
-        "InvisibilityNugget": "InvisibilityNugget",
-        "BroadcastRadius": "FloatingPoint",
-        "ObjectFilter": "ObjectFilter",
-        "Duration": "UnsignedInteger"
-    },
-    "SpecialPowerModule": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "UpdateModuleStartsAttack": "Boolean",
-        "StartsPaused": "Boolean",
-        "InitiateSound": "AudioEvent",
-        "ReEnableAntiCategory": "Boolean",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AttributeModifier": "String",
-        "AttributeModifierRange": "FloatingPoint",
-        "AttributeModifierAffectsSelf": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter",
-        "AttributeModifierFX": "FXList",
-        "AttributeModifierWeatherBased": "Boolean",
-        "WeatherDuration": "UnsignedInteger",
-        "RequirementsFilterMPSkirmish": "ObjectFilter",
-        "RequirementsFilterStrategic": "ObjectFilter",
-        "TargetEnemy": "Boolean",
-        "TargetAllSides": "Boolean",
-        "InitiateFX": "FXList",
-        "TriggerFX": "FXList",
-        "SetModelCondition": "ContainCondition",
-        "SetModelConditionTime": "FloatingPoint",
-        "GiveLevels": "SignedInteger",
-        "DisableDuringAnimDuration": "Boolean",
-        "IdleWhenStartingPower": "Boolean",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "AffectAllies": "Boolean",
-        "AvailableAtStart": "Boolean",
-        "ChangeWeather": "WeatherFlag",
-        "AdjustVictim": "Boolean",
-        "OnTriggerRechargeSpecialPower": "String",
-        "BurnDecayModifier": "UnsignedInteger",
-        "UseDistanceFromCommandCenter": "Boolean",
-        "DistanceFromCommandCenter": "FloatingPoint"
-    },
-    "RespawnBody": {
-        "MaxHealth": "FloatingPoint",
-        "MaxHealthDamaged": "FloatingPoint",
-        "MaxHealthReallyDamaged": "FloatingPoint",
-        "InitialHealth": "FloatingPoint",
-        "RecoveryTime": "UnsignedInteger",
-        "DodgePercent": "Percentage",
-        "EnteringDamagedTransitionTime": "UnsignedInteger",
-        "EnteringReallyDamagedTransitionTime": "UnsignedInteger",
-        "GrabObject": "String",
-        "GrabFX": "FXList",
-        "GrabDamage": "FloatingPoint",
-        "GrabOffset": "Vector2",
-        "UseDefaultDamageSettings": "Boolean",
-        "DamageCreationList": "DamageCreationList",
-        "HealingBuffFx": "FXList",
-        "DamagedAttributeModifier": "String",
-        "ReallyDamagedAttributeModifier": "String",
-        "CheerRadius": "FloatingPoint",
-        "RemoveUpgradesOnDeath": "Boolean",
-        "BurningDeathBehavior": "Boolean",
-        "BurningDeathFX": "FXList",
-        "PermanentlyKilledByFilter": "ObjectFilter",
-        "CanRespawn": "Boolean"
-    },
-    "PorcupineFormationBodyModule": {
-        "MaxHealth": "FloatingPoint",
-        "MaxHealthDamaged": "FloatingPoint",
-        "MaxHealthReallyDamaged": "FloatingPoint",
-        "InitialHealth": "FloatingPoint",
-        "RecoveryTime": "UnsignedInteger",
-        "DodgePercent": "Percentage",
-        "EnteringDamagedTransitionTime": "UnsignedInteger",
-        "EnteringReallyDamagedTransitionTime": "UnsignedInteger",
-        "GrabObject": "String",
-        "GrabFX": "FXList",
-        "GrabDamage": "FloatingPoint",
-        "GrabOffset": "Vector2",
-        "UseDefaultDamageSettings": "Boolean",
-        "DamageCreationList": "DamageCreationList",
-        "HealingBuffFx": "FXList",
-        "DamagedAttributeModifier": "String",
-        "ReallyDamagedAttributeModifier": "String",
-        "CheerRadius": "FloatingPoint",
-        "RemoveUpgradesOnDeath": "Boolean",
-        "BurningDeathBehavior": "Boolean",
-        "BurningDeathFX": "FXList",
-        "DamageWeaponTemplate": "Weapon",
-        "CrushDamageWeaponTemplate": "Weapon",
-        "CrusherLevelResisted": "SignedInteger"
-    },
-    "OathbreakerBody": {
-        "MaxHealth": "FloatingPoint",
-        "MaxHealthDamaged": "FloatingPoint",
-        "MaxHealthReallyDamaged": "FloatingPoint",
-        "InitialHealth": "FloatingPoint",
-        "RecoveryTime": "UnsignedInteger",
-        "DodgePercent": "Percentage",
-        "EnteringDamagedTransitionTime": "UnsignedInteger",
-        "EnteringReallyDamagedTransitionTime": "UnsignedInteger",
-        "GrabObject": "String",
-        "GrabFX": "FXList",
-        "GrabDamage": "FloatingPoint",
-        "GrabOffset": "Vector2",
-        "UseDefaultDamageSettings": "Boolean",
-        "DamageCreationList": "DamageCreationList",
-        "HealingBuffFx": "FXList",
-        "DamagedAttributeModifier": "String",
-        "ReallyDamagedAttributeModifier": "String",
-        "CheerRadius": "FloatingPoint",
-        "RemoveUpgradesOnDeath": "Boolean",
-        "BurningDeathBehavior": "Boolean",
-        "BurningDeathFX": "FXList"
-    },
-    "DetachableRiderBody": {
-        "MaxHealth": "FloatingPoint",
-        "MaxHealthDamaged": "FloatingPoint",
-        "MaxHealthReallyDamaged": "FloatingPoint",
-        "InitialHealth": "FloatingPoint",
-        "RecoveryTime": "UnsignedInteger",
-        "DodgePercent": "Percentage",
-        "EnteringDamagedTransitionTime": "UnsignedInteger",
-        "EnteringReallyDamagedTransitionTime": "UnsignedInteger",
-        "GrabObject": "String",
-        "GrabFX": "FXList",
-        "GrabDamage": "FloatingPoint",
-        "GrabOffset": "Vector2",
-        "UseDefaultDamageSettings": "Boolean",
-        "DamageCreationList": "DamageCreationList",
-        "HealingBuffFx": "FXList",
-        "DamagedAttributeModifier": "String",
-        "ReallyDamagedAttributeModifier": "String",
-        "CheerRadius": "FloatingPoint",
-        "RemoveUpgradesOnDeath": "Boolean",
-        "BurningDeathBehavior": "Boolean",
-        "BurningDeathFX": "FXList",
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "HealthPercentageWhenRiderDies": "Percentage",
-        "StartsActive": "Boolean",
-        "RiderlessDeathChance": "Percentage"
-    },
-    "FreeLifeBody": {
-        "PermanentlyKilledByFilter": "ObjectFilter",
-        "CanRespawn": "Boolean",
-        "FreeLifeHealthPercent": "Percentage",
-        "FreeLifeTime": "UnsignedInteger",
-        "FreeLifeInvincible": "Boolean",
-        "FreeLifePrerequisiteUpgrade": "Upgrade",
-        "FreeLifeAnimAndDuration": "AnimAndDuration"
-    },
-    "DelayedDeathBody": {
-        "PermanentlyKilledByFilter": "ObjectFilter",
-        "CanRespawn": "Boolean",
-        "DelayedDeathTime": "UnsignedInteger",
-        "ImmortalUntilDeathTime": "Boolean",
-        "DoHealthCheck": "Boolean",
-        "InvulnerableFX": "FXList",
-        "DelayedDeathPrerequisiteUpgrade": "Upgrade"
-    },
-    "SymbioticStructuresBody": {
-        "MaxHealth": "FloatingPoint",
-        "MaxHealthDamaged": "FloatingPoint",
-        "MaxHealthReallyDamaged": "FloatingPoint",
-        "InitialHealth": "FloatingPoint",
-        "RecoveryTime": "UnsignedInteger",
-        "DodgePercent": "Percentage",
-        "EnteringDamagedTransitionTime": "UnsignedInteger",
-        "EnteringReallyDamagedTransitionTime": "UnsignedInteger",
-        "GrabObject": "String",
-        "GrabFX": "FXList",
-        "GrabDamage": "FloatingPoint",
-        "GrabOffset": "Vector2",
-        "UseDefaultDamageSettings": "Boolean",
-        "DamageCreationList": "DamageCreationList",
-        "HealingBuffFx": "FXList",
-        "DamagedAttributeModifier": "String",
-        "ReallyDamagedAttributeModifier": "String",
-        "CheerRadius": "FloatingPoint",
-        "RemoveUpgradesOnDeath": "Boolean",
-        "BurningDeathBehavior": "Boolean",
-        "BurningDeathFX": "FXList",
-        "Symbiote": "String"
-    },
-    "StructureBody": {
-        "MaxHealth": "FloatingPoint",
-        "MaxHealthDamaged": "FloatingPoint",
-        "MaxHealthReallyDamaged": "FloatingPoint",
-        "InitialHealth": "FloatingPoint",
-        "RecoveryTime": "UnsignedInteger",
-        "DodgePercent": "Percentage",
-        "EnteringDamagedTransitionTime": "UnsignedInteger",
-        "EnteringReallyDamagedTransitionTime": "UnsignedInteger",
-        "GrabObject": "String",
-        "GrabFX": "FXList",
-        "GrabDamage": "FloatingPoint",
-        "GrabOffset": "Vector2",
-        "UseDefaultDamageSettings": "Boolean",
-        "DamageCreationList": "DamageCreationList",
-        "HealingBuffFx": "FXList",
-        "DamagedAttributeModifier": "String",
-        "ReallyDamagedAttributeModifier": "String",
-        "CheerRadius": "FloatingPoint",
-        "RemoveUpgradesOnDeath": "Boolean",
-        "BurningDeathBehavior": "Boolean",
-        "BurningDeathFX": "FXList"
-    },
-    "ImmortalBody": {
-        "MaxHealth": "FloatingPoint",
-        "MaxHealthDamaged": "FloatingPoint",
-        "MaxHealthReallyDamaged": "FloatingPoint",
-        "InitialHealth": "FloatingPoint",
-        "RecoveryTime": "UnsignedInteger",
-        "DodgePercent": "Percentage",
-        "EnteringDamagedTransitionTime": "UnsignedInteger",
-        "EnteringReallyDamagedTransitionTime": "UnsignedInteger",
-        "GrabObject": "String",
-        "GrabFX": "FXList",
-        "GrabDamage": "FloatingPoint",
-        "GrabOffset": "Vector2",
-        "UseDefaultDamageSettings": "Boolean",
-        "DamageCreationList": "DamageCreationList",
-        "HealingBuffFx": "FXList",
-        "DamagedAttributeModifier": "String",
-        "ReallyDamagedAttributeModifier": "String",
-        "CheerRadius": "FloatingPoint",
-        "RemoveUpgradesOnDeath": "Boolean",
-        "BurningDeathBehavior": "Boolean",
-        "BurningDeathFX": "FXList"
-    },
-    "HighlanderBody": {
-        "MaxHealth": "FloatingPoint",
-        "MaxHealthDamaged": "FloatingPoint",
-        "MaxHealthReallyDamaged": "FloatingPoint",
-        "InitialHealth": "FloatingPoint",
-        "RecoveryTime": "UnsignedInteger",
-        "DodgePercent": "Percentage",
-        "EnteringDamagedTransitionTime": "UnsignedInteger",
-        "EnteringReallyDamagedTransitionTime": "UnsignedInteger",
-        "GrabObject": "String",
-        "GrabFX": "FXList",
-        "GrabDamage": "FloatingPoint",
-        "GrabOffset": "Vector2",
-        "UseDefaultDamageSettings": "Boolean",
-        "DamageCreationList": "DamageCreationList",
-        "HealingBuffFx": "FXList",
-        "DamagedAttributeModifier": "String",
-        "ReallyDamagedAttributeModifier": "String",
-        "CheerRadius": "FloatingPoint",
-        "RemoveUpgradesOnDeath": "Boolean",
-        "BurningDeathBehavior": "Boolean",
-        "BurningDeathFX": "FXList"
-    },
-    "ActiveBody": {
-        "MaxHealth": "FloatingPoint",
-        "MaxHealthDamaged": "FloatingPoint",
-        "MaxHealthReallyDamaged": "FloatingPoint",
-        "InitialHealth": "FloatingPoint",
-        "RecoveryTime": "UnsignedInteger",
-        "DodgePercent": "Percentage",
-        "EnteringDamagedTransitionTime": "UnsignedInteger",
-        "EnteringReallyDamagedTransitionTime": "UnsignedInteger",
-        "GrabObject": "String",
-        "GrabFX": "FXList",
-        "GrabDamage": "FloatingPoint",
-        "GrabOffset": "Vector2",
-        "UseDefaultDamageSettings": "Boolean",
-        "DamageCreationList": "DamageCreationList",
-        "HealingBuffFx": "FXList",
-        "DamagedAttributeModifier": "String",
-        "ReallyDamagedAttributeModifier": "String",
-        "CheerRadius": "FloatingPoint",
-        "RemoveUpgradesOnDeath": "Boolean",
-        "BurningDeathBehavior": "Boolean",
-        "BurningDeathFX": "FXList"
-    },
-    "InactiveBody": {},
-    "CivilianSpawnCollide": {
-        "DeleteObjectFilter": "ObjectFilter"
-    },
-    "SalvageCrateCollide": {
-        "RequiredKindOf": "KindofList",
-        "ForbiddenKindOf": "KindofList",
-        "ForbidOwnerPlayer": "Boolean",
-        "BuildingPickup": "Boolean",
-        "HumanOnly": "Boolean",
-        "PickupScience": "Unknown",
-        "ExecuteFX": "FXList",
-        "ExecuteAnimation": "String",
-        "ExecuteAnimationTime": "FloatingPoint",
-        "ExecuteAnimationZRise": "FloatingPoint",
-        "ExecuteAnimationFades": "Boolean",
-        "PorterChance": "Percentage",
-        "BannerChance": "Percentage",
-        "LevelUpChance": "Percentage",
-        "LevelUpRadius": "Percentage",
-        "ResourceChance": "Percentage",
-        "Upgrade": "String",
-        "MinResource": "SignedInteger",
-        "MaxResource": "SignedInteger",
-        "AllowAIPickup": "Boolean"
-    },
-    "VeterancyCrateCollide": {
-        "RequiredKindOf": "KindofList",
-        "ForbiddenKindOf": "KindofList",
-        "ForbidOwnerPlayer": "Boolean",
-        "BuildingPickup": "Boolean",
-        "HumanOnly": "Boolean",
-        "PickupScience": "Unknown",
-        "ExecuteFX": "FXList",
-        "ExecuteAnimation": "String",
-        "ExecuteAnimationTime": "FloatingPoint",
-        "ExecuteAnimationZRise": "FloatingPoint",
-        "ExecuteAnimationFades": "Boolean",
-        "EffectRange": "UnsignedInteger",
-        "AddsOwnerVeterancy": "Boolean",
-        "IsPilot": "Boolean",
-        "AffectsUpToLevel": "SignedInteger"
-    },
-    "UnitCrateCollide": {
-        "RequiredKindOf": "KindofList",
-        "ForbiddenKindOf": "KindofList",
-        "ForbidOwnerPlayer": "Boolean",
-        "BuildingPickup": "Boolean",
-        "HumanOnly": "Boolean",
-        "PickupScience": "Unknown",
-        "ExecuteFX": "FXList",
-        "ExecuteAnimation": "String",
-        "ExecuteAnimationTime": "FloatingPoint",
-        "ExecuteAnimationZRise": "FloatingPoint",
-        "ExecuteAnimationFades": "Boolean",
-        "UnitCount": "UnsignedInteger",
-        "UnitName": "String"
-    },
-    "ShroudCrateCollide": {},
-    "MoneyCrateCollide": {
-        "RequiredKindOf": "KindofList",
-        "ForbiddenKindOf": "KindofList",
-        "ForbidOwnerPlayer": "Boolean",
-        "BuildingPickup": "Boolean",
-        "HumanOnly": "Boolean",
-        "PickupScience": "Unknown",
-        "ExecuteFX": "FXList",
-        "ExecuteAnimation": "String",
-        "ExecuteAnimationTime": "FloatingPoint",
-        "ExecuteAnimationZRise": "FloatingPoint",
-        "ExecuteAnimationFades": "Boolean",
-        "MoneyProvided": "UnsignedInteger"
-    },
-    "HealCrateCollide": {
-        "RequiredKindOf": "KindofList",
-        "ForbiddenKindOf": "KindofList",
-        "ForbidOwnerPlayer": "Boolean",
-        "BuildingPickup": "Boolean",
-        "HumanOnly": "Boolean",
-        "PickupScience": "Unknown",
-        "ExecuteFX": "FXList",
-        "ExecuteAnimation": "String",
-        "ExecuteAnimationTime": "FloatingPoint",
-        "ExecuteAnimationZRise": "FloatingPoint",
-        "ExecuteAnimationFades": "Boolean"
-    },
-    "HordeMemberCollide": {},
-    "AODCrushCollide": {
-        "SmallFXList": "FXList",
-        "SmallObjectCreationList": "ObjectCreationList",
-        "MediumFXList": "FXList",
-        "MediumObjectCreationList": "ObjectCreationList",
-        "LargeFXList": "FXList",
-        "LargeObjectCreationList": "ObjectCreationList",
-        "Damage": "FloatingPoint",
-        "DamageType": "EnumDamageType",
-        "DeathType": "EnumDeathType",
-        "SpecialDamage": "FloatingPoint",
-        "SpecialDamageType": "EnumDamageType",
-        "SpecialDeathType": "EnumDeathType",
-        "SelfDamage": "FloatingPoint",
-        "SelfDamageType": "EnumDamageType",
-        "SelfDeathType": "EnumDeathType",
-        "SpecialObject": "ObjectFilter"
-    },
-    "SquishCollide": {},
-    "FireWeaponCollide": {
-        "CollideWeapon": "Weapon",
-        "FireOnce": "Boolean",
-        "RequiredStatus": "ObjectStatus",
-        "ForbiddenStatus": "ObjectStatus"
-    },
-    "CallHelpOnDamage": {
-        "DamageTypes": "DamageTypeFilter",
-        "CallRadius": "FloatingPoint",
-        "CallDelay": "UnsignedInteger",
-        "MoveToAttacker": "Boolean",
-        "ValidObjects": "ObjectFilter"
-    },
-    "HordeTransportContainDamage": {},
-    "EvacuateDamage": {
-        "WeaponThatCausesEvacuation": "Unknown",
-        "DamageTypeToTrack": "EnumDamageType",
-        "DamageToPanicThreshold": "Percentage",
-        "TrackingTimeSpan": "UnsignedInteger"
-    },
-    "ReflectDamage": {
-        "DamageTypesToReflect": "DamageTypeFilter",
-        "ReflectDamagePercentage": "Percentage",
-        "MinimumDamageToReflect": "FloatingPoint"
-    },
-    "TransitionDamageFX": {
-        "DamageFXTypes": "DamageTypeFilter",
-        "DamageOCLTypes": "DamageTypeFilter",
-        "DamageParticleTypes": "DamageTypeFilter",
-        "DamagedFXList1": "Unknown",
-        "DamagedFXList2": "Unknown",
-        "DamagedFXList3": "Unknown",
-        "DamagedFXList4": "Unknown",
-        "DamagedFXList5": "Unknown",
-        "DamagedFXList6": "Unknown",
-        "DamagedFXList7": "Unknown",
-        "DamagedFXList8": "Unknown",
-        "DamagedFXList9": "Unknown",
-        "DamagedFXList10": "Unknown",
-        "DamagedFXList11": "Unknown",
-        "DamagedFXList12": "Unknown",
-        "ReallyDamagedFXList1": "Unknown",
-        "ReallyDamagedFXList2": "Unknown",
-        "ReallyDamagedFXList3": "Unknown",
-        "ReallyDamagedFXList4": "Unknown",
-        "ReallyDamagedFXList5": "Unknown",
-        "ReallyDamagedFXList6": "Unknown",
-        "ReallyDamagedFXList7": "Unknown",
-        "ReallyDamagedFXList8": "Unknown",
-        "ReallyDamagedFXList9": "Unknown",
-        "ReallyDamagedFXList10": "Unknown",
-        "ReallyDamagedFXList11": "Unknown",
-        "ReallyDamagedFXList12": "Unknown",
-        "RubbleFXList1": "Unknown",
-        "RubbleFXList2": "Unknown",
-        "RubbleFXList3": "Unknown",
-        "RubbleFXList4": "Unknown",
-        "RubbleFXList5": "Unknown",
-        "RubbleFXList6": "Unknown",
-        "RubbleFXList7": "Unknown",
-        "RubbleFXList8": "Unknown",
-        "RubbleFXList9": "Unknown",
-        "RubbleFXList10": "Unknown",
-        "RubbleFXList11": "Unknown",
-        "RubbleFXList12": "Unknown",
-        "DamagedOCL1": "Unknown",
-        "DamagedOCL2": "Unknown",
-        "DamagedOCL3": "Unknown",
-        "DamagedOCL4": "Unknown",
-        "DamagedOCL5": "Unknown",
-        "DamagedOCL6": "Unknown",
-        "DamagedOCL7": "Unknown",
-        "DamagedOCL8": "Unknown",
-        "DamagedOCL9": "Unknown",
-        "DamagedOCL10": "Unknown",
-        "DamagedOCL11": "Unknown",
-        "DamagedOCL12": "Unknown",
-        "ReallyDamagedOCL1": "Unknown",
-        "ReallyDamagedOCL2": "Unknown",
-        "ReallyDamagedOCL3": "Unknown",
-        "ReallyDamagedOCL4": "Unknown",
-        "ReallyDamagedOCL5": "Unknown",
-        "ReallyDamagedOCL6": "Unknown",
-        "ReallyDamagedOCL7": "Unknown",
-        "ReallyDamagedOCL8": "Unknown",
-        "ReallyDamagedOCL9": "Unknown",
-        "ReallyDamagedOCL10": "Unknown",
-        "ReallyDamagedOCL11": "Unknown",
-        "ReallyDamagedOCL12": "Unknown",
-        "RubbleOCL1": "Unknown",
-        "RubbleOCL2": "Unknown",
-        "RubbleOCL3": "Unknown",
-        "RubbleOCL4": "Unknown",
-        "RubbleOCL5": "Unknown",
-        "RubbleOCL6": "Unknown",
-        "RubbleOCL7": "Unknown",
-        "RubbleOCL8": "Unknown",
-        "RubbleOCL9": "Unknown",
-        "RubbleOCL10": "Unknown",
-        "RubbleOCL11": "Unknown",
-        "RubbleOCL12": "Unknown",
-        "DamagedParticleSystem1": "Unknown",
-        "DamagedParticleSystem2": "Unknown",
-        "DamagedParticleSystem3": "Unknown",
-        "DamagedParticleSystem4": "Unknown",
-        "DamagedParticleSystem5": "Unknown",
-        "DamagedParticleSystem6": "Unknown",
-        "DamagedParticleSystem7": "Unknown",
-        "DamagedParticleSystem8": "Unknown",
-        "DamagedParticleSystem9": "Unknown",
-        "DamagedParticleSystem10": "Unknown",
-        "DamagedParticleSystem11": "Unknown",
-        "DamagedParticleSystem12": "Unknown",
-        "ReallyDamagedParticleSystem1": "Unknown",
-        "ReallyDamagedParticleSystem2": "Unknown",
-        "ReallyDamagedParticleSystem3": "Unknown",
-        "ReallyDamagedParticleSystem4": "Unknown",
-        "ReallyDamagedParticleSystem5": "Unknown",
-        "ReallyDamagedParticleSystem6": "Unknown",
-        "ReallyDamagedParticleSystem7": "Unknown",
-        "ReallyDamagedParticleSystem8": "Unknown",
-        "ReallyDamagedParticleSystem9": "Unknown",
-        "ReallyDamagedParticleSystem10": "Unknown",
-        "ReallyDamagedParticleSystem11": "Unknown",
-        "ReallyDamagedParticleSystem12": "Unknown",
-        "RubbleParticleSystem1": "Unknown",
-        "RubbleParticleSystem2": "Unknown",
-        "RubbleParticleSystem3": "Unknown",
-        "RubbleParticleSystem4": "Unknown",
-        "RubbleParticleSystem5": "Unknown",
-        "RubbleParticleSystem6": "Unknown",
-        "RubbleParticleSystem7": "Unknown",
-        "RubbleParticleSystem8": "Unknown",
-        "RubbleParticleSystem9": "Unknown",
-        "RubbleParticleSystem10": "Unknown",
-        "RubbleParticleSystem11": "Unknown",
-        "RubbleParticleSystem12": "Unknown",
-        "RubbleNeighbor": "Unknown",
-        "PristineShowSubObject": "Strings",
-        "PristineHideSubObject": "Strings",
-        "DamagedShowSubObject": "Strings",
-        "DamagedHideSubObject": "Strings",
-        "ReallyDamagedShowSubObject": "Strings",
-        "ReallyDamagedHideSubObject": "Strings",
-        "RubbleShowSubObject": "Strings",
-        "RubbleHideSubObject": "Strings"
-    },
-    "BoneFXDamage": {},
-    "InheritUpgradeCreate": {
-        "Radius": "FloatingPoint",
-        "Upgrade": "Upgrades",
-        "ObjectFilter": "ObjectFilter"
-    },
-    "ExperienceLevelCreate": {
-        "LevelToGrant": "SignedInteger",
-        "MPOnly": "Boolean"
-    },
-    "GrantUpgradeCreate": {
-        "UpgradeToGrant": "String",
-        "ExemptStatus": "ObjectStatus",
-        "GiveOnBuildComplete": "Boolean"
-    },
-    "SpecialPowerCreate": {},
-    "SupplyWarehouseCreate": {},
-    "SupplyCenterCreate": {},
-    "SpawnedModelConditionCreate": {
-        "SpawnerTrigger": "Unknown"
-    },
-    "PreorderCreate": {},
-    "LockWeaponCreate": {
-        "SlotToLock": "SlotTypes"
-    },
-    "ActivateModuleSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "TriggerSpecialPower": "Unknown"
-    },
-    "PillageModule": {
-        "PillageAmount": "UnsignedInteger",
-        "NumDamageEventsPerPillage": "UnsignedInteger",
-        "PillageFilter": "ObjectFilter"
-    },
-    "GiveOrRestoreUpgradeSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "CommandButton": "String",
-        "UpgradeToGive": "String",
-        "FlagsUsedForToggle": "WeaponsetFlags"
-    },
-    "CurseSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "TriggerFX": "FXList",
-        "CursedFX": "FXList",
-        "CursePercentage": "Percentage"
-    },
-    "EvacuateGarrisonSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint"
-    },
-    "UnleashSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint"
-    },
-    "StoreObjectsSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "Radius": "FloatingPoint"
-    },
-    "TemporarilyDefectUpdate": {
-        "DefectDuration": "UnsignedInteger"
-    },
-    "TeleportToCasterSpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "Radius": "FloatingPoint",
-        "MinDestinationRadius": "FloatingPoint",
-        "MaxDestinationRadius": "FloatingPoint",
-        "TriggerFX": "FXList",
-        "TargetFX": "FXList"
-    },
-    "DominateEnemySpecialPower": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "DominateRadius": "FloatingPoint",
-        "TriggerFX": "FXList",
-        "DominatedFX": "FXList",
-        "PermanentlyConvert": "Boolean",
-        "AttributeModifierAffects": "ObjectFilter"
-    },
-    "PassiveAreaEffectBehavior": {
-        "EffectRadius": "FloatingPoint",
-        "PingDelay": "UnsignedInteger",
-        "HealPercentPerSecond": "Percentage",
-        "ModifierName": "Strings",
-        "AllowFilter": "ObjectFilter",
-        "UpgradeRequired": "String",
-        "NonStackable": "Boolean",
-        "AntiCategories": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "HealFX": "FXList"
-    },
-    "CommandPointsUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "CommandPoints": "SignedInteger",
-        "RequiredObject": "ObjectFilter"
-    },
-    "AllowBannerSpawnUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean"
-    },
-    "BuildableHeroListUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean"
-    },
-    "RemoveUpgradeUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "UpgradeToRemove": "Strings",
-        "UpgradeGroupsToRemove": "Strings",
-        "SuppressEvaEventForRemoval": "Boolean",
-        "RemoveFromAllPlayerObjects": "Boolean"
-    },
-    "AudioLoopUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees",
-        "SoundToPlay": "AudioEvent",
-        "KillAfterMS": "UnsignedInteger",
-        "KillOnDeath": "Boolean"
-    },
-    "TooltipUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "DisplayName": "String",
-        "Description": "String"
-    },
-    "GarrisonUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean"
-    },
-    "ReplaceSelfUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "ReplaceWith": "Strings",
-        "AndThenAddA": "Strings"
-    },
-    "GeometryUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "ShowGeometry": "Strings",
-        "HideGeometry": "Strings",
-        "WallBoundsMesh": "String",
-        "RampMesh1": "String",
-        "RampMesh2": "String"
-    },
-    "CastleUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "Upgrade": "String",
-        "WallUpgradeRadius": "FloatingPoint"
-    },
-    "AttributeModifierUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "AttributeModifier": "String"
-    },
-    "ModelConditionUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "AddConditionFlags": "ConditionFlags",
-        "RemoveConditionFlags": "ConditionFlags",
-        "RemoveConditionFlagsInRange": "ModelConditionFlagRange",
-        "AddTempConditionFlag": "ModelConditionFlag",
-        "TempConditionTime": "FloatingPoint"
-    },
-    "MaxHealthUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "AddMaxHealth": "FloatingPoint",
-        "ChangeType": "HealthOperation"
-    },
-    "ExperienceScalarUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "AddXPScalar": "FloatingPoint"
-    },
-    "WeaponSetUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "WeaponCondition": "WeaponsetFlags"
-    },
-    "WeaponBonusUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean"
-    },
-    "UnpauseSpecialPowerUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "SpecialPowerTemplate": "SpecialPower",
-        "ObeyRechageOnTrigger": "Boolean"
-    },
-    "ObjectCreationUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "UpgradeObject": "ObjectCreationList",
-        "Delay": "UnsignedInteger",
-        "RemoveUpgrade": "String",
-        "GrantUpgrade": "String",
-        "ThingToSpawn": "String",
-        "Offset": "Vector3",
-        "Angle": "Degrees",
-        "DestroyWhenSold": "Boolean",
-        "DeathAnimAndDuration": "AnimAndDuration",
-        "FadeInTime": "UnsignedInteger",
-        "UseBuildingProduction": "Boolean"
-    },
-    "LocomotorSetUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "KillLocomotorUpgrade": "Boolean"
-    },
-    "RadarUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "DisableProof": "Boolean"
-    },
-    "StealthUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean"
-    },
-    "SubObjectsUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "ShowSubObjects": "Strings",
-        "HideSubObjects": "Strings",
-        "UpgradeTexture": "TextureReplacement",
-        "FadeTimeInSeconds": "FloatingPoint",
-        "WaitBeforeFadeInSeconds": "FloatingPoint",
-        "RecolorHouse": "Boolean",
-        "ExcludeSubobjects": "Strings",
-        "SkipFadeOnCreate": "Boolean",
-        "HideSubObjectsOnRemove": "Boolean",
-        "UnHideSubObjectsOnRemove": "Boolean"
-    },
-    "DoCommandUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "GetUpgradeCommandButtonName": "String",
-        "RemoveUpgradeCommandButtonName": "String"
-    },
-    "StatusBitsUpgradeIfEldestKindof": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "StatusToSet": "ObjectStatus",
-        "StatusToClear": "ObjectStatus",
-        "ObjectFilter": "ObjectFilter"
-    },
-    "StatusBitsUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "StatusToSet": "ObjectStatus",
-        "StatusToClear": "ObjectStatus"
-    },
-    "LevelUpUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "LevelsToGain": "SignedInteger",
-        "LevelCap": "SignedInteger"
-    },
-    "DelayedUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "DelayTime": "UnsignedInteger"
-    },
-    "CommandSetUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "CommandSet": "String"
-    },
-    "BaseUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "BuildingTemplateName": "String",
-        "PlacementPrefix": "String",
-        "PlacementIndex": "SignedInteger"
-    },
-    "SpellRechargeModifierUpgrade": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "Percentage": "Percentage",
-        "StartsActive": "Boolean",
-        "LabelForPalantirString": "String",
-        "ObjectFilter": "ObjectFilter",
-        "UpgradeDiscount": "Boolean",
-        "ApplyToTheseUpgrades": "Strings",
-        "Slaughter": "Boolean"
-    },
-    "AISpecialPowerUpdate": {
-        "CommandButtonName": "String",
-        "SpecialPowerAIType": "Unknown",
-        "SpecialPowerRadius": "FloatingPoint",
-        "SpecialPowerRange": "FloatingPoint",
-        "RandomizeTargetLocation": "Boolean",
-        "SpellMakesAStructure": "Boolean"
-    },
-    "ReplaceObjectUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "ReplaceObject": "Unknown",
-        "ReplaceRadius": "FloatingPoint",
-        "ReplaceFX": "FXList",
-        "Scatter": "Boolean"
-    },
-    "ProjectileStreamUpdate": {},
-    "ThreatFinderUpdate": {
-        "DefaultRadius": "FloatingPoint"
-    },
-    "EmotionTrackerUpdate": {
-        "TauntAndPointDistance": "FloatingPoint",
-        "TauntAndPointUpdateDelay": "UnsignedInteger",
-        "TauntAndPointExcluded": "ObjectFilter",
-        "AfraidOf": "ObjectFilter",
-        "AlwaysAfraidOf": "ObjectFilter",
-        "PointAt": "ObjectFilter",
-        "HeroScanDistance": "FloatingPoint",
-        "FearScanDistance": "FloatingPoint",
-        "QuarrelProbability": "Percentage",
-        "IgnoreVeterancy": "Boolean",
-        "ImmuneToFearLevel": "SignedInteger",
-        "AddEmotion": "Unknown"
-    },
-    "SpecialDisguiseUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "OpacityTarget": "FloatingPoint",
-        "TriggerInstantlyOnCreate": "Boolean",
-        "DisguiseAsTemplate": "String",
-        "DisguisedAsTemplate_EnemyPerspec": "String",
-        "DisguiseFX": "FXList",
-        "ForceMountedWhenDisguising": "Boolean"
-    },
-    "AttributeModifierPoolUpdate": {},
-    "BloodthirstyUpdate": {
-        "SacrificeFilter": "ObjectFilter",
-        "ExperienceModifier": "FloatingPoint",
-        "InitiateVoice": "AudioEvent"
-    },
-    "RespawnUpdate": {
-        "DeathAnim": "ConditionFlags",
-        "DeathFX": "FXList",
-        "DeathAnimationTime": "UnsignedInteger",
-        "InitialSpawnAnim": "ConditionFlags",
-        "InitialSpawnFX": "FXList",
-        "InitialSpawnAnimationTime": "UnsignedInteger",
-        "RespawnAnim": "ConditionFlags",
-        "RespawnFX": "FXList",
-        "RespawnAnimationTime": "UnsignedInteger",
-        "AutoRespawnAtObjectFilter": "ObjectFilter",
-        "RespawnRules": "Unknown",
-        "RespawnEntry": "Unknown",
-        "ButtonImage": "String",
-        "RespawnAsTemplate": "String"
-    },
-    "DetachableRiderUpdate": {
-        "RiderSubObjects": "Strings",
-        "RiderlessWeaponSlot": "SlotTypes",
-        "RiderlessHordeFlees": "Boolean",
-        "DeathEntry": "Unknown",
-        "RemoveRiderlessFromHorde": "Boolean"
-    },
-    "WallUpgradeUpdate": {},
-    "WorkerAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean",
-        "MaxBoxes": "SignedInteger",
-        "RepairHealthPercentPerSecond": "Percentage",
-        "BoredTime": "UnsignedInteger",
-        "BoredRange": "FloatingPoint",
-        "SupplyCenterActionDelay": "UnsignedInteger",
-        "SupplyWarehouseActionDelay": "UnsignedInteger",
-        "SupplyWarehouseScanDistance": "FloatingPoint",
-        "HarvestTrees": "Boolean",
-        "SuppliesDepletedVoice": "AudioEvent",
-        "HarvestActivationRange": "FloatingPoint",
-        "HarvestPreparationTime": "UnsignedInteger",
-        "HarvestActionTime": "UnsignedInteger"
-    },
-    "FoundationAIUpdate": {
-        "RepairHealthPercentPerSecond": "Percentage",
-        "BuildVariation": "SignedInteger"
-    },
-    "AnimalAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean",
-        "FleeRange": "SignedInteger",
-        "FleeDistance": "SignedInteger",
-        "WanderPercentage": "SignedInteger",
-        "MaxWanderDistance": "SignedInteger",
-        "MaxWanderRadius": "SignedInteger",
-        "UpdateTimer": "SignedInteger",
-        "AfraidOfCastles": "Boolean"
-    },
-    "WanderAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean",
-        "WildBeast": "Boolean",
-        "ConditionForEntry": "ContainCondition",
-        "Selectable": "Boolean",
-        "WanderDistance": "UnsignedInteger"
-    },
-    "TransportAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean"
-    },
-    "RadarUpdate": {
-        "RadarExtendTime": "UnsignedInteger"
-    },
-    "BoneFXUpdate": {
-        "DamageFXTypes": "DamageTypeFilter",
-        "DamageOCLTypes": "DamageTypeFilter",
-        "DamageParticleTypes": "DamageTypeFilter",
-        "PristineFXList1": "Unknown",
-        "PristineFXList2": "Unknown",
-        "PristineFXList3": "Unknown",
-        "PristineFXList4": "Unknown",
-        "PristineFXList5": "Unknown",
-        "PristineFXList6": "Unknown",
-        "PristineFXList7": "Unknown",
-        "PristineFXList8": "Unknown",
-        "DamagedFXList1": "Unknown",
-        "DamagedFXList2": "Unknown",
-        "DamagedFXList3": "Unknown",
-        "DamagedFXList4": "Unknown",
-        "DamagedFXList5": "Unknown",
-        "DamagedFXList6": "Unknown",
-        "DamagedFXList7": "Unknown",
-        "DamagedFXList8": "Unknown",
-        "ReallyDamagedFXList1": "Unknown",
-        "ReallyDamagedFXList2": "Unknown",
-        "ReallyDamagedFXList3": "Unknown",
-        "ReallyDamagedFXList4": "Unknown",
-        "ReallyDamagedFXList5": "Unknown",
-        "ReallyDamagedFXList6": "Unknown",
-        "ReallyDamagedFXList7": "Unknown",
-        "ReallyDamagedFXList8": "Unknown",
-        "RubbleFXList1": "Unknown",
-        "RubbleFXList2": "Unknown",
-        "RubbleFXList3": "Unknown",
-        "RubbleFXList4": "Unknown",
-        "RubbleFXList5": "Unknown",
-        "RubbleFXList6": "Unknown",
-        "RubbleFXList7": "Unknown",
-        "RubbleFXList8": "Unknown",
-        "PristineOCL1": "Unknown",
-        "PristineOCL2": "Unknown",
-        "PristineOCL3": "Unknown",
-        "PristineOCL4": "Unknown",
-        "PristineOCL5": "Unknown",
-        "PristineOCL6": "Unknown",
-        "PristineOCL7": "Unknown",
-        "PristineOCL8": "Unknown",
-        "DamagedOCL1": "Unknown",
-        "DamagedOCL2": "Unknown",
-        "DamagedOCL3": "Unknown",
-        "DamagedOCL4": "Unknown",
-        "DamagedOCL5": "Unknown",
-        "DamagedOCL6": "Unknown",
-        "DamagedOCL7": "Unknown",
-        "DamagedOCL8": "Unknown",
-        "ReallyDamagedOCL1": "Unknown",
-        "ReallyDamagedOCL2": "Unknown",
-        "ReallyDamagedOCL3": "Unknown",
-        "ReallyDamagedOCL4": "Unknown",
-        "ReallyDamagedOCL5": "Unknown",
-        "ReallyDamagedOCL6": "Unknown",
-        "ReallyDamagedOCL7": "Unknown",
-        "ReallyDamagedOCL8": "Unknown",
-        "RubbleOCL1": "Unknown",
-        "RubbleOCL2": "Unknown",
-        "RubbleOCL3": "Unknown",
-        "RubbleOCL4": "Unknown",
-        "RubbleOCL5": "Unknown",
-        "RubbleOCL6": "Unknown",
-        "RubbleOCL7": "Unknown",
-        "RubbleOCL8": "Unknown",
-        "PristineParticleSystem1": "Unknown",
-        "PristineParticleSystem2": "Unknown",
-        "PristineParticleSystem3": "Unknown",
-        "PristineParticleSystem4": "Unknown",
-        "PristineParticleSystem5": "Unknown",
-        "PristineParticleSystem6": "Unknown",
-        "PristineParticleSystem7": "Unknown",
-        "PristineParticleSystem8": "Unknown",
-        "DamagedParticleSystem1": "Unknown",
-        "DamagedParticleSystem2": "Unknown",
-        "DamagedParticleSystem3": "Unknown",
-        "DamagedParticleSystem4": "Unknown",
-        "DamagedParticleSystem5": "Unknown",
-        "DamagedParticleSystem6": "Unknown",
-        "DamagedParticleSystem7": "Unknown",
-        "DamagedParticleSystem8": "Unknown",
-        "ReallyDamagedParticleSystem1": "Unknown",
-        "ReallyDamagedParticleSystem2": "Unknown",
-        "ReallyDamagedParticleSystem3": "Unknown",
-        "ReallyDamagedParticleSystem4": "Unknown",
-        "ReallyDamagedParticleSystem5": "Unknown",
-        "ReallyDamagedParticleSystem6": "Unknown",
-        "ReallyDamagedParticleSystem7": "Unknown",
-        "ReallyDamagedParticleSystem8": "Unknown",
-        "RubbleParticleSystem1": "Unknown",
-        "RubbleParticleSystem2": "Unknown",
-        "RubbleParticleSystem3": "Unknown",
-        "RubbleParticleSystem4": "Unknown",
-        "RubbleParticleSystem5": "Unknown",
-        "RubbleParticleSystem6": "Unknown",
-        "RubbleParticleSystem7": "Unknown",
-        "RubbleParticleSystem8": "Unknown"
-    },
-    "RubbleRiseUpdate": {
-        "MinRubbleRiseDelay": "UnsignedInteger",
-        "MaxRubbleRiseDelay": "UnsignedInteger",
-        "MinBurstDelay": "UnsignedInteger",
-        "MaxBurstDelay": "UnsignedInteger",
-        "RubbleRiseDamping": "FloatingPoint",
-        "RubbleHeight": "FloatingPoint",
-        "MaxShudder": "FloatingPoint",
-        "BigBurstFrequency": "SignedInteger",
-        "OCL": "Unknown",
-        "FXList": "Unknown",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees"
-    },
-    "StructureCollapseUpdate": {
-        "MinCollapseDelay": "UnsignedInteger",
-        "MaxCollapseDelay": "UnsignedInteger",
-        "MinBurstDelay": "UnsignedInteger",
-        "MaxBurstDelay": "UnsignedInteger",
-        "CollapseDamping": "FloatingPoint",
-        "MaxShudder": "FloatingPoint",
-        "BigBurstFrequency": "SignedInteger",
-        "OCL": "Unknown",
-        "FXList": "Unknown",
-        "DestroyObjectWhenDone": "Boolean",
-        "CollapseHeight": "FloatingPoint",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees"
-    },
-    "StructureToppleUpdate": {
-        "MinToppleDelay": "UnsignedInteger",
-        "MaxToppleDelay": "UnsignedInteger",
-        "MinToppleBurstDelay": "UnsignedInteger",
-        "MaxToppleBurstDelay": "UnsignedInteger",
-        "ToppleAccelerationFactor": "FloatingPoint",
-        "StructuralIntegrity": "FloatingPoint",
-        "StructuralDecay": "FloatingPoint",
-        "DamageFXTypes": "DamageTypeFilter",
-        "TopplingFX": "FXList",
-        "ToppleDelayFX": "FXList",
-        "ToppleStartFX": "FXList",
-        "ToppleDoneFX": "FXList",
-        "CrushingFX": "FXList",
-        "CrushingWeaponName": "String",
-        "ForceToppleAngle": "FloatingPoint",
-        "OCL": "Unknown",
-        "AngleFX": "Unknown",
-        "DeathTypes": "DeathTypeFilter",
-        "ExemptStatus": "ObjectStatus",
-        "RequiredStatus": "ObjectStatus",
-        "DamageAmountRequired": "FloatingPoint",
-        "MinKillerAngle": "Degrees",
-        "MaxKillerAngle": "Degrees"
-    },
-    "FadeAndDieOrnamentUpdate": {
-        "AttachToTargetBone": "String",
-        "Envelope": "Unknown",
-        "FollowTarget": "Unknown"
-    },
-    "HijackerUpdate": {
-        "AttachToTargetBone": "String"
-    },
-    "ProneUpdate": {
-        "DamageToFramesRatio": "FloatingPoint"
-    },
-    "ProductionUpdate": {
-        "MaxQueueEntries": "UnsignedInteger",
-        "NumDoorAnimations": "SignedInteger",
-        "DoorOpeningTime": "UnsignedInteger",
-        "DoorWaitOpenTime": "UnsignedInteger",
-        "DoorCloseTime": "UnsignedInteger",
-        "ConstructionCompleteDuration": "UnsignedInteger",
-        "GiveNoXP": "Boolean",
-        "UnitInvulnerableTime": "UnsignedInteger",
-        "SpecialPrepModelconditionTime": "UnsignedInteger",
-        "VeteranUnitsFromVeteranFactory": "Boolean",
-        "SetBonusModelConditionOnSpeedBon": "Boolean",
-        "BonusForType": "String",
-        "SpeedBonusAudioLoop": "AudioEvent",
-        "SecondaryQueue": "Boolean"
-    },
-    "GloriousChargeUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "BonusRadius": "FloatingPoint",
-        "SpeechDuration": "UnsignedInteger",
-        "UpdateInterval": "UnsignedInteger"
-    },
-    "RousingSpeechUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "BonusRadius": "FloatingPoint",
-        "SpeechDuration": "UnsignedInteger",
-        "UpdateInterval": "UnsignedInteger",
-        "LeaderFX": "FXList",
-        "FollowerFX": "FXList",
-        "CreateWave": "Boolean",
-        "WaveWidth": "FloatingPoint",
-        "ModifierName": "Strings",
-        "LevelUp": "Boolean",
-        "ObjectFilter": "ObjectFilter"
-    },
-    "DozerAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean",
-        "RepairHealthPercentPerSecond": "Percentage",
-        "BoredTime": "UnsignedInteger",
-        "BoredRange": "FloatingPoint"
-    },
-    "MonsterDockUpdate": {
-        "NumberApproachPositions": "SignedInteger",
-        "AllowsPassthrough": "Boolean",
-        "DockableObjectFilter": "ObjectFilter",
-        "DockedAnimationTime": "UnsignedInteger"
-    },
-    "SupplyWarehouseDockUpdate": {
-        "NumberApproachPositions": "SignedInteger",
-        "AllowsPassthrough": "Boolean",
-        "StartingBoxes": "SignedInteger",
-        "DeleteWhenEmpty": "Boolean"
-    },
-    "SupplyCenterDockUpdate": {
-        "NumberApproachPositions": "SignedInteger",
-        "AllowsPassthrough": "Boolean",
-        "ValueMultiplier": "FloatingPoint",
-        "BonusScience": "Unknown",
-        "BonusScienceMultiplier": "Percentage"
-    },
-    "SupplyCenterProductionExitUpdate": {
-        "UnitCreatePoint": "Vector3",
-        "NaturalRallyPoint": "Vector3"
-    },
-    "SpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint"
-    },
-    "RadiateFearUpdate": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "InitiallyActive": "Boolean",
-        "WhichSpecialPower": "SignedInteger",
-        "GenerateTerror": "Boolean",
-        "GenerateFear": "Boolean",
-        "GenerateUncontrollableFear": "Boolean",
-        "EmotionPulseRadiusl": "FloatingPoint",
-        "EmotionPulseInterval": "UnsignedInteger",
-        "VictimFilter": "ObjectFilter"
-    },
-    "AttributeModifierAuraUpdate": {
-        "TriggeredBy": "Upgrades",
-        "ConflictsWith": "Upgrades",
-        "RequiresAllTriggers": "Boolean",
-        "RequiresAllConflictingTriggers": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "Permanent": "Boolean",
-        "BonusName": "String",
-        "RefreshDelay": "UnsignedInteger",
-        "Range": "FloatingPoint",
-        "TargetEnemy": "Boolean",
-        "AllowPowerWhenAttacking": "Boolean",
-        "ObjectFilter": "ObjectFilter",
-        "StartsActive": "Boolean",
-        "RequiredConditions": "AModAuraConditions",
-        "AntiCategory": "AttributeModifierCategory",
-        "AntiFX": "FXList",
-        "AffectGood": "Boolean",
-        "AffectEvil": "Boolean",
-        "RunWhileDead": "Boolean",
-        "AllowSelf": "Boolean",
-        "AffectContainedOnly": "Boolean",
-        "MaxActiveRank": "SignedInteger"
-    },
-    "OCLUpdate": {
-        "OCL": "ObjectCreationList",
-        "MinDelay": "UnsignedInteger",
-        "MaxDelay": "UnsignedInteger",
-        "CreateAtEdge": "Boolean",
-        "Amount": "SignedInteger"
-    },
-    "SlavedUpdate": {
-        "LeashRange": "SignedInteger",
-        "GuardMaxRange": "SignedInteger",
-        "GuardWanderRange": "SignedInteger",
-        "AttackRange": "SignedInteger",
-        "AttackWanderRange": "SignedInteger",
-        "ScoutRange": "SignedInteger",
-        "ScoutWanderRange": "SignedInteger",
-        "RepairRange": "SignedInteger",
-        "RepairMinAltitude": "FloatingPoint",
-        "RepairMaxAltitude": "FloatingPoint",
-        "DistToTargetToGrantRangeBonus": "SignedInteger",
-        "RepairRatePerSecond": "FloatingPoint",
-        "RepairWhenBelowHealth_": "SignedInteger",
-        "RepairMinReadyTime": "UnsignedInteger",
-        "RepairMaxReadyTime": "UnsignedInteger",
-        "RepairMinWeldTime": "UnsignedInteger",
-        "RepairMaxWeldTime": "UnsignedInteger",
-        "RepairWeldingSys": "String",
-        "RepairWeldingFXBone": "String",
-        "StayOnSameLayerAsMaster": "Boolean",
-        "UseSlaverAsControlForEvaObjectSightedEvents": "Boolean",
-        "DieOnMastersDeath": "Boolean",
-        "GuardPositionOffset": "Vector3",
-        "FadeOutRange": "SignedInteger",
-        "FadeTime": "UnsignedInteger",
-        "MarkUnselectable": "Boolean"
-    },
-    "SpawnPointProductionExitUpdate": {
-        "SpawnPointBoneName": "String"
-    },
-    "DefaultProductionExitUpdate": {
-        "UnitCreatePoint": "Vector3",
-        "NaturalRallyPoint": "Vector3"
-    },
-    "SummonReplacementSpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "WhichSpecialPower": "SignedInteger",
-        "GenerateTerror": "Boolean",
-        "GenerateUncontrollableFear": "Boolean",
-        "EmotionPulseRadius": "FloatingPoint",
-        "ObjectFilter": "ObjectFilter",
-        "OpacityTarget": "FloatingPoint",
-        "TriggerInstantlyOnCreate": "Boolean",
-        "CancelDisguiseWhenDismounting": "Boolean",
-        "MountedTemplate": "String",
-        "SynchronizeTimerOnSpecialPower": "Strings"
-    },
-    "PickupStuffUpdate": {
-        "SkirmishAIOnly": "Boolean",
-        "ScanRange": "FloatingPoint",
-        "StuffToPickUp": "ObjectFilter",
-        "ScanIntervalSeconds": "FloatingPoint"
-    },
-    "AttachUpdate": {
-        "ObjectFilter": "ObjectFilter",
-        "ScanRange": "FloatingPoint",
-        "ParentStatus": "ObjectStatus",
-        "AlwaysTeleport": "Boolean",
-        "AnchorToTopOfGeometry": "Boolean",
-        "ParentOwnerAttachmentEvaEvent": "EvaEvent",
-        "ParentAllyAttachmentEvaEvent": "EvaEvent",
-        "ParentEnemyAttachmentEvaEvent": "EvaEvent",
-        "AttachFX": "FXList",
-        "ParentOwnerDiedEvaEvent": "EvaEvent",
-        "ParentAllyDiedEvaEvent": "EvaEvent",
-        "ParentEnemyDiedtEvaEvent": "EvaEvent"
-    },
-    "HordeNotifyTargetsOfImminentProbableCrushingUpdate": {
-        "TimeBetweenUpdatesMS": "UnsignedInteger",
-        "ScanAheadTimeMS": "UnsignedInteger",
-        "ScanHeight": "FloatingPoint",
-        "ScanWidth": "FloatingPoint"
-    },
-    "NotifyTargetsOfImminentProbableCrushingUpdate": {
-        "TimeBetweenUpdatesMS": "UnsignedInteger",
-        "ScanAheadTimeMS": "UnsignedInteger",
-        "ScanHeight": "FloatingPoint",
-        "ScanWidth": "FloatingPoint"
-    },
-    "LargeGroupAudioUpdate": {
-        "TimeBetweenUpdatesMin": "UnsignedInteger",
-        "TimeBetweenUpdatesVariation": "UnsignedInteger",
-        "UnitWeight": "Unknown",
-        "Key": "Unknown"
-    },
-    "GiveUpgradeUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "GiveUpgradeEffect": "FXList",
-        "SpawnOutFX": "FXList",
-        "FadeOutSpeed": "FloatingPoint",
-        "DeliverUpgrade": "Boolean"
-    },
-    "FlingPassengerSpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "FlingPassengerVelocity": "Vector3",
-        "FlingPassengerLandingWarhead": "Weapon"
-    },
-    "ScaleWallSpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "DelayAtFootOfWall": "UnsignedInteger"
-    },
-    "WeaponSetSpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "WeaponsetEffectDuration": "UnsignedInteger",
-        "WhichWeaponSet": "SignedInteger"
-    },
-    "HeroModeSpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "HeroAttributeModifier": "String",
-        "HeroEffectDuration": "UnsignedInteger",
-        "UseUSERModelcondition": "Boolean",
-        "StopUnitBeforeActivating": "Boolean"
-    },
-    "TeleportSpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "HeroAttributeModifier": "String",
-        "HeroEffectDuration": "UnsignedInteger",
-        "UseUSERModelcondition": "Boolean",
-        "StopUnitBeforeActivating": "Boolean"
-    },
-    "WeaponFireSpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "SpecialWeapon": "String",
-        "WhichSpecialWeapon": "SignedInteger",
-        "SkipContinue": "Boolean",
-        "BusyForDuration": "UnsignedInteger",
-        "NeedLivingTargets": "Boolean",
-        "PlayWeaponPreFireFX": "Boolean"
-    },
-    "ToggleDeploySpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "SoundDeploy": "AudioEvent",
-        "SoundUndeploy": "AudioEvent"
-    },
-    "ToggleHiddenSpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "ShowPalantirTimer": "Boolean"
-    },
-    "ToggleMountedSpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "OpacityTarget": "FloatingPoint",
-        "TriggerInstantlyOnCreate": "Boolean",
-        "CancelDisguiseWhenDismounting": "Boolean",
-        "MountedTemplate": "String",
-        "SynchronizeTimerOnSpecialPower": "Strings"
-    },
-    "StrafeAreaUpdate": {
-        "WeaponName": "String",
-        "StrafeAreaRadius": "FloatingPoint",
-        "Sweepfrequency": "FloatingPoint",
-        "SweepAmplitude": "FloatingPoint",
-        "Slope": "FloatingPoint",
-        "InitialSweepPhase": "FloatingPoint"
-    },
-    "ModelConditionSpecialAbilityUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "WhichSpecialPower": "SignedInteger",
-        "GenerateTerror": "Boolean",
-        "GenerateUncontrollableFear": "Boolean",
-        "EmotionPulseRadius": "FloatingPoint",
-        "ObjectFilter": "ObjectFilter"
-    },
-    "WeaponModeSpecialPowerUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "InitiateSound": "AudioEvent",
-        "StartsPaused": "Boolean",
-        "Duration": "UnsignedInteger",
-        "AttributeModifier": "String",
-        "LockWeaponSlot": "SlotTypes",
-        "WeaponSetFlags": "WeaponsetFlags"
-    },
-    "ArrowStormUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "StartAbilityRange": "FloatingPoint",
-        "AbilityAbortRange": "FloatingPoint",
-        "PreparationTime": "UnsignedInteger",
-        "PersistentPrepTime": "UnsignedInteger",
-        "PersistentCount": "SignedInteger",
-        "PackTime": "UnsignedInteger",
-        "UnpackTime": "UnsignedInteger",
-        "PreTriggerUnstealthTime": "UnsignedInteger",
-        "SkipPackingWithNoTarget": "Boolean",
-        "PackUnpackVariationFactor": "FloatingPoint",
-        "ParalyzeDurationWhenCompleted": "UnsignedInteger",
-        "ParalyzeDurationWhenAborted": "UnsignedInteger",
-        "SpecialObject": "String",
-        "SpecialObjectAttachToBone": "String",
-        "MaxSpecialObjects": "UnsignedInteger",
-        "SpecialObjectsPersistent": "Boolean",
-        "EffectDuration": "UnsignedInteger",
-        "EffectValue": "SignedInteger",
-        "EffectRange": "FloatingPoint",
-        "UniqueSpecialObjectTargets": "Boolean",
-        "SpecialObjectsPersistWhenOwnerDies": "Boolean",
-        "AlwaysValidateSpecialObjects": "Boolean",
-        "FlipOwnerAfterPacking": "Boolean",
-        "FlipOwnerAfterUnpacking": "Boolean",
-        "FleeRangeAfterCompletion": "FloatingPoint",
-        "DisableFXParticleSystem": "ParticleSystem",
-        "DoCaptureFX": "Boolean",
-        "PackSound": "AudioEvent",
-        "UnpackSound": "AudioEvent",
-        "PrepSoundLoop": "AudioEvent",
-        "TriggerSound": "AudioEvent",
-        "ActiveLoopSound": "AudioEvent",
-        "LoseStealthOnTrigger": "Boolean",
-        "AwardXPForTriggering": "SignedInteger",
-        "SkillPointsForTriggering": "SignedInteger",
-        "ApproachRequiresLOS": "Boolean",
-        "ChargeAttackSpeedBoost": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerAnimAndDuration": "AnimAndDuration",
-        "GrabPassengerHealGainPercent": "FloatingPoint",
-        "UnpackingVariation": "SignedInteger",
-        "MustFinishAbility": "Boolean",
-        "FreezeAfterTriggerDuration": "UnsignedInteger",
-        "DisableWhenWearingTheRing": "Boolean",
-        "RequiredConditions": "SpecialPowerUnpackConditions",
-        "RejectedConditions": "SpecialPowerUnpackConditions",
-        "ContactPointOverride": "String",
-        "TriggerAttributeModifier": "String",
-        "AttributeModifierDuration": "UnsignedInteger",
-        "KillAttributeModifierOnExit": "Boolean",
-        "KillAttributeModifierOnRejected": "Boolean",
-        "Instant": "Boolean",
-        "NeedCollisionBeforeTrigger": "Boolean",
-        "ChainedButton": "String",
-        "SuppressForHordes": "Boolean",
-        "ApproachUntilMembersInRange": "Boolean",
-        "IgnoreFacingCheck": "Boolean",
-        "TriggerModelCondition": "ContainCondition",
-        "TriggerModelConditionDuration": "FloatingPoint",
-        "WeaponTemplate": "String",
-        "TargetRadius": "FloatingPoint",
-        "ShotsPerTarget": "SignedInteger",
-        "ShotsPerBurst": "SignedInteger",
-        "MaxShots": "SignedInteger",
-        "CanShootEmptyGround": "Boolean"
-    },
-    "RepairDockUpdate": {
-        "NumberApproachPositions": "SignedInteger",
-        "AllowsPassthrough": "Boolean",
-        "TimeForFullHeal": "UnsignedInteger"
-    },
-    "QueueProductionExitUpdate": {
-        "UnitCreatePoint": "Vector3",
-        "PlacementViewAngle": "Degrees",
-        "NaturalRallyPoint": "Vector3",
-        "ExitDelay": "UnsignedInteger",
-        "AllowAirborneCreation": "Boolean",
-        "InitialBurst": "UnsignedInteger",
-        "NoExitPath": "Boolean",
-        "CanRallyToSlaughter": "Boolean",
-        "UseReturnToFormation": "Boolean"
-    },
-    "GateProxyBehavior": {
-        "OpenByDefault": "Boolean",
-        "ResetTimeInMilliseconds": "UnsignedInteger",
-        "PercentOpenForPathing": "UnsignedInteger",
-        "Proxy": "String",
-        "RepelCollidingUnits": "Boolean",
-        "GeometryForOpen": "Strings",
-        "GeometryForClosed": "Strings",
-        "SoundOpeningGateLoop": "AudioEvent",
-        "SoundFinishedOpeningGate": "AudioEvent",
-        "SoundClosingGateLoop": "AudioEvent",
-        "SoundFinishedClosingGate": "AudioEvent",
-        "TimeBeforePlayingOpenSound": "UnsignedInteger",
-        "TimeBeforePlayingClosedSound": "UnsignedInteger"
-    },
-    "GateOpenAndCloseBehavior": {
-        "OpenByDefault": "Boolean",
-        "ResetTimeInMilliseconds": "UnsignedInteger",
-        "PercentOpenForPathing": "UnsignedInteger",
-        "Proxy": "String",
-        "RepelCollidingUnits": "Boolean",
-        "GeometryForOpen": "Strings",
-        "GeometryForClosed": "Strings",
-        "SoundOpeningGateLoop": "AudioEvent",
-        "SoundFinishedOpeningGate": "AudioEvent",
-        "SoundClosingGateLoop": "AudioEvent",
-        "SoundFinishedClosingGate": "AudioEvent",
-        "TimeBeforePlayingOpenSound": "UnsignedInteger",
-        "TimeBeforePlayingClosedSound": "UnsignedInteger"
-    },
-    "BattlePlanUpdate": {
-        "SpecialPowerTemplate": "SpecialPower",
-        "BombardmentPlanAnimationTime": "UnsignedInteger",
-        "HoldTheLinePlanAnimationTime": "UnsignedInteger",
-        "SearchAndDestroyPlanAnimationTime": "UnsignedInteger",
-        "TransitionIdleTime": "UnsignedInteger",
-        "BombardmentPlanUnpackSoundName": "AudioEvent",
-        "BombardmentPlanPackSoundName": "AudioEvent",
-        "BombardmentMessageLabel": "String",
-        "BombardmentAnnouncementName": "AudioEvent",
-        "SearchAndDestroyPlanUnpackSoundName": "AudioEvent",
-        "SearchAndDestroyPlanIdleLoopSoundName": "AudioEvent",
-        "SearchAndDestroyPlanPackSoundName": "AudioEvent",
-        "SearchAndDestroyMessageLabel": "String",
-        "SearchAndDestroyAnnouncementName": "AudioEvent",
-        "HoldTheLinePlanUnpackSoundName": "AudioEvent",
-        "HoldTheLinePlanPackSoundName": "AudioEvent",
-        "HoldTheLineMessageLabel": "String",
-        "HoldTheLineAnnouncementName": "AudioEvent",
-        "ValidMemberKindOf": "KindofList",
-        "InvalidMemberKindOf": "KindofList",
-        "BattlePlanChangeParalyzeTime": "UnsignedInteger",
-        "HoldTheLinePlanArmorDamageScalar": "FloatingPoint",
-        "SearchAndDestroyPlanSightRangeScalar": "FloatingPoint",
-        "StrategyCenterSearchAndDestroySightRangeScalar": "FloatingPoint",
-        "StrategyCenterSearchAndDestroyDetectsStealth": "Boolean",
-        "StrategyCenterHoldTheLineMaxHealthScalar": "FloatingPoint",
-        "StrategyCenterHoldTheLineMaxHealthChangeType": "EnumHealthRatioType",
-        "VisionObjectName": "String"
-    },
-    "BannerCarrierUpdate": {
-        "IdleSpawnRate": "UnsignedInteger",
-        "MeleeFreeUnitSpawnTime": "UnsignedInteger",
-        "DiedRespawnTime": "UnsignedInteger",
-        "MeleeFreeBannerReSpawnTime": "UnsignedInteger",
-        "MorphCondition": "Unknown",
-        "ExpLevelDraw": "Unknown",
-        "BannerMorphFX": "FXList",
-        "UnitSpawnFX": "FXList",
-        "ReplenishNearbyHorde": "Boolean",
-        "ReplenishAllNearbyHordes": "Boolean",
-        "ScanHordeDistance": "FloatingPoint",
-        "UpgradeRequired": "String"
-    },
-    "ShareExperienceBehavior": {
-        "Radius": "FloatingPoint",
-        "DropOff": "FloatingPoint",
-        "Percentage": "FloatingPoint",
-        "ObjectFilter": "ObjectFilter"
-    },
-    "CivilianSpawnUpdate": {
-        "SpawnDelayTime": "UnsignedInteger",
-        "MaximumDistance": "SignedInteger",
-        "RunToFilter": "ObjectFilter",
-        "Civilian": "Strings"
-    },
-    "BoredUpdate": {
-        "ScanDelayTime": "UnsignedInteger",
-        "ScanDistance": "FloatingPoint",
-        "BoredFilter": "ObjectFilter",
-        "CanScanWhileAttackingOrMoving": "Boolean",
-        "SpecialPowerTemplate": "SpecialPower"
-    },
-    "AutoPickUpUpdate": {
-        "ScanDelayTime": "UnsignedInteger",
-        "PickUpFilter": "ObjectFilter",
-        "ScanDistance": "FloatingPoint",
-        "EatObjectEntry": "Unknown",
-        "AutoThrowObject": "Boolean",
-        "RunFromButton": "Boolean",
-        "RunFromButtonNumber": "SignedInteger",
-        "CanScanWhileAttackingOrMoving": "Boolean"
-    },
-    "DemoTrapUpdate": {
-        "DefaultProximityMode": "Boolean",
-        "DetonationWeaponSlot": "SlotTypes",
-        "ProximityModeWeaponSlot": "SlotTypes",
-        "ManualModeWeaponSlot": "SlotTypes",
-        "TriggerDetonationRange": "FloatingPoint",
-        "IgnoreTargetTypes": "KindofList",
-        "ScanRate": "UnsignedInteger",
-        "AutoDetonationWithFriendsInvolve": "Boolean",
-        "DetonationWeapon": "Weapon",
-        "DetonateWhenKilled": "Boolean"
-    },
-    "CommandButtonHuntUpdate": {
-        "ScanRate": "UnsignedInteger",
-        "ScanRange": "FloatingPoint"
-    },
-    "LaserUpdate": {
-        "MuzzleParticleSystem": "String",
-        "TargetParticleSystem": "String",
-        "ParentFireBoneName": "String",
-        "ParentFireBoneOnTurret": "Boolean",
-        "LaserLifetime": "FloatingPoint"
-    },
-    "SupplyTruckAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean",
-        "MaxBoxes": "SignedInteger",
-        "SupplyCenterActionDelay": "UnsignedInteger",
-        "SupplyWarehouseActionDelay": "UnsignedInteger",
-        "SupplyWarehouseScanDistance": "FloatingPoint",
-        "HarvestTrees": "Boolean",
-        "HarvestActivationRange": "FloatingPoint",
-        "HarvestPreparationTime": "UnsignedInteger",
-        "HarvestActionTime": "UnsignedInteger"
-    },
-    "HordeWorkerAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean"
-    },
-    "HordeAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean"
-    },
-    "AIUpdateInterface": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean"
-    },
-    "SiegeAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean"
-    },
-    "HeightDieUpdate": {
-        "TargetHeight": "FloatingPoint",
-        "TargetHeightIncludesStructures": "Boolean",
-        "OnlyWhenMovingDown": "Boolean",
-        "DestroyAttachedParticlesAtHeight": "FloatingPoint",
-        "SnapToGroundOnDeath": "Boolean",
-        "InitialDelay": "UnsignedInteger"
-    },
-    "FloodUpdate": {
-        "FloodMember": "Unknown",
-        "AngleOfFlow": "Degrees",
-        "DirectionIsRelative": "Boolean"
-    },
-    "FloatUpdate": {
-        "Enabled": "Boolean"
-    },
-    "FlammableUpdate": {
-        "BurnedDelay": "UnsignedInteger",
-        "AflameDuration": "UnsignedInteger",
-        "AflameDamageDelay": "UnsignedInteger",
-        "AflameDamageAmount": "SignedInteger",
-        "BurningSoundName": "AudioEvent",
-        "FlameDamageLimit": "FloatingPoint",
-        "FlameDamageExpiration": "UnsignedInteger",
-        "FireFXList": "Unknown",
-        "SetBurnedStatus": "Boolean",
-        "SwapModelWhenAflame": "Boolean",
-        "SwapModelWhenQuenched": "Boolean",
-        "SwapTextureWhenAflame": "Boolean",
-        "SwapTextureWhenQuenhed": "Boolean",
-        "BurnContained": "Boolean",
-        "RunToWater": "Boolean",
-        "RunToWaterDepth": "FloatingPoint",
-        "RunToWaterSearchRadius": "FloatingPoint",
-        "RunToWaterSearchIncrement": "FloatingPoint",
-        "PanicLocomotorWhileAflame": "Boolean",
-        "CustomAnimAndDuration": "AnimAndDuration",
-        "DamageType": "EnumDamageType"
-    },
-    "MonitorConditionUpdate": {
-        "ModelConditionFlags": "ConditionFlags",
-        "ModelConditionCommandSet": "String",
-        "WeaponSetFlags": "WeaponsetFlags",
-        "WeaponToggleCommandSet": "String"
-    },
-    "DamageFieldUpdate": {
-        "FireWeaponNugget": "Unknown",
-        "HeroModeTrigger": "Boolean",
-        "ChargingModeTrigger": "Boolean",
-        "AliveOnly": "Boolean",
-        "Radius": "SignedInteger",
-        "ObjectFilter": "ObjectFilter",
-        "RequiredUpgrade": "String"
-    },
-    "OilSpillUpdate": {
-        "FireWeaponNugget": "Unknown",
-        "HeroModeTrigger": "Boolean",
-        "ChargingModeTrigger": "Boolean",
-        "AliveOnly": "Boolean",
-        "BreadcrumbName": "String",
-        "IgnitionWeaponName": "String",
-        "IgnitionWeaponSpacing": "FloatingPoint",
-        "OilSpillFX": "FXList"
-    },
-    "FireWeaponUpdate": {
-        "FireWeaponNugget": "Unknown",
-        "HeroModeTrigger": "Boolean",
-        "ChargingModeTrigger": "Boolean",
-        "AliveOnly": "Boolean"
-    },
-    "FireSpreadUpdate": {
-        "OCLEmbers": "ObjectCreationList",
-        "MinSpreadDelay": "UnsignedInteger",
-        "MaxSpreadDelay": "UnsignedInteger",
-        "SpreadTryRange": "FloatingPoint"
-    },
-    "AutoDepositUpdate": {
-        "DepositTiming": "UnsignedInteger",
-        "Upgrade": "Upgrade",
-        "DepositAmount": "SignedInteger",
-        "InitialCaptureBonus": "SignedInteger",
-        "UpgradeBonusPercent": "Percentage",
-        "UpgradeMustBePresent": "ObjectFilter",
-        "GiveNoXP": "Boolean",
-        "OnlyWhenGarrisoned": "Boolean"
-    },
-    "PartTheHeavensUpdate": {
-        "Texture": "String",
-        "Radius": "Unknown",
-        "Color": "Unknown",
-        "Opacity": "Unknown",
-        "Angle": "Unknown"
-    },
-    "DestroyEnvironmentUpdate": {
-        "StartTime": "UnsignedInteger",
-        "DestructionTime": "UnsignedInteger"
-    },
-    "RainOfFireUpdate": {
-        "StartRainTime": "UnsignedInteger",
-        "DarknessFadeTime": "UnsignedInteger",
-        "RainEmitterHeight": "FloatingPoint",
-        "DarknessLevel": "FloatingPoint",
-        "JitterRadius": "FloatingPoint",
-        "DPSMin": "FloatingPoint",
-        "DPSMax": "FloatingPoint",
-        "DPSRampupTime": "UnsignedInteger",
-        "RainOffset": "Vector2"
-    },
-    "RadiusDecalUpdate": {},
-    "SpecialEnemySenseUpdate": {
-        "SpecialEnemyFilter": "ObjectFilter",
-        "ScanRange": "FloatingPoint",
-        "ScanInterval": "UnsignedInteger"
-    },
-    "OneRingPenaltyUpdate": {
-        "SpecialObjectName": "String",
-        "RingTimeBeforeSpawning": "UnsignedInteger",
-        "TimeSpentRoamingAround": "UnsignedInteger",
-        "TimeRingPowerSuppressed": "UnsignedInteger",
-        "StartingDistanceFromMe": "FloatingPoint",
-        "TimeFrozenFromPenalty": "UnsignedInteger",
-        "DiscoveredSound": "AudioEvent"
-    },
-    "LifetimeUpdate": {
-        "MinLifetime": "UnsignedInteger",
-        "MaxLifetime": "UnsignedInteger",
-        "WaitForWakeUp": "Boolean",
-        "ScoreKill": "Boolean",
-        "DeathType": "EnumDeathType"
-    },
-    "DelayedLuaEventUpdate": {},
-    "ToppleUpdate": {
-        "ToppleFX": "FXList",
-        "BounceFX": "FXList",
-        "StumpName": "String",
-        "KillWhenStartToppling": "Boolean",
-        "KillWhenFinishedToppling": "Boolean",
-        "KillStumpWhenToppled": "Boolean",
-        "ToppleLeftOrRightOnly": "Boolean",
-        "ReorientToppledRubble": "Boolean",
-        "InitialVelocityPercent": "Percentage",
-        "InitialAccelPercent": "Percentage",
-        "BounceVelocityPercent": "Percentage",
-        "MinimumToppleSpeed": "FloatingPoint"
-    },
-    "LargeGroupBonusUpdate": {
-        "UpdateRate": "UnsignedInteger",
-        "HordeMemberFilter": "ObjectFilter",
-        "Count": "SignedInteger",
-        "Radius": "FloatingPoint",
-        "RubOffRadius": "FloatingPoint",
-        "AlliesOnly": "Boolean",
-        "FlagSubObjectNames": "Strings",
-        "AttributeModifier": "String"
-    },
-    "GiantBirdAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean",
-        "AttackLocomotorType": "LocomotorSetType",
-        "ReturnForAmmoLocomotorType": "LocomotorSetType",
-        "GrabTossTimeTrigger": "FloatingPoint",
-        "GrabTossHeightTrigger": "FloatingPoint",
-        "FollowThroughDistance": "FloatingPoint",
-        "FollowThroughCheckStep": "FloatingPoint",
-        "FollowThroughGradient": "FloatingPoint",
-        "TossFX": "FXList"
-    },
-    "AssaultTransportAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean"
-    },
-    "DeployStyleAIUpdate": {
-        "Turret": "TurretModule",
-        "AttackPriority": "String",
-        "AutoAcquireEnemiesWhenIdle": "AllowedWhenConditions",
-        "StopChaseDistance": "FloatingPoint",
-        "StandGround": "Boolean",
-        "MoodAttackCheckRate": "UnsignedInteger",
-        "CanAttackWhileContained": "Boolean",
-        "HoldGroundCloseRangeDistance": "FloatingPoint",
-        "AILuaEventsList": "String",
-        "MinCowerTime": "UnsignedInteger",
-        "MaxCowerTime": "UnsignedInteger",
-        "RampageTime": "UnsignedInteger",
-        "RampageRequiresAflame": "Boolean",
-        "BurningDeathTime": "UnsignedInteger",
-        "TimeToEjectPassengersOnRampage": "UnsignedInteger",
-        "ComboLocomotorSet": "LocomotorSetType",
-        "ComboLocoAttackDistance": "FloatingPoint",
-        "SpecialContactPoints": "Strings",
-        "FadeOnPortals": "Boolean",
-        "UnpackTime": "UnsignedInteger",
-        "PackTime": "UnsignedInteger",
-        "ResetTurretBeforePacking": "Boolean",
-        "TurretsFunctionOnlyWhenDeployed": "Boolean",
-        "TurretsMustCenterBeforePacking": "Boolean",
-        "MustDeployToAttack": "Boolean",
-        "DeployedAttributeModifier": "String"
-    },
-    "DynamicShroudClearingRangeUpdate": {
-        "ChangeInterval": "UnsignedInteger",
-        "GrowInterval": "UnsignedInteger",
-        "ShrinkDelay": "UnsignedInteger",
-        "ShrinkTime": "UnsignedInteger",
-        "GrowDelay": "UnsignedInteger",
-        "GrowTime": "UnsignedInteger",
-        "FinalVision": "FloatingPoint",
-        "GridDecalTemplate": "Unknown"
-    },
-    "DeletionUpdate": {
-        "MinLifetime": "UnsignedInteger",
-        "MaxLifetime": "UnsignedInteger"
-    },
-    "DelayedWeaponSetUpgradeUpdate": {},
-    "InvisibilityUpdate": {
-        "InvisibilityNugget": "InvisibilityNugget",
-        "UpdatePeriod": "UnsignedInteger",
-        "RequiredUpgrades": "Upgrades",
-        "ForbiddenUpgrades": "Upgrades",
-        "Broadcast": "Boolean",
-        "BroadcastObjectFilter": "ObjectFilter",
-        "BroadcastRange": "FloatingPoint",
-        "StartsActive": "Boolean",
-        "UnitSpecificSoundNameToUseAsVoiceMoveToStealthyArea": "String",
-        "UnitSpecificSoundNameToUseAsVoiceEnterStateMoveToStealthyArea": "String"
-    }
-}
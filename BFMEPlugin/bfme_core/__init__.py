@@ -0,0 +1,91 @@
+"""Editor independent BFME indexing and lookup core.
+
+Nothing in this package imports sublime, so it can be driven from scripts,
+benchmarks and other editors. BFMEParser is the Sublime Text adapter on top.
+"""
+
+from .index import (
+    INDEX_CACHE_VERSION,
+    DEFAULT_EXCLUDE_FOLDERS,
+    SHARD_INTERVAL,
+    PROGRESS_INTERVAL,
+    bfme_pattern,
+    macro_pattern,
+    LayeredIndex,
+    IndexIgnoreRules,
+    ProjectIndex,
+    ProjectRegistry,
+    is_inside,
+    merge_definition,
+    entry_locations,
+    add_definition,
+    remove_definition,
+    is_index_file,
+    intern_kind,
+    read_string_names,
+    index_file,
+    index_path,
+    scan_dir,
+    walk_index_files,
+    index_folders,
+    merge_shards,
+    IndexProgress,
+    find_changed_files,
+    save_layer,
+    load_layer,
+    PathTable,
+    write_cache,
+    read_cache,
+    project_cache_path,
+    save_project_cache,
+    load_project_cache,
+    base_cache_path,
+    load_base_layer,
+    project_key,
+    build_project_index,
+    symbol_browser_items,
+    reindex_changed_files,
+)
+from .behaviors import prefix_range, BehaviorTable, get_behaviors, get_behavior_table
+from .schema import MODULE_CATEGORIES, module_category, module_tag, NameTable, Schema, get_schema
+from .context import (
+    include_pattern,
+    behavior_pattern,
+    resolve_include,
+    find_behavior_context,
+    block_header,
+    find_block_path,
+    iter_block_paths,
+)
+from .references import (
+    external_symbols,
+    find_used_symbols,
+    strip_comment,
+    scan_references,
+    build_references,
+    get_references,
+)
+from .completion import (
+    TYPE_KINDS,
+    context_kinds,
+    value_type,
+    completion_candidates,
+    schema_completions,
+)
+from .validation import (
+    ERROR,
+    WARNING,
+    VALIDATION_WORKERS,
+    MOMENT_PHASE_TYPE,
+    check_values,
+    validate_line,
+    validate_lines,
+    validate_rows,
+    validate_file,
+    duplicate_diagnostics,
+    file_duplicate_diagnostics,
+    validate_project,
+    format_diagnostic,
+)
+from . import perf, profiling
+from .memory import deep_size, memory_report, format_memory_report
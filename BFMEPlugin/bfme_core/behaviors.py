@@ -0,0 +1,92 @@
+import sys
+import bisect
+import json
+import threading
+
+# Decoded lazily from behaviors_data by get_behaviors.
+_behaviors = None
+_behavior_table = None
+_behaviors_lock = threading.Lock()
+
+
+def prefix_range(sorted_keys, prefix):
+    """Return the keys of a sorted list starting with prefix."""
+    start = bisect.bisect_left(sorted_keys, prefix)
+    end = bisect.bisect_right(sorted_keys, prefix + "\uffff", start)
+    return sorted_keys[start:end]
+
+
+class BehaviorTable(object):
+    """Case-insensitive lookups into the behavior table.
+
+    Behavior and parameter names are case folded once and kept in sorted lists,
+    so exact lookups are a dict access and prefix queries two bisections.
+    """
+
+    def __init__(self, behaviors):
+        self.behaviors = behaviors
+        self.names = dict((name.lower(), name) for name in behaviors)
+        self.sorted_names = sorted(self.names)
+        self.params = {}
+        self.sorted_params = {}
+        for name, params in behaviors.items():
+            folded = dict((param.lower(), param) for param in params)
+            self.params[name] = folded
+            self.sorted_params[name] = sorted(folded)
+
+    def behavior(self, name):
+        """Return the canonical spelling of a behavior name, or None if unknown."""
+        return self.names.get(name.lower()) if name else None
+
+    def parameter(self, behavior, name):
+        """Return (parameter, type) for a parameter of behavior, or None if unknown."""
+        behavior = self.behavior(behavior)
+        if behavior is None:
+            return None
+        param = self.params[behavior].get(name.lower())
+        if param is None:
+            return None
+        return param, self.behaviors[behavior][param]
+
+    def parameters_with_prefix(self, behavior, prefix):
+        """Return the (parameter, type) pairs of behavior starting with prefix."""
+        behavior = self.behavior(behavior)
+        if behavior is None:
+            return []
+        params = self.params[behavior]
+        types = self.behaviors[behavior]
+        return [
+            (params[key], types[params[key]])
+            for key in prefix_range(self.sorted_params[behavior], prefix.lower())
+        ]
+
+
+def get_behavior_table():
+    global _behavior_table
+    if _behavior_table is None:
+        table = BehaviorTable(get_behaviors())
+        _behavior_table = table
+    return _behavior_table
+
+
+def get_behaviors():
+    """Return the behavior name -> {parameter: type} table, decoding it on first use.
+
+    behaviors_data only holds a packed JSON string, so importing the plugin does
+    not pay for building several thousand dicts entries nobody may ever need.
+    """
+    global _behaviors
+    if _behaviors is None:
+        with _behaviors_lock:
+            if _behaviors is None:
+                from . import behaviors_data
+
+                packed = json.loads(behaviors_data.BEHAVIORS)
+                types = [sys.intern(t) for t in packed["types"]]
+                behaviors = {}
+                for behavior_name, flat in packed["behaviors"]:
+                    behaviors[behavior_name] = dict(
+                        (sys.intern(flat[i]), types[flat[i + 1]]) for i in range(0, len(flat), 2)
+                    )
+                _behaviors = behaviors
+    return _behaviors
@@ -0,0 +1,312 @@
+# Generated behaviors data
+# This file contains all behaviors and their parameters as a packed JSON
+# string, it is decoded on first use by bfme_core.get_behaviors.
+
+BEHAVIORS = (
+    '{"types":["AModAuraConditions","AllowedWhenConditions","AmountAndObjectFilter","AnimAndDuration","AttributeModifierCategory","AudioEvent","Boolean","ComboHorde","ConditionFlags","Conditions","ContainCondition","Crate","CreateAtLocation","DamageCreationList","DamageTypeFilter","DamageTypes","DeathTypeFilter","Degrees","DynamicPortalLink","DynamicPortalWaypoint","EmotionNuggetType","EnumDamageType","EnumDeathType","EnumHealthRatioType","EvaEvent","FXList","FloatingPoint","HealthOperation","IndexAnimationState","InvisibilityNugget","KindofList","LocomotorSetType","MeleeBehavior","ModelConditionAudio","ModelConditionFlag","ModelConditionFlagRange","MomentFXList","MomentOCL","MomentSound","MomentWeapon","Object","ObjectCreationList","ObjectFilter","ObjectObjectFilter","ObjectPosition","ObjectStatus","Options","ParticleSystem","PassengerBoneKindof","Payload","Percentage","PreBuiltObjectLocation","RankInfo","SignedInteger","SlotTypes","SpecialPower","SpecialPowerForbiddenUnpackConditions","SpecialPowerUnpackConditions","SplitHorde","Stance","String","Strings","TextureReplacement","TurretModule","UnitSpecificSounds","Unknown","UnpackBase","UnpackDecal","UnsignedInteger","UnsignedIntegerList","Upgrade","UpgradeObjectAmount","Upgrades","Vector2","Vector3","Weapon","WeaponsetFlags","WeatherFlag"],"behaviors":['
+    '["ActivateModuleSpecialPower",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"TriggerSpecialPower",65,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["ActiveBody",["BurningDeathBehavior",6,"BurningDeathFX",25,"CheerRadius",26,"DamageCreationList",13,"DamagedAttributeModifier",60,"DodgePercent",50,"EnteringDamagedTransitionTime",68,"EnteringReallyDamagedTransitionTime",68,"GrabDamage",26,"GrabFX",25,"GrabObject",60,"GrabOffset",73,"HealingBuffFx",25,"InitialHealth",26,"MaxHealth",26,"MaxHealthDamaged",26,"MaxHealthReallyDamaged",26,"ReallyDamagedAttributeModifier",60,"RecoveryTime",68,"RemoveUpgradesOnDeath",6,"UseDefaultDamageSettings",6]],'
+    '["AIGateUpdate",["TriggerWidthX",26,"TriggerWidthY",26]],'
+    '["AimWeaponBehavior",["AimFarDistance",26,"AimHighThreshold",26,"AimLowThreshold",26,"AimNearDistance",26]],'
+    '["AISpecialPowerUpdate",["CommandButtonName",60,"RandomizeTargetLocation",6,"SpecialPowerAIType",65,"SpecialPowerRadius",26,"SpecialPowerRange",26,"SpellMakesAStructure",6]],'
+    '["AIUpdateInterface",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63]],'
+    '["AllowBannerSpawnUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["AnimalAIUpdate",["AfraidOfCastles",6,"AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"FleeDistance",53,"FleeRange",53,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MaxWanderDistance",53,"MaxWanderRadius",53,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63,"UpdateTimer",53,"WanderPercentage",53]],'
+    '["AnimatedParticleSysBoneClientUpdate",[]],'
+    '["AnimationSoundClientBehavior",[]],'
+    '["AnnounceBirthAndDeathBehavior",[]],'
+    '["AODCrushCollide",["Damage",26,"DamageType",21,"DeathType",22,"LargeFXList",25,"LargeObjectCreationList",41,"MediumFXList",25,"MediumObjectCreationList",41,"SelfDamage",26,"SelfDamageType",21,"SelfDeathType",22,"SmallFXList",25,"SmallObjectCreationList",41,"SpecialDamage",26,"SpecialDamageType",21,"SpecialDeathType",22,"SpecialObject",42]],'
+    '["ArrowStormUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"CanShootEmptyGround",6,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxShots",53,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"ShotsPerBurst",53,"ShotsPerTarget",53,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TargetRadius",26,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"WeaponTemplate",60]],'
+    '["AssaultTransportAIUpdate",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63]],'
+    '["AssistedTargetingUpdate",["AssistingClipSize",53,"AssistingWeaponSlot",54,"LaserFromAssisted",40,"LaserToTarget",40]],'
+    '["AttachUpdate",["AlwaysTeleport",6,"AnchorToTopOfGeometry",6,"AttachFX",25,"ObjectFilter",42,"ParentAllyAttachmentEvaEvent",24,"ParentAllyDiedEvaEvent",24,"ParentEnemyAttachmentEvaEvent",24,"ParentEnemyDiedtEvaEvent",24,"ParentOwnerAttachmentEvaEvent",24,"ParentOwnerDiedEvaEvent",24,"ParentStatus",45,"ScanRange",26]],'
+    '["AttributeModifierAuraUpdate",["AffectContainedOnly",6,"AffectEvil",6,"AffectGood",6,"AllowPowerWhenAttacking",6,"AllowSelf",6,"AntiCategory",4,"AntiFX",25,"BonusName",60,"ConflictsWith",72,"CustomAnimAndDuration",3,"MaxActiveRank",53,"ObjectFilter",42,"Permanent",6,"Range",26,"RefreshDelay",68,"RequiredConditions",0,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"RunWhileDead",6,"StartsActive",6,"TargetEnemy",6,"TriggeredBy",72]],'
+    '["AttributeModifierPoolUpdate",[]],'
+    '["AttributeModifierUpgrade",["AttributeModifier",60,"ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["AudioLoopUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"KillAfterMS",68,"KillOnDeath",6,"MaxKillerAngle",17,"MinKillerAngle",17,"Permanent",6,"RequiredStatus",45,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"SoundToPlay",5,"TriggeredBy",72]],'
+    '["AutoAbilityBehavior",["AdjustAttackMeleePosition",6,"AllowSelf",6,"BaseMaxRangeFromStartPos",6,"ForbiddenStatus",45,"IdleTimeSeconds",26,"MaxScanRange",26,"MinScanRange",26,"Query",2,"SpecialAbility",60,"StartsActive",6,"WorkingRadius",26]],'
+    '["AutoDepositUpdate",["DepositAmount",53,"DepositTiming",68,"GiveNoXP",6,"InitialCaptureBonus",53,"OnlyWhenGarrisoned",6,"Upgrade",70,"UpgradeBonusPercent",50,"UpgradeMustBePresent",42]],'
+    '["AutoFindHealingUpdate",["AlwaysHeal",26,"NeverHeal",26,"ScanRange",26,"ScanRate",68]],'
+    '["AutoHealBehavior",["AffectsContained",6,"AffectsWholePlayer",6,"ButtonTriggered",6,"ConflictsWith",72,"CustomAnimAndDuration",3,"HealingAmount",53,"HealingDelay",68,"HealOnlyIfNotInCombat",6,"HealOnlyIfNotUnderAttack",6,"HealOnlyOthers",6,"KindOf",30,"NonStackable",6,"Permanent",6,"Radius",53,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"RespawnFXList",25,"RespawnMinimumDelay",68,"RespawnNearbyHordeMembers",6,"SingleBurst",6,"StartHealingDelay",68,"StartsActive",6,"TriggeredBy",72,"UnitHealPulseFX",25]],'
+    '["AutoPickUpUpdate",["AutoThrowObject",6,"CanScanWhileAttackingOrMoving",6,"EatObjectEntry",65,"PickUpFilter",42,"RunFromButton",6,"RunFromButtonNumber",53,"ScanDelayTime",68,"ScanDistance",26]],'
+    '["BannerCarrierUpdate",["BannerMorphFX",25,"DiedRespawnTime",68,"ExpLevelDraw",65,"IdleSpawnRate",68,"MeleeFreeBannerReSpawnTime",68,"MeleeFreeUnitSpawnTime",68,"MorphCondition",65,"ReplenishAllNearbyHordes",6,"ReplenishNearbyHorde",6,"ScanHordeDistance",26,"UnitSpawnFX",25,"UpgradeRequired",60]],'
+    '["BaseUpgrade",["BuildingTemplateName",60,"ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"PlacementIndex",53,"PlacementPrefix",60,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["BattlePlanUpdate",["BattlePlanChangeParalyzeTime",68,"BombardmentAnnouncementName",5,"BombardmentMessageLabel",60,"BombardmentPlanAnimationTime",68,"BombardmentPlanPackSoundName",5,"BombardmentPlanUnpackSoundName",5,"HoldTheLineAnnouncementName",5,"HoldTheLineMessageLabel",60,"HoldTheLinePlanAnimationTime",68,"HoldTheLinePlanArmorDamageScalar",26,"HoldTheLinePlanPackSoundName",5,"HoldTheLinePlanUnpackSoundName",5,"InvalidMemberKindOf",30,"SearchAndDestroyAnnouncementName",5,"SearchAndDestroyMessageLabel",60,"SearchAndDestroyPlanAnimationTime",68,"SearchAndDestroyPlanIdleLoopSoundName",5,"SearchAndDestroyPlanPackSoundName",5,"SearchAndDestroyPlanSightRangeScalar",26,"SearchAndDestroyPlanUnpackSoundName",5,"SpecialPowerTemplate",55,"StrategyCenterHoldTheLineMaxHealthChangeType",23,"StrategyCenterHoldTheLineMaxHealthScalar",26,"StrategyCenterSearchAndDestroyDetectsStealth",6,"StrategyCenterSearchAndDestroySightRangeScalar",26,"TransitionIdleTime",68,"ValidMemberKindOf",30,"VisionObjectName",60]],'
+    '["BeaconClientUpdate",["RadarPulseDuration",68,"RadarPulseFrequency",68]],'
+    '["BezierProjectileBehavior",["BounceCount",53,"BounceDistance",26,"BounceFirstHeight",26,"BounceFirstPercentIndent",50,"BounceSecondHeight",26,"BounceSecondPercentIndent",50,"CrushStyle",6,"CurveFlattenMinDist",26,"DetonateCallsKill",6,"DieOnImpact",6,"FadeInTime",68,"FinalStuckTime",68,"FirstHeight",26,"FirstPercentHeight",50,"FirstPercentIndent",50,"FlightPathAdjustDistPerSecond",26,"GarrisonHitKillCount",68,"GarrisonHitKillForbiddenKindOf",30,"GarrisonHitKillFX",25,"GarrisonHitKillRequiredKindOf",30,"GroundBounceFX",25,"GroundBounceWeapon",75,"GroundHitFX",25,"GroundHitWeapon",75,"IgnoreTerrainHeight",6,"InvisibleFrames",68,"OrientToFlightPath",6,"PostLandingEmotion",20,"PostLandingEmotionRadius",26,"PostLandingStateTime",68,"PreLandingEmotion",20,"PreLandingEmotionRadius",26,"PreLandingStateTime",68,"SecondHeight",26,"SecondPercentHeight",50,"SecondPercentIndent",50,"TumbleRandomly",6]],'
+    '["BloodthirstyUpdate",["ExperienceModifier",26,"InitiateVoice",5,"SacrificeFilter",42]],'
+    '["BoneFXDamage",[]],'
+    '["BoneFXUpdate",["DamagedFXList1",65,"DamagedFXList2",65,"DamagedFXList3",65,"DamagedFXList4",65,"DamagedFXList5",65,"DamagedFXList6",65,"DamagedFXList7",65,"DamagedFXList8",65,"DamagedOCL1",65,"DamagedOCL2",65,"DamagedOCL3",65,"DamagedOCL4",65,"DamagedOCL5",65,"DamagedOCL6",65,"DamagedOCL7",65,"DamagedOCL8",65,"DamagedParticleSystem1",65,"DamagedParticleSystem2",65,"DamagedParticleSystem3",65,"DamagedParticleSystem4",65,"DamagedParticleSystem5",65,"DamagedParticleSystem6",65,"DamagedParticleSystem7",65,"DamagedParticleSystem8",65,"DamageFXTypes",14,"DamageOCLTypes",14,"DamageParticleTypes",14,"PristineFXList1",65,"PristineFXList2",65,"PristineFXList3",65,"PristineFXList4",65,"PristineFXList5",65,"PristineFXList6",65,"PristineFXList7",65,"PristineFXList8",65,"PristineOCL1",65,"PristineOCL2",65,"PristineOCL3",65,"PristineOCL4",65,"PristineOCL5",65,"PristineOCL6",65,"PristineOCL7",65,"PristineOCL8",65,"PristineParticleSystem1",65,"PristineParticleSystem2",65,"PristineParticleSystem3",65,"PristineParticleSystem4",65,"PristineParticleSystem5",65,"PristineParticleSystem6",65,"PristineParticleSystem7",65,"PristineParticleSystem8",65,"ReallyDamagedFXList1",65,"ReallyDamagedFXList2",65,"ReallyDamagedFXList3",65,"ReallyDamagedFXList4",65,"ReallyDamagedFXList5",65,"ReallyDamagedFXList6",65,"ReallyDamagedFXList7",65,"ReallyDamagedFXList8",65,"ReallyDamagedOCL1",65,"ReallyDamagedOCL2",65,"ReallyDamagedOCL3",65,"ReallyDamagedOCL4",65,"ReallyDamagedOCL5",65,"ReallyDamagedOCL6",65,"ReallyDamagedOCL7",65,"ReallyDamagedOCL8",65,"ReallyDamagedParticleSystem1",65,"ReallyDamagedParticleSystem2",65,"ReallyDamagedParticleSystem3",65,"ReallyDamagedParticleSystem4",65,"ReallyDamagedParticleSystem5",65,"ReallyDamagedParticleSystem6",65,"ReallyDamagedParticleSystem7",65,"ReallyDamagedParticleSystem8",65,"RubbleFXList1",65,"RubbleFXList2",65,"RubbleFXList3",65,"RubbleFXList4",65,"RubbleFXList5",65,"RubbleFXList6",65,"RubbleFXList7",65,"RubbleFXList8",65,"RubbleOCL1",65,"RubbleOCL2",65,"RubbleOCL3",65,"RubbleOCL4",65,"RubbleOCL5",65,"RubbleOCL6",65,"RubbleOCL7",65,"RubbleOCL8",65,"RubbleParticleSystem1",65,"RubbleParticleSystem2",65,"RubbleParticleSystem3",65,"RubbleParticleSystem4",65,"RubbleParticleSystem5",65,"RubbleParticleSystem6",65,"RubbleParticleSystem7",65,"RubbleParticleSystem8",65]],'
+    '["BoredUpdate",["BoredFilter",42,"CanScanWhileAttackingOrMoving",6,"ScanDelayTime",68,"ScanDistance",26,"SpecialPowerTemplate",55]],'
+    '["BridgeScaffoldBehavior",[]],'
+    '["BridgeTowerBehavior",[]],'
+    '["BroadcastStealthUpdate",["AllowKindOf",30,"ConflictsWith",72,"CustomAnimAndDuration",3,"DelayBetweenUpdates",53,"Permanent",6,"PersistantConditions",9,"Radius",26,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["BuildableHeroListUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["BuildingBehavior",["FireName",61,"FireWindowName",61,"GlowWindowName",61,"NightWindowName",61]],'
+    '["CallHelpOnDamage",["CallDelay",68,"CallRadius",26,"DamageTypes",14,"MoveToAttacker",6,"ValidObjects",42]],'
+    '["CashHackSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"MoneyAmount",53,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UpgradeMoneyAmount",65,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["CastleBehavior",["BuildTime",26,"BuildVariation",53,"CastleToUnpackForFaction",66,"CrewPrepareFX",25,"CrewPrepareInterval",68,"CrewPrepareTime",68,"CrewReleaseFX",25,"DecalName",60,"DecalSize",26,"DisableStructureRotation",6,"EvaEnemyCastleSightedEvent",24,"FactionDecal",67,"FadeTime",26,"FilterCrew",42,"FilterValidOwnedEntries",42,"InstantUnpack",6,"KeepDeathKillsEverything",6,"MaxCastleRadius",26,"PreBuiltList",51,"PreBuiltPlyr",60,"RepairHealthPercentPerSecond",50,"ScanDistance",26,"Summoned",6,"TransferFoundationHealthToCastleUponUnpack",6,"UnpackDelayTime",26]],'
+    '["CastleMemberBehavior",["BeingBuiltSound",5,"CampDestroyedAllyEvaEvent",24,"CampDestroyedAttackerEvaEvent",24,"CampDestroyedOwnerEvaEvent",24,"CountsForEvaCastleBreached",6,"StoreUpgradePrice",6]],'
+    '["CastleUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72,"Upgrade",60,"WallUpgradeRadius",26]],'
+    '["CaveContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CaveIndex",53,"CollidePickup",6,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterSound",5,"ExemptStatus",45,"ExitSound",5,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RequiredStatus",45,"ShowPips",6]],'
+    '["CitadelSlaughterHordeContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CanAlwaysEnter",42,"CashBackPercent",50,"CollidePickup",6,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterSound",5,"EntryOffset",74,"EntryPosition",74,"ExemptStatus",45,"ExitDelay",68,"ExitOffset",74,"ExitSound",5,"FXForRingEntry",25,"HealObjects",6,"ImmuneToClearBuildingAttacks",6,"InitialRoster",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"MobileGarrison",6,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"ObjectToDestroyForRingEntry",42,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RequiredStatus",45,"ShowPips",6,"StatusForRingEntry",45,"StatusRequiredForCanAlwaysEnter",45,"TimeForFullHeal",68,"UpgradeForRingEntry",61]],'
+    '["CivilianSpawnCollide",["DeleteObjectFilter",42]],'
+    '["CivilianSpawnUpdate",["Civilian",61,"MaximumDistance",53,"RunToFilter",42,"SpawnDelayTime",68]],'
+    '["ClearanceTestingSlowDeathBehavior",["ClearanceGeometry",65,"ClearanceGeometryHeight",26,"ClearanceGeometryIsSmall",6,"ClearanceGeometryMajorRadius",26,"ClearanceGeometryMinorRadius",26,"ClearanceGeometryOffset",74,"ClearanceGeometryRotationAnchorOffset",74,"ClearanceMaxHeight",26,"ClearanceMaxHeightFraction",26,"ClearanceMinHeight",26,"ClearanceMinHeightFraction",26,"DamageAmountRequired",26,"DeathTypes",16,"DecayBeginTime",68,"DestructionDelay",68,"DestructionDelayVariance",68,"ExemptStatus",45,"FX",36,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierBonusPerOverkillPercent",50,"OCL",37,"ProbabilityModifier",53,"RequiredStatus",45,"SinkDelay",68,"SinkDelayVariance",68,"SinkRate",26,"Sound",38,"Weapon",39]],'
+    '["ClickReactionBehavior",["ClickReactionTimer",53,"ReactionFrames1",53,"ReactionFrames2",53,"ReactionFrames3",53,"ReactionFrames4",53,"ReactionFrames5",53]],'
+    '["CloudBreakSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"CloudBreakFX",25,"CloudBreakRadius",26,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"ObjectSpacing",26,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"SunbeamObject",60,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["CombineHordeSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"ScanRange",26,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["CommandButtonHuntUpdate",["ScanRange",26,"ScanRate",68]],'
+    '["CommandPointsUpgrade",["CommandPoints",53,"ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiredObject",42,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["CommandSetUpgrade",["CommandSet",60,"ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["CreateCrateDie",["CrateData",11,"DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"RequiredStatus",45]],'
+    '["CreateObjectDie",["CreationList",41,"DamageAmountRequired",26,"DeathTypes",16,"DebrisPortionOfSelf",60,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"RequiredStatus",45,"UpgradeRequired",61]],'
+    '["CreateObjectDieIfEldestKindof",["CreationList",41,"DamageAmountRequired",26,"DeathTypes",16,"DebrisPortionOfSelf",60,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"ObjectFilter",42,"RequiredStatus",45,"UpgradeRequired",61]],'
+    '["CritterEmitterUpdate",["FX",25,"ReloadTime",68]],'
+    '["CrushDie",["BackEndCrushSound",5,"BackEndCrushSoundPercent",53,"DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"FrontEndCrushSound",5,"FrontEndCrushSoundPercent",53,"MaxKillerAngle",17,"MinKillerAngle",17,"RequiredStatus",45,"TotalCrushSound",5,"TotalCrushSoundPercent",53]],'
+    '["CurseSpecialPower",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CursedFX",25,"CursePercentage",50,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerFX",25,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["DamageFieldUpdate",["AliveOnly",6,"ChargingModeTrigger",6,"FireWeaponNugget",65,"HeroModeTrigger",6,"ObjectFilter",42,"Radius",53,"RequiredUpgrade",60]],'
+    '["DamageFilteredCreateObjectDie",["CreationList",41,"DamageAmountRequired",26,"DamageTypeTriggersForDuration",15,"DamageTypeTriggersInstantly",15,"DeathTypes",16,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"PostFilterTriggeredDuration",68,"RequiredStatus",45]],'
+    '["DarknessSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DarknessFX",25,"DarknessRadius",26,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["DefaultProductionExitUpdate",["NaturalRallyPoint",74,"UnitCreatePoint",74]],'
+    '["DefectorSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"FatCursorRadius",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["DeflectSpecialPower",["InitiateSound",5,"SpecialPowerTemplate",55,"StartsPaused",6]],'
+    '["DelayedDeathBody",["CanRespawn",6,"DelayedDeathPrerequisiteUpgrade",70,"DelayedDeathTime",68,"DoHealthCheck",6,"ImmortalUntilDeathTime",6,"InvulnerableFX",25,"PermanentlyKilledByFilter",42]],'
+    '["DelayedLuaEventUpdate",[]],'
+    '["DelayedUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"DelayTime",68,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["DelayedWeaponSetUpgradeUpdate",[]],'
+    '["DeletionUpdate",["MaxLifetime",68,"MinLifetime",68]],'
+    '["DemoTrapUpdate",["AutoDetonationWithFriendsInvolve",6,"DefaultProximityMode",6,"DetonateWhenKilled",6,"DetonationWeapon",75,"DetonationWeaponSlot",54,"IgnoreTargetTypes",30,"ManualModeWeaponSlot",54,"ProximityModeWeaponSlot",54,"ScanRate",68,"TriggerDetonationRange",26]],'
+    '["DeployStyleAIUpdate",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"DeployedAttributeModifier",60,"FadeOnPortals",6,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"MustDeployToAttack",6,"PackTime",68,"RampageRequiresAflame",6,"RampageTime",68,"ResetTurretBeforePacking",6,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63,"TurretsFunctionOnlyWhenDeployed",6,"TurretsMustCenterBeforePacking",6,"UnpackTime",68]],'
+    '["DestroyDie",["DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"RequiredStatus",45]],'
+    '["DestroyEnvironmentUpdate",["DestructionTime",68,"StartTime",68]],'
+    '["DetachableRiderBody",["BurningDeathBehavior",6,"BurningDeathFX",25,"CheerRadius",26,"ConflictsWith",72,"CustomAnimAndDuration",3,"DamageCreationList",13,"DamagedAttributeModifier",60,"DodgePercent",50,"EnteringDamagedTransitionTime",68,"EnteringReallyDamagedTransitionTime",68,"GrabDamage",26,"GrabFX",25,"GrabObject",60,"GrabOffset",73,"HealingBuffFx",25,"HealthPercentageWhenRiderDies",50,"InitialHealth",26,"MaxHealth",26,"MaxHealthDamaged",26,"MaxHealthReallyDamaged",26,"Permanent",6,"ReallyDamagedAttributeModifier",60,"RecoveryTime",68,"RemoveUpgradesOnDeath",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"RiderlessDeathChance",50,"StartsActive",6,"TriggeredBy",72,"UseDefaultDamageSettings",6]],'
+    '["DetachableRiderUpdate",["DeathEntry",65,"RemoveRiderlessFromHorde",6,"RiderlessHordeFlees",6,"RiderlessWeaponSlot",54,"RiderSubObjects",61]],'
+    '["DevastateSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"FireWeapon",60,"FX",25,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"Radius",26,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TreeValueMultiplier",50,"TreeValueTotalCap",26,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["DoCommandUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"GetUpgradeCommandButtonName",60,"Permanent",6,"RemoveUpgradeCommandButtonName",60,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["DominateEnemySpecialPower",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierAffects",42,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"DominatedFX",25,"DominateRadius",26,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PermanentlyConvert",6,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerFX",25,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["DozerAIUpdate",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BoredRange",26,"BoredTime",68,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"RepairHealthPercentPerSecond",50,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63]],'
+    '["DualWeaponBehavior",["MinimumSwitchTime",68,"SwitchWeaponOnCloseRangeDistance",26,"UseCloseRangeWhileMounted",6,"UseHordeRangeWeapon",6,"UseRealVictimRange",6]],'
+    '["DynamicPortalBehaviour",["AboveWall",68,"ActivationDelaySeconds",26,"AllowEnemies",6,"BonePrefix",60,"ConflictsWith",72,"CustomAnimAndDuration",3,"GenerateNow",6,"Link",18,"NumberOfBones",53,"ObjectFilter",42,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TopAttackPos",74,"TopAttackRadius",26,"TriggeredBy",72,"WallBoundsMesh",60,"WayPoint",19]],'
+    '["DynamicShroudClearingRangeUpdate",["ChangeInterval",68,"FinalVision",26,"GridDecalTemplate",65,"GrowDelay",68,"GrowInterval",68,"GrowTime",68,"ShrinkDelay",68,"ShrinkTime",68]],'
+    '["ElvenWoodSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"ElvenGroveObject",60,"ElvenNumObjects",53,"ElvenWoodFX",25,"ElvenWoodObject",65,"ElvenWoodOCL",41,"ElvenWoodRadius",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["EmotionTrackerUpdate",["AddEmotion",65,"AfraidOf",42,"AlwaysAfraidOf",42,"FearScanDistance",26,"HeroScanDistance",26,"IgnoreVeterancy",6,"ImmuneToFearLevel",53,"PointAt",42,"QuarrelProbability",50,"TauntAndPointDistance",26,"TauntAndPointExcluded",42,"TauntAndPointUpdateDelay",68]],'
+    '["EnragedBehavior",["EnragedLifeTimer",26]],'
+    '["EntEnragedUpdate",["EnragedOffBuffFX",25,"EnragedOnBuffFX",25,"EnragedTime",68,"EnragedTransitionFX",25,"EnragedTransitionTime",68,"FriendlyDeadFilter",42,"HatedObjectFilter",42,"ScanDelayTime",68,"ScanDistance",26,"TimeUntilCanRageAgain",68]],'
+    '["EvaAnnounceClientCreate",["AnnouncementEventAlly",24,"AnnouncementEventEnemy",24,"AnnouncementEventOwner",24,"CountAsFirstSightedAnnoucement",6,"CreateFakeRadarEvent",6,"DelayBeforeAnnouncementMS",68,"OnlyIfVisible",6,"UseObjectsPosition",6]],'
+    '["EvacuateDamage",["DamageToPanicThreshold",50,"DamageTypeToTrack",21,"TrackingTimeSpan",68,"WeaponThatCausesEvacuation",65]],'
+    '["EvacuateGarrisonSpecialPower",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["ExperienceLevelCreate",["LevelToGrant",53,"MPOnly",6]],'
+    '["ExperienceScalarUpgrade",["AddXPScalar",26,"ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["FadeAndDieOrnamentUpdate",["AttachToTargetBone",60,"Envelope",65,"FollowTarget",65]],'
+    '["FakePathfindPortalBehaviour",["AllowEnemies",6,"AllowNonSkirmishAIUnits",6,"ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["FellBeastSwoopPower",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"SpecialWeapon",75,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"WhichSpecialWeapon",53]],'
+    '["FireSpreadUpdate",["MaxSpreadDelay",68,"MinSpreadDelay",68,"OCLEmbers",41,"SpreadTryRange",26]],'
+    '["FireWeaponCollide",["CollideWeapon",75,"FireOnce",6,"ForbiddenStatus",45,"RequiredStatus",45]],'
+    '["FireWeaponUpdate",["AliveOnly",6,"ChargingModeTrigger",6,"FireWeaponNugget",65,"HeroModeTrigger",6]],'
+    '["FireWeaponWhenDamagedBehavior",["ConflictsWith",72,"ContinuousWeaponDamaged",75,"ContinuousWeaponPristine",75,"ContinuousWeaponReallyDamaged",75,"ContinuousWeaponRubble",75,"CustomAnimAndDuration",3,"DamageAmount",26,"DamageTypes",14,"Permanent",6,"ReactionWeaponDamaged",75,"ReactionWeaponPristine",75,"ReactionWeaponReallyDamaged",75,"ReactionWeaponRubble",75,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"StartsActive",6,"TriggeredBy",72]],'
+    '["FireWeaponWhenDeadBehavior",["ActiveDuringConstruction",6,"ConflictsWith",72,"CustomAnimAndDuration",3,"DamageAmountRequired",26,"DeathTypes",16,"DeathWeapon",75,"DelayTime",68,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"Permanent",6,"RequiredStatus",45,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"StartsActive",6,"TriggeredBy",72,"WeaponOffset",74]],'
+    '["FlammableUpdate",["AflameDamageAmount",53,"AflameDamageDelay",68,"AflameDuration",68,"BurnContained",6,"BurnedDelay",68,"BurningSoundName",5,"CustomAnimAndDuration",3,"DamageType",21,"FireFXList",65,"FlameDamageExpiration",68,"FlameDamageLimit",26,"PanicLocomotorWhileAflame",6,"RunToWater",6,"RunToWaterDepth",26,"RunToWaterSearchIncrement",26,"RunToWaterSearchRadius",26,"SetBurnedStatus",6,"SwapModelWhenAflame",6,"SwapModelWhenQuenched",6,"SwapTextureWhenAflame",6,"SwapTextureWhenQuenhed",6]],'
+    '["FlingPassengerSpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlingPassengerLandingWarhead",75,"FlingPassengerVelocity",74,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["FloatUpdate",["Enabled",6]],'
+    '["FloodUpdate",["AngleOfFlow",17,"DirectionIsRelative",6,"FloodMember",65]],'
+    '["FoundationAIUpdate",["BuildVariation",53,"RepairHealthPercentPerSecond",50]],'
+    '["FreeLifeBody",["CanRespawn",6,"FreeLifeAnimAndDuration",3,"FreeLifeHealthPercent",50,"FreeLifeInvincible",6,"FreeLifePrerequisiteUpgrade",70,"FreeLifeTime",68,"PermanentlyKilledByFilter",42]],'
+    '["FreezingRainSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"BurnRateModifier",53,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"FreezingRainFX",25,"FreezingRainRadius",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["FXListDie",["DamageAmountRequired",26,"DeathFX",25,"DeathTypes",16,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"OrientToObject",6,"RequiredStatus",45]],'
+    '["GarrisonContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CollidePickup",6,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterSound",5,"ExemptStatus",45,"ExitSound",5,"HealObjects",6,"ImmuneToClearBuildingAttacks",6,"InitialRoster",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"MobileGarrison",6,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RequiredStatus",45,"ShowPips",6,"TimeForFullHeal",68]],'
+    '["GarrisonUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["GateOpenAndCloseBehavior",["GeometryForClosed",61,"GeometryForOpen",61,"OpenByDefault",6,"PercentOpenForPathing",68,"Proxy",60,"RepelCollidingUnits",6,"ResetTimeInMilliseconds",68,"SoundClosingGateLoop",5,"SoundFinishedClosingGate",5,"SoundFinishedOpeningGate",5,"SoundOpeningGateLoop",5,"TimeBeforePlayingClosedSound",68,"TimeBeforePlayingOpenSound",68]],'
+    '["GateProxyBehavior",["GeometryForClosed",61,"GeometryForOpen",61,"OpenByDefault",6,"PercentOpenForPathing",68,"Proxy",60,"RepelCollidingUnits",6,"ResetTimeInMilliseconds",68,"SoundClosingGateLoop",5,"SoundFinishedClosingGate",5,"SoundFinishedOpeningGate",5,"SoundOpeningGateLoop",5,"TimeBeforePlayingClosedSound",68,"TimeBeforePlayingOpenSound",68]],'
+    '["GeometryUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"HideGeometry",61,"Permanent",6,"RampMesh1",60,"RampMesh2",60,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"ShowGeometry",61,"TriggeredBy",72,"WallBoundsMesh",60]],'
+    '["GettingBuiltBehavior",["DisallowRebuildFilter",42,"DisallowRebuildRange",26,"EvilWorkerName",60,"HealWeapon",75,"PercentOfBuildCostToRebuildDamaged",50,"PercentOfBuildCostToRebuildPristine",50,"PercentOfBuildCostToRebuildReallyDamaged",50,"PercentOfBuildCostToRebuildRubble",50,"RebuildTimeSeconds",26,"RebuildWhenDead",6,"SelfBuildingLoop",5,"SelfRepairFromDamageLoop",5,"SelfRepairFromRubbleLoop",5,"SpawnTimer",26,"TestFaction",6,"UseSpawnTimerWithoutWorker",6,"WorkerName",60]],'
+    '["GiantBirdAIUpdate",["AILuaEventsList",60,"AttackLocomotorType",31,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"FollowThroughCheckStep",26,"FollowThroughDistance",26,"FollowThroughGradient",26,"GrabTossHeightTrigger",26,"GrabTossTimeTrigger",26,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"ReturnForAmmoLocomotorType",31,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"TossFX",25,"Turret",63]],'
+    '["GiantBirdSlowDeathBehavior",["CrashAvoidKindOfs",30,"CrashAvoidRadius",26,"CrashAvoidStrength",26,"DamageAmountRequired",26,"DeathTypes",16,"DecayBeginTime",68,"DelayFromGroundToFinalDeath",68,"DestructionDelay",68,"DestructionDelayVariance",68,"ExemptStatus",45,"FX",36,"FXHitGround",25,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierBonusPerOverkillPercent",50,"NeedToMaintainFlailingHeight",6,"OCL",37,"OCLHitGround",41,"ProbabilityModifier",53,"RequiredStatus",45,"SinkDelay",68,"SinkDelayVariance",68,"SinkRate",26,"Sound",38,"Weapon",39]],'
+    '["GiveOrRestoreUpgradeSpecialPower",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"CommandButton",60,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FlagsUsedForToggle",76,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"UpgradeToGive",60]],'
+    '["GiveUpgradeUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DeliverUpgrade",6,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FadeOutSpeed",26,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GiveUpgradeEffect",25,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpawnOutFX",25,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["GloriousChargeUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"BonusRadius",26,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"SpeechDuration",68,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"UpdateInterval",68]],'
+    '["GrabPassengerSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AllowTree",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"GrabRadius",26,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["GrantUpgradeCreate",["ExemptStatus",45,"GiveOnBuildComplete",6,"UpgradeToGrant",60]],'
+    '["HealContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CollidePickup",6,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterSound",5,"ExemptStatus",45,"ExitSound",5,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RequiredStatus",45,"ShowPips",6,"TimeForFullHeal",68]],'
+    '["HealCrateCollide",["BuildingPickup",6,"ExecuteAnimation",60,"ExecuteAnimationFades",6,"ExecuteAnimationTime",26,"ExecuteAnimationZRise",26,"ExecuteFX",25,"ForbiddenKindOf",30,"ForbidOwnerPlayer",6,"HumanOnly",6,"PickupScience",65,"RequiredKindOf",30]],'
+    '["HeightDieUpdate",["DestroyAttachedParticlesAtHeight",26,"InitialDelay",68,"OnlyWhenMovingDown",6,"SnapToGroundOnDeath",6,"TargetHeight",26,"TargetHeightIncludesStructures",6]],'
+    '["HeroDie",["DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"RequiredStatus",45,"SpecialPowerTemplate",55]],'
+    '["HeroModeSpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"HeroAttributeModifier",60,"HeroEffectDuration",68,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"StopUnitBeforeActivating",6,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"UseUSERModelcondition",6]],'
+    '["HighlanderBody",["BurningDeathBehavior",6,"BurningDeathFX",25,"CheerRadius",26,"DamageCreationList",13,"DamagedAttributeModifier",60,"DodgePercent",50,"EnteringDamagedTransitionTime",68,"EnteringReallyDamagedTransitionTime",68,"GrabDamage",26,"GrabFX",25,"GrabObject",60,"GrabOffset",73,"HealingBuffFx",25,"InitialHealth",26,"MaxHealth",26,"MaxHealthDamaged",26,"MaxHealthReallyDamaged",26,"ReallyDamagedAttributeModifier",60,"RecoveryTime",68,"RemoveUpgradesOnDeath",6,"UseDefaultDamageSettings",6]],'
+    '["HijackerUpdate",["AttachToTargetBone",60]],'
+    '["HitReactionBehavior",["FastHitsResetReaction",6,"HitReactionLifeTimer1",68,"HitReactionLifeTimer2",68,"HitReactionLifeTimer3",68,"HitReactionThreshold1",26,"HitReactionThreshold2",26,"HitReactionThreshold3",26,"HitsParalyze",6]],'
+    '["HordeAIUpdate",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63]],'
+    '["HordeContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"AlternateFormation",60,"AttributeModifiers",61,"BackUpMaxDelayTime",68,"BackUpMaxDistance",26,"BackUpMinDelayTime",68,"BackUpMinDistance",26,"BackupPercentage",50,"BannerCarrierDestroyHordeOnDeath",6,"BannerCarrierHordeDeathType",16,"BannerCarrierMinLevel",68,"BannerCarrierPosition",44,"BannerCarriersAllowed",61,"BoneSpecificConditionState",28,"CanGrabStructure",6,"CollidePickup",6,"ComboHorde",7,"ConditionForEntry",10,"ContainMax",53,"CowerRadius",26,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DestroyRidersWhoAreNotFreeToExit",6,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterFadeTime",26,"EnterSound",5,"EvaEventLastMemberDeath",24,"ExemptStatus",45,"ExitBone",60,"ExitDelay",68,"ExitFadeTime",26,"ExitPitchRate",26,"ExitSound",5,"FadeFilter",42,"FadePassengerOnEnter",6,"FadePassengerOnExit",6,"FadeReverse",6,"FireGrabWeaponOnVictim",6,"FlankedDelay",68,"FlankedDuration",68,"ForcedLocomotorSet",31,"ForceOrientationContainer",6,"FrontAngle",26,"GoAggressiveOnExit",6,"GrabWeapon",75,"HealthRegen_PerSec",26,"InitialPayload",49,"IsPorcupineFormation",6,"KillPassengersOnDeath",6,"LeaderPosition",74,"LeaderRank",53,"LeadersAllowed",61,"LivingWorldOverloadTemplate",60,"MachineAllowed",6,"MachineType",60,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MeleeAttackLeashDistance",26,"MeleeBehavior",32,"MinimumHordeSize",68,"MinKillerAngle",17,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NotComboFormation",6,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"OrientLikeContainerOnExit",6,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RandomOffset",73,"RankInfo",52,"RankSplit",6,"RanksThatStopAdvance",68,"RanksToJustFreeWhenAttacking",69,"RanksToReleaseWhenAttacking",69,"ReleaseSnappyness",26,"RequiredStatus",45,"ResetMoodCheckTimeOnExit",6,"ScatterNearbyOnExit",6,"ShouldThrowOutPassengers",6,"ShowPips",6,"Slots",53,"SplitHorde",58,"SplitHordeNumber",53,"ThisFormationIsTheMainFormation",6,"ThrowOutPassengersDelay",68,"ThrowOutPassengersLandingWarhead",75,"ThrowOutPassengersVelocity",74,"TypeOneForWeaponSet",30,"TypeOneForWeaponState",30,"TypeThreeForWeaponState",30,"TypeTwoForWeaponSet",30,"TypeTwoForWeaponState",30,"UpgradeCreationTrigger",71,"UseMarchingAnims",6,"UseSlowHordeMovement",6,"VisionRearOverride",50,"VisionSideOverride",50]],'
+    '["HordeDispatchSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["HordeGarrisonContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CollidePickup",6,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterSound",5,"EntryOffset",74,"EntryPosition",74,"ExemptStatus",45,"ExitDelay",68,"ExitOffset",74,"ExitSound",5,"HealObjects",6,"ImmuneToClearBuildingAttacks",6,"InitialRoster",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"MobileGarrison",6,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RequiredStatus",45,"ShowPips",6,"TimeForFullHeal",68]],'
+    '["HordeMemberCollide",[]],'
+    '["HordeNotifyTargetsOfImminentProbableCrushingUpdate",["ScanAheadTimeMS",68,"ScanHeight",26,"ScanWidth",26,"TimeBetweenUpdatesMS",68]],'
+    '["HordeSiegeEngineContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CanGrabStructure",6,"CollidePickup",6,"ConditionForEntry",10,"ContainMax",53,"CrewAllowedToFire",6,"CrewFilter",42,"CrewMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DestroyRidersWhoAreNotFreeToExit",6,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterFadeTime",26,"EnterSound",5,"ExemptStatus",45,"ExitBone",60,"ExitDelay",68,"ExitFadeTime",26,"ExitPitchRate",26,"ExitSound",5,"FadeFilter",42,"FadePassengerOnEnter",6,"FadePassengerOnExit",6,"FadeReverse",6,"FireGrabWeaponOnVictim",6,"ForceOrientationContainer",6,"GoAggressiveOnExit",6,"GrabWeapon",75,"HealthRegen_PerSec",26,"InitialCrew",49,"InitialPayload",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"ObjectStatusOfCrew",45,"OrientLikeContainerOnExit",6,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"ReleaseSnappyness",26,"RequiredStatus",45,"ResetMoodCheckTimeOnExit",6,"ScatterNearbyOnExit",6,"ShouldThrowOutPassengers",6,"ShowPips",6,"Slots",53,"SpeedPercentPerCrew",50,"ThrowOutPassengersDelay",68,"ThrowOutPassengersLandingWarhead",75,"ThrowOutPassengersVelocity",74,"TypeOneForWeaponSet",30,"TypeOneForWeaponState",30,"TypeThreeForWeaponState",30,"TypeTwoForWeaponSet",30,"TypeTwoForWeaponState",30,"UpgradeCreationTrigger",71]],'
+    '["HordeTransportContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CanGrabStructure",6,"CollidePickup",6,"ConditionForEntry",10,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DestroyRidersWhoAreNotFreeToExit",6,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterFadeTime",26,"EnterSound",5,"ExemptStatus",45,"ExitBone",60,"ExitDelay",68,"ExitFadeTime",26,"ExitPitchRate",26,"ExitSound",5,"FadeFilter",42,"FadePassengerOnEnter",6,"FadePassengerOnExit",6,"FadeReverse",6,"FireGrabWeaponOnVictim",6,"ForceOrientationContainer",6,"GoAggressiveOnExit",6,"GrabWeapon",75,"HealthRegen_PerSec",26,"InitialPayload",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"OrientLikeContainerOnExit",6,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"ReleaseSnappyness",26,"RequiredStatus",45,"ResetMoodCheckTimeOnExit",6,"ScatterNearbyOnExit",6,"ShouldThrowOutPassengers",6,"ShowPips",6,"Slots",53,"ThrowOutPassengersDelay",68,"ThrowOutPassengersLandingWarhead",75,"ThrowOutPassengersVelocity",74,"TypeOneForWeaponSet",30,"TypeOneForWeaponState",30,"TypeThreeForWeaponState",30,"TypeTwoForWeaponSet",30,"TypeTwoForWeaponState",30,"UpgradeCreationTrigger",71]],'
+    '["HordeTransportContainDamage",[]],'
+    '["HordeWorkerAIUpdate",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63]],'
+    '["HorseHordeContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"AlternateFormation",60,"AttributeModifiers",61,"BackUpMaxDelayTime",68,"BackUpMaxDistance",26,"BackUpMinDelayTime",68,"BackUpMinDistance",26,"BackupPercentage",50,"BannerCarrierDestroyHordeOnDeath",6,"BannerCarrierHordeDeathType",16,"BannerCarrierMinLevel",68,"BannerCarrierPosition",44,"BannerCarriersAllowed",61,"BoneSpecificConditionState",28,"CanGrabStructure",6,"CollidePickup",6,"ComboHorde",7,"ConditionForEntry",10,"ContainMax",53,"CowerRadius",26,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DestroyRidersWhoAreNotFreeToExit",6,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterFadeTime",26,"EnterSound",5,"EvaEventLastMemberDeath",24,"ExemptStatus",45,"ExitBone",60,"ExitDelay",68,"ExitFadeTime",26,"ExitPitchRate",26,"ExitSound",5,"FadeFilter",42,"FadePassengerOnEnter",6,"FadePassengerOnExit",6,"FadeReverse",6,"FireGrabWeaponOnVictim",6,"FlankedDelay",68,"FlankedDuration",68,"ForcedLocomotorSet",31,"ForceOrientationContainer",6,"FrontAngle",26,"GoAggressiveOnExit",6,"GrabWeapon",75,"HealthRegen_PerSec",26,"InitialPayload",49,"IsPorcupineFormation",6,"KillPassengersOnDeath",6,"LeaderPosition",74,"LeaderRank",53,"LeadersAllowed",61,"LivingWorldOverloadTemplate",60,"MachineAllowed",6,"MachineType",60,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MeleeAttackLeashDistance",26,"MeleeBehavior",32,"MinimumHordeSize",68,"MinKillerAngle",17,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NotComboFormation",6,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"OrientLikeContainerOnExit",6,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RandomOffset",73,"RankInfo",52,"RankSplit",6,"RanksThatStopAdvance",68,"RanksToJustFreeWhenAttacking",69,"RanksToReleaseWhenAttacking",69,"ReleaseSnappyness",26,"RequiredStatus",45,"ResetMoodCheckTimeOnExit",6,"ScatterNearbyOnExit",6,"ShouldThrowOutPassengers",6,"ShowPips",6,"Slots",53,"SplitHorde",58,"SplitHordeNumber",53,"ThisFormationIsTheMainFormation",6,"ThrowOutPassengersDelay",68,"ThrowOutPassengersLandingWarhead",75,"ThrowOutPassengersVelocity",74,"TypeOneForWeaponSet",30,"TypeOneForWeaponState",30,"TypeThreeForWeaponState",30,"TypeTwoForWeaponSet",30,"TypeTwoForWeaponState",30,"UpgradeCreationTrigger",71,"UseMarchingAnims",6,"UseSlowHordeMovement",6,"VisionRearOverride",50,"VisionSideOverride",50]],'
+    '["ImmortalBody",["BurningDeathBehavior",6,"BurningDeathFX",25,"CheerRadius",26,"DamageCreationList",13,"DamagedAttributeModifier",60,"DodgePercent",50,"EnteringDamagedTransitionTime",68,"EnteringReallyDamagedTransitionTime",68,"GrabDamage",26,"GrabFX",25,"GrabObject",60,"GrabOffset",73,"HealingBuffFx",25,"InitialHealth",26,"MaxHealth",26,"MaxHealthDamaged",26,"MaxHealthReallyDamaged",26,"ReallyDamagedAttributeModifier",60,"RecoveryTime",68,"RemoveUpgradesOnDeath",6,"UseDefaultDamageSettings",6]],'
+    '["InactiveBody",[]],'
+    '["InheritUpgradeCreate",["ObjectFilter",42,"Radius",26,"Upgrade",72]],'
+    '["InstantDeathBehavior",["DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"FX",25,"MaxKillerAngle",17,"MinKillerAngle",17,"OCL",41,"RequiredStatus",45,"Sound",38,"Weapon",75]],'
+    '["InvisibilitySpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BroadcastRadius",26,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"Duration",68,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"InvisibilityNugget",29,"ObjectFilter",42,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["InvisibilityUpdate",["Broadcast",6,"BroadcastObjectFilter",42,"BroadcastRange",26,"ForbiddenUpgrades",72,"InvisibilityNugget",29,"RequiredUpgrades",72,"StartsActive",6,"UnitSpecificSoundNameToUseAsVoiceEnterStateMoveToStealthyArea",60,"UnitSpecificSoundNameToUseAsVoiceMoveToStealthyArea",60,"UpdatePeriod",68]],'
+    '["KeepObjectDie",["CollapsingTime",68,"DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"RequiredStatus",45,"StayOnRadar",6]],'
+    '["LargeGroupAudioUpdate",["Key",65,"TimeBetweenUpdatesMin",68,"TimeBetweenUpdatesVariation",68,"UnitWeight",65]],'
+    '["LargeGroupBonusUpdate",["AlliesOnly",6,"AttributeModifier",60,"Count",53,"FlagSubObjectNames",61,"HordeMemberFilter",42,"Radius",26,"RubOffRadius",26,"UpdateRate",68]],'
+    '["LaserUpdate",["LaserLifetime",26,"MuzzleParticleSystem",60,"ParentFireBoneName",60,"ParentFireBoneOnTurret",6,"TargetParticleSystem",60]],'
+    '["LevelGrantSpecialPower",["AbilityAbortRange",26,"AcceptanceFilter",42,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"Experience",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LevelFX",25,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RadiusEffect",26,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["LevelUpUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"LevelCap",53,"LevelsToGain",53,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["LifetimeUpdate",["DeathType",22,"MaxLifetime",68,"MinLifetime",68,"ScoreKill",6,"WaitForWakeUp",6]],'
+    '["LockWeaponCreate",["SlotToLock",54]],'
+    '["LocomotorSetUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"KillLocomotorUpgrade",6,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["ManTheWallsSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["MaxHealthUpgrade",["AddMaxHealth",26,"ChangeType",27,"ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["MineshaftPortalBehaviour",["AllowEnemies",6,"AllowNonSkirmishAIUnits",6,"ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["MissileUpdate",["BounceCount",53,"BounceDistance",26,"BounceFirstHeight",26,"BounceFirstPercentIndent",50,"BounceSecondHeight",26,"BounceSecondPercentIndent",50,"CrushStyle",6,"CurveFlattenMinDist",26,"DetonateCallsKill",6,"DetonateOnNoFuel",6,"DieOnImpact",6,"DistanceToTargetBeforeDiving",26,"DistanceToTravelBeforeTurning",26,"ExhaustTemplate",60,"FadeInTime",68,"FinalStuckTime",68,"FirstHeight",26,"FirstPercentHeight",50,"FirstPercentIndent",50,"FlightPathAdjustDistPerSecond",26,"FuelLifetime",68,"GarrisonHitKillCount",68,"GarrisonHitKillForbiddenKindOf",30,"GarrisonHitKillFX",25,"GarrisonHitKillRequiredKindOf",30,"GroundBounceFX",25,"GroundBounceWeapon",75,"GroundHitFX",25,"GroundHitWeapon",75,"IgnitionDelay",68,"IgnitionFX",25,"IgnoreTerrainHeight",6,"InvisibleFrames",68,"OrientToFlightPath",6,"PostLandingEmotion",20,"PostLandingEmotionRadius",26,"PostLandingStateTime",68,"PreLandingEmotion",20,"PreLandingEmotionRadius",26,"PreLandingStateTime",68,"SecondHeight",26,"SecondPercentHeight",50,"SecondPercentIndent",50,"TumbleRandomly",6]],'
+    '["ModelConditionAudioLoopClientBehavior",["ModelCondition",33]],'
+    '["ModelConditionSoundSelectorClientBehavior",[]],'
+    '["ModelConditionSpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"EmotionPulseRadius",26,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GenerateTerror",6,"GenerateUncontrollableFear",6,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"ObjectFilter",42,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"WhichSpecialPower",53]],'
+    '["ModelConditionUpgrade",["AddConditionFlags",8,"AddTempConditionFlag",34,"ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RemoveConditionFlags",8,"RemoveConditionFlagsInRange",35,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TempConditionTime",26,"TriggeredBy",72]],'
+    '["MoneyCrateCollide",["BuildingPickup",6,"ExecuteAnimation",60,"ExecuteAnimationFades",6,"ExecuteAnimationTime",26,"ExecuteAnimationZRise",26,"ExecuteFX",25,"ForbiddenKindOf",30,"ForbidOwnerPlayer",6,"HumanOnly",6,"MoneyProvided",68,"PickupScience",65,"RequiredKindOf",30]],'
+    '["MonitorConditionUpdate",["ModelConditionCommandSet",60,"ModelConditionFlags",8,"WeaponSetFlags",76,"WeaponToggleCommandSet",60]],'
+    '["MonsterDockUpdate",["AllowsPassthrough",6,"DockableObjectFilter",42,"DockedAnimationTime",68,"NumberApproachPositions",53]],'
+    '["NotifyTargetsOfImminentProbableCrushingUpdate",["ScanAheadTimeMS",68,"ScanHeight",26,"ScanWidth",26,"TimeBetweenUpdatesMS",68]],'
+    '["OathbreakerBody",["BurningDeathBehavior",6,"BurningDeathFX",25,"CheerRadius",26,"DamageCreationList",13,"DamagedAttributeModifier",60,"DodgePercent",50,"EnteringDamagedTransitionTime",68,"EnteringReallyDamagedTransitionTime",68,"GrabDamage",26,"GrabFX",25,"GrabObject",60,"GrabOffset",73,"HealingBuffFx",25,"InitialHealth",26,"MaxHealth",26,"MaxHealthDamaged",26,"MaxHealthReallyDamaged",26,"ReallyDamagedAttributeModifier",60,"RecoveryTime",68,"RemoveUpgradesOnDeath",6,"UseDefaultDamageSettings",6]],'
+    '["ObjectCreationUpgrade",["Angle",17,"ConflictsWith",72,"CustomAnimAndDuration",3,"DeathAnimAndDuration",3,"Delay",68,"DestroyWhenSold",6,"FadeInTime",68,"GrantUpgrade",60,"Offset",74,"Permanent",6,"RemoveUpgrade",60,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"ThingToSpawn",60,"TriggeredBy",72,"UpgradeObject",41,"UseBuildingProduction",6]],'
+    '["OCLSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"CreateLocation",12,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"NearestSecondaryObjectFilter",42,"OCL",41,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UpgradeName",70,"UpgradeOCL",70,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["OCLUpdate",["Amount",53,"CreateAtEdge",6,"MaxDelay",68,"MinDelay",68,"OCL",41]],'
+    '["OilSpillUpdate",["AliveOnly",6,"BreadcrumbName",60,"ChargingModeTrigger",6,"FireWeaponNugget",65,"HeroModeTrigger",6,"IgnitionWeaponName",60,"IgnitionWeaponSpacing",26,"OilSpillFX",25]],'
+    '["OneRingPenaltyUpdate",["DiscoveredSound",5,"RingTimeBeforeSpawning",68,"SpecialObjectName",60,"StartingDistanceFromMe",26,"TimeFrozenFromPenalty",68,"TimeRingPowerSuppressed",68,"TimeSpentRoamingAround",68]],'
+    '["OpenContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CollidePickup",6,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterSound",5,"ExemptStatus",45,"ExitSound",5,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RequiredStatus",45,"ShowPips",6]],'
+    '["PartTheHeavensUpdate",["Angle",65,"Color",65,"Opacity",65,"Radius",65,"Texture",60]],'
+    '["PassiveAreaEffectBehavior",["AllowFilter",42,"AntiCategories",4,"AntiFX",25,"EffectRadius",26,"HealFX",25,"HealPercentPerSecond",50,"ModifierName",61,"NonStackable",6,"PingDelay",68,"UpgradeRequired",60]],'
+    '["PhysicsBehavior",["AllowBouncing",6,"BounceCount",53,"BounceFirstHeight",26,"BounceFirstPercentIndent",50,"BounceSecondHeight",26,"BounceSecondPercentIndent",50,"CurveFlattenMinDist",26,"FirstHeight",26,"FirstPercentHeight",50,"FirstPercentIndent",50,"GravityMult",26,"GroundBounceFX",25,"GroundHitFX",25,"IgnoreTerrainHeight",6,"KillWhenRestingOnGround",6,"OrientToFlightPath",6,"SecondHeight",26,"SecondPercentHeight",50,"SecondPercentIndent",50,"ShockStandingTime",68,"ShockStunnedTimeHigh",68,"ShockStunnedTimeLow",68,"TumbleRandomly",6]],'
+    '["PickupStuffUpdate",["ScanIntervalSeconds",26,"ScanRange",26,"SkirmishAIOnly",6,"StuffToPickUp",42]],'
+    '["PillageModule",["NumDamageEventsPerPillage",68,"PillageAmount",68,"PillageFilter",42]],'
+    '["PlayerHealSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"HealAffects",30,"HealAmount",26,"HealAsPercent",6,"HealFX",25,"HealOCL",41,"HealRadius",26,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["PlayerUpgradeSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UpgradeName",70,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["PoisonedBehavior",["PoisonDamageInterval",68]],'
+    '["PorcupineFormationBodyModule",["BurningDeathBehavior",6,"BurningDeathFX",25,"CheerRadius",26,"CrushDamageWeaponTemplate",75,"CrusherLevelResisted",53,"DamageCreationList",13,"DamagedAttributeModifier",60,"DamageWeaponTemplate",75,"DodgePercent",50,"EnteringDamagedTransitionTime",68,"EnteringReallyDamagedTransitionTime",68,"GrabDamage",26,"GrabFX",25,"GrabObject",60,"GrabOffset",73,"HealingBuffFx",25,"InitialHealth",26,"MaxHealth",26,"MaxHealthDamaged",26,"MaxHealthReallyDamaged",26,"ReallyDamagedAttributeModifier",60,"RecoveryTime",68,"RemoveUpgradesOnDeath",6,"UseDefaultDamageSettings",6]],'
+    '["PreorderCreate",[]],'
+    '["ProductionQueueHordeContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CollidePickup",6,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DestinationTemplate",43,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterSound",5,"EntryOffset",74,"EntryPosition",74,"ExemptStatus",45,"ExitDelay",68,"ExitOffset",74,"ExitSound",5,"HealObjects",6,"ImmuneToClearBuildingAttacks",6,"InitialRoster",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"MobileGarrison",6,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RequiredStatus",45,"ShowPips",6,"TimeForFullHeal",68]],'
+    '["ProductionSpeedBonus",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"NumberOfFrames",53,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"SpeedMulitplier",26,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"Type",61,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["ProductionUpdate",["BonusForType",60,"ConstructionCompleteDuration",68,"DoorCloseTime",68,"DoorOpeningTime",68,"DoorWaitOpenTime",68,"GiveNoXP",6,"MaxQueueEntries",68,"NumDoorAnimations",53,"SecondaryQueue",6,"SetBonusModelConditionOnSpeedBon",6,"SpecialPrepModelconditionTime",68,"SpeedBonusAudioLoop",5,"UnitInvulnerableTime",68,"VeteranUnitsFromVeteranFactory",6]],'
+    '["ProjectileStreamUpdate",[]],'
+    '["ProneUpdate",["DamageToFramesRatio",26]],'
+    '["PropagandaTowerBehavior",["DelayBetweenUpdates",68,"HealPercentEachSecond",50,"PulseFX",25,"Radius",26,"UpgradedHealPercentEachSecond",50,"UpgradedPulseFX",25,"UpgradeRequired",60]],'
+    '["QueueProductionExitUpdate",["AllowAirborneCreation",6,"CanRallyToSlaughter",6,"ExitDelay",68,"InitialBurst",68,"NaturalRallyPoint",74,"NoExitPath",6,"PlacementViewAngle",17,"UnitCreatePoint",74,"UseReturnToFormation",6]],'
+    '["RadarMarkerClientUpdate",["MarkerType",60]],'
+    '["RadarUpdate",["RadarExtendTime",68]],'
+    '["RadarUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"DisableProof",6,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["RadiateFearUpdate",["ConflictsWith",72,"CustomAnimAndDuration",3,"EmotionPulseInterval",68,"EmotionPulseRadiusl",26,"GenerateFear",6,"GenerateTerror",6,"GenerateUncontrollableFear",6,"InitiallyActive",6,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72,"VictimFilter",42,"WhichSpecialPower",53]],'
+    '["RadiusDecalUpdate",[]],'
+    '["RainOfFireUpdate",["DarknessFadeTime",68,"DarknessLevel",26,"DPSMax",26,"DPSMin",26,"DPSRampupTime",68,"JitterRadius",26,"RainEmitterHeight",26,"RainOffset",73,"StartRainTime",68]],'
+    '["RampageBehavior",["RampageAngryLifeTimer",53,"RampageEnemyCheckRange",26,"RampageEnemyThreshold",53,"RampageHealthThreshold",26,"RampageLifeTimer",53,"RampageResetTimer",53,"RequiredUpgrade",61]],'
+    '["RandomSoundSelectorClientBehavior",["Chance",50,"RerollOnEveryFrame",6,"SoundAmbient",5,"SoundAmbientBattle",5,"SoundAmbientDamaged",5,"SoundAmbientReallyDamaged",5,"SoundAmbientRubble",5,"SoundCreated",5,"SoundCrushing",5,"SoundEnter",5,"SoundExit",5,"SoundFallingFromPlane",5,"SoundImpact",5,"SoundImpactCyclonic",5,"SoundMoveLoop",5,"SoundMoveLoopDamaged",5,"SoundMoveStart",5,"SoundMoveStartDamaged",5,"SoundOnDamaged",5,"SoundOnReallyDamaged",5,"SoundPromotedElite",5,"SoundPromotedHero",5,"SoundPromotedVeteran",5,"SoundStealthOff",5,"SoundStealthOn",5,"UnitSpecificSounds",64,"VoiceAlert",5,"VoiceAttack",5,"VoiceAttackAir",5,"VoiceAttackCharge",5,"VoiceAttackMachine",5,"VoiceAttackStructure",5,"VoiceCombineWithHorde",5,"VoiceCreated",5,"VoiceDefect",5,"VoiceEnterStateAttack",5,"VoiceEnterStateAttackAir",5,"VoiceEnterStateAttackCharge",5,"VoiceEnterStateAttackMachine",5,"VoiceEnterStateAttackStructure",5,"VoiceEnterStateMove",5,"VoiceEnterStateMoveOverWalls",5,"VoiceEnterStateMoveToCamp",5,"VoiceEnterStateMoveToHigherGround",5,"VoiceEnterStateMoveWhileAttacking",5,"VoiceEnterStateRetreatToCastle",5,"VoiceFear",5,"VoiceFullyCreated",5,"VoiceGuard",5,"VoiceMove",5,"VoiceMoveOverWalls",5,"VoiceMoveToCamp",5,"VoiceMoveToHigherGround",5,"VoiceMoveWhileAttacking",5,"VoicePriority",68,"VoiceRetreatToCastle",5,"VoiceSelect",5,"VoiceSelectBattle",5,"VoiceSelectUnderConstruction",5,"VoiceTaskComplete",5]],'
+    '["RebuildHoleBehavior",["HoleHealthRegen_PerSecond",50,"WorkerObjectName",60,"WorkerRespawnDelay",68]],'
+    '["RebuildHoleExposeDie",["DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"FadeInTimeSeconds",26,"HoleMaxHealth",26,"HoleName",60,"MaxKillerAngle",17,"MinKillerAngle",17,"RequiredStatus",45,"TransferAttackers",6]],'
+    '["ReflectDamage",["DamageTypesToReflect",14,"MinimumDamageToReflect",26,"ReflectDamagePercentage",50]],'
+    '["RefundDie",["BuildingRequired",42,"DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"RefundPercent",50,"RequiredStatus",45,"UpgradeRequired",70]],'
+    '["RemoveUpgradeUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RemoveFromAllPlayerObjects",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"SuppressEvaEventForRemoval",6,"TriggeredBy",72,"UpgradeGroupsToRemove",61,"UpgradeToRemove",61]],'
+    '["RepairDockUpdate",["AllowsPassthrough",6,"NumberApproachPositions",53,"TimeForFullHeal",68]],'
+    '["RepairSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["ReplaceObjectUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"ReplaceFX",25,"ReplaceObject",65,"ReplaceRadius",26,"RequiredConditions",57,"Scatter",6,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["ReplaceSelfUpgrade",["AndThenAddA",61,"ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"ReplaceWith",61,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["ReplenishUnitsBehavior",["ConflictsWith",72,"CustomAnimAndDuration",3,"NoReplenishIfEnemyWithinRadius",26,"Permanent",6,"ReplenishDelay",68,"ReplenishFXList",25,"ReplenishHordeMembersOnly",6,"ReplenishRadius",26,"ReplenishStatii",45,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"StartsActive",6,"TriggeredBy",72]],'
+    '["RespawnBody",["BurningDeathBehavior",6,"BurningDeathFX",25,"CanRespawn",6,"CheerRadius",26,"DamageCreationList",13,"DamagedAttributeModifier",60,"DodgePercent",50,"EnteringDamagedTransitionTime",68,"EnteringReallyDamagedTransitionTime",68,"GrabDamage",26,"GrabFX",25,"GrabObject",60,"GrabOffset",73,"HealingBuffFx",25,"InitialHealth",26,"MaxHealth",26,"MaxHealthDamaged",26,"MaxHealthReallyDamaged",26,"PermanentlyKilledByFilter",42,"ReallyDamagedAttributeModifier",60,"RecoveryTime",68,"RemoveUpgradesOnDeath",6,"UseDefaultDamageSettings",6]],'
+    '["RespawnUpdate",["AutoRespawnAtObjectFilter",42,"ButtonImage",60,"DeathAnim",8,"DeathAnimationTime",68,"DeathFX",25,"InitialSpawnAnim",8,"InitialSpawnAnimationTime",68,"InitialSpawnFX",25,"RespawnAnim",8,"RespawnAnimationTime",68,"RespawnAsTemplate",60,"RespawnEntry",65,"RespawnFX",25,"RespawnRules",65]],'
+    '["RiderChangeContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CanGrabStructure",6,"CollidePickup",6,"ConditionForEntry",10,"ContainMax",53,"CrewAllowedToFire",6,"CrewFilter",42,"CrewMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DestroyRidersWhoAreNotFreeToExit",6,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterFadeTime",26,"EnterSound",5,"ExemptStatus",45,"ExitBone",60,"ExitDelay",68,"ExitFadeTime",26,"ExitPitchRate",26,"ExitSound",5,"FadeFilter",42,"FadePassengerOnEnter",6,"FadePassengerOnExit",6,"FadeReverse",6,"FireGrabWeaponOnVictim",6,"ForceOrientationContainer",6,"GoAggressiveOnExit",6,"GrabWeapon",75,"HealthRegen_PerSec",26,"InitialCrew",49,"InitialPayload",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"ObjectStatusOfCrew",45,"OrientLikeContainerOnExit",6,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"ReleaseSnappyness",26,"RequiredStatus",45,"ResetMoodCheckTimeOnExit",6,"ScatterNearbyOnExit",6,"ShouldThrowOutPassengers",6,"ShowPips",6,"Slots",53,"SpeedPercentPerCrew",50,"ThrowOutPassengersDelay",68,"ThrowOutPassengersLandingWarhead",75,"ThrowOutPassengersVelocity",74,"TransferSelection",6,"TypeOneForWeaponSet",30,"TypeOneForWeaponState",30,"TypeThreeForWeaponState",30,"TypeTwoForWeaponSet",30,"TypeTwoForWeaponState",30,"UpgradeCreationTrigger",71]],'
+    '["RousingSpeechUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"BonusRadius",26,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CreateWave",6,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FollowerFX",25,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LeaderFX",25,"LevelUp",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"ModifierName",61,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"ObjectFilter",42,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"SpeechDuration",68,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"UpdateInterval",68,"WaveWidth",26]],'
+    '["RubbleRiseUpdate",["BigBurstFrequency",53,"DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"FXList",65,"MaxBurstDelay",68,"MaxKillerAngle",17,"MaxRubbleRiseDelay",68,"MaxShudder",26,"MinBurstDelay",68,"MinKillerAngle",17,"MinRubbleRiseDelay",68,"OCL",65,"RequiredStatus",45,"RubbleHeight",26,"RubbleRiseDamping",26]],'
+    '["RunOffMapBehavior",["DieOnMap",6,"RequiresSpecificTrigger",6,"RunOffMapWaypointName",60,"RunToLocation",73]],'
+    '["SalvageCrateCollide",["AllowAIPickup",6,"BannerChance",50,"BuildingPickup",6,"ExecuteAnimation",60,"ExecuteAnimationFades",6,"ExecuteAnimationTime",26,"ExecuteAnimationZRise",26,"ExecuteFX",25,"ForbiddenKindOf",30,"ForbidOwnerPlayer",6,"HumanOnly",6,"LevelUpChance",50,"LevelUpRadius",50,"MaxResource",53,"MinResource",53,"PickupScience",65,"PorterChance",50,"RequiredKindOf",30,"ResourceChance",50,"Upgrade",60]],'
+    '["ScaleWallSpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DelayAtFootOfWall",68,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["ScavengerSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BountyPercent",26,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["ShareExperienceBehavior",["DropOff",26,"ObjectFilter",42,"Percentage",26,"Radius",26]],'
+    '["ShipSlowDeathBehavior",["DamageAmountRequired",26,"DeathTypes",16,"DecayBeginTime",68,"DestructionDelay",68,"DestructionDelayVariance",68,"ExemptStatus",45,"FX",36,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierBonusPerOverkillPercent",50,"OCL",37,"ProbabilityModifier",53,"RequiredStatus",45,"SinkDelay",68,"SinkDelayVariance",68,"SinkRate",26,"Sound",38,"Weapon",39]],'
+    '["ShroudCrateCollide",[]],'
+    '["SiegeAIUpdate",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63]],'
+    '["SiegeDeployHordeSpecialPower",["HordeDeploy",6,"InitiateSound",5,"SpecialPowerTemplate",55,"StartsPaused",6]],'
+    '["SiegeDeploySpecialPower",["AwayFromWallWaitDist",26,"EvacuateCrewOnDeploy",6,"EvacuatePassengersOnDeploy",6,"ExtraWallDistance",26,"InitiateSound",5,"LowerDelay",68,"RaiseDelay",68,"SkipAdjustPosition",6,"SpecialPowerTemplate",55,"StartsPaused",6,"WallSearchDistance",26]],'
+    '["SiegeDockingBehavior",["DUMMY",53]],'
+    '["SiegeEngineContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CanGrabStructure",6,"CollidePickup",6,"ConditionForEntry",10,"ContainMax",53,"CrewAllowedToFire",6,"CrewFilter",42,"CrewMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DestroyRidersWhoAreNotFreeToExit",6,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterFadeTime",26,"EnterSound",5,"ExemptStatus",45,"ExitBone",60,"ExitDelay",68,"ExitFadeTime",26,"ExitPitchRate",26,"ExitSound",5,"FadeFilter",42,"FadePassengerOnEnter",6,"FadePassengerOnExit",6,"FadeReverse",6,"FireGrabWeaponOnVictim",6,"ForceOrientationContainer",6,"GoAggressiveOnExit",6,"GrabWeapon",75,"HealthRegen_PerSec",26,"InitialCrew",49,"InitialPayload",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"ObjectStatusOfCrew",45,"OrientLikeContainerOnExit",6,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"ReleaseSnappyness",26,"RequiredStatus",45,"ResetMoodCheckTimeOnExit",6,"ScatterNearbyOnExit",6,"ShouldThrowOutPassengers",6,"ShowPips",6,"Slots",53,"SpeedPercentPerCrew",50,"ThrowOutPassengersDelay",68,"ThrowOutPassengersLandingWarhead",75,"ThrowOutPassengersVelocity",74,"TransferSelection",6,"TypeOneForWeaponSet",30,"TypeOneForWeaponState",30,"TypeThreeForWeaponState",30,"TypeTwoForWeaponSet",30,"TypeTwoForWeaponState",30,"UpgradeCreationTrigger",71]],'
+    '["SlaughterHordeContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CanAlwaysEnter",42,"CashBackPercent",50,"CollidePickup",6,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterSound",5,"EntryOffset",74,"EntryPosition",74,"ExemptStatus",45,"ExitDelay",68,"ExitOffset",74,"ExitSound",5,"HealObjects",6,"ImmuneToClearBuildingAttacks",6,"InitialRoster",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"MobileGarrison",6,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RequiredStatus",45,"ShowPips",6,"StatusRequiredForCanAlwaysEnter",45,"TimeForFullHeal",68]],'
+    '["SlavedUpdate",["AttackRange",53,"AttackWanderRange",53,"DieOnMastersDeath",6,"DistToTargetToGrantRangeBonus",53,"FadeOutRange",53,"FadeTime",68,"GuardMaxRange",53,"GuardPositionOffset",74,"GuardWanderRange",53,"LeashRange",53,"MarkUnselectable",6,"RepairMaxAltitude",26,"RepairMaxReadyTime",68,"RepairMaxWeldTime",68,"RepairMinAltitude",26,"RepairMinReadyTime",68,"RepairMinWeldTime",68,"RepairRange",53,"RepairRatePerSecond",26,"RepairWeldingFXBone",60,"RepairWeldingSys",60,"RepairWhenBelowHealth_",53,"ScoutRange",53,"ScoutWanderRange",53,"StayOnSameLayerAsMaster",6,"UseSlaverAsControlForEvaObjectSightedEvents",6]],'
+    '["SlaveWatcherBehavior",["GrantUpgrade",60,"LetSlaveLive",6,"RemoveUpgrade",60,"ShareUpgrades",6]],'
+    '["SlowDeathBehavior",["DamageAmountRequired",26,"DeathTypes",16,"DecayBeginTime",68,"DestructionDelay",68,"DestructionDelayVariance",68,"ExemptStatus",45,"FX",36,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierBonusPerOverkillPercent",50,"OCL",37,"ProbabilityModifier",53,"RequiredStatus",45,"SinkDelay",68,"SinkDelayVariance",68,"SinkRate",26,"Sound",38,"Weapon",39]],'
+    '["SpawnBehavior",["AggregateHealth",6,"CanReclaimOrphans",6,"ConflictsWith",72,"CustomAnimAndDuration",3,"DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"ExitByBudding",6,"FadeInTime",68,"InitialBurst",53,"KillSpawnsBasedOnModelConditionState",6,"MaxKillerAngle",17,"MinKillerAngle",17,"OneShot",6,"Permanent",6,"PropagateDamageTypesToSlavesWhenExisting",14,"RequiredStatus",45,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"RespectCommandLimit",6,"ShareUpgrades",6,"SpawnedRequireSpawner",6,"SpawnInsideBuilding",6,"SpawnNumber",53,"SpawnReplaceDelay",68,"SpawnTemplateName",61,"TriggeredBy",72]],'
+    '["SpawnedModelConditionCreate",["SpawnerTrigger",65]],'
+    '["SpawnPointProductionExitUpdate",["SpawnPointBoneName",60]],'
+    '["SpawnUnitBehavior",["SpawnOnce",6,"UnitCommand",60,"UnitName",60]],'
+    '["SpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["SpecialDisguiseUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DisguiseAsTemplate",60,"DisguisedAsTemplate_EnemyPerspec",60,"DisguiseFX",25,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"ForceMountedWhenDisguising",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"OpacityTarget",26,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerInstantlyOnCreate",6,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["SpecialEnemySenseUpdate",["ScanInterval",68,"ScanRange",26,"SpecialEnemyFilter",42]],'
+    '["SpecialPowerCompletionDie",["DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"RequiredStatus",45,"SpecialPowerTemplate",55]],'
+    '["SpecialPowerCreate",[]],'
+    '["SpecialPowerModule",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["SpecialPowerTimerRefreshSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["SpellRechargeModifierUpgrade",["ApplyToTheseUpgrades",61,"ConflictsWith",72,"CustomAnimAndDuration",3,"LabelForPalantirString",60,"ObjectFilter",42,"Percentage",50,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"Slaughter",6,"StartsActive",6,"TriggeredBy",72,"UpgradeDiscount",6]],'
+    '["SplitHordeSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["SquishCollide",[]],'
+    '["StancesBehavior",["StanceTemplate",59]],'
+    '["StatusBitsUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"StatusToClear",45,"StatusToSet",45,"TriggeredBy",72]],'
+    '["StatusBitsUpgradeIfEldestKindof",["ConflictsWith",72,"CustomAnimAndDuration",3,"ObjectFilter",42,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"StatusToClear",45,"StatusToSet",45,"TriggeredBy",72]],'
+    '["StealthDetectorUpdate",["CancelOneRingEffect",6,"CanDetectWhileContained",6,"CanDetectWhileGarrisoned",6,"DetectionRange",26,"DetectionRate",68,"ExtraForbiddenKindOf",30,"ExtraRequiredKindOf",30,"InitiallyDisabled",6,"IRBeaconParticleSysName",47,"IRBrightParticleSysName",47,"IRGridParticleSysName",47,"IRParticleSysBone",60,"IRParticleSysName",47,"LoudPingSound",5,"PingSound",5,"RequiredUpgrade",60]],'
+    '["StealthUpdate",["BecomeStealthedFX",25,"BecomeStealthedOneRingFX",25,"DetectedByAnyoneRange",26,"DetectedByFriendliesOnly",6,"DisguiseFX",25,"DisguiseRevealFX",25,"DisguiseRevealTransitionTime",68,"DisguisesAsTeam",6,"DisguiseTransitionTime",68,"EvaEventDetectedAlly",24,"EvaEventDetectedEnemy",24,"EvaEventDetectedOwner",24,"ExitStealthFX",25,"ExitStealthOneRingFX",25,"ForbiddenUpgradeNames",61,"FriendlyOpacityMax",50,"FriendlyOpacityMin",50,"HintDetectableConditions",45,"InnateStealth",6,"MoveThresholdSpeed",26,"OneRingDelayOff",68,"OneRingDelayOn",68,"OrderIdleEnemiesToAttackMeUponReveal",6,"PulseFrequency",68,"RemoveTerrainRestrictionOnUpgrade",61,"RequiredUpgradeNames",61,"RevealDistanceFromTarget",26,"RevealWeaponSets",76,"RingAnimTimeOff",68,"RingAnimTimeOn",68,"RingDelayAfterRemoving",68,"StartsActive",6,"StealthDelay",68,"StealthForbiddenConditions",9,"VoiceEnterStateMoveToStealthyArea",5,"VoiceMoveToStealthyArea",5]],'
+    '["StealthUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["StopSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"StopPowerTemplate",55,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["StoreObjectsSpecialPower",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"Radius",26,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["StrafeAreaUpdate",["InitialSweepPhase",26,"Slope",26,"StrafeAreaRadius",26,"SweepAmplitude",26,"Sweepfrequency",26,"WeaponName",60]],'
+    '["StructureBody",["BurningDeathBehavior",6,"BurningDeathFX",25,"CheerRadius",26,"DamageCreationList",13,"DamagedAttributeModifier",60,"DodgePercent",50,"EnteringDamagedTransitionTime",68,"EnteringReallyDamagedTransitionTime",68,"GrabDamage",26,"GrabFX",25,"GrabObject",60,"GrabOffset",73,"HealingBuffFx",25,"InitialHealth",26,"MaxHealth",26,"MaxHealthDamaged",26,"MaxHealthReallyDamaged",26,"ReallyDamagedAttributeModifier",60,"RecoveryTime",68,"RemoveUpgradesOnDeath",6,"UseDefaultDamageSettings",6]],'
+    '["StructureCollapseUpdate",["BigBurstFrequency",53,"CollapseDamping",26,"CollapseHeight",26,"DamageAmountRequired",26,"DeathTypes",16,"DestroyObjectWhenDone",6,"ExemptStatus",45,"FXList",65,"MaxBurstDelay",68,"MaxCollapseDelay",68,"MaxKillerAngle",17,"MaxShudder",26,"MinBurstDelay",68,"MinCollapseDelay",68,"MinKillerAngle",17,"OCL",65,"RequiredStatus",45]],'
+    '["StructureToppleUpdate",["AngleFX",65,"CrushingFX",25,"CrushingWeaponName",60,"DamageAmountRequired",26,"DamageFXTypes",14,"DeathTypes",16,"ExemptStatus",45,"ForceToppleAngle",26,"MaxKillerAngle",17,"MaxToppleBurstDelay",68,"MaxToppleDelay",68,"MinKillerAngle",17,"MinToppleBurstDelay",68,"MinToppleDelay",68,"OCL",65,"RequiredStatus",45,"StructuralDecay",26,"StructuralIntegrity",26,"ToppleAccelerationFactor",26,"ToppleDelayFX",25,"ToppleDoneFX",25,"ToppleStartFX",25,"TopplingFX",25]],'
+    '["SubObjectsUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"ExcludeSubobjects",61,"FadeTimeInSeconds",26,"HideSubObjects",61,"HideSubObjectsOnRemove",6,"Permanent",6,"RecolorHouse",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"ShowSubObjects",61,"SkipFadeOnCreate",6,"TriggeredBy",72,"UnHideSubObjectsOnRemove",6,"UpgradeTexture",62,"WaitBeforeFadeInSeconds",26]],'
+    '["SummonReplacementSpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"CancelDisguiseWhenDismounting",6,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"EmotionPulseRadius",26,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GenerateTerror",6,"GenerateUncontrollableFear",6,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MountedTemplate",60,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"ObjectFilter",42,"OpacityTarget",26,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"SynchronizeTimerOnSpecialPower",61,"TriggerAttributeModifier",60,"TriggerInstantlyOnCreate",6,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"WhichSpecialPower",53]],'
+    '["SupplyCenterCreate",[]],'
+    '["SupplyCenterDockUpdate",["AllowsPassthrough",6,"BonusScience",65,"BonusScienceMultiplier",50,"NumberApproachPositions",53,"ValueMultiplier",26]],'
+    '["SupplyCenterProductionExitUpdate",["NaturalRallyPoint",74,"UnitCreatePoint",74]],'
+    '["SupplyTruckAIUpdate",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"HarvestActionTime",68,"HarvestActivationRange",26,"HarvestPreparationTime",68,"HarvestTrees",6,"HoldGroundCloseRangeDistance",26,"MaxBoxes",53,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"SupplyCenterActionDelay",68,"SupplyWarehouseActionDelay",68,"SupplyWarehouseScanDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63]],'
+    '["SupplyWarehouseCreate",[]],'
+    '["SupplyWarehouseCripplingBehavior",["SelfHealAmount",26,"SelfHealDelay",68,"SelfHealSupression",68]],'
+    '["SupplyWarehouseDockUpdate",["AllowsPassthrough",6,"DeleteWhenEmpty",6,"NumberApproachPositions",53,"StartingBoxes",53]],'
+    '["SwayClientUpdate",[]],'
+    '["SymbioticStructuresBody",["BurningDeathBehavior",6,"BurningDeathFX",25,"CheerRadius",26,"DamageCreationList",13,"DamagedAttributeModifier",60,"DodgePercent",50,"EnteringDamagedTransitionTime",68,"EnteringReallyDamagedTransitionTime",68,"GrabDamage",26,"GrabFX",25,"GrabObject",60,"GrabOffset",73,"HealingBuffFx",25,"InitialHealth",26,"MaxHealth",26,"MaxHealthDamaged",26,"MaxHealthReallyDamaged",26,"ReallyDamagedAttributeModifier",60,"RecoveryTime",68,"RemoveUpgradesOnDeath",6,"Symbiote",60,"UseDefaultDamageSettings",6]],'
+    '["TaintSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TaintFX",25,"TaintObject",60,"TaintOCL",41,"TaintRadius",26,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["TeleportSpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"HeroAttributeModifier",60,"HeroEffectDuration",68,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"StopUnitBeforeActivating",6,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"UseUSERModelcondition",6]],'
+    '["TeleportToCasterSpecialPower",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxDestinationRadius",26,"MaxSpecialObjects",68,"MinDestinationRadius",26,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"Radius",26,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TargetFX",25,"TriggerAttributeModifier",60,"TriggerFX",25,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["TemporarilyDefectUpdate",["DefectDuration",68]],'
+    '["TerrainResourceBehavior",["HighPriority",6,"IncomeInterval",68,"MaxIncome",53,"Radius",26,"Upgrade",70,"UpgradeBonusPercent",50,"UpgradeMustBePresent",42,"Visible",6]],'
+    '["TerrainResourceClientBehavior",[]],'
+    '["ThreatFinderUpdate",["DefaultRadius",26]],'
+    '["ToggleDeploySpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SoundDeploy",5,"SoundUndeploy",5,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["ToggleHiddenSpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"ShowPalantirTimer",6,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["ToggleMountedSpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"CancelDisguiseWhenDismounting",6,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MountedTemplate",60,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"OpacityTarget",26,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"SynchronizeTimerOnSpecialPower",61,"TriggerAttributeModifier",60,"TriggerInstantlyOnCreate",6,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["TooltipUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"Description",60,"DisplayName",60,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["ToppleUpdate",["BounceFX",25,"BounceVelocityPercent",50,"InitialAccelPercent",50,"InitialVelocityPercent",50,"KillStumpWhenToppled",6,"KillWhenFinishedToppling",6,"KillWhenStartToppling",6,"MinimumToppleSpeed",26,"ReorientToppledRubble",6,"StumpName",60,"ToppleFX",25,"ToppleLeftOrRightOnly",6]],'
+    '["TransitionDamageFX",["DamagedFXList1",65,"DamagedFXList10",65,"DamagedFXList11",65,"DamagedFXList12",65,"DamagedFXList2",65,"DamagedFXList3",65,"DamagedFXList4",65,"DamagedFXList5",65,"DamagedFXList6",65,"DamagedFXList7",65,"DamagedFXList8",65,"DamagedFXList9",65,"DamagedHideSubObject",61,"DamagedOCL1",65,"DamagedOCL10",65,"DamagedOCL11",65,"DamagedOCL12",65,"DamagedOCL2",65,"DamagedOCL3",65,"DamagedOCL4",65,"DamagedOCL5",65,"DamagedOCL6",65,"DamagedOCL7",65,"DamagedOCL8",65,"DamagedOCL9",65,"DamagedParticleSystem1",65,"DamagedParticleSystem10",65,"DamagedParticleSystem11",65,"DamagedParticleSystem12",65,"DamagedParticleSystem2",65,"DamagedParticleSystem3",65,"DamagedParticleSystem4",65,"DamagedParticleSystem5",65,"DamagedParticleSystem6",65,"DamagedParticleSystem7",65,"DamagedParticleSystem8",65,"DamagedParticleSystem9",65,"DamagedShowSubObject",61,"DamageFXTypes",14,"DamageOCLTypes",14,"DamageParticleTypes",14,"PristineHideSubObject",61,"PristineShowSubObject",61,"ReallyDamagedFXList1",65,"ReallyDamagedFXList10",65,"ReallyDamagedFXList11",65,"ReallyDamagedFXList12",65,"ReallyDamagedFXList2",65,"ReallyDamagedFXList3",65,"ReallyDamagedFXList4",65,"ReallyDamagedFXList5",65,"ReallyDamagedFXList6",65,"ReallyDamagedFXList7",65,"ReallyDamagedFXList8",65,"ReallyDamagedFXList9",65,"ReallyDamagedHideSubObject",61,"ReallyDamagedOCL1",65,"ReallyDamagedOCL10",65,"ReallyDamagedOCL11",65,"ReallyDamagedOCL12",65,"ReallyDamagedOCL2",65,"ReallyDamagedOCL3",65,"ReallyDamagedOCL4",65,"ReallyDamagedOCL5",65,"ReallyDamagedOCL6",65,"ReallyDamagedOCL7",65,"ReallyDamagedOCL8",65,"ReallyDamagedOCL9",65,"ReallyDamagedParticleSystem1",65,"ReallyDamagedParticleSystem10",65,"ReallyDamagedParticleSystem11",65,"ReallyDamagedParticleSystem12",65,"ReallyDamagedParticleSystem2",65,"ReallyDamagedParticleSystem3",65,"ReallyDamagedParticleSystem4",65,"ReallyDamagedParticleSystem5",65,"ReallyDamagedParticleSystem6",65,"ReallyDamagedParticleSystem7",65,"ReallyDamagedParticleSystem8",65,"ReallyDamagedParticleSystem9",65,"ReallyDamagedShowSubObject",61,"RubbleFXList1",65,"RubbleFXList10",65,"RubbleFXList11",65,"RubbleFXList12",65,"RubbleFXList2",65,"RubbleFXList3",65,"RubbleFXList4",65,"RubbleFXList5",65,"RubbleFXList6",65,"RubbleFXList7",65,"RubbleFXList8",65,"RubbleFXList9",65,"RubbleHideSubObject",61,"RubbleNeighbor",65,"RubbleOCL1",65,"RubbleOCL10",65,"RubbleOCL11",65,"RubbleOCL12",65,"RubbleOCL2",65,"RubbleOCL3",65,"RubbleOCL4",65,"RubbleOCL5",65,"RubbleOCL6",65,"RubbleOCL7",65,"RubbleOCL8",65,"RubbleOCL9",65,"RubbleParticleSystem1",65,"RubbleParticleSystem10",65,"RubbleParticleSystem11",65,"RubbleParticleSystem12",65,"RubbleParticleSystem2",65,"RubbleParticleSystem3",65,"RubbleParticleSystem4",65,"RubbleParticleSystem5",65,"RubbleParticleSystem6",65,"RubbleParticleSystem7",65,"RubbleParticleSystem8",65,"RubbleParticleSystem9",65,"RubbleShowSubObject",61]],'
+    '["TransportAIUpdate",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63]],'
+    '["TransportContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CanGrabStructure",6,"CollidePickup",6,"ConditionForEntry",10,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DestroyRidersWhoAreNotFreeToExit",6,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterFadeTime",26,"EnterSound",5,"ExemptStatus",45,"ExitBone",60,"ExitDelay",68,"ExitFadeTime",26,"ExitPitchRate",26,"ExitSound",5,"FadeFilter",42,"FadePassengerOnEnter",6,"FadePassengerOnExit",6,"FadeReverse",6,"FireGrabWeaponOnVictim",6,"ForceOrientationContainer",6,"GoAggressiveOnExit",6,"GrabWeapon",75,"HealthRegen_PerSec",26,"InitialPayload",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"OrientLikeContainerOnExit",6,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"ReleaseSnappyness",26,"RequiredStatus",45,"ResetMoodCheckTimeOnExit",6,"ScatterNearbyOnExit",6,"ShouldThrowOutPassengers",6,"ShowPips",6,"Slots",53,"ThrowOutPassengersDelay",68,"ThrowOutPassengersLandingWarhead",75,"ThrowOutPassengersVelocity",74,"TypeOneForWeaponSet",30,"TypeOneForWeaponState",30,"TypeThreeForWeaponState",30,"TypeTwoForWeaponSet",30,"TypeTwoForWeaponState",30,"UpgradeCreationTrigger",71]],'
+    '["TunnelContain",["AllowAlliesInside",6,"AllowEnemiesInside",6,"AllowNeutralInside",6,"AllowOwnPlayerInsideOverride",6,"BoneSpecificConditionState",28,"CollidePickup",6,"ContainMax",53,"DamageAmountRequired",26,"DamagePercentToUnits",50,"DeathTypes",16,"DoorOpenTime",68,"EjectPassengersOnDeath",6,"Enabled",6,"EnterSound",5,"EntryOffset",74,"EntryPosition",74,"ExemptStatus",45,"ExitDelay",68,"ExitOffset",74,"ExitSound",5,"HealObjects",6,"ImmuneToClearBuildingAttacks",6,"InitialRoster",49,"KillPassengersOnDeath",6,"ManualPickUpFilter",42,"MaxKillerAngle",17,"MinKillerAngle",17,"MobileGarrison",6,"ModifierRequiredTime",68,"ModifierToGiveOnExit",61,"NumberOfExitPaths",53,"ObjectStatusOfContained",45,"PassengerBonePrefix",48,"PassengerFilter",42,"PassengersInTurret",6,"PassengersTestCollisionHeight",26,"RequiredStatus",45,"ShowPips",6,"TimeForFullHeal",68]],'
+    '["UnitCrateCollide",["BuildingPickup",6,"ExecuteAnimation",60,"ExecuteAnimationFades",6,"ExecuteAnimationTime",26,"ExecuteAnimationZRise",26,"ExecuteFX",25,"ForbiddenKindOf",30,"ForbidOwnerPlayer",6,"HumanOnly",6,"PickupScience",65,"RequiredKindOf",30,"UnitCount",68,"UnitName",60]],'
+    '["UnleashSpecialPower",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]],'
+    '["UnpauseSpecialPowerUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"ObeyRechageOnTrigger",6,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"SpecialPowerTemplate",55,"TriggeredBy",72]],'
+    '["UntamedAllegianceSpecialPower",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["UpgradeDie",["DamageAmountRequired",26,"DeathTypes",16,"ExemptStatus",45,"MaxKillerAngle",17,"MinKillerAngle",17,"RequiredStatus",45,"UpgradeToRemove",60]],'
+    '["UpgradeSoundSelectorClientBehavior",[]],'
+    '["VeterancyCrateCollide",["AddsOwnerVeterancy",6,"AffectsUpToLevel",53,"BuildingPickup",6,"EffectRange",68,"ExecuteAnimation",60,"ExecuteAnimationFades",6,"ExecuteAnimationTime",26,"ExecuteAnimationZRise",26,"ExecuteFX",25,"ForbiddenKindOf",30,"ForbidOwnerPlayer",6,"HumanOnly",6,"IsPilot",6,"PickupScience",65,"RequiredKindOf",30]],'
+    '["WallHubBehavior",["BorderCapTemplateName",60,"BuilderRadius",26,"CliffCapTemplateName",60,"DefaultSegmentTemplateName",60,"ElevatedSegmentTemplateName",60,"HubCapTemplateName",60,"MaxBuildoutDistance",26,"Options",46,"SegmentTemplateName",61,"ShoreCapTemplateName",60,"StaggeredBuildFactor",53]],'
+    '["WallUpgradeUpdate",[]],'
+    '["WanderAIUpdate",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"ConditionForEntry",10,"FadeOnPortals",6,"HoldGroundCloseRangeDistance",26,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"Selectable",6,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63,"WanderDistance",68,"WildBeast",6]],'
+    '["WargBehavior",[]],'
+    '["WeaponBonusUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72]],'
+    '["WeaponChangeSpecialPowerModule",["AdjustVictim",6,"AffectAllies",6,"AffectEvil",6,"AffectGood",6,"AntiCategory",4,"AntiFX",25,"AttributeModifier",60,"AttributeModifierAffects",42,"AttributeModifierAffectsSelf",6,"AttributeModifierFX",25,"AttributeModifierRange",26,"AttributeModifierWeatherBased",6,"AvailableAtStart",6,"BurnDecayModifier",68,"ChangeWeather",77,"DisableDuringAnimDuration",6,"DistanceFromCommandCenter",26,"FlagsUsedForToggle",76,"GiveLevels",53,"IdleWhenStartingPower",6,"InitiateFX",25,"InitiateSound",5,"OnTriggerRechargeSpecialPower",60,"ReEnableAntiCategory",6,"RequirementsFilterMPSkirmish",42,"RequirementsFilterStrategic",42,"SetModelCondition",10,"SetModelConditionTime",26,"SpecialPowerTemplate",55,"StartsPaused",6,"TargetAllSides",6,"TargetEnemy",6,"ToggleOffAttributeModifier",60,"ToggleOffSleepFrames",53,"ToggleOnAttributeModifier",60,"ToggleOnSleepFrames",53,"TriggerFX",25,"UpdateModuleStartsAttack",6,"UseDistanceFromCommandCenter",6,"WeatherDuration",68]],'
+    '["WeaponFireSpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"BusyForDuration",68,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"NeedLivingTargets",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PlayWeaponPreFireFX",6,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipContinue",6,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"SpecialWeapon",60,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"WhichSpecialWeapon",53]],'
+    '["WeaponModeSpecialPowerUpdate",["AttributeModifier",60,"Duration",68,"InitiateSound",5,"LockWeaponSlot",54,"SpecialPowerTemplate",55,"StartsPaused",6,"WeaponSetFlags",76]],'
+    '["WeaponSetSpecialAbilityUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68,"WeaponsetEffectDuration",68,"WhichWeaponSet",53]],'
+    '["WeaponSetUpgrade",["ConflictsWith",72,"CustomAnimAndDuration",3,"Permanent",6,"RequiresAllConflictingTriggers",6,"RequiresAllTriggers",6,"TriggeredBy",72,"WeaponCondition",76]],'
+    '["WorkerAIUpdate",["AILuaEventsList",60,"AttackPriority",60,"AutoAcquireEnemiesWhenIdle",1,"BoredRange",26,"BoredTime",68,"BurningDeathTime",68,"CanAttackWhileContained",6,"ComboLocoAttackDistance",26,"ComboLocomotorSet",31,"FadeOnPortals",6,"HarvestActionTime",68,"HarvestActivationRange",26,"HarvestPreparationTime",68,"HarvestTrees",6,"HoldGroundCloseRangeDistance",26,"MaxBoxes",53,"MaxCowerTime",68,"MinCowerTime",68,"MoodAttackCheckRate",68,"RampageRequiresAflame",6,"RampageTime",68,"RepairHealthPercentPerSecond",50,"SpecialContactPoints",61,"StandGround",6,"StopChaseDistance",26,"SuppliesDepletedVoice",5,"SupplyCenterActionDelay",68,"SupplyWarehouseActionDelay",68,"SupplyWarehouseScanDistance",26,"TimeToEjectPassengersOnRampage",68,"Turret",63]],'
+    '["WoundArrowUpdate",["AbilityAbortRange",26,"ActiveLoopSound",5,"AlwaysValidateSpecialObjects",6,"ApproachRequiresLOS",6,"ApproachUntilMembersInRange",6,"AttributeModifierDuration",68,"AwardXPForTriggering",53,"ChainedButton",60,"ChargeAttackSpeedBoost",6,"ContactPointOverride",60,"CustomAnimAndDuration",3,"DisableFXParticleSystem",47,"DisableWhenWearingTheRing",6,"DoCaptureFX",6,"EffectDuration",68,"EffectRange",26,"EffectValue",53,"FleeDistance",26,"FleeRangeAfterCompletion",26,"FlipOwnerAfterPacking",6,"FlipOwnerAfterUnpacking",6,"ForbiddenConditions",56,"FreezeAfterTriggerDuration",68,"GrabPassengerAnimAndDuration",3,"GrabPassengerHealGainPercent",26,"IgnoreFacingCheck",6,"Instant",6,"KillAttributeModifierOnExit",6,"KillAttributeModifierOnRejected",6,"LoseStealthOnTrigger",6,"MaxSpecialObjects",68,"MustFinishAbility",6,"NeedCollisionBeforeTrigger",6,"PackSound",5,"PackTime",68,"PackUnpackVariationFactor",26,"ParalyzeDurationWhenAborted",68,"ParalyzeDurationWhenCompleted",68,"PersistentCount",53,"PersistentPrepTime",68,"PreparationTime",68,"PrepSoundLoop",5,"PreTriggerUnstealthTime",68,"RejectedConditions",57,"RequiredConditions",57,"SkillPointsForTriggering",53,"SkipPackingWithNoTarget",6,"SpecialObject",60,"SpecialObjectAttachToBone",60,"SpecialObjectsPersistent",6,"SpecialObjectsPersistWhenOwnerDies",6,"SpecialPowerTemplate",55,"StartAbilityRange",26,"SuppressForHordes",6,"TriggerAttributeModifier",60,"TriggerModelCondition",10,"TriggerModelConditionDuration",26,"TriggerSound",5,"UniqueSpecialObjectTargets",6,"UnpackingVariation",53,"UnpackSound",5,"UnpackTime",68]]'
+    ']}'
+)
@@ -0,0 +1,143 @@
+import re
+
+from .context import find_block_path
+from .schema import get_schema, module_tag
+
+KIND_KEYWORDS = [
+    (("primaryweapon", "secondaryweapon", "weapon"), ("weapon",)),
+    (("armor", "armorset"), ("armor",)),
+    (("locomotor", "locomotorset"), ("locomotor",)),
+    (("commandset", "commandbutton"), ("commandset", "commandbutton")),
+    (("audioevent", "sound"), ("audioevent",)),
+    (("upgrade", "science"), ("upgrade", "science")),
+]
+STRING_KEYWORDS = ("displayname", "description", "tooltip", "string")
+
+assignment_pattern = re.compile(r'^\s*(\w+)\s*=(.*)$')
+
+
+# Declared parameter type -> index kinds of the names it takes.
+TYPE_KINDS = {
+    "Weapon": ("weapon",),
+    "MomentWeapon": ("weapon",),
+    "Armor": ("armor",),
+    "FXList": ("fxlist",),
+    "MomentFXList": ("fxlist",),
+    "AudioEvent": ("audioevent",),
+    "MomentSound": ("audioevent",),
+    "Upgrade": ("upgrade",),
+    "Upgrades": ("upgrade",),
+    "ObjectCreationList": ("objectcreationlist",),
+    "MomentOCL": ("objectcreationlist",),
+    "SpecialPower": ("specialpower",),
+    "ParticleSystem": ("fxparticlesystem",),
+    "Object": ("object", "childobject"),
+    "Locomotor": ("locomotor",),
+    "CommandSet": ("commandset",),
+    "Stance": ("stancetemplate",),
+    "UnsignedInteger": ("macro",),
+    "SignedInteger": ("macro",),
+    "FloatingPoint": ("macro",),
+    "Percentage": ("macro",),
+    "Degrees": ("macro",),
+}
+
+
+def context_kinds(line_text):
+    """Guess the symbol kinds wanted on line_text, or None for any kind."""
+    line_text = line_text.lower()
+    for keywords, kinds in KIND_KEYWORDS:
+        if any(keyword in line_text for keyword in keywords):
+            return kinds
+    return None
+
+
+def value_type(get_line, row, line_before):
+    """Return the declared type of the field assigned on line_before, or None if unknown."""
+    match = assignment_pattern.match(line_before)
+    if match is None:
+        return None
+    schema = get_schema()
+    block = schema.resolve(find_block_path(get_line, row))
+    field = schema.field(block, match.group(1)) if block is not None else None
+    return field[1] if field is not None else None
+
+
+def completion_candidates(project, prefix, line_text, declared_type=None):
+    """Return the (symbols, strings) (name, entry) pairs to complete prefix on line_text.
+
+    With the declared_type of the field being assigned, see value_type, only
+    the kinds that type takes are searched, and enumerations get no symbols.
+    Fields of unknown type fall back to guessing the kinds from line_text.
+    """
+    schema = get_schema()
+    if declared_type in TYPE_KINDS:
+        return project.symbols.with_prefix(prefix, TYPE_KINDS[declared_type]), []
+    if declared_type is not None and schema.enum(declared_type) is not None:
+        return [], []
+
+    kinds = context_kinds(line_text)
+    symbols = project.symbols.with_prefix(prefix, kinds)
+    strings = []
+    if not kinds or any(keyword in line_text.lower() for keyword in STRING_KEYWORDS):
+        strings = project.strings.with_prefix(prefix)
+    return symbols, strings
+
+
+def schema_completions(get_line, row, line_before, prefix):
+    """Return the [(label, insert text, category, detail)] the schema offers for prefix.
+
+    line_before is the text of row up to the cursor, ending with prefix.
+    At the start of a line the fields of the enclosing block are offered,
+    after "Behavior =" (or Draw, Body...) the modules of that category and
+    then their ModuleTag, and after other fields the values of their type
+    when it is an enumeration. category is "field", "module", "tag" or
+    "value".
+    """
+    schema = get_schema()
+    match = assignment_pattern.match(line_before)
+    if match is None:
+        if line_before.strip() != prefix:
+            return []
+        block = schema.resolve(find_block_path(get_line, row))
+        if block is None:
+            return []
+        items = []
+        for field, field_type in schema.fields_with_prefix(block, prefix):
+            opens_block = field_type != "Module" and schema.is_block_type(field_type)
+            items.append((
+                field,
+                field if opens_block else field + " = ",
+                "field",
+                "{block} parameter ({type})".format(block=block[1], type=field_type),
+            ))
+        return items
+
+    key, value = match.groups()
+    position = len(value[:len(value) - len(prefix)].split())
+    category = schema.category(key)
+    if category is not None:
+        if position == 0:
+            return [
+                (name, name, "module", "{category} module ({count} parameters)".format(
+                    category=category, count=len(schema.modules.behaviors[name])
+                ))
+                for name in schema.modules_with_prefix(category, prefix)
+            ]
+        if position == 1:
+            tag = module_tag(value.split()[0])
+            if tag.lower().startswith(prefix.lower()):
+                return [(tag, tag, "tag", "Module tag")]
+        return []
+
+    block = schema.resolve(find_block_path(get_line, row))
+    field = schema.field(block, key) if block is not None else None
+    enum = schema.enum(field[1]) if field is not None else None
+    if enum is None:
+        return []
+    # filters prefix values with + or -, keep the sign when the prefix has it
+    sign = prefix[:len(prefix) - len(prefix.lstrip("+-"))]
+    return [
+        (sign + name, sign + name, "value", "{type} value".format(type=field[1]))
+        for name in enum.with_prefix(prefix[len(sign):])
+    ]
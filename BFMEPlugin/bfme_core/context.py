@@ -0,0 +1,110 @@
+import os
+import re
+
+include_pattern = re.compile(r'#include\s+"([^"]+)"', re.I)
+behavior_pattern = re.compile(r'^\s*Behavior\s*=\s*(\w+)', re.I)
+
+
+def indent_of(line_text):
+    return len(line_text) - len(line_text.lstrip())
+
+
+def resolve_include(current_file, include_path):
+    """Return the absolute path of an #include relative to current_file."""
+    include_path_normalized = include_path.replace("\\", os.sep)
+    if include_path_normalized.startswith(os.sep):
+        include_path_normalized = include_path_normalized[1:]
+
+    return os.path.normpath(
+        os.path.join(os.path.dirname(current_file), include_path_normalized)
+    )
+
+
+def find_behavior_context(get_line, row):
+    """Find the behavior block containing row and return the behavior name.
+
+    get_line(row) returns the text of a line, lines are scanned upwards from
+    row until a Behavior line or an End closing a block is found.
+    """
+    target_indent = indent_of(get_line(row))
+
+    while row > 0:
+        line_text = get_line(row)
+
+        if line_text.strip().lower() == 'end':
+            return None
+
+        behavior_match = behavior_pattern.match(line_text)
+        if behavior_match:
+            if target_indent > indent_of(line_text):
+                return behavior_match.group(1)
+            return None
+
+        row -= 1
+
+    return None
+
+
+def block_header(line_text):
+    """Return (keyword, first argument) of a line opening a block."""
+    line_text = line_text.split(";", 1)[0].split("//", 1)[0]
+    if "=" in line_text:
+        keyword, _, value = line_text.partition("=")
+        keyword = keyword.strip()
+    else:
+        keyword, _, value = line_text.strip().partition(" ")
+    words = value.split()
+    return keyword, words[0] if words else ""
+
+
+def find_block_path(get_line, row):
+    """Return the [(keyword, argument)] of the blocks enclosing row, outermost first.
+
+    Like find_behavior_context this relies on indentation: scanning upwards,
+    every line indented less than the lines below it opens the block holding
+    them, until a line without indentation. Returns [] when an End closes a
+    block around row, since row is then not inside it.
+    """
+    path = []
+    target_indent = indent_of(get_line(row))
+    row -= 1
+    while row >= 0 and target_indent > 0:
+        line_text = get_line(row)
+        stripped = line_text.strip()
+        row -= 1
+        if not stripped or stripped.startswith((";", "//")):
+            continue
+        indent = indent_of(line_text)
+        if indent >= target_indent:
+            continue
+        if stripped.lower() == "end":
+            return []
+        path.append(block_header(stripped))
+        target_indent = indent
+
+    path.reverse()
+    return path
+
+
+def iter_block_paths(lines):
+    """Yield (row, line text, block path) for the non blank lines of a file.
+
+    The forward equivalent of calling find_block_path on every row, in one
+    pass: a stack of the lines that may open a block is popped by any line
+    indented as much or less.
+    """
+    stack = []
+    for row, line_text in enumerate(lines):
+        stripped = line_text.strip()
+        if not stripped or stripped.startswith((";", "//")):
+            continue
+        indent = indent_of(line_text)
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        if any(header is None for _, header in stack):
+            path = []
+        else:
+            path = [header for _, header in stack]
+        yield row, line_text, path
+        # an End keeps the lines indented below it out of any block
+        stack.append((indent, None if stripped.lower() == "end" else block_header(stripped)))
@@ -0,0 +1,886 @@
+import os
+import re
+import bisect
+import csv
+import sys
+import zlib
+import marshal
+import fnmatch
+import hashlib
+import threading
+import time
+
+from .perf import span
+
+INDEX_CACHE_VERSION = 1
+DEFAULT_EXCLUDE_FOLDERS = ["art", "audio", "maps", ".git", ".svn", ".hg"]
+# Seconds of indexing collected into one shard before it is made searchable.
+SHARD_INTERVAL = 0.5
+PROGRESS_INTERVAL = 0.25
+
+bfme_pattern = re.compile(
+    r"^(AudioEvent|MappedImage|Object|ChildObject|ObjectCreationList|ModifierList|FXList|FXParticleSystem|Locomotor|Upgrade|Science|StanceTemplate|CommandSet|CommandButton|Weapon|Armor|SpecialPower)\s+([\w+\-]+)",
+    re.I,
+)
+macro_pattern = re.compile(r"^\s*#define\s+([\w+\-]+)\s+([^;]+)", re.I)
+
+# Definition keyword as written -> interned lowercase kind, see intern_kind.
+_kinds = {}
+
+# Base game layers are shared by every project, keyed by normalized base path.
+_base_layers = {}
+_base_layers_lock = threading.Lock()
+
+
+class LayeredIndex(object):
+    """Lookup table made of a mutable mod layer on top of a read-only base layer.
+
+    Lookups fall through the layers, so a name defined by the mod shadows the
+    base game definition without the base layer ever being copied or modified.
+    While a project is indexed for the first time the shards completed so far
+    sit between the two, so lookups work before indexing has finished.
+
+    Layers are never modified once published, a changed mod layer is a new
+    dict swapped in with replace. That lets prefix queries use per-kind
+    sorted name lists built once per layer, see with_prefix.
+    """
+
+    def __init__(self):
+        self.mod = {}
+        self.shards = []
+        self.base = None
+        # id(layer) -> (layer, {kind: (sorted folded names, names)})
+        self.kind_tables = {}
+
+    def layers(self):
+        layers = (self.mod,) + tuple(self.shards)
+        if self.base:
+            return layers + (self.base,)
+        return layers
+
+    def __contains__(self, name):
+        return any(name in layer for layer in self.layers())
+
+    def __getitem__(self, name):
+        for layer in self.layers():
+            if name in layer:
+                return layer[name]
+        raise KeyError(name)
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def items(self):
+        layers = self.layers()
+        yield from layers[0].items()
+        for depth in range(1, len(layers)):
+            above = layers[:depth]
+            for name, entry in layers[depth].items():
+                if not any(name in upper for upper in above):
+                    yield name, entry
+
+    def __len__(self):
+        return sum(1 for _ in self.items())
+
+    def __bool__(self):
+        return any(self.layers())
+
+    def clear(self):
+        """Drop the mod layer, the shared base layer is left untouched."""
+        self.replace({})
+
+    def replace(self, mod, shards=()):
+        """Swap in new mod and shard layers and forget the prefix tables built so far.
+
+        Only the table of the shared base layer survives a swap, so a table
+        never outlives the contents of the layer it was built from.
+        """
+        self.mod = mod
+        self.shards = list(shards)
+        base = self.kind_tables.get(id(self.base))
+        self.kind_tables = {id(self.base): base} if base is not None and base[0] is self.base else {}
+
+    def kind_table(self, layer):
+        """Return {kind: (sorted folded names, names)} of layer, built on first use."""
+        cached = self.kind_tables.get(id(layer))
+        if cached is not None and cached[0] is layer:
+            return cached[1]
+
+        by_kind = {}
+        for name, entry in layer.items():
+            by_kind.setdefault(entry[2], []).append((name.lower(), name))
+        table = {}
+        for kind, pairs in by_kind.items():
+            pairs.sort()
+            table[kind] = ([folded for folded, _ in pairs], [name for _, name in pairs])
+
+        live = dict((id(l), l) for l in self.layers())
+        tables = dict((key, value) for key, value in self.kind_tables.items() if live.get(key) is value[0])
+        tables[id(layer)] = (layer, table)
+        self.kind_tables = tables
+        return table
+
+    def with_prefix(self, prefix, kinds=None):
+        """Return the (name, entry) pairs starting with prefix, ignoring case.
+
+        Only the name lists of the given kinds are searched, two bisections
+        each, names shadowed by an upper layer are left out.
+        """
+        prefix = prefix.lower()
+        layers = self.layers()
+        matches = []
+        for depth, layer in enumerate(layers):
+            table = self.kind_table(layer)
+            for kind in table if kinds is None else kinds:
+                lists = table.get(kind)
+                if lists is None:
+                    continue
+                folded, names = lists
+                start = bisect.bisect_left(folded, prefix)
+                end = bisect.bisect_right(folded, prefix + "\uffff", start)
+                for name in names[start:end]:
+                    if depth and any(name in upper for upper in layers[:depth]):
+                        continue
+                    matches.append((name, layer[name]))
+        return matches
+
+
+class IndexIgnoreRules(object):
+    """Folder names and glob patterns skipped while walking the project.
+
+    Folder names are compared case-insensitively against the directory name,
+    patterns are matched against both the entry name and its full path.
+    """
+
+    def __init__(self, folders=(), patterns=()):
+        self.folders = set(f.strip("/\\").lower() for f in folders)
+        self.patterns = [p.replace("\\", "/").lower() for p in patterns]
+
+    def _matches(self, name, path):
+        path = path.replace("\\", "/").lower()
+        return any(
+            fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(path, pattern)
+            for pattern in self.patterns
+        )
+
+    def ignores_dir(self, name, path):
+        name = name.lower()
+        return name in self.folders or self._matches(name, path)
+
+    def ignores_file(self, name, path):
+        return bool(self.patterns) and self._matches(name.lower(), path)
+
+
+class ProjectIndex(object):
+    """Symbol and string index of one set of project folders."""
+
+    def __init__(self, folders):
+        self.folders = folders
+        self.symbols = LayeredIndex()
+        self.strings = LayeredIndex()
+        self.refcount = 0
+        self.indexing = False
+        self.indexed = False
+        # file id -> [(name, line, kind)] defined by that file, used to list
+        # the symbols of a file and to re-index single files
+        self.files = {}
+        self.file_ids = {}
+        self.file_paths = []
+        # directory -> (mtime, {path: (mtime, size)}) of the indexed files
+        self.snapshot = {}
+        # bumped whenever the content of the index changes
+        self.generation = 0
+        # quick panel items keyed by separator, see symbol_browser_items
+        self.browser_items = {}
+        # (generation, name -> [(path, line)]), see references.get_references
+        self.references = None
+        self.ignore = IndexIgnoreRules(DEFAULT_EXCLUDE_FOLDERS)
+        self.write_lock = threading.Lock()
+        self.file_id_lock = threading.Lock()
+
+    def file_id(self, path):
+        file_id = self.file_ids.get(path)
+        if file_id is None:
+            with self.file_id_lock:
+                file_id = self.file_ids.get(path)
+                if file_id is None:
+                    path = sys.intern(path)
+                    file_id = len(self.file_paths)
+                    self.file_paths.append(path)
+                    self.file_ids[path] = file_id
+        return file_id
+
+    def file_symbols(self, path):
+        """Return the (name, line, kind) records defined in path."""
+        file_id = self.file_ids.get(path)
+        if file_id is None:
+            return []
+        return self.files.get(file_id, [])
+
+
+def is_inside(path, parent):
+    path = os.path.normcase(os.path.abspath(path))
+    parent = os.path.normcase(os.path.abspath(parent))
+    return path == parent or path.startswith(parent.rstrip(os.sep) + os.sep)
+
+
+def merge_definition(entries, name, entry):
+    """Record a (path, line, kind, extra) entry, returns True if name was already defined."""
+    existing = entries.get(name)
+    if existing is None:
+        entries[name] = entry
+        return False
+
+    old_path, old_line, _, old_extra = existing
+    path, line, kind, extra = entry
+    if not isinstance(old_path, list):
+        old_path, old_line = [old_path], [old_line]
+    if not isinstance(path, list):
+        path, line = [path], [line]
+    entries[name] = (old_path + path, old_line + line, kind, old_extra + extra)
+    return True
+
+
+def entry_locations(entry):
+    """Return the [(path, line)] definitions of an index entry."""
+    path, line = entry[0], entry[1]
+    if isinstance(path, list):
+        return list(zip(path, line))
+    return [(path, line)]
+
+
+def add_definition(entries, name, path, line, kind, extra=tuple()):
+    return merge_definition(entries, name, (path, line, kind, extra))
+
+
+def remove_definition(entries, name, path):
+    """Forget the definitions of name that come from path."""
+    existing = entries.get(name)
+    if existing is None:
+        return
+
+    old_path, old_line, kind, extra = existing
+    if not isinstance(old_path, list):
+        if old_path == path:
+            del entries[name]
+        return
+
+    keep = [i for i, p in enumerate(old_path) if p != path]
+    if len(extra) == len(old_path):
+        extra = tuple(extra[i] for i in keep)
+    if not keep:
+        del entries[name]
+    elif len(keep) == 1:
+        entries[name] = (old_path[keep[0]], old_line[keep[0]], kind, extra)
+    else:
+        entries[name] = ([old_path[i] for i in keep], [old_line[i] for i in keep], kind, extra)
+
+
+def is_index_file(fn):
+    fn = fn.lower()
+    return (fn.endswith((".ini", ".inc")) and fn != "map.ini") or fn == "lotr.csv"
+
+
+def read_string_names(path, strings):
+    """Add the string names of a lotr.csv file to strings.
+
+    Returns the (name, line, kind) records read.
+    """
+    records = []
+    path = sys.intern(path)
+    try:
+        with open(path, "r", encoding="latin-1", errors="ignore") as f:
+            reader = csv.reader(f, delimiter=";")
+            for i, row in enumerate(reader):
+                if row:
+                    name = sys.intern(row[0].strip().lower())
+                    if name:
+                        strings[name] = (path, i + 1, "string", tuple())
+                        records.append((name, i + 1, "string"))
+        print("[BFME Plugin] Indexed strings from {path}".format(path=path))
+    except Exception as e:
+        print("[BFME Plugin] Failed to read {path}: {e}".format(path=path, e=e))
+    return records
+
+
+def intern_kind(kind):
+    """Return the shared lowercase spelling of a definition kind."""
+    folded = _kinds.get(kind)
+    if folded is None:
+        folded = _kinds[kind] = sys.intern(kind.lower())
+    return folded
+
+
+def index_file(path, symbols):
+    """Add the symbols and macros defined in a single INI file to symbols.
+
+    Returns the (name, line, kind) records of the file.
+    """
+    records = []
+    path = sys.intern(path)
+    try:
+        with open(path, "r", encoding="latin-1", errors="ignore") as f:
+            for i, line in enumerate(f):
+                m = bfme_pattern.match(line)
+                if m:
+                    kind, name = m.groups()
+                    kind = intern_kind(kind)
+                    name = sys.intern(name)
+                    records.append((name, i + 1, kind))
+                    if add_definition(symbols, name, path, i + 1, kind):
+                        print(
+                            "[BFME Plugin] Duplicate symbol found: {name} (now has {count} definitions)".format(
+                                name=name, count=len(symbols[name][0])
+                            )
+                        )
+
+                mm = macro_pattern.match(line)
+                if mm:
+                    macro_name = sys.intern(mm.group(1))
+                    records.append((macro_name, i + 1, "macro"))
+                    if add_definition(symbols, macro_name, path, i + 1, "macro", (mm.group(2),)):
+                        print(
+                            "[BFME Plugin] Duplicate macro found: {macro_name} (now has {count} definitions)".format(
+                                macro_name=macro_name,
+                                count=len(symbols[macro_name][0]),
+                            )
+                        )
+    except Exception as e:
+        print("[BFME Plugin] Failed to read {path}: {e}".format(path=path, e=e))
+    return records
+
+
+def index_path(path, symbols, strings):
+    if os.path.basename(path).lower() == "lotr.csv":
+        return read_string_names(path, strings)
+    return index_file(path, symbols)
+
+
+def scan_dir(root, ignore):
+    """List a single directory with os.scandir.
+
+    Returns ({path: (mtime, size)} of the files to index, [(subdir, mtime)]).
+    Ignored subdirectories are pruned here so they are never listed, and only
+    the files we index are stat-ed.
+    """
+    tracked = {}
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not ignore.ignores_dir(entry.name, entry.path):
+                    subdirs.append((entry.path, entry.stat(follow_symlinks=False).st_mtime))
+            elif is_index_file(entry.name) and not ignore.ignores_file(entry.name, entry.path):
+                st = entry.stat()
+                tracked[entry.path] = (st.st_mtime, st.st_size)
+    return tracked, subdirs
+
+
+def walk_index_files(folder, snapshot, ignore):
+    """Yield the files to index below folder, recording every directory in snapshot."""
+    try:
+        stack = [(folder, os.stat(folder).st_mtime)]
+    except OSError:
+        return
+    while stack:
+        root, mtime = stack.pop()
+        try:
+            tracked, subdirs = scan_dir(root, ignore)
+        except OSError:
+            continue
+        snapshot[root] = (mtime, tracked)
+        stack.extend(subdirs)
+        for path in sorted(tracked):
+            yield path
+
+
+def index_folders(folders, symbols, strings, snapshot=None, ignore=None):
+    """Index every INI file and string table below folders."""
+    snapshot = {} if snapshot is None else snapshot
+    ignore = IndexIgnoreRules(DEFAULT_EXCLUDE_FOLDERS) if ignore is None else ignore
+    for folder in folders:
+        for path in walk_index_files(folder, snapshot, ignore):
+            index_path(path, symbols, strings)
+
+
+def merge_shards(shards):
+    """Combine the (symbols, strings, files) shards of an indexing run into new dicts.
+
+    The shards are published while indexing runs and may still be read by
+    other threads, so they are left untouched.
+    """
+    symbols, strings, files = (dict(table) for table in shards[0])
+    for shard_symbols, shard_strings, shard_files in shards[1:]:
+        for name, entry in shard_symbols.items():
+            if merge_definition(symbols, name, entry):
+                print(
+                    "[BFME Plugin] Duplicate symbol found: {name} (now has {count} definitions)".format(
+                        name=name, count=len(symbols[name][0])
+                    )
+                )
+        strings.update(shard_strings)
+        files.update(shard_files)
+    return symbols, strings, files
+
+
+class IndexProgress(object):
+    """Counts indexed files and bytes and reports them at a throttled rate."""
+
+    def __init__(self, total_files, total_bytes, report):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.files = 0
+        self.bytes = 0
+        self.report = report
+        self.started = time.monotonic()
+        self.last_report = 0
+
+    def advance(self, size):
+        self.files += 1
+        self.bytes += size
+        now = time.monotonic()
+        if now - self.last_report >= PROGRESS_INTERVAL:
+            self.last_report = now
+            self.report(self.message())
+
+    def message(self):
+        text = "BFME: Indexing {files}/{total_files} files ({mb:.1f}/{total_mb:.1f} MB)".format(
+            files=self.files,
+            total_files=self.total_files,
+            mb=self.bytes / 1048576.0,
+            total_mb=self.total_bytes / 1048576.0,
+        )
+        elapsed = time.monotonic() - self.started
+        if self.bytes and elapsed >= 1:
+            eta = elapsed * (self.total_bytes - self.bytes) / self.bytes
+            text += ", about {eta:.0f}s left".format(eta=eta)
+        return text
+
+
+def find_changed_files(snapshot, ignore):
+    """Diff the file system against snapshot and update it.
+
+    Only directories whose mtime moved are listed again, which catches files
+    being created, deleted or renamed. The tracked INI files of the other
+    directories are stat-ed to catch in-place edits. Returns (changed, removed).
+    """
+    changed, removed = set(), set()
+    for root in list(snapshot):
+        dir_mtime, tracked = snapshot[root]
+        try:
+            mtime = os.stat(root).st_mtime
+        except OSError:
+            removed.update(tracked)
+            del snapshot[root]
+            continue
+
+        if mtime != dir_mtime:
+            try:
+                current, subdirs = scan_dir(root, ignore)
+            except OSError:
+                continue
+            removed.update(path for path in tracked if path not in current)
+            changed.update(path for path, sig in current.items() if tracked.get(path) != sig)
+            snapshot[root] = (mtime, current)
+            for subdir, _ in subdirs:
+                if subdir not in snapshot:
+                    changed.update(walk_index_files(subdir, snapshot, ignore))
+            continue
+
+        for path, sig in list(tracked.items()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                removed.add(path)
+                del tracked[path]
+                continue
+            if (st.st_mtime, st.st_size) != sig:
+                tracked[path] = (st.st_mtime, st.st_size)
+                changed.add(path)
+
+    return changed, removed
+
+
+class PathTable(object):
+    """Numbers paths so a cache file stores each of them only once."""
+
+    def __init__(self, paths=None):
+        self.paths = [sys.intern(path) for path in paths] if paths is not None else []
+        self.ids = dict((path, i) for i, path in enumerate(self.paths))
+
+    def id(self, path):
+        path_id = self.ids.get(path)
+        if path_id is None:
+            path_id = self.ids[path] = len(self.paths)
+            self.paths.append(path)
+        return path_id
+
+    def pack(self, entries):
+        packed = []
+        for name, (path, line, kind, extra) in entries.items():
+            if isinstance(path, list):
+                path = [self.id(p) for p in path]
+            else:
+                path = self.id(path)
+            packed.append((name, path, line, kind, extra))
+        return packed
+
+    def unpack(self, packed):
+        paths = self.paths
+        entries = {}
+        for name, path, line, kind, extra in packed:
+            if isinstance(path, list):
+                path = [paths[p] for p in path]
+            else:
+                path = paths[path]
+            entries[sys.intern(name)] = (path, line, intern_kind(kind), extra)
+        return entries
+
+
+def write_cache(cache_file, payload):
+    """Atomically write payload to a compressed, versioned cache file."""
+    payload = (INDEX_CACHE_VERSION, tuple(sys.version_info[:2])) + tuple(payload)
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_file = cache_file + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(zlib.compress(marshal.dumps(payload)))
+    os.replace(tmp_file, cache_file)
+
+
+def read_cache(cache_file):
+    """Return the payload written by write_cache, or None if missing or stale."""
+    try:
+        with open(cache_file, "rb") as f:
+            payload = marshal.loads(zlib.decompress(f.read()))
+    except (OSError, ValueError, EOFError, TypeError, zlib.error):
+        return None
+
+    if not isinstance(payload, tuple) or payload[:2] != (INDEX_CACHE_VERSION, tuple(sys.version_info[:2])):
+        return None
+    return payload[2:]
+
+
+def save_layer(cache_file, symbols, strings):
+    """Write a layer to a compressed cache file, storing each path only once."""
+    table = PathTable()
+    packed_symbols = table.pack(symbols)
+    packed_strings = table.pack(strings)
+    write_cache(cache_file, (table.paths, packed_symbols, packed_strings))
+
+
+def load_layer(cache_file):
+    """Read a layer written by save_layer, returns None if missing or stale."""
+    payload = read_cache(cache_file)
+    if payload is None or len(payload) != 3:
+        return None
+    paths, packed_symbols, packed_strings = payload
+    table = PathTable(paths)
+    return table.unpack(packed_symbols), table.unpack(packed_strings)
+
+
+def project_cache_path(folders, cache_dir):
+    key = "\n".join(project_key(folders)).encode("utf-8")
+    return os.path.join(cache_dir, "project-{digest}.cache".format(digest=hashlib.md5(key).hexdigest()))
+
+
+def ignore_key(ignore):
+    return (sorted(ignore.folders), list(ignore.patterns))
+
+
+def save_project_cache(project, cache_file, folders):
+    """Write the mod layer of project, its file records and snapshot to cache_file.
+
+    folders are the folders that were indexed, the cache is only reused for
+    the same folders and ignore rules.
+    """
+    with project.write_lock:
+        table = PathTable()
+        packed_symbols = table.pack(project.symbols.mod)
+        packed_strings = table.pack(project.strings.mod)
+        files = [(table.id(project.file_paths[file_id]), records) for file_id, records in project.files.items()]
+        snapshot = [
+            (root, mtime, [(table.id(path), sig) for path, sig in tracked.items()])
+            for root, (mtime, tracked) in project.snapshot.items()
+        ]
+        payload = (
+            list(project_key(folders)),
+            ignore_key(project.ignore),
+            table.paths,
+            packed_symbols,
+            packed_strings,
+            files,
+            snapshot,
+        )
+    write_cache(cache_file, payload)
+
+
+def load_project_cache(project, cache_file, folders):
+    """Restore project from a cache written by save_project_cache.
+
+    Returns False if the cache is missing, stale or was written for other
+    folders or ignore rules. The restored index may be behind the files on
+    disk, see reindex_changed_files.
+    """
+    payload = read_cache(cache_file)
+    if payload is None or len(payload) != 7:
+        return False
+    key, ignore, paths, packed_symbols, packed_strings, files, snapshot = payload
+    if key != list(project_key(folders)) or ignore != ignore_key(project.ignore):
+        return False
+
+    table = PathTable(paths)
+    paths = table.paths
+    with project.write_lock:
+        project.symbols.replace(table.unpack(packed_symbols))
+        project.strings.replace(table.unpack(packed_strings))
+        project.files = dict((project.file_id(paths[path_id]), records) for path_id, records in files)
+        project.snapshot = dict(
+            (root, (mtime, dict((paths[path_id], tuple(sig)) for path_id, sig in tracked)))
+            for root, mtime, tracked in snapshot
+        )
+        project.indexed = True
+        project.generation += 1
+    return True
+
+
+def base_cache_path(base_path, cache_dir):
+    key = os.path.normcase(os.path.abspath(base_path)).encode("utf-8")
+    return os.path.join(cache_dir, "base-{digest}.cache".format(digest=hashlib.md5(key).hexdigest()))
+
+
+def load_base_layer(base_path, cache_dir=None, rebuild=False):
+    """Return the shared (symbols, strings) layer of the base game files.
+
+    The layer is built once, written to cache_dir and then reused by every
+    project until it is explicitly rebuilt. Without a cache_dir it only lives
+    in memory.
+    """
+    key = os.path.normcase(os.path.abspath(base_path))
+    with _base_layers_lock:
+        if not rebuild and key in _base_layers:
+            return _base_layers[key]
+
+        cache_file = base_cache_path(base_path, cache_dir) if cache_dir else None
+        layer = None if rebuild or not cache_file else load_layer(cache_file)
+        if layer is None:
+            symbols, strings = {}, {}
+            index_folders([base_path], symbols, strings)
+            layer = (symbols, strings)
+            if cache_file:
+                try:
+                    save_layer(cache_file, symbols, strings)
+                except OSError as e:
+                    print("[BFME Plugin] Failed to write {path}: {e}".format(path=cache_file, e=e))
+            print("[BFME Plugin] Built base game index for {path}".format(path=base_path))
+
+        _base_layers[key] = layer
+        return layer
+
+
+def project_key(folders):
+    return tuple(sorted(set(os.path.normcase(os.path.abspath(f)) for f in folders)))
+
+
+class ProjectRegistry(object):
+    """Project indexes shared by all owners opened on the same folders.
+
+    An owner is anything with a stable id, a Sublime window or a language
+    server client. A project is dropped once its last owner is released.
+    """
+
+    def __init__(self):
+        self.projects = {}
+        self.owners = {}
+        self.lock = threading.Lock()
+
+    def _release(self, key):
+        project = self.projects[key]
+        project.refcount -= 1
+        if project.refcount <= 0:
+            del self.projects[key]
+
+    def acquire(self, owner, folders):
+        """Return the project of folders, moving owner to it if needed."""
+        key = project_key(folders)
+        with self.lock:
+            old_key = self.owners.get(owner)
+            if old_key != key:
+                if old_key is not None:
+                    self._release(old_key)
+                if key not in self.projects:
+                    self.projects[key] = ProjectIndex(folders)
+                self.projects[key].refcount += 1
+                self.owners[owner] = key
+            return self.projects[key]
+
+    def release(self, owner):
+        with self.lock:
+            key = self.owners.pop(owner, None)
+            if key is not None:
+                self._release(key)
+
+    def owners_of(self, project):
+        with self.lock:
+            return set(
+                owner for owner, key in self.owners.items() if self.projects.get(key) is project
+            )
+
+    def all(self):
+        with self.lock:
+            return list(self.projects.values())
+
+    def clear(self):
+        with self.lock:
+            self.projects.clear()
+            self.owners.clear()
+
+
+def build_project_index(project, base_path=None, cache_dir=None, report=None, rebuild=False):
+    """Index all BFME symbols in the project folders.
+
+    With a cache_dir a cold start restores the index written by the previous
+    run and only re-indexes the files changed since. Otherwise the files
+    indexed so far are published as shards every SHARD_INTERVAL seconds, a
+    reindex keeps serving the previous index until the new one is complete.
+    report is called with progress messages, rebuild ignores the cached
+    indexes. Returns the number of indexed files.
+    """
+    report = report or (lambda message: None)
+    if base_path and os.path.isdir(base_path):
+        report("BFME: Loading base game index")
+        with span("index.base_layer"):
+            project.symbols.base, project.strings.base = load_base_layer(base_path, cache_dir, rebuild)
+        folders = [f for f in project.folders if not is_inside(f, base_path)]
+    else:
+        project.symbols.base = project.strings.base = None
+        folders = project.folders
+
+    cache_file = project_cache_path(folders, cache_dir) if cache_dir else None
+    if cache_file and not rebuild and not project.indexed:
+        with span("index.cache_load"):
+            loaded = load_project_cache(project, cache_file, folders)
+    else:
+        loaded = False
+    if loaded:
+        print("[BFME Plugin] Loaded cached index of {files} files".format(files=len(project.files)))
+        report("BFME: Loaded cached index")
+        if reindex_changed_files(project):
+            with span("index.cache_save"):
+                save_project_cache(project, cache_file, folders)
+        return len(project.files)
+
+    snapshot = {}
+    paths = []
+    with span("index.walk"):
+        for folder in folders:
+            paths.extend(walk_index_files(folder, snapshot, project.ignore))
+    sizes = {}
+    for _, tracked in snapshot.values():
+        for path, (_, size) in tracked.items():
+            sizes[path] = size
+
+    progress = IndexProgress(len(paths), sum(sizes.values()), report)
+    publish = not project.indexed
+    shards = []
+    shard = ({}, {}, {})
+    shard_started = time.monotonic()
+    with span("index.parse"):
+        for path in paths:
+            symbols, strings, files = shard
+            files[project.file_id(path)] = index_path(path, symbols, strings)
+            progress.advance(sizes.get(path, 0))
+            if publish and time.monotonic() - shard_started >= SHARD_INTERVAL:
+                shards.append(shard)
+                project.symbols.replace(project.symbols.mod, [s[0] for s in shards])
+                project.strings.replace(project.strings.mod, [s[1] for s in shards])
+                project.generation += 1
+                shard = ({}, {}, {})
+                shard_started = time.monotonic()
+        shards.append(shard)
+
+    with span("index.merge"):
+        symbols, strings, files = merge_shards(shards)
+    with project.write_lock:
+        project.symbols.replace(symbols)
+        project.strings.replace(strings)
+        project.files = files
+        project.snapshot = snapshot
+        project.indexed = True
+        project.generation += 1
+
+    print("[BFME Plugin] Indexed {index} symbols".format(index=len(project.symbols)))
+    if cache_file:
+        try:
+            with span("index.cache_save"):
+                save_project_cache(project, cache_file, folders)
+        except OSError as e:
+            print("[BFME Plugin] Failed to write {path}: {e}".format(path=cache_file, e=e))
+    return len(paths)
+
+
+def symbol_browser_items(project, separator):
+    """Return the sorted (display, path, line) items and display strings of a
+    symbol quick panel.
+
+    Both are built once per index generation and reused until the index changes.
+    """
+    generation = project.generation
+    cached = project.browser_items.get(separator)
+    if cached is not None and cached[0] == generation:
+        return cached[1], cached[2]
+
+    items = []
+    for name, (path, line, kind, *_) in project.symbols.items():
+        if isinstance(path, list):
+            for p, line_num in zip(path, line):
+                display = "{name}{separator}[{kind}] - {fullpath}".format(
+                    name=name, separator=separator, kind=kind, fullpath=p
+                )
+                items.append((display, p, line_num))
+        else:
+            display = "{name}{separator}[{kind}]".format(name=name, separator=separator, kind=kind)
+            items.append((display, path, line))
+
+    for name, (path, line, kind, *_) in project.strings.items():
+        display = "{name}{separator}[string]".format(name=name, separator=separator)
+        items.append((display, path, line))
+
+    items.sort(key=lambda x: x[0].lower())
+    displays = [item[0] for item in items]
+    project.browser_items[separator] = (generation, items, displays)
+    return items, displays
+
+
+def reindex_changed_files(project):
+    """Re-index only the files that changed on disk since the last scan.
+
+    The mod layer is updated on copies which are swapped in at the end, so
+    lookups running meanwhile never see a half-updated index.
+    """
+    with project.write_lock, span("index.refresh"):
+        changed, removed = find_changed_files(project.snapshot, project.ignore)
+        if not changed and not removed:
+            return 0
+
+        symbols = dict(project.symbols.mod)
+        strings = dict(project.strings.mod)
+        files = dict(project.files)
+        for path in changed | removed:
+            file_id = project.file_id(path)
+            for name, _, kind in files.pop(file_id, ()):
+                remove_definition(strings if kind == "string" else symbols, name, path)
+            if path in changed:
+                files[file_id] = index_path(path, symbols, strings)
+
+        project.symbols.replace(symbols)
+        project.strings.replace(strings)
+        project.files = files
+        project.generation += 1
+
+    print("[BFME Plugin] Re-indexed {count} changed files".format(count=len(changed | removed)))
+    return len(changed | removed)
+
+
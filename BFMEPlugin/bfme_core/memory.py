@@ -0,0 +1,96 @@
+import sys
+
+
+def deep_size(obj, seen):
+    """Return the size of obj and everything it holds not already in seen.
+
+    Objects are counted once across calls sharing seen, so interned names,
+    kinds and paths are attributed to the first structure that holds them.
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return size
+
+
+def layer_sizes(layers, seen, sizes, counts, prefix=""):
+    """Add the entries of layers to sizes and counts, split into macros and other symbols."""
+    for layer in layers:
+        for name, entry in layer.items():
+            category = prefix + ("macros" if entry[2] == "macro" else "symbols")
+            sizes[category] = sizes.get(category, 0) + deep_size(name, seen) + deep_size(entry, seen)
+            counts[category] = counts.get(category, 0) + 1
+        category = prefix + "symbols"
+        seen.add(id(layer))
+        sizes[category] = sizes.get(category, 0) + sys.getsizeof(layer)
+
+
+def memory_report(project):
+    """Return [(structure, entries, bytes)] of the memory held by project.
+
+    The shared base game layer is reported separately, it is held once for
+    every project that uses it.
+    """
+    seen = set()
+    sizes = {}
+    counts = {}
+    project_symbols = (project.symbols.mod,) + tuple(project.symbols.shards)
+    layer_sizes(project_symbols, seen, sizes, counts)
+    for layer in (project.strings.mod,) + tuple(project.strings.shards):
+        sizes["strings"] = sizes.get("strings", 0) + deep_size(layer, seen)
+        counts["strings"] = counts.get("strings", 0) + len(layer)
+
+    sizes["file records"] = deep_size(project.files, seen) + deep_size(project.file_ids, seen)
+    sizes["file records"] += deep_size(project.file_paths, seen)
+    counts["file records"] = len(project.files)
+    sizes["snapshot"] = deep_size(project.snapshot, seen)
+    counts["snapshot"] = sum(len(tracked) for _, tracked in project.snapshot.values())
+
+    references = project.references[1] if project.references else {}
+    sizes["references"] = deep_size(references, seen)
+    counts["references"] = sum(len(uses) for uses in references.values())
+    sizes["browser items"] = deep_size(project.browser_items, seen)
+    counts["browser items"] = sum(len(items) for _, items, _ in project.browser_items.values())
+
+    if project.symbols.base:
+        layer_sizes((project.symbols.base,), seen, sizes, counts, "base ")
+    if project.strings.base:
+        sizes["base strings"] = deep_size(project.strings.base, seen)
+        counts["base strings"] = len(project.strings.base)
+
+    # last, so the layers they point at are already counted above
+    tables = [project.symbols.kind_tables, project.strings.kind_tables]
+    sizes["prefix tables"] = deep_size(tables, seen)
+    counts["prefix tables"] = sum(
+        len(names) for kind_tables in tables for _, table in kind_tables.values() for _, names in table.values()
+    )
+
+    order = [
+        "symbols", "macros", "strings", "references", "file records", "snapshot", "browser items",
+        "base symbols", "base macros", "base strings", "prefix tables",
+    ]
+    return [(name, counts.get(name, 0), sizes[name]) for name in order if name in sizes]
+
+
+def format_memory_report(rows, title="BFME index memory"):
+    lines = [title, ""]
+    header = "{name:<16} {count:>10} {size:>12}".format(name="structure", count="entries", size="MB")
+    lines += [header, "-" * len(header)]
+    total = 0
+    for name, count, size in rows:
+        total += size
+        lines.append("{name:<16} {count:>10} {size:>12.2f}".format(name=name, count=count, size=size / 1048576.0))
+    lines.append("-" * len(header))
+    lines.append("{name:<16} {count:>10} {size:>12.2f}".format(name="total", count="", size=total / 1048576.0))
+    lines += ["", "Shared objects such as interned names and paths are counted once, in the first row holding them."]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,151 @@
+import threading
+import time
+
+# Upper bounds of the histogram buckets in milliseconds, the last one is open.
+BUCKET_BOUNDS_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+_enabled = False
+_histograms = {}
+_histograms_lock = threading.Lock()
+
+
+class Histogram(object):
+    """Durations of one span, bucketed on a fixed log-like scale."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        index = 0
+        while index < len(BUCKET_BOUNDS_MS) and ms > BUCKET_BOUNDS_MS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += ms
+        self.min = ms if self.min is None else min(self.min, ms)
+        self.max = max(self.max, ms)
+
+    def percentile(self, fraction):
+        """Return the upper bound in ms of the bucket holding the given fraction of samples."""
+        if not self.count:
+            return 0.0
+        wanted = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= wanted:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return min(BUCKET_BOUNDS_MS[index], self.max)
+                return self.max
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "total_ms": self.total,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "min_ms": self.min or 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max,
+        }
+
+
+class _Span(object):
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class _NoSpan(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def set_enabled(enabled):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    return _enabled
+
+
+def span(name):
+    """Time a with block into the histogram of name.
+
+    While instrumentation is disabled this returns a shared no-op context
+    manager, so a span costs one function call and a global lookup.
+    """
+    if not _enabled:
+        return _NO_SPAN
+    return _Span(name)
+
+
+def record(name, seconds):
+    with _histograms_lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.add(seconds)
+
+
+def reset():
+    with _histograms_lock:
+        _histograms.clear()
+
+
+def stats():
+    """Return name -> summary dict of every recorded span."""
+    with _histograms_lock:
+        return dict((name, histogram.summary()) for name, histogram in _histograms.items())
+
+
+def format_stats(title="BFME performance stats"):
+    """Return the recorded spans as a text table sorted by name."""
+    summaries = stats()
+    lines = [title, ""]
+    if not summaries:
+        lines.append("No timings recorded yet.")
+        return "\n".join(lines) + "\n"
+
+    header = "{name:<28} {count:>7} {mean:>10} {p50:>10} {p95:>10} {max:>10} {total:>11}".format(
+        name="span", count="count", mean="mean ms", p50="p50 ms", p95="p95 ms", max="max ms", total="total ms"
+    )
+    lines += [header, "-" * len(header)]
+    for name in sorted(summaries):
+        s = summaries[name]
+        lines.append(
+            "{name:<28} {count:>7} {mean:>10.2f} {p50:>10.2f} {p95:>10.2f} {max:>10.2f} {total:>11.1f}".format(
+                name=name,
+                count=s["count"],
+                mean=s["mean_ms"],
+                p50=s["p50_ms"],
+                p95=s["p95_ms"],
+                max=s["max_ms"],
+                total=s["total_ms"],
+            )
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,75 @@
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+PROFILE_TOP = 40
+
+# tracemalloc is process wide, profiles run one at a time.
+_profile_lock = threading.Lock()
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return "{size:.1f} {unit}".format(size=size, unit=unit)
+        size /= 1024.0
+    return "{size:.1f} GB".format(size=size)
+
+
+def profile(function, title, report_file, top=PROFILE_TOP, trace_memory=True):
+    """Run function under cProfile and tracemalloc and write a text report.
+
+    The report lists the top functions by cumulative and by own time and the
+    top allocation sites still alive when function returns. cProfile only
+    sees the calling thread, so function must do its work synchronously.
+    Returns the value of function.
+    """
+    with _profile_lock:
+        profiler = cProfile.Profile()
+        started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(10)
+        try:
+            started = time.perf_counter()
+            profiler.enable()
+            try:
+                result = function()
+            finally:
+                profiler.disable()
+            elapsed = time.perf_counter() - started
+            snapshot = tracemalloc.take_snapshot() if trace_memory else None
+            peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+    out = io.StringIO()
+    out.write("{title}\n{date}, {elapsed:.3f}s wall time\n\n".format(
+        title=title, date=time.strftime("%Y-%m-%d %H:%M:%S"), elapsed=elapsed
+    ))
+    for sort in ("cumulative", "tottime"):
+        out.write("== Top {top} functions by {sort} time ==\n".format(top=top, sort=sort))
+        stats = pstats.Stats(profiler, stream=out)
+        stats.strip_dirs().sort_stats(sort).print_stats(top)
+
+    if snapshot is not None:
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ])
+        statistics = snapshot.statistics("lineno")
+        out.write("== Top {top} allocation sites, peak {peak} ==\n".format(top=top, peak=format_size(peak)))
+        for stat in statistics[:top]:
+            frame = stat.traceback[0]
+            out.write("{size:>10}  {count:>8} blocks  {file}:{line}\n".format(
+                size=format_size(stat.size), count=stat.count, file=frame.filename, line=frame.lineno
+            ))
+
+    os.makedirs(os.path.dirname(os.path.abspath(report_file)), exist_ok=True)
+    with open(report_file, "w", encoding="utf-8") as f:
+        f.write(out.getvalue())
+    return result
@@ -0,0 +1,128 @@
+import re
+
+from .perf import span
+
+token_pattern = re.compile(r"[\w:+\-]+")
+
+
+def external_symbols(current_file, symbols, strings):
+    """Return name -> (kind, path, line) of the symbols defined outside current_file."""
+    external = {}
+    for symbol_name, (symbol_path, symbol_line, symbol_kind, *_) in symbols.items():
+        if isinstance(symbol_path, list):
+            if current_file in symbol_path:
+                continue
+        elif symbol_path == current_file:
+            continue
+
+        if isinstance(symbol_path, list):
+            def_path = symbol_path[0]
+            def_line = symbol_line[0] if isinstance(symbol_line, list) else symbol_line
+        else:
+            def_path = symbol_path
+            def_line = symbol_line
+
+        external[symbol_name] = (symbol_kind, def_path, def_line)
+
+    for symbol_name, (symbol_path, symbol_line, symbol_kind, *_) in strings.items():
+        if symbol_path != current_file:
+            external[symbol_name] = (symbol_kind, symbol_path, symbol_line)
+
+    return external
+
+
+def find_used_symbols(text, current_file, symbols, strings):
+    """Return the external symbols used in text, sorted by line.
+
+    Each symbol is reported once, at its first use, as a
+    (name, line, kind, definition path, definition line, line text) tuple.
+    """
+    with span("used_symbols.scan"):
+        return _find_used_symbols(text, current_file, symbols, strings)
+
+
+def _find_used_symbols(text, current_file, symbols, strings):
+    external = external_symbols(current_file, symbols, strings)
+    used_symbols = []
+    symbol_patterns = {}
+
+    for line_num, line in enumerate(text.split('\n'), 1):
+        stripped_line = line.strip()
+        if not stripped_line or stripped_line.startswith(';') or stripped_line.startswith('//'):
+            continue
+
+        for symbol_name, (symbol_kind, def_path, def_line) in external.items():
+            if symbol_name in line:
+                if symbol_name not in symbol_patterns:
+                    symbol_patterns[symbol_name] = re.compile(r'\b' + re.escape(symbol_name) + r'\b', re.IGNORECASE)
+
+                if symbol_patterns[symbol_name].search(line):
+                    used_symbols.append((
+                        symbol_name,
+                        line_num,
+                        symbol_kind,
+                        def_path,
+                        def_line,
+                        stripped_line
+                    ))
+                    del external[symbol_name]
+                    break
+
+    used_symbols.sort(key=lambda x: x[1])
+    return used_symbols
+
+
+def strip_comment(line):
+    for marker in (";", "//"):
+        index = line.find(marker)
+        if index >= 0:
+            line = line[:index]
+    return line
+
+
+def scan_references(path, symbol_names, string_names, references):
+    """Add the uses of known symbols and strings in the file at path to references."""
+    try:
+        with open(path, "r", encoding="latin-1", errors="ignore") as f:
+            for i, line in enumerate(f):
+                for token in token_pattern.findall(strip_comment(line)):
+                    if token in symbol_names:
+                        references.setdefault(token, []).append((path, i + 1))
+                    else:
+                        folded = token.lower()
+                        if folded in string_names:
+                            references.setdefault(folded, []).append((path, i + 1))
+    except OSError as e:
+        print("[BFME Plugin] Failed to read {path}: {e}".format(path=path, e=e))
+
+
+def build_references(project):
+    """Return name -> [(path, line)] of every use of a known name in the mod files.
+
+    Definitions count as uses too, strings are keyed by their lowercase name
+    like in project.strings.
+    """
+    symbol_names = set()
+    for layer in project.symbols.layers():
+        symbol_names.update(layer)
+    string_names = set()
+    for layer in project.strings.layers():
+        string_names.update(layer)
+
+    references = {}
+    for file_id in sorted(project.files):
+        path = project.file_paths[file_id]
+        if not path.lower().endswith(".csv"):
+            scan_references(path, symbol_names, string_names, references)
+    return references
+
+
+def get_references(project):
+    """Return the references of project, built on first use for each index generation."""
+    cached = project.references
+    generation = project.generation
+    if cached is None or cached[0] != generation:
+        with span("references.build"):
+            cached = (generation, build_references(project))
+        project.references = cached
+    return cached[1]
@@ -0,0 +1,171 @@
+import threading
+
+from .behaviors import prefix_range, BehaviorTable, get_behaviors
+
+MODULE_CATEGORIES = ("Behavior", "Body", "ClientBehavior", "ClientUpdate", "Draw")
+# Top level definitions with a schema, mapped to their block type.
+TOP_LEVEL_BLOCKS = {"object": "Object", "childobject": "Object", "objectreskin": "Object"}
+MODULE_TYPE = "Module"
+
+_schema = None
+_schema_lock = threading.Lock()
+
+
+def module_category(module_name):
+    """Return the category of a module documented with the behaviors, from its name."""
+    if module_name.endswith(("Body", "BodyModule")):
+        return "Body"
+    if module_name.endswith("ClientUpdate"):
+        return "ClientUpdate"
+    if module_name.endswith(("ClientBehavior", "ClientCreate")):
+        return "ClientBehavior"
+    return "Behavior"
+
+
+def module_tag(module_name):
+    """Return the conventional ModuleTag_ name of a module."""
+    stem = module_name
+    for suffix in ("ClientBehavior", "ClientUpdate", "Behavior", "Behaviour", "Module", "Update", "Draw"):
+        if stem.endswith(suffix) and len(stem) > len(suffix):
+            stem = stem[:-len(suffix)]
+            break
+    return "ModuleTag_" + stem
+
+
+class NameTable(object):
+    """Case-insensitive exact and prefix lookups into a list of names."""
+
+    def __init__(self, names):
+        self.names = dict((name.lower(), name) for name in names)
+        self.sorted_names = sorted(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def get(self, name):
+        """Return the canonical spelling of name, or None if unknown."""
+        return self.names.get(name.lower()) if name else None
+
+    def with_prefix(self, prefix):
+        return [self.names[key] for key in prefix_range(self.sorted_names, prefix.lower())]
+
+
+class Schema(object):
+    """Modules by category, nested blocks and enumerations of object definitions.
+
+    A block is referred to as (table, name), where table is the modules or
+    the blocks BehaviorTable, so fields of modules and of nested blocks are
+    looked up the same way: a dict access or two bisections.
+    """
+
+    def __init__(self, behaviors, draw_modules, object_fields, blocks, enums, enum_aliases):
+        modules = dict(behaviors)
+        modules.update(draw_modules)
+        self.modules = BehaviorTable(modules)
+        by_category = dict((category, []) for category in MODULE_CATEGORIES)
+        for name in behaviors:
+            by_category[module_category(name)].append(name)
+        by_category["Draw"].extend(draw_modules)
+        self.categories = dict((category, NameTable(names)) for category, names in by_category.items())
+        self.category_names = NameTable(MODULE_CATEGORIES)
+
+        blocks = dict(blocks)
+        blocks["Object"] = object_fields
+        self.blocks = BehaviorTable(blocks)
+
+        self.enums = dict((name, NameTable(values)) for name, values in enums.items())
+        for alias, name in enum_aliases.items():
+            values = list(enums[name])
+            if alias.endswith("Filter"):
+                values += ["ALL", "NONE"]
+            self.enums[alias] = NameTable(values)
+        self.enum_values = NameTable(value for values in enums.values() for value in values)
+
+    def category(self, keyword):
+        """Return the module category named by keyword (Behavior, Draw, ...), or None."""
+        return self.category_names.get(keyword)
+
+    def modules_with_prefix(self, category, prefix):
+        return self.categories[category].with_prefix(prefix)
+
+    def module(self, category, name):
+        """Return the block of a module of category, or None if unknown.
+
+        Categories are guessed from module names, so a module known under
+        another category is accepted too.
+        """
+        canonical = self.categories[category].get(name) or self.modules.behavior(name)
+        return (self.modules, canonical) if canonical is not None else None
+
+    def resolve(self, path):
+        """Return the block a [(keyword, argument)] path from find_block_path leads to, or None.
+
+        Resolution starts at the innermost top level definition or module
+        line, so module blocks kept in include files resolve too.
+        """
+        block = None
+        start = len(path)
+        while start > 0 and block is None:
+            start -= 1
+            keyword, argument = path[start]
+            if keyword.lower() in TOP_LEVEL_BLOCKS:
+                block = (self.blocks, TOP_LEVEL_BLOCKS[keyword.lower()])
+            elif self.category(keyword) is not None:
+                block = self.module(self.category(keyword), argument)
+                if block is None:
+                    return None
+
+        if block is None:
+            return None
+        for keyword, argument in path[start + 1:]:
+            field = self.field(block, keyword)
+            if field is None:
+                return None
+            if field[1] == MODULE_TYPE:
+                block = self.module(self.category(field[0]), argument)
+            elif self.blocks.behavior(field[1]) is not None:
+                block = (self.blocks, self.blocks.behavior(field[1]))
+            else:
+                return None
+            if block is None:
+                return None
+        return block
+
+    def field(self, block, name):
+        """Return (field, type) of a field of block, or None if unknown."""
+        table, block_name = block
+        return table.parameter(block_name, name)
+
+    def fields_with_prefix(self, block, prefix):
+        table, block_name = block
+        return table.parameters_with_prefix(block_name, prefix)
+
+    def enum(self, type_name):
+        """Return the NameTable of the values of an enumerated type, or None."""
+        return self.enums.get(type_name)
+
+    def is_enum_value(self, name):
+        """Return True if name is a value of any enumerated type."""
+        return self.enum_values.get(name) is not None
+
+    def is_block_type(self, type_name):
+        return type_name == MODULE_TYPE or self.blocks.behavior(type_name) is not None
+
+
+def get_schema():
+    """Return the Schema of the documented behaviors and schema_data, built on first use."""
+    global _schema
+    if _schema is None:
+        with _schema_lock:
+            if _schema is None:
+                from . import schema_data
+
+                _schema = Schema(
+                    get_behaviors(),
+                    schema_data.DRAW_MODULES,
+                    schema_data.OBJECT_FIELDS,
+                    schema_data.BLOCKS,
+                    schema_data.ENUMS,
+                    schema_data.ENUM_ALIASES,
+                )
+    return _schema
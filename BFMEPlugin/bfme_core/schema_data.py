@@ -0,0 +1,291 @@
+# Hand maintained part of the object schema.
+# behaviors_data holds the modules documented on the wiki, which only covers
+# Behavior, Body and client modules and no nested block contents. This
+# file adds the Draw modules, the fields of Object blocks, the nested blocks
+# and the values of enumerated types. Field types use the wiki's type names,
+# a type named in BLOCKS opens a nested block ending with End.
+
+OBJECT_FIELDS = {
+    "Behavior": "Module",
+    "Body": "Module",
+    "ClientUpdate": "Module",
+    "ClientBehavior": "Module",
+    "Draw": "Module",
+    "ArmorSet": "ArmorSet",
+    "WeaponSet": "WeaponSet",
+    "LocomotorSet": "LocomotorSet",
+    "UnitSpecificSounds": "UnitSpecificSounds",
+    "DisplayName": "String",
+    "Description": "String",
+    "Side": "String",
+    "EditorSorting": "EditorSorting",
+    "KindOf": "KindofList",
+    "ThingClass": "String",
+    "BuildCost": "UnsignedInteger",
+    "BuildTime": "FloatingPoint",
+    "CommandSet": "CommandSet",
+    "CommandPoints": "UnsignedInteger",
+    "VisionRange": "FloatingPoint",
+    "ShroudClearingRange": "FloatingPoint",
+    "Scale": "FloatingPoint",
+    "Geometry": "GeometryType",
+    "GeometryMajorRadius": "FloatingPoint",
+    "GeometryMinorRadius": "FloatingPoint",
+    "GeometryHeight": "FloatingPoint",
+    "GeometryIsSmall": "Boolean",
+    "GeometryOffset": "Vector3",
+    "Shadow": "ShadowType",
+    "ShadowSizeX": "FloatingPoint",
+    "ShadowSizeY": "FloatingPoint",
+    "ShadowTexture": "String",
+    "RadarPriority": "RadarPriority",
+    "ExperienceValue": "UnsignedIntegerList",
+    "ExperienceRequired": "UnsignedIntegerList",
+    "IsTrainable": "Boolean",
+    "BountyValue": "UnsignedInteger",
+    "TransportSlotCount": "UnsignedInteger",
+    "CrushableLevel": "UnsignedInteger",
+    "CrusherLevel": "UnsignedInteger",
+    "SelectPortrait": "String",
+    "ButtonImage": "String",
+    "UpgradeCameo1": "Upgrade",
+    "UpgradeCameo2": "Upgrade",
+    "UpgradeCameo3": "Upgrade",
+    "UpgradeCameo4": "Upgrade",
+    "UpgradeCameo5": "Upgrade",
+    "VoiceSelect": "AudioEvent",
+    "VoiceMove": "AudioEvent",
+    "VoiceAttack": "AudioEvent",
+    "VoiceGuard": "AudioEvent",
+    "VoiceFear": "AudioEvent",
+    "VoiceCreated": "AudioEvent",
+    "SoundImpact": "AudioEvent",
+    "SoundDie": "AudioEvent",
+    "SoundAmbient": "AudioEvent",
+    "EvaEventDamagedOwner": "EvaEvent",
+    "EvaEventDieOwner": "EvaEvent",
+    "FormationWidth": "UnsignedInteger",
+    "FormationDepth": "UnsignedInteger",
+    "ThreatLevel": "FloatingPoint",
+}
+
+DRAW_MODULES = {
+    "W3DScriptedModelDraw": {
+        "OkToChangeModelColor": "Boolean",
+        "StaticModelLODMode": "Boolean",
+        "ParticlesAttachedToAnimatedBones": "Boolean",
+        "ExtraPublicBone": "Strings",
+        "AttachToBoneInAnotherModule": "String",
+        "TrackMarks": "String",
+        "TrackMarksLeftBone": "String",
+        "TrackMarksRightBone": "String",
+        "WadingParticleSys": "ParticleSystem",
+        "IgnoreConditionStates": "ConditionFlags",
+        "DefaultModelConditionState": "ModelConditionState",
+        "ModelConditionState": "ModelConditionState",
+        "AnimationState": "AnimationState",
+        "IdleAnimationState": "AnimationState",
+        "TransitionState": "AnimationState",
+    },
+    "W3DHordeModelDraw": {
+        "OkToChangeModelColor": "Boolean",
+        "StaticModelLODMode": "Boolean",
+        "ExtraPublicBone": "Strings",
+        "IgnoreConditionStates": "ConditionFlags",
+        "LodOptions": "String",
+        "DefaultModelConditionState": "ModelConditionState",
+        "ModelConditionState": "ModelConditionState",
+        "AnimationState": "AnimationState",
+        "IdleAnimationState": "AnimationState",
+        "TransitionState": "AnimationState",
+    },
+    "W3DModelDraw": {
+        "OkToChangeModelColor": "Boolean",
+        "ExtraPublicBone": "Strings",
+        "AttachToBoneInAnotherModule": "String",
+        "IgnoreConditionStates": "ConditionFlags",
+        "DefaultConditionState": "ModelConditionState",
+        "ConditionState": "ModelConditionState",
+        "TransitionState": "ModelConditionState",
+    },
+    "W3DDefaultDraw": {},
+    "W3DLaserDraw": {
+        "Texture": "String",
+        "NumBeams": "UnsignedInteger",
+        "InnerBeamWidth": "FloatingPoint",
+        "OuterBeamWidth": "FloatingPoint",
+        "InnerColor": "String",
+        "OuterColor": "String",
+        "Tile": "Boolean",
+        "ScrollRate": "FloatingPoint",
+        "Segments": "UnsignedInteger",
+        "ArcHeight": "FloatingPoint",
+        "SegmentOverlapRatio": "FloatingPoint",
+        "TilingScalar": "FloatingPoint",
+    },
+    "W3DTreeDraw": {
+        "ModelName": "String",
+        "TextureName": "String",
+        "MoveOutwardTime": "UnsignedInteger",
+        "MoveInwardTime": "UnsignedInteger",
+        "MoveOutwardDistanceFactor": "FloatingPoint",
+        "DarkeningFactor": "FloatingPoint",
+        "ToppleFX": "FXList",
+        "BounceFX": "FXList",
+        "KillWhenFinishedToppling": "Boolean",
+        "DoTopple": "Boolean",
+        "DoShadow": "Boolean",
+    },
+    "W3DPropDraw": {
+        "ModelName": "String",
+    },
+}
+
+BLOCKS = {
+    "ArmorSet": {
+        "Conditions": "ArmorSetFlags",
+        "Armor": "Armor",
+        "DamageFX": "DamageFX",
+    },
+    "WeaponSet": {
+        "Conditions": "WeaponsetFlags",
+        "Weapon": "Weapon",
+        "AutoChooseSources": "String",
+        "PreferredAgainst": "String",
+        "OnlyAgainst": "String",
+        "ShareWeaponReloadTime": "Boolean",
+        "WeaponLockSharedAcrossSets": "Boolean",
+    },
+    "LocomotorSet": {
+        "Locomotor": "Locomotor",
+        "Condition": "LocomotorSetType",
+        "Speed": "FloatingPoint",
+    },
+    "UnitSpecificSounds": {},
+    "TurretModule": {
+        "TurretTurnRate": "FloatingPoint",
+        "TurretPitchRate": "FloatingPoint",
+        "NaturalTurretAngle": "Degrees",
+        "NaturalTurretPitch": "Degrees",
+        "FirePitch": "Degrees",
+        "MinPhysicalPitch": "Degrees",
+        "GroundUnitPitch": "Degrees",
+        "TurretFireAngleSweep": "String",
+        "TurretSweepSpeedModifier": "String",
+        "ControlledWeaponSlots": "SlotTypes",
+        "AllowsPitch": "Boolean",
+        "MinIdleScanTime": "UnsignedInteger",
+        "MaxIdleScanTime": "UnsignedInteger",
+        "MinIdleScanAngle": "Degrees",
+        "MaxIdleScanAngle": "Degrees",
+        "RecenterTime": "UnsignedInteger",
+        "InitiallyDisabled": "Boolean",
+        "FiresWhileTurning": "Boolean",
+    },
+    "ModelConditionState": {
+        "Model": "String",
+        "Skeleton": "String",
+        "Texture": "String",
+        "ParticleSysBone": "String",
+        "HideSubObject": "Strings",
+        "ShowSubObject": "Strings",
+        "WeaponFireFXBone": "String",
+        "WeaponRecoilBone": "String",
+        "WeaponMuzzleFlash": "String",
+        "WeaponLaunchBone": "String",
+        "WeaponHideShowBone": "String",
+        "Shadow": "ShadowType",
+    },
+    "AnimationState": {
+        "Animation": "Animation",
+        "StateName": "String",
+        "Flags": "AnimationStateFlags",
+        "ParticleSysBone": "String",
+        "FXEvent": "String",
+        "LuaEvent": "String",
+        "EnteringStateFX": "FXList",
+        "BeginScript": "String",
+        "EndScript": "String",
+        "ShareAnimation": "Boolean",
+        "AllowRepeatInRandomPick": "Boolean",
+        "FrameForPristineBonePositions": "UnsignedInteger",
+    },
+    "Animation": {
+        "AnimationName": "String",
+        "AnimationMode": "AnimationMode",
+        "AnimationPriority": "UnsignedInteger",
+        "AnimationBlendTime": "UnsignedInteger",
+        "AnimationSpeedFactorRange": "String",
+        "AnimationMustCompleteBlend": "Boolean",
+        "UseWeaponTiming": "Boolean",
+        "Distance": "FloatingPoint",
+    },
+}
+
+ENUMS = {
+    "KindofList": [
+        "AIRCRAFT", "ARCHER", "ALWAYS_SELECTABLE", "ALWAYS_VISIBLE", "ATTACK_NEEDS_LINE_OF_SIGHT", "BASE_FOUNDATION",
+        "BASE_SITE", "BRIDGE", "BRIDGE_TOWER", "CAN_ATTACK", "CAN_BE_REPULSED", "CAN_CAST_REFLECTIONS", "CAVALRY",
+        "CLICK_THROUGH", "COMMANDCENTER", "CRATE", "DOZER", "FS_BASE_DEFENSE", "FS_FACTORY", "FS_TECHNOLOGY",
+        "GARRISON", "HERO", "HORDE", "HUGE_VEHICLE", "IGNORED_IN_GUI", "IMMOBILE", "IMMUNE_TO_CAPTURE", "INERT",
+        "INFANTRY", "LINEBUILD", "MACHINE", "MONSTER", "NO_COLLIDE", "NONOCCLUDING", "NOT_AUTOACQUIRABLE", "OBSTACLE",
+        "PATH_THROUGH_EACH_OTHER", "PATH_THROUGH_INFANTRY", "PRELOAD", "PROJECTILE", "SCORE", "SELECTABLE",
+        "SHRUBBERY", "SIEGE_TOWER", "STICK_TO_TERRAIN_SLOPE", "STRUCTURE", "TRANSPORT", "UNATTACKABLE", "WALL_HUB",
+        "WALL_SEGMENT", "WALK_ON_TOP_OF_WALL",
+    ],
+    "ObjectStatus": [
+        "AFLAME", "AIRBORNE_TARGET", "BURNED", "CAN_ATTACK", "DESTROYED", "DETECTED", "HIJACKED", "IS_AIMING_WEAPON",
+        "IS_ATTACKING", "IS_BRAKING", "IS_FIRING_WEAPON", "MASKED", "NO_ATTACK", "NO_ATTACK_FROM_AI",
+        "NO_COLLISIONS", "RECONSTRUCTING", "SOLD", "STEALTHED", "UNDER_CONSTRUCTION", "UNDERGOING_REPAIR",
+        "UNSELECTABLE", "USING_ABILITY",
+    ],
+    "ConditionFlags": [
+        "ACTIVELY_CONSTRUCTING", "ATTACKING", "AWAITING_CONSTRUCTION", "BETWEEN_FIRING_SHOTS_A",
+        "CONSTRUCTION_COMPLETE", "DAMAGED", "DYING", "EMOTION_AFRAID", "EMOTION_ALERT", "EMOTION_CELEBRATING",
+        "EMOTION_TERROR", "FIRING_A", "FIRING_B", "FIRING_C", "GARRISONED", "MOVING", "NIGHT",
+        "PARTIALLY_CONSTRUCTED", "PREATTACK_A", "PREATTACK_B", "REALLYDAMAGED", "RELOADING_A", "RUBBLE", "SELECTED",
+        "SNOW", "SPECIAL_WEAPON_ONE", "USER_1", "USER_2", "USING_WEAPON_A", "USING_WEAPON_B",
+    ],
+    "LocomotorSetType": [
+        "SET_BURNINGDEATH", "SET_CHARGING", "SET_FREEFALL", "SET_NORMAL", "SET_NORMAL_UPGRADED", "SET_PANIC",
+        "SET_SLUGGISH", "SET_SUPERSONIC", "SET_TAXIING", "SET_WANDER",
+    ],
+    "WeaponsetFlags": [
+        "CONTESTING_BUILDING", "CRATEUPGRADE_ONE", "CRATEUPGRADE_TWO", "ELITE", "HERO", "MOUNTED",
+        "PLAYER_UPGRADE", "VETERAN", "WEAPONSET_HERO_MODE", "WEAPONSET_TOGGLE_1",
+    ],
+    "ArmorSetFlags": ["AGENT", "CRATE_UPGRADE_ONE", "CRATE_UPGRADE_TWO", "ELITE", "HERO", "PLAYER_UPGRADE", "VETERAN"],
+    "SlotTypes": ["PRIMARY", "SECONDARY", "TERTIARY"],
+    "EnumDeathType": [
+        "BURNED", "CRUSHED", "DETONATED", "EXPLODED", "FADED", "FLOODED", "KNOCKBACK", "LASERED", "NONE", "NORMAL",
+        "POISONED", "SPLATTED", "SUICIDED", "TOPPLED",
+    ],
+    "EnumDamageType": [
+        "CAVALRY", "CAVALRY_RANGED", "CRUSH", "EXPLOSION", "FALLING", "FLAME", "FROST", "HEALING", "HERO",
+        "HERO_RANGED", "LOGICAL_FIRE", "MAGIC", "PIERCE", "POISON", "SIEGE", "SLASH", "SPECIALIST", "STRUCTURAL",
+        "TOPPLING", "UNRESISTABLE", "URUK", "WATER",
+    ],
+    "GeometryType": ["BOX", "CYLINDER", "SPHERE"],
+    "ShadowType": [
+        "SHADOW_ADDITIVE_DECAL", "SHADOW_ALPHA_DECAL", "SHADOW_DECAL", "SHADOW_DYNAMIC_PROJECTION",
+        "SHADOW_PROJECTION", "SHADOW_VOLUME",
+    ],
+    "RadarPriority": ["INVALID", "NOT_ON_RADAR", "STRUCTURE", "UNIT", "LOCAL_UNIT_ONLY"],
+    "EditorSorting": ["AUDIO", "DEBRIS", "MISC", "NONE", "SHRUBBERY", "STRUCTURE", "SYSTEM", "UNIT"],
+    "AnimationMode": ["LOOP", "LOOP_BACKWARDS", "MANUAL", "ONCE", "ONCE_BACKWARDS", "PING_PONG", "PING_PONG_BACKWARDS"],
+    "AnimationStateFlags": [
+        "ADJUST_HEIGHT_BY_CONSTRUCTION_PERCENT", "MAINTAIN_FRAME_ACROSS_STATES", "RANDOMSTART", "RESTART_ANIM_WHEN_COMPLETE",
+        "START_FRAME_FIRST", "START_FRAME_LAST",
+    ],
+    "Boolean": ["No", "Yes"],
+    # first word of the Moment* values of slow deaths, e.g. FX = INITIAL FX_Death
+    "SlowDeathPhase": ["INITIAL", "MIDPOINT", "FINAL", "HIT_GROUND"],
+}
+
+# Types whose values come from another enumeration, filters also take ALL and NONE.
+ENUM_ALIASES = {
+    "ModelConditionFlag": "ConditionFlags",
+    "DeathTypeFilter": "EnumDeathType",
+    "DamageTypeFilter": "EnumDamageType",
+    "DamageTypes": "EnumDamageType",
+}
@@ -0,0 +1,217 @@
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .behaviors import get_behaviors
+from .completion import TYPE_KINDS, assignment_pattern
+from .context import include_pattern, resolve_include, iter_block_paths, find_block_path
+from .index import entry_locations
+from .perf import span
+from .references import strip_comment
+from .schema import get_schema
+
+ERROR = "error"
+WARNING = "warning"
+VALIDATION_WORKERS = 4
+# Moment* values start with the phase of the slow death they belong to.
+MOMENT_PHASE_TYPE = "SlowDeathPhase"
+
+value_token_pattern = re.compile(r"[+\-]?([\w:]+)")
+number_pattern = re.compile(r"^-?\d+(\.\d*)?%?$")
+key_pattern = re.compile(r"^\s*(\w+)")
+
+
+def check_values(project, schema, field, line_text, start):
+    """Yield (start, end, severity, message) for the names in line_text[start:] a field does not take."""
+    field_name, field_type = field
+    kinds = TYPE_KINDS.get(field_type)
+    if kinds is None or kinds == ("macro",):
+        return
+    value = strip_comment(line_text[start:])
+    matches = list(value_token_pattern.finditer(value))
+    if field_type.startswith("Moment") and matches:
+        phase = matches.pop(0)
+        phases = schema.enum(MOMENT_PHASE_TYPE)
+        if phases.get(phase.group(1)) is None:
+            message = "{field} starts with a phase, one of {phases}".format(
+                field=field_name, phases=", ".join(phases.names.values())
+            )
+            yield start + phase.start(1), start + phase.end(1), ERROR, message
+    for match in matches:
+        name = match.group(1)
+        if number_pattern.match(name) or name.upper() == "NONE" or schema.is_enum_value(name):
+            continue
+        entry = project.symbols.get(name)
+        if entry is None:
+            message = "undefined {kind} {name}".format(kind=kinds[0], name=name)
+            yield start + match.start(1), start + match.end(1), ERROR, message
+        elif entry[2] != "macro" and entry[2] not in kinds:
+            message = "{field} takes {expected}, {name} is {kind}".format(
+                field=field_name, expected=" or ".join(kinds), name=name, kind=entry[2]
+            )
+            yield start + match.start(1), start + match.end(1), ERROR, message
+
+
+def validate_line(project, schema, path, row, line_text, block_path):
+    """Return the [(path, line, start column, end column, severity, message)] of one line.
+
+    block_path is the find_block_path of row. Columns are 0-based offsets in
+    line_text, a diagnostic with start == end covers the whole line.
+    """
+    diagnostics = []
+    stripped = line_text.strip()
+    if stripped.startswith("#"):
+        match = include_pattern.search(line_text)
+        if match and not os.path.isfile(resolve_include(path, match.group(1))):
+            message = "missing include {include}".format(include=match.group(1))
+            diagnostics.append((path, row + 1, match.start(1), match.end(1), ERROR, message))
+        return diagnostics
+    if stripped.lower() == "end":
+        return diagnostics
+
+    match = assignment_pattern.match(line_text) or key_pattern.match(line_text)
+    if match is None:
+        return diagnostics
+    key = match.group(1)
+    category = schema.category(key)
+    if category is not None and category != "Draw" and "=" in line_text:
+        # Draw modules are maintained by hand and not exhaustive, they are not checked
+        value = line_text[line_text.index("=") + 1:]
+        words = strip_comment(value).split()
+        if words and schema.module(category, words[0]) is None:
+            column = line_text.index(words[0], line_text.index("="))
+            message = "unknown {category} module {name}".format(category=category, name=words[0])
+            diagnostics.append((path, row + 1, column, column + len(words[0]), WARNING, message))
+        return diagnostics
+
+    block = schema.resolve(block_path)
+    if block is None:
+        return diagnostics
+    field = schema.field(block, key)
+    if field is None:
+        # only the modules documented on the wiki have complete parameter lists
+        if block[0] is schema.modules and block[1] in get_behaviors():
+            column = match.start(1)
+            message = "unknown parameter {key} of {module}".format(key=key, module=block[1])
+            diagnostics.append((path, row + 1, column, column + len(key), WARNING, message))
+        return diagnostics
+
+    if "=" in line_text:
+        start = line_text.index("=") + 1
+        for start_column, end_column, severity, message in check_values(project, schema, field, line_text, start):
+            diagnostics.append((path, row + 1, start_column, end_column, severity, message))
+    return diagnostics
+
+
+def validate_lines(project, path, lines):
+    """Return the diagnostics of the lines of the file at path, checked in one pass."""
+    schema = get_schema()
+    diagnostics = []
+    for row, line_text, block_path in iter_block_paths(lines):
+        diagnostics.extend(validate_line(project, schema, path, row, line_text, block_path))
+    return diagnostics
+
+
+def validate_rows(project, path, get_line, rows):
+    """Return the diagnostics of some rows of a file, get_line(row) returns the text of a row.
+
+    Each row resolves its own block path, so checking a few edited rows of a
+    large file only reads those rows and the lines above them in their block.
+    """
+    schema = get_schema()
+    diagnostics = []
+    for row in rows:
+        line_text = get_line(row)
+        stripped = line_text.strip()
+        if not stripped or stripped.startswith((";", "//")):
+            continue
+        diagnostics.extend(validate_line(project, schema, path, row, line_text, find_block_path(get_line, row)))
+    return diagnostics
+
+
+def validate_file(project, path):
+    """Return the diagnostics of an INI file of the project."""
+    try:
+        with open(path, "r", encoding="latin-1", errors="ignore") as f:
+            lines = f.read().split("\n")
+    except OSError as e:
+        return [(path, 1, 0, 0, ERROR, "cannot read file: {e}".format(e=e))]
+    return validate_lines(project, path, lines)
+
+
+def definition_duplicates(name, entry):
+    """Return a diagnostic for every definition of a name after the first one."""
+    locations = entry_locations(entry)
+    first_path, first_line = locations[0]
+    message = "{kind} {name} is already defined at {first_path}:{first_line}".format(
+        kind=entry[2], name=name, first_path=first_path, first_line=first_line
+    )
+    return [(path, line, 0, 0, WARNING, message) for path, line in locations[1:]]
+
+
+def duplicate_diagnostics(project):
+    """Return a diagnostic for every definition of a name defined more than once in the mod."""
+    diagnostics = []
+    for name, entry in project.symbols.mod.items():
+        if isinstance(entry[0], list):
+            diagnostics.extend(definition_duplicates(name, entry))
+    diagnostics.sort()
+    return diagnostics
+
+
+def file_duplicate_diagnostics(project, path):
+    """Return the duplicate definition diagnostics of the names defined in path."""
+    diagnostics = []
+    for name in sorted(set(name for name, _, _ in project.file_symbols(path))):
+        entry = project.symbols.mod.get(name)
+        if entry is not None and isinstance(entry[0], list):
+            diagnostics.extend(d for d in definition_duplicates(name, entry) if d[0] == path)
+    return diagnostics
+
+
+def validate_project(project, report, workers=VALIDATION_WORKERS, stop=None):
+    """Check every INI file of project, calling report(diagnostics) as each file is done.
+
+    Duplicate definitions come first, then the files in completion order.
+    Files are checked on a pool of worker threads; setting the stop event
+    cancels the files not started yet. Returns {"files", "errors", "warnings"}.
+    """
+    stop = stop or threading.Event()
+    totals = {"files": 0, "errors": 0, "warnings": 0}
+
+    def count(diagnostics):
+        for diagnostic in diagnostics:
+            totals["errors" if diagnostic[4] == ERROR else "warnings"] += 1
+        report(diagnostics)
+
+    with span("validation.project"):
+        count(duplicate_diagnostics(project))
+        paths = sorted(
+            project.file_paths[file_id] for file_id in project.files
+            if project.file_paths[file_id].lower().endswith((".ini", ".inc"))
+        )
+
+        def check(path):
+            if stop.is_set():
+                return []
+            with span("validation.file"):
+                return validate_file(project, path)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(check, path) for path in paths]
+            for future in as_completed(futures):
+                if stop.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                totals["files"] += 1
+                count(future.result())
+    return totals
+
+
+def format_diagnostic(diagnostic):
+    path, line, start, _, severity, message = diagnostic
+    return "{path}:{line}:{column}: {severity}: {message}".format(
+        path=path, line=line, column=start + 1, severity=severity, message=message
+    )
@@ -1,53 +1,423 @@
+import argparse
+import ast
+import hashlib
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
 import requests
 import bs4
-import pprint
 
 base_url = "http://rcmod.the3rdage.net/wiki"
+behavior_list_url = base_url + "/group___behavior.html"
+
+DEFAULT_CACHE_DIR = ".scrape_cache"
+DEFAULT_OUTPUT = "BFMEPlugin/bfme_core/behaviors_data.py"
+
+
+class PageCache(object):
+    """Raw HTML pages on disk keyed by URL, with the validators to re-fetch them."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest())
+
+    def get(self, url):
+        """Return (html, metadata) of a cached page, or (None, {})."""
+        path = self._path(url)
+        try:
+            with open(path + ".html", "r", encoding="utf-8") as f:
+                html = f.read()
+            with open(path + ".json", "r", encoding="utf-8") as f:
+                return html, json.load(f)
+        except (OSError, ValueError):
+            return None, {}
+
+    def put(self, url, html, metadata):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(url)
+        for suffix, content in ((".html", html), (".json", json.dumps(dict(metadata, url=url), indent=2))):
+            with open(path + suffix + ".tmp", "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(path + suffix + ".tmp", path + suffix)
+
+
+class RateLimiter(object):
+    """Spaces the start of requests at least 1 / rate seconds apart across threads."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0
+        self.lock = threading.Lock()
+        self.next_start = 0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class Fetcher(object):
+    """Fetch pages through the cache, concurrently, politely and with retries.
+
+    Online, cached pages are re-fetched conditionally (ETag / Last-Modified)
+    and kept when the server answers 304. With offline set nothing is fetched,
+    pages come from the cache, or from html_dir, a folder of saved pages named
+    like the last part of their URL.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, offline=False, html_dir=None, workers=8, rate=5, retries=3, timeout=30):
+        self.cache = PageCache(cache_dir)
+        self.offline = offline or html_dir is not None
+        self.html_dir = html_dir
+        self.workers = workers
+        self.limiter = RateLimiter(rate)
+        self.retries = retries
+        self.timeout = timeout
+        self.local = threading.local()
+        self.stats = {"fetched": 0, "not_modified": 0, "cached": 0}
+        self.stats_lock = threading.Lock()
+
+    def count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def session(self):
+        session = getattr(self.local, "session", None)
+        if session is None:
+            session = self.local.session = requests.Session()
+        return session
 
-def gather_behaviors():
-    html = requests.get(base_url + "/group___behavior.html").text
+    def get(self, url):
+        if self.html_dir is not None:
+            path = os.path.join(self.html_dir, os.path.basename(urlparse(url).path))
+            with open(path, "r", encoding="utf-8") as f:
+                self.count("cached")
+                return f.read()
+
+        html, metadata = self.cache.get(url)
+        if self.offline:
+            if html is None:
+                raise IOError("{url} is not in the cache".format(url=url))
+            self.count("cached")
+            return html
+
+        headers = {}
+        if html is not None:
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
+        for attempt in range(self.retries + 1):
+            self.limiter.wait()
+            try:
+                response = self.session().get(url, headers=headers, timeout=self.timeout)
+                if response.status_code >= 500:
+                    raise IOError("{url} answered {status}".format(url=url, status=response.status_code))
+            except (IOError, requests.RequestException) as e:
+                if attempt == self.retries:
+                    if html is not None:
+                        print("Failed to fetch {url}, using the cached page: {e}".format(url=url, e=e))
+                        self.count("cached")
+                        return html
+                    raise
+                time.sleep(2 ** attempt)
+                continue
+
+            if response.status_code == 304 and html is not None:
+                self.count("not_modified")
+                return html
+            response.raise_for_status()
+            self.cache.put(url, response.text, {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            })
+            self.count("fetched")
+            return response.text
+
+    def map(self, function, items):
+        """Apply function to items on the worker pool, keeping their order."""
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(function, items))
+
+
+def parse_behavior_list(html):
+    """Return the [(behavior name, page URL)] listed on the behavior group page."""
     soup = bs4.BeautifulSoup(html, 'html.parser')
     table = soup.find('table', {'class': 'memberdecls'})
-    rows = table.find_all('tr')[1:] 
-    behaviors = {}
+    rows = table.find_all('tr')[1:]
+    behaviors = []
     for row in rows:
         if len(row.find_all('td')) < 2:
                 continue
 
         behavior_link = row.find('td', class_="memItemRight").a
-        behavior_name = behavior_link.text
-        behavior_url = base_url + "/" + behavior_link['href']
-        behavior_html = requests.get(behavior_url).text
-        behavior_soup = bs4.BeautifulSoup(behavior_html, 'html.parser')
-        behavior_table = behavior_soup.find('table', {'class': 'memberdecls'})
-        params = {}
-
-        if behavior_table:
-            behavior_rows = behavior_table.find_all('tr')[1:]
-            for b_row in behavior_rows:
-                if len(b_row.find_all('td')) < 2:
-                    continue
-
-                cols = b_row.find_all('td')
-                param_type = cols[0].text.strip()
-                param_name = cols[1].text.strip()
-                params[param_name] = param_type
+        behaviors.append((behavior_link.text, base_url + "/" + behavior_link['href']))
+    return behaviors
+
+
+def parse_behavior_page(html):
+    """Return the {parameter: type} table of a behavior page."""
+    behavior_soup = bs4.BeautifulSoup(html, 'html.parser')
+    behavior_table = behavior_soup.find('table', {'class': 'memberdecls'})
+    params = {}
+
+    if behavior_table:
+        behavior_rows = behavior_table.find_all('tr')[1:]
+        for b_row in behavior_rows:
+            if len(b_row.find_all('td')) < 2:
+                continue
+
+            cols = b_row.find_all('td')
+            param_type = cols[0].text.strip()
+            param_name = cols[1].text.strip()
+            params[param_name] = param_type
+
+    return params
+
+
+class ParsedPages(object):
+    """Parameter tables of pages already parsed, keyed by URL and page hash.
 
+    Parsing is the slow part of a regeneration; a page whose HTML did not
+    change since the previous run is not parsed again.
+    """
+
+    def __init__(self, cache_dir):
+        self.path = os.path.join(cache_dir, "parsed.json")
+        self.lock = threading.Lock()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.pages = json.load(f)
+        except (OSError, ValueError):
+            self.pages = {}
+        self.reused = 0
+
+    def parse(self, url, html):
+        digest = hashlib.sha1(html.encode("utf-8")).hexdigest()
+        with self.lock:
+            cached = self.pages.get(url)
+            if cached is not None and cached[0] == digest:
+                self.reused += 1
+                return dict(cached[1])
+        params = parse_behavior_page(html)
+        with self.lock:
+            self.pages[url] = [digest, params]
+        return params
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.pages, f, sort_keys=True)
+        os.replace(self.path + ".tmp", self.path)
+
+
+def gather_behaviors(fetcher=None, parsed=None):
+    """Return the {behavior: {parameter: type}} schema documented on the wiki."""
+    fetcher = fetcher or Fetcher()
+    parse = parsed.parse if parsed is not None else lambda url, html: parse_behavior_page(html)
+    listed = parse_behavior_list(fetcher.get(behavior_list_url))
+    pages = fetcher.map(lambda item: parse(item[1], fetcher.get(item[1])), listed)
+    behaviors = {}
+    for (behavior_name, _), params in zip(listed, pages):
         behaviors[behavior_name] = params
 
     return behaviors
 
+
+def sort_behaviors(behaviors):
+    """Return behaviors with behaviors and parameters in case-insensitive name order."""
+    order = lambda name: (name.lower(), name)
+    return dict(
+        (behavior_name, dict((name, behaviors[behavior_name][name]) for name in sorted(behaviors[behavior_name], key=order)))
+        for behavior_name in sorted(behaviors, key=order)
+    )
+
+
+def read_behaviors_data(path):
+    """Return the behaviors stored in a generated behaviors_data.py, or {} if there is none."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+    except OSError:
+        return {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(target, "id", None) == "BEHAVIORS" for target in node.targets):
+            data = json.loads(ast.literal_eval(node.value))
+            break
+    else:
+        return {}
+
+    types = data["types"]
+    behaviors = {}
+    for behavior_name, flat in data["behaviors"]:
+        behaviors[behavior_name] = dict((flat[i], types[flat[i + 1]]) for i in range(0, len(flat), 2))
+    return behaviors
+
+
+def diff_behaviors(old, new):
+    """Compare two schemas.
+
+    Returns a dict with the "added" and "removed" behavior names and the
+    "changed" behaviors, each mapped to its added and removed parameters and
+    to the parameters whose type changed as [old type, new type].
+    """
+    changed = {}
+    for behavior_name in set(old) & set(new):
+        old_params, new_params = old[behavior_name], new[behavior_name]
+        if old_params == new_params:
+            continue
+        changed[behavior_name] = {
+            "added": dict((name, new_params[name]) for name in new_params if name not in old_params),
+            "removed": dict((name, old_params[name]) for name in old_params if name not in new_params),
+            "retyped": dict(
+                (name, [old_params[name], new_params[name]])
+                for name in new_params
+                if name in old_params and old_params[name] != new_params[name]
+            ),
+        }
+    return {
+        "added": sorted(set(new) - set(old), key=str.lower),
+        "removed": sorted(set(old) - set(new), key=str.lower),
+        "changed": dict((name, changed[name]) for name in sorted(changed, key=str.lower)),
+    }
+
+
+def merge_behaviors(old, new, diff):
+    """Apply diff to old, keeping the entries of unchanged behaviors as they are."""
+    merged = dict((name, params) for name, params in old.items() if name not in diff["removed"])
+    for name in diff["added"]:
+        merged[name] = new[name]
+    for name in diff["changed"]:
+        merged[name] = new[name]
+    return sort_behaviors(merged)
+
+
+def format_change_report(diff):
+    lines = []
+    for name in diff["added"]:
+        lines.append("+ {name}".format(name=name))
+    for name in diff["removed"]:
+        lines.append("- {name}".format(name=name))
+    for name, change in diff["changed"].items():
+        lines.append("~ {name}".format(name=name))
+        for param, param_type in sorted(change["added"].items()):
+            lines.append("    + {param}: {type}".format(param=param, type=param_type))
+        for param, param_type in sorted(change["removed"].items()):
+            lines.append("    - {param}: {type}".format(param=param, type=param_type))
+        for param, (old_type, new_type) in sorted(change["retyped"].items()):
+            lines.append("    ~ {param}: {old} -> {new}".format(param=param, old=old_type, new=new_type))
+    lines.append("{added} added, {removed} removed, {changed} changed".format(
+        added=len(diff["added"]), removed=len(diff["removed"]), changed=len(diff["changed"])
+    ))
+    return "\n".join(lines) + "\n"
+
+
+def pack_behaviors(behaviors):
+    """Pack behaviors into a compact JSON structure.
+
+    Every parameter type name is stored once in "types" and parameters are
+    flattened into [name, type index, name, type index, ...] lists. The types
+    table is sorted, so the same schema always packs to the same output.
+    """
+    types = sorted(set(param_type for params in behaviors.values() for param_type in params.values()))
+    type_ids = dict((param_type, i) for i, param_type in enumerate(types))
+    packed = []
+    for behavior_name, params in behaviors.items():
+        flat = []
+        for param_name, param_type in params.items():
+            flat.extend((param_name, type_ids[param_type]))
+        packed.append([behavior_name, flat])
+    return types, packed
+
+
+def format_behaviors_data(behaviors):
+    """Return the source of behaviors_data.py holding behaviors."""
+    types, packed = pack_behaviors(behaviors)
+    dump = lambda value: json.dumps(value, separators=(",", ":"))
+
+    lines = [
+        '# Generated behaviors data\n',
+        '# This file contains all behaviors and their parameters as a packed JSON\n',
+        '# string, it is decoded on first use by bfme_core.get_behaviors.\n\n',
+        'BEHAVIORS = (\n',
+        '    {!r}\n'.format('{"types":' + dump(types) + ',"behaviors":['),
+    ]
+    for i, item in enumerate(packed):
+        separator = ',' if i < len(packed) - 1 else ''
+        lines.append('    {!r}\n'.format(dump(item) + separator))
+    lines.append("    ']}'\n")
+    lines.append(')\n')
+    return ''.join(lines)
+
+
+def write_behaviors_data(behaviors, path):
+    """Write behaviors to path, return False when the file already held exactly that."""
+    source = format_behaviors_data(behaviors)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == source:
+                return False
+    except OSError:
+        pass
+
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(source)
+    os.replace(path + '.tmp', path)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape the behavior documentation into behaviors_data.py.")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="where raw pages are cached")
+    parser.add_argument("--offline", action="store_true", help="only use cached pages")
+    parser.add_argument("--html-dir", help="read saved pages from this folder instead of the wiki")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=5, help="maximum requests started per second")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--report", metavar="FILE", help="also write the changes as JSON to FILE")
+    parser.add_argument("--dry-run", action="store_true", help="report the changes without writing the output")
+    parser.add_argument("--full", action="store_true", help="reparse every page, even unchanged ones")
+    args = parser.parse_args(argv)
+
+    fetcher = Fetcher(args.cache_dir, args.offline, args.html_dir, args.workers, args.rate, args.retries)
+    parsed = None if args.full else ParsedPages(args.cache_dir)
+    started = time.monotonic()
+    scraped = gather_behaviors(fetcher, parsed)
+    if parsed is not None:
+        parsed.save()
+
+    old = read_behaviors_data(args.output)
+    diff = diff_behaviors(old, scraped)
+    print(format_change_report(diff), end="")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(diff, f, indent=2)
+
+    behaviors = merge_behaviors(old, scraped, diff)
+    if args.dry_run:
+        written = "not written (dry run)"
+    elif write_behaviors_data(behaviors, args.output):
+        written = "saved to"
+    else:
+        written = "unchanged in"
+
+    print("Behaviors data {written} '{path}': {count} behaviors in {seconds:.1f}s "
+          "({fetched} fetched, {not_modified} not modified, {cached} from cache, {reused} pages not reparsed)".format(
+              written=written, path=args.output, count=len(behaviors), seconds=time.monotonic() - started,
+              reused=parsed.reused if parsed is not None else 0, **fetcher.stats))
+
+
 if __name__ == "__main__":
-    behaviors = gather_behaviors()
-   
-    # Save pretty printed behaviors to a Python file
-    with open('BFMEPlugin/behaviors_data.py', 'w', encoding='utf-8') as f:
-        f.write('# Generated behaviors data\n')
-        f.write('# This file contains all behaviors and their parameters\n\n')
-        f.write('behaviors = ')
-        f.write(json.dumps(behaviors, indent=4))
-        f.write('\n')
-    
-    print("Behaviors data saved to 'behaviors_data.py'")
-    
\ No newline at end of file
+    main()
@@ -0,0 +1,224 @@
+"""Time the indexer and the lookups on a synthetic mod.
+
+Generates a mod with synthetic_mod.generate_mod (or reuses --mod-dir), then
+times the index build, the cache round trip, completion queries, behavior
+context lookups and used-symbol scans, and writes the results as JSON:
+
+    python benchmarks/run_benchmarks.py --files 500 --output before.json
+    python benchmarks/run_benchmarks.py --files 500 --compare before.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "BFMEPlugin"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bfme_core  # noqa: E402
+from synthetic_mod import generate_mod  # noqa: E402
+
+RESULTS_VERSION = 1
+COMPLETION_LINES = ["    Weapon = PRIMARY ", "    Armor = ", "  DisplayName = ", "    "]
+
+
+def timed(function, repeat, ops=1):
+    """Run function repeat times and return its timing statistics in seconds."""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    median = statistics.median(times)
+    return {
+        "repeat": repeat,
+        "ops": ops,
+        "min": min(times),
+        "median": median,
+        "mean": statistics.mean(times),
+        "max": max(times),
+        "per_op_us": median / ops * 1e6,
+    }
+
+
+def quiet():
+    """Swallow the indexer's progress output while timing."""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def run(mod_dir, repeat, queries, seed):
+    rng = random.Random(seed)
+    results = {}
+
+    def build():
+        project = bfme_core.ProjectIndex([mod_dir])
+        with quiet():
+            bfme_core.build_project_index(project)
+        return project
+
+    results["index_build"] = timed(build, repeat)
+    project = build()
+    symbols, strings = project.symbols.mod, project.strings.mod
+
+    cache_dir = tempfile.mkdtemp(prefix="bfme-bench-cache-")
+    try:
+        cache_file = os.path.join(cache_dir, "layer.cache")
+        results["cache_save"] = timed(lambda: bfme_core.save_layer(cache_file, symbols, strings), repeat)
+        results["cache_load"] = timed(lambda: bfme_core.load_layer(cache_file), repeat)
+        cache_bytes = os.path.getsize(cache_file)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    names = sorted(symbols)
+    table = bfme_core.get_behavior_table()
+    completion_queries = [
+        (name[:rng.randint(1, 4)], rng.choice(COMPLETION_LINES)) for name in rng.sample(names, min(queries, len(names)))
+    ]
+    behavior_queries = [
+        (behavior, rng.choice("abcdefghilmnoprstuw"))
+        for behavior in (rng.choice(table.sorted_names) for _ in range(queries))
+    ]
+
+    def complete():
+        for prefix, line_text in completion_queries:
+            bfme_core.completion_candidates(project, prefix, line_text)
+        for behavior, prefix in behavior_queries:
+            table.parameters_with_prefix(behavior, prefix)
+
+    results["completion"] = timed(complete, repeat, len(completion_queries) + len(behavior_queries))
+
+    declared_types = sorted(bfme_core.TYPE_KINDS)
+    typed_queries = [(prefix, rng.choice(declared_types)) for prefix, _ in completion_queries]
+
+    def complete_typed():
+        for prefix, declared_type in typed_queries:
+            bfme_core.completion_candidates(project, prefix, "", declared_type)
+
+    results["typed_completion"] = timed(complete_typed, repeat, len(typed_queries))
+
+    ini_files = sorted(path for path in project.file_paths if path.lower().endswith(".ini"))
+    if not ini_files:
+        raise SystemExit("no INI files indexed in {mod_dir}".format(mod_dir=mod_dir))
+    # object definitions are the typical hover targets, mods laid out differently use any INI file
+    object_files = [path for path in ini_files if os.sep + "object" + os.sep in path.lower()] or ini_files
+    sample_files = rng.sample(object_files, min(20, len(object_files)))
+    texts = {}
+    for path in sample_files:
+        with open(path, "r", encoding="latin-1") as f:
+            texts[path] = f.read()
+
+    context_queries = []
+    for _ in range(queries):
+        path = rng.choice(sample_files)
+        lines = texts[path].split("\n")
+        context_queries.append((lines, rng.randrange(len(lines))))
+
+    def contexts():
+        for lines, row in context_queries:
+            bfme_core.find_behavior_context(lines.__getitem__, row)
+
+    results["hover_context"] = timed(contexts, repeat, len(context_queries))
+
+    scan_files = sample_files[:5]
+
+    def used_symbols():
+        for path in scan_files:
+            bfme_core.find_used_symbols(texts[path], path, project.symbols, project.strings)
+
+    results["used_symbols"] = timed(used_symbols, repeat, len(scan_files))
+
+    index = {
+        "files": len(project.file_paths),
+        "symbols": len(symbols),
+        "strings": len(strings),
+        "cache_bytes": cache_bytes,
+    }
+    return index, results
+
+
+def compare(results, baseline):
+    """Print the median change of every benchmark against a previous run."""
+    for name, stats in sorted(results.items()):
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            continue
+        ratio = stats["median"] / before["median"] if before["median"] else float("inf")
+        print(
+            "{name:<16} {before:10.4f}s -> {after:10.4f}s  x{ratio:.2f}".format(
+                name=name, before=before["median"], after=stats["median"], ratio=ratio
+            ),
+            file=sys.stderr,
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the BFME indexer on a synthetic mod.")
+    parser.add_argument("--mod-dir", help="benchmark an existing mod instead of generating one")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--objects-per-file", type=int, default=20)
+    parser.add_argument("--macro-density", type=float, default=0.1)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.01)
+    parser.add_argument("--include-depth", type=int, default=3)
+    parser.add_argument("--csv-rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=500, help="lookups per query benchmark")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--compare", help="previous JSON results to compare against")
+    args = parser.parse_args(argv)
+
+    params = {
+        "seed": args.seed,
+        "files": args.files,
+        "objects_per_file": args.objects_per_file,
+        "macro_density": args.macro_density,
+        "duplicate_ratio": args.duplicate_ratio,
+        "include_depth": args.include_depth,
+        "csv_rows": args.csv_rows,
+    }
+    mod_dir = args.mod_dir
+    generated = None
+    corpus = None
+    try:
+        if mod_dir is None:
+            generated = mod_dir = tempfile.mkdtemp(prefix="bfme-bench-mod-")
+            started = time.perf_counter()
+            corpus = generate_mod(mod_dir, **params)
+            corpus["generate_seconds"] = time.perf_counter() - started
+        index, results = run(mod_dir, args.repeat, args.queries, args.seed)
+    finally:
+        if generated:
+            shutil.rmtree(generated, ignore_errors=True)
+
+    report = {
+        "version": RESULTS_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params if args.mod_dir is None else {"mod_dir": os.path.abspath(args.mod_dir), "seed": args.seed},
+        "corpus": corpus,
+        "index": index,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Deterministic synthetic SAGE INI mods for the benchmarks.
+
+The same seed and parameters always produce byte-identical files, so timings
+taken on different commits index exactly the same corpus.
+
+    python benchmarks/synthetic_mod.py OUTPUT_DIR --files 500 --seed 1
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "BFMEPlugin"))
+
+from bfme_core import get_behaviors  # noqa: E402
+
+FACTIONS = ["gondor", "rohan", "isengard", "mordor", "elves", "dwarves", "goblins", "angmar"]
+# Behaviors are picked among the ones with a handful of parameters, like real mods do.
+MIN_BEHAVIOR_PARAMS = 3
+
+
+def behavior_pool():
+    behaviors = get_behaviors()
+    return sorted(name for name, params in behaviors.items() if len(params) >= MIN_BEHAVIOR_PARAMS)
+
+
+def write_file(path, lines):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="latin-1", newline="\n") as f:
+        f.write("\n".join(lines) + "\n")
+    return os.path.getsize(path)
+
+
+def generate_mod(
+    root,
+    seed=0,
+    files=200,
+    objects_per_file=20,
+    macro_density=0.1,
+    duplicate_ratio=0.01,
+    include_depth=3,
+    csv_rows=5000,
+):
+    """Write a synthetic mod below root and return a summary of its content.
+
+    files is the number of object files, a weapon, armor and FX file is added
+    for every tenth of them. macro_density is the number of macros per object,
+    duplicate_ratio the share of objects defined a second time and
+    include_depth the length of the #include chain every object file pulls in.
+    """
+    rng = random.Random(seed)
+    behaviors = get_behaviors()
+    pool = behavior_pool()
+    ini = os.path.join(root, "data", "ini")
+    summary = {"files": 0, "bytes": 0, "objects": 0, "macros": 0, "duplicates": 0, "strings": 0}
+
+    def add(path, lines):
+        summary["files"] += 1
+        summary["bytes"] += write_file(path, lines)
+
+    support_files = max(1, files // 10)
+    weapons = ["Weapon_{:05d}".format(i) for i in range(support_files * 20)]
+    armors = ["Armor_{:05d}".format(i) for i in range(support_files * 5)]
+    fxlists = ["FX_{:05d}".format(i) for i in range(support_files * 10)]
+    for i in range(support_files):
+        lines = []
+        for name in weapons[i * 20:(i + 1) * 20]:
+            lines += [
+                "Weapon {}".format(name),
+                "  PrimaryDamage = {}".format(rng.randint(10, 500)),
+                "  AttackRange = {}".format(rng.randint(10, 400)),
+                "  FireFX = {}".format(rng.choice(fxlists)),
+                "End",
+                "",
+            ]
+        add(os.path.join(ini, "weapon", "weapon_{:04d}.ini".format(i)), lines)
+
+        lines = []
+        for name in armors[i * 5:(i + 1) * 5]:
+            lines += ["Armor {}".format(name), "  Armor = DEFAULT {}%".format(rng.randint(10, 100)), "End", ""]
+        for name in fxlists[i * 10:(i + 1) * 10]:
+            lines += ["FXList {}".format(name), "  ViewShake", "    Type = SUBTLE", "  End", "End", ""]
+        add(os.path.join(ini, "armor_fx", "armor_fx_{:04d}.ini".format(i)), lines)
+
+    macro_count = int(files * objects_per_file * macro_density)
+    macros = ["MACRO_{:05d}".format(i) for i in range(macro_count)]
+    depth = max(1, include_depth)
+    for level in range(depth):
+        lines = []
+        if level + 1 < depth:
+            lines.append('#include "level_{}.inc"'.format(level + 1))
+        for name in macros[level::depth]:
+            lines.append("#define {} {}".format(name, rng.randint(1, 1000)))
+        add(os.path.join(ini, "includes", "level_{}.inc".format(level)), lines)
+    summary["macros"] = macro_count
+
+    objects = []
+    for i in range(files):
+        faction = FACTIONS[i % len(FACTIONS)]
+        lines = ['#include "../../includes/level_0.inc"', ""]
+        for j in range(objects_per_file):
+            name = "{}_Unit_{:05d}_{:02d}".format(faction.title(), i, j)
+            objects.append(name)
+            lines += [
+                "Object {}".format(name),
+                "  DisplayName = OBJECT:{}".format(name),
+                "  WeaponSet",
+                "    Conditions = None",
+                "    Weapon = PRIMARY {}".format(rng.choice(weapons)),
+                "  End",
+                "  ArmorSet",
+                "    Conditions = None",
+                "    Armor = {}".format(rng.choice(armors)),
+                "  End",
+            ]
+            for k in range(rng.randint(1, 4)):
+                behavior = rng.choice(pool)
+                params = sorted(behaviors[behavior])
+                lines.append("  Behavior = {} ModuleTag_{:02d}".format(behavior, k))
+                for param in rng.sample(params, min(len(params), rng.randint(2, 6))):
+                    value = rng.choice(macros) if macros and rng.random() < 0.3 else str(rng.randint(0, 100))
+                    lines.append("    {} = {}".format(param, value))
+                lines.append("  End")
+            lines += ["End", ""]
+        add(os.path.join(ini, "object", faction, "units_{:04d}.ini".format(i)), lines)
+    summary["objects"] = len(objects)
+
+    duplicates = rng.sample(objects, int(len(objects) * duplicate_ratio))
+    if duplicates:
+        lines = []
+        for name in duplicates:
+            lines += ["Object {}".format(name), "  DisplayName = OBJECT:{}".format(name), "End", ""]
+        add(os.path.join(ini, "object", "duplicates.ini"), lines)
+    summary["duplicates"] = len(duplicates)
+
+    lines = []
+    for i in range(csv_rows):
+        if i < len(objects):
+            lines.append('OBJECT:{};"{}"'.format(objects[i], objects[i].replace("_", " ")))
+        else:
+            lines.append('CONTROLBAR:Tooltip_{:06d};"Tooltip {}"'.format(i, i))
+    add(os.path.join(root, "data", "lotr", "lotr.csv"), lines)
+    summary["strings"] = csv_rows
+
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic BFME mod.")
+    parser.add_argument("output", help="folder to write the mod to")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--objects-per-file", type=int, default=20)
+    parser.add_argument("--macro-density", type=float, default=0.1)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.01)
+    parser.add_argument("--include-depth", type=int, default=3)
+    parser.add_argument("--csv-rows", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    summary = generate_mod(
+        args.output,
+        seed=args.seed,
+        files=args.files,
+        objects_per_file=args.objects_per_file,
+        macro_density=args.macro_density,
+        duplicate_ratio=args.duplicate_ratio,
+        include_depth=args.include_depth,
+        csv_rows=args.csv_rows,
+    )
+    print(
+        "Wrote {files} files ({mb:.1f} MB), {objects} objects, {macros} macros to {path}".format(
+            mb=summary["bytes"] / 1048576.0, path=args.output, **summary
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
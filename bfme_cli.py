@@ -0,0 +1,258 @@
+"""Command line front end of the BFME indexer.
+
+Runs the same indexer as the Sublime Text plugin, so indexes can be built in
+CI, profiled on large mods and queried by scripts without the editor:
+
+    python bfme_cli.py index path/to/mod --base path/to/base --timings
+    python bfme_cli.py query path/to/mod GondorFighter
+    python bfme_cli.py duplicates path/to/mod --json
+    python bfme_cli.py references path/to/mod GondorSword
+    python bfme_cli.py validate path/to/mod --base path/to/base
+
+Every command updates the cached index first, so only the files changed
+since the previous run are indexed again. Point --cache-dir at the plugin's
+cache folder (Sublime's Cache/BFMEPlugin) to pre-build the index it loads.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "BFMEPlugin"))
+
+import bfme_core  # noqa: E402
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "BFMEPlugin")
+
+
+class Timings(object):
+    """Wall clock time of each phase of a command."""
+
+    def __init__(self):
+        self.phases = []
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def report(self, out):
+        for name, seconds in self.phases:
+            print("{name:<20} {ms:10.1f} ms".format(name=name, ms=seconds * 1000), file=out)
+
+
+def open_project(args, timings):
+    """Index args.mod, reusing and updating the cached index."""
+    project = bfme_core.ProjectIndex([os.path.abspath(args.mod)])
+    project.ignore = bfme_core.IndexIgnoreRules(
+        args.exclude_folder if args.exclude_folder is not None else bfme_core.DEFAULT_EXCLUDE_FOLDERS,
+        args.exclude_pattern or [],
+    )
+    cache_dir = None if args.no_cache else args.cache_dir
+    with timings.phase("index"), quiet(args):
+        bfme_core.build_project_index(project, base_path=args.base, cache_dir=cache_dir, rebuild=args.rebuild)
+    return project
+
+
+def quiet(args):
+    """Hide the indexer's log lines unless --verbose is given."""
+    if args.verbose:
+        return contextlib.ExitStack()
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def definition_records(project, name):
+    records = []
+    entry = project.symbols.get(name)
+    if entry is not None:
+        extra = list(entry[3])
+        for i, (path, line) in enumerate(bfme_core.entry_locations(entry)):
+            record = {"name": name, "kind": entry[2], "path": path, "line": line}
+            if i < len(extra):
+                record["value"] = extra[i].strip()
+            records.append(record)
+    entry = project.strings.get(name.lower())
+    if entry is not None:
+        records.append({"name": name.lower(), "kind": "string", "path": entry[0], "line": entry[1]})
+    return records
+
+
+def print_records(records, args):
+    if args.json:
+        print(json.dumps(records, indent=2))
+        return
+    for record in records:
+        text = "{path}:{line}: {kind} {name}".format(**record)
+        if "value" in record:
+            text += " = {value}".format(**record)
+        if "count" in record:
+            text += " ({count})".format(**record)
+        print(text)
+
+
+def command_index(args, project, timings):
+    summary = {
+        "files": len(project.files),
+        "symbols": len(project.symbols),
+        "mod_symbols": len(project.symbols.mod),
+        "strings": len(project.strings),
+    }
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print("Indexed {files} files, {symbols} symbols ({mod_symbols} in the mod), {strings} strings".format(**summary))
+    return 0
+
+
+def command_query(args, project, timings):
+    with timings.phase("query"):
+        if args.prefix:
+            symbols, strings = bfme_core.completion_candidates(project, args.name, "")
+            records = []
+            for name, entry in symbols + strings:
+                for path, line in bfme_core.entry_locations(entry):
+                    records.append({"name": name, "kind": entry[2], "path": path, "line": line})
+            records.sort(key=lambda record: record["name"].lower())
+        else:
+            records = definition_records(project, args.name)
+    print_records(records, args)
+    return 0 if records else 1
+
+
+def command_duplicates(args, project, timings):
+    with timings.phase("duplicates"):
+        records = []
+        for name, entry in sorted(project.symbols.mod.items(), key=lambda item: item[0].lower()):
+            if isinstance(entry[0], list):
+                for path, line in bfme_core.entry_locations(entry):
+                    records.append(
+                        {"name": name, "kind": entry[2], "path": path, "line": line, "count": len(entry[0])}
+                    )
+    print_records(records, args)
+    return 0
+
+
+def command_references(args, project, timings):
+    with timings.phase("references"):
+        references = bfme_core.get_references(project)
+    if args.name:
+        names = [args.name] if args.name in references else [args.name.lower()]
+    else:
+        names = sorted(references, key=str.lower)
+
+    records = []
+    for name in names:
+        kind = "string" if name in project.strings and name not in project.symbols else None
+        if kind is None:
+            entry = project.symbols.get(name)
+            kind = entry[2] if entry is not None else "unknown"
+        for path, line in sorted(references.get(name, ())):
+            records.append({"name": name, "kind": kind, "path": path, "line": line})
+    print_records(records, args)
+    return 0 if records else 1
+
+
+def command_memory(args, project, timings):
+    with timings.phase("memory"):
+        if args.references:
+            bfme_core.get_references(project)
+        rows = bfme_core.memory_report(project)
+    if args.json:
+        print(json.dumps([{"structure": name, "entries": count, "bytes": size} for name, count, size in rows], indent=2))
+    else:
+        print(bfme_core.format_memory_report(rows), end="")
+    return 0
+
+
+def command_validate(args, project, timings):
+    records = []
+
+    def report(diagnostics):
+        for diagnostic in diagnostics:
+            if args.json:
+                path, line, start, end, severity, message = diagnostic
+                records.append({
+                    "path": path, "line": line, "column": start + 1, "end_column": end + 1,
+                    "severity": severity, "message": message,
+                })
+            else:
+                print(bfme_core.format_diagnostic(diagnostic), flush=True)
+
+    with timings.phase("validate"):
+        totals = bfme_core.validate_project(project, report, workers=args.workers)
+    if args.json:
+        print(json.dumps(records, indent=2))
+    else:
+        print("{errors} errors, {warnings} warnings in {files} files".format(**totals), file=sys.stderr)
+    return 1 if totals["errors"] else 0
+
+
+def main(argv=None):
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("mod", help="mod folder to index")
+    common.add_argument("--base", help="unmodified base game files, indexed into a shared layer")
+    common.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="where cached indexes are kept")
+    common.add_argument("--no-cache", action="store_true", help="index from scratch and write no cache")
+    common.add_argument("--rebuild", action="store_true", help="drop the cached indexes first")
+    common.add_argument("--exclude-folder", action="append", help="folder name to skip, replaces the defaults")
+    common.add_argument("--exclude-pattern", action="append", help="glob pattern of files or folders to skip")
+    common.add_argument("--json", action="store_true", help="print JSON instead of text")
+    common.add_argument("--timings", action="store_true", help="print the time of each phase to stderr")
+    common.add_argument("--verbose", action="store_true", help="show the indexer log")
+    common.add_argument("--profile", metavar="FILE", help="run under cProfile and tracemalloc, write a report to FILE")
+
+    parser = argparse.ArgumentParser(description="Index and query BFME mods.")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+    commands.add_parser("index", parents=[common], help="build or update the cached index")
+    query = commands.add_parser("query", parents=[common], help="print the definitions of a name")
+    query.add_argument("name")
+    query.add_argument("--prefix", action="store_true", help="list every name starting with name")
+    commands.add_parser("duplicates", parents=[common], help="list names defined more than once in the mod")
+    references = commands.add_parser("references", parents=[common], help="dump the uses of a name, or of all names")
+    references.add_argument("name", nargs="?")
+    memory = commands.add_parser("memory", parents=[common], help="break down the memory held by the index")
+    memory.add_argument("--references", action="store_true", help="build the references index first")
+    validate = commands.add_parser("validate", parents=[common], help="check every reference, parameter and include")
+    validate.add_argument("--workers", type=int, default=bfme_core.VALIDATION_WORKERS, help="files checked at once")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.mod):
+        parser.error("not a folder: {mod}".format(mod=args.mod))
+
+    timings = Timings()
+    bfme_core.perf.set_enabled(args.timings)
+    handler = {
+        "index": command_index,
+        "query": command_query,
+        "duplicates": command_duplicates,
+        "references": command_references,
+        "memory": command_memory,
+        "validate": command_validate,
+    }[args.command]
+    run = lambda: handler(args, open_project(args, timings), timings)
+    if args.profile:
+        title = "bfme_cli {command} {mod}".format(command=args.command, mod=args.mod)
+        status = bfme_core.profiling.profile(run, title, args.profile)
+    else:
+        status = run()
+    if args.timings:
+        timings.report(sys.stderr)
+        print(file=sys.stderr)
+        print(bfme_core.perf.format_stats(), file=sys.stderr, end="")
+    return status
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # the output was piped into something like head which exited early
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
@@ -0,0 +1,483 @@
+"""Language server for BFME INI files over stdio.
+
+Serves definition, references, hover, completion, document symbols and
+workspace symbols from the same index as the Sublime Text plugin. The index
+is loaded from the project cache, updated in the background as files change
+and shared by every workspace folder the client opens:
+
+    python bfme_lsp.py
+
+initializationOptions accepts the plugin settings: base_game_path,
+index_exclude_folders, index_exclude_patterns, watch_interval and cache_dir.
+"""
+import json
+import os
+import re
+import sys
+import threading
+import time
+from urllib.parse import quote, unquote, urlparse
+from urllib.request import url2pathname
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "BFMEPlugin"))
+
+import bfme_core  # noqa: E402
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "BFMEPlugin")
+COMPLETION_LIMIT = 100
+WORKSPACE_SYMBOL_LIMIT = 200
+word_pattern = re.compile(r"[\w:+\-]+")
+
+# LSP enumerations
+TEXT_DOCUMENT_SYNC_FULL = 1
+COMPLETION_KIND_VARIABLE = 6
+COMPLETION_KIND_CLASS = 7
+COMPLETION_KIND_PROPERTY = 10
+COMPLETION_KIND_CONSTANT = 21
+COMPLETION_KIND_TEXT = 1
+COMPLETION_KIND_REFERENCE = 18
+COMPLETION_KIND_ENUM_MEMBER = 20
+SCHEMA_COMPLETION_KINDS = {
+    "module": COMPLETION_KIND_CLASS,
+    "tag": COMPLETION_KIND_REFERENCE,
+    "field": COMPLETION_KIND_PROPERTY,
+    "value": COMPLETION_KIND_ENUM_MEMBER,
+}
+SYMBOL_KIND_CLASS = 5
+SYMBOL_KIND_CONSTANT = 14
+SYMBOL_KIND_STRING = 15
+SYMBOL_KIND_OBJECT = 19
+MESSAGE_TYPE_LOG = 4
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+
+def uri_to_path(uri):
+    return url2pathname(unquote(urlparse(uri).path))
+
+
+def path_to_uri(path):
+    path = os.path.abspath(path).replace("\\", "/")
+    if not path.startswith("/"):
+        path = "/" + path
+    return "file://" + quote(path)
+
+
+def location(path, line):
+    position = {"line": max(line - 1, 0), "character": 0}
+    return {"uri": path_to_uri(path), "range": {"start": position, "end": position}}
+
+
+def completion_kind(kind):
+    if kind in ("object", "childobject"):
+        return COMPLETION_KIND_CLASS
+    if kind == "macro":
+        return COMPLETION_KIND_CONSTANT
+    if kind == "string":
+        return COMPLETION_KIND_TEXT
+    return COMPLETION_KIND_VARIABLE
+
+
+def symbol_kind(kind):
+    if kind in ("object", "childobject"):
+        return SYMBOL_KIND_CLASS
+    if kind == "macro":
+        return SYMBOL_KIND_CONSTANT
+    if kind == "string":
+        return SYMBOL_KIND_STRING
+    return SYMBOL_KIND_OBJECT
+
+
+class LanguageServer(object):
+    """JSON-RPC loop and the LSP request handlers."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.write_lock = threading.Lock()
+        self.registry = bfme_core.ProjectRegistry()
+        self.project = None
+        self.options = {}
+        # uri -> text of the documents open in the client
+        self.documents = {}
+        self.stop = threading.Event()
+        self.shutdown_requested = False
+        self.handlers = {
+            "initialize": self.initialize,
+            "initialized": self.initialized,
+            "shutdown": self.shutdown,
+            "exit": self.exit,
+            "textDocument/didOpen": self.did_open,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didClose": self.did_close,
+            "textDocument/didSave": self.did_save,
+            "workspace/didChangeWatchedFiles": self.did_change_watched_files,
+            "workspace/didChangeWorkspaceFolders": self.did_change_workspace_folders,
+            "textDocument/definition": self.definition,
+            "textDocument/references": self.references,
+            "textDocument/hover": self.hover,
+            "textDocument/completion": self.completion,
+            "textDocument/documentSymbol": self.document_symbol,
+            "workspace/symbol": self.workspace_symbol,
+        }
+
+    # JSON-RPC
+
+    def read_message(self):
+        length = None
+        while True:
+            line = self.reader.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode("ascii").partition(":")
+            if name.lower() == "content-length":
+                length = int(value.strip())
+        if length is None:
+            return None
+        return json.loads(self.reader.read(length).decode("utf-8"))
+
+    def send(self, message):
+        message["jsonrpc"] = "2.0"
+        body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+        with self.write_lock:
+            self.writer.write("Content-Length: {length}\r\n\r\n".format(length=len(body)).encode("ascii"))
+            self.writer.write(body)
+            self.writer.flush()
+
+    def notify(self, method, params):
+        self.send({"method": method, "params": params})
+
+    def log(self, message):
+        self.notify("window/logMessage", {"type": MESSAGE_TYPE_LOG, "message": message})
+
+    def run(self):
+        while not self.stop.is_set():
+            message = self.read_message()
+            if message is None:
+                break
+            self.dispatch(message)
+        self.stop.set()
+        return 0 if self.shutdown_requested else 1
+
+    def dispatch(self, message):
+        method = message.get("method")
+        request_id = message.get("id")
+        handler = self.handlers.get(method)
+        if handler is None:
+            if request_id is not None and method is not None:
+                self.send({"id": request_id, "error": {"code": METHOD_NOT_FOUND, "message": method}})
+            return
+        try:
+            result = handler(message.get("params") or {})
+        except Exception as e:
+            print("[BFME Plugin] {method} failed: {e}".format(method=method, e=e))
+            if request_id is not None:
+                self.send({"id": request_id, "error": {"code": INTERNAL_ERROR, "message": str(e)}})
+            return
+        if request_id is not None:
+            self.send({"id": request_id, "result": result})
+
+    # Lifecycle
+
+    def initialize(self, params):
+        self.options = params.get("initializationOptions") or {}
+        folders = [uri_to_path(f["uri"]) for f in params.get("workspaceFolders") or []]
+        if not folders and params.get("rootUri"):
+            folders = [uri_to_path(params["rootUri"])]
+        self.open_project(folders)
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": TEXT_DOCUMENT_SYNC_FULL, "save": True},
+                "definitionProvider": True,
+                "referencesProvider": True,
+                "hoverProvider": True,
+                "completionProvider": {"triggerCharacters": ["=", " "]},
+                "documentSymbolProvider": True,
+                "workspaceSymbolProvider": True,
+                "workspace": {"workspaceFolders": {"supported": True, "changeNotifications": True}},
+            },
+            "serverInfo": {"name": "bfme-lsp"},
+        }
+
+    def initialized(self, params):
+        threading.Thread(target=self.watch, daemon=True).start()
+
+    def shutdown(self, params):
+        self.shutdown_requested = True
+        return None
+
+    def exit(self, params):
+        self.stop.set()
+
+    # Index
+
+    def open_project(self, folders):
+        project = self.registry.acquire("client", folders)
+        project.ignore = bfme_core.IndexIgnoreRules(
+            self.options.get("index_exclude_folders", bfme_core.DEFAULT_EXCLUDE_FOLDERS),
+            self.options.get("index_exclude_patterns", []),
+        )
+        self.project = project
+        if folders:
+            threading.Thread(target=self.index, args=(project,), daemon=True).start()
+
+    def index(self, project):
+        with self.registry.lock:
+            if project.indexing:
+                return
+            project.indexing = True
+        started = time.monotonic()
+        try:
+            files = bfme_core.build_project_index(
+                project,
+                base_path=self.options.get("base_game_path"),
+                cache_dir=self.options.get("cache_dir", DEFAULT_CACHE_DIR),
+                report=self.log,
+            )
+        finally:
+            project.indexing = False
+        self.log(
+            "BFME: Indexing complete, {files} files in {seconds:.1f}s".format(
+                files=files, seconds=time.monotonic() - started
+            )
+        )
+
+    def refresh(self):
+        project = self.project
+        if project is not None and project.indexed and not project.indexing:
+            try:
+                bfme_core.reindex_changed_files(project)
+            except Exception as e:
+                print("[BFME Plugin] Failed to refresh index: {e}".format(e=e))
+
+    def watch(self):
+        """Poll the project for files changed outside of the client."""
+        interval = self.options.get("watch_interval", 2)
+        while not self.stop.wait(interval if interval and interval > 0 else 5):
+            if interval and interval > 0:
+                self.refresh()
+
+    # Documents
+
+    def did_open(self, params):
+        document = params["textDocument"]
+        self.documents[document["uri"]] = document["text"]
+
+    def did_change(self, params):
+        changes = params.get("contentChanges") or []
+        if changes:
+            self.documents[params["textDocument"]["uri"]] = changes[-1]["text"]
+
+    def did_close(self, params):
+        self.documents.pop(params["textDocument"]["uri"], None)
+
+    def did_save(self, params):
+        self.refresh()
+
+    def did_change_watched_files(self, params):
+        self.refresh()
+
+    def did_change_workspace_folders(self, params):
+        folders = list(self.project.folders) if self.project else []
+        event = params.get("event") or {}
+        removed = set(uri_to_path(f["uri"]) for f in event.get("removed") or [])
+        folders = [f for f in folders if f not in removed]
+        folders += [uri_to_path(f["uri"]) for f in event.get("added") or []]
+        self.open_project(folders)
+
+    def lines(self, uri):
+        text = self.documents.get(uri)
+        if text is None:
+            try:
+                with open(uri_to_path(uri), "r", encoding="latin-1", errors="ignore") as f:
+                    text = f.read()
+            except OSError:
+                text = ""
+        return text.split("\n")
+
+    def word_at(self, line_text, character):
+        for match in word_pattern.finditer(line_text):
+            if match.start() <= character <= match.end():
+                return match.group(0)
+        return ""
+
+    def position(self, params):
+        """Return (path, lines, row, line text, word) of a text document position."""
+        uri = params["textDocument"]["uri"]
+        row = params["position"]["line"]
+        lines = self.lines(uri)
+        line_text = lines[row] if row < len(lines) else ""
+        return uri_to_path(uri), lines, row, line_text, self.word_at(line_text, params["position"]["character"])
+
+    def behavior_context(self, lines, row):
+        get_line = lambda r: lines[r] if r < len(lines) else ""
+        return bfme_core.get_behavior_table().behavior(bfme_core.find_behavior_context(get_line, row))
+
+    # Features
+
+    def definition(self, params):
+        path, lines, row, line_text, word = self.position(params)
+        include_match = bfme_core.include_pattern.search(line_text)
+        if include_match:
+            include_path = bfme_core.resolve_include(path, include_match.group(1))
+            return [location(include_path, 1)] if os.path.exists(include_path) else []
+
+        project = self.project
+        if not word or project is None:
+            return []
+        entry = project.symbols.get(word)
+        if entry is None:
+            entry = project.strings.get(word.lower())
+        if entry is None:
+            return []
+        return [location(p, line) for p, line in bfme_core.entry_locations(entry)]
+
+    def references(self, params):
+        _, _, _, _, word = self.position(params)
+        project = self.project
+        if not word or project is None:
+            return []
+        references = bfme_core.get_references(project)
+        uses = references.get(word)
+        if uses is None:
+            uses = references.get(word.lower(), [])
+        if not (params.get("context") or {}).get("includeDeclaration", True):
+            entry = project.symbols.get(word) or project.strings.get(word.lower())
+            declarations = set(bfme_core.entry_locations(entry)) if entry else set()
+            uses = [use for use in uses if use not in declarations]
+        return [location(p, line) for p, line in sorted(uses)]
+
+    def hover(self, params):
+        path, lines, row, line_text, word = self.position(params)
+        include_match = bfme_core.include_pattern.search(line_text)
+        if include_match:
+            include_path = bfme_core.resolve_include(path, include_match.group(1))
+            found = "Found" if os.path.exists(include_path) else "File not found"
+            return markdown("**Include:** {path}\n\n_{found}:_ {full_path}".format(
+                path=include_match.group(1), found=found, full_path=include_path
+            ))
+
+        table = bfme_core.get_behavior_table()
+        behavior_match = bfme_core.behavior_pattern.match(line_text)
+        if behavior_match:
+            behavior_name = table.behavior(behavior_match.group(1))
+            if behavior_name is not None:
+                params_list = sorted(table.behaviors[behavior_name].items())
+                text = "**{name}**\n\n".format(name=behavior_name)
+                text += "\n".join("- {param}: {type}".format(param=p, type=t) for p, t in params_list)
+                return markdown(text)
+
+        current_behavior = self.behavior_context(lines, row)
+        if current_behavior is not None and word:
+            param = table.parameter(current_behavior, word)
+            if param is not None:
+                return markdown("**{param}**\n\n_{behavior} parameter_\n\nType: {type}".format(
+                    param=param[0], behavior=current_behavior, type=param[1]
+                ))
+
+        project = self.project
+        if not word or project is None:
+            return None
+        entry = project.symbols.get(word)
+        if entry is not None:
+            text = "**{word}** ({kind})".format(word=word, kind=entry[2])
+            for i, (p, line) in enumerate(bfme_core.entry_locations(entry)):
+                text += "\n\n- {path}:{line}".format(path=p, line=line)
+                if entry[2] == "macro" and i < len(entry[3]):
+                    text += " = {value}".format(value=entry[3][i].strip())
+            return markdown(text)
+        entry = project.strings.get(word.lower())
+        if entry is not None:
+            return markdown("**{word}** (string)\n\n- {path}:{line}".format(word=word, path=entry[0], line=entry[1]))
+        return None
+
+    def completion(self, params):
+        _, lines, row, line_text, _ = self.position(params)
+        character = params["position"]["character"]
+        before = line_text[:character]
+        prefix = ""
+        for match in word_pattern.finditer(before):
+            if match.end() == len(before):
+                prefix = match.group(0)
+
+        items = []
+        get_line = lambda r: lines[r] if r < len(lines) else ""
+        for label, insert, category, detail in bfme_core.schema_completions(get_line, row, before, prefix):
+            item = {"label": label, "kind": SCHEMA_COMPLETION_KINDS[category], "detail": detail}
+            if insert != label:
+                item["insertText"] = insert
+            items.append(item)
+
+        project = self.project
+        if project is not None:
+            declared_type = bfme_core.value_type(get_line, row, before)
+            symbols, strings = bfme_core.completion_candidates(project, prefix, line_text, declared_type)
+            for name, entry in symbols + strings:
+                path = entry[0][0] if isinstance(entry[0], list) else entry[0]
+                items.append({
+                    "label": name,
+                    "kind": completion_kind(entry[2]),
+                    "detail": "{kind} - {file}".format(kind=entry[2].title(), file=os.path.basename(path)),
+                })
+
+        folded = prefix.lower()
+        items.sort(key=lambda item: (item["label"].lower() != folded, item["label"].lower()))
+        return {"isIncomplete": len(items) > COMPLETION_LIMIT, "items": items[:COMPLETION_LIMIT]}
+
+    def document_symbol(self, params):
+        uri = params["textDocument"]["uri"]
+        path = uri_to_path(uri)
+        project = self.project
+        records = project.file_symbols(path) if project is not None else []
+        if uri in self.documents or not records:
+            records = []
+            for i, line in enumerate(self.lines(uri)):
+                m = bfme_core.bfme_pattern.match(line)
+                if m:
+                    records.append((m.group(2), i + 1, m.group(1).lower()))
+                mm = bfme_core.macro_pattern.match(line)
+                if mm:
+                    records.append((mm.group(1), i + 1, "macro"))
+        return [
+            {"name": name, "kind": symbol_kind(kind), "containerName": kind, "location": location(path, line)}
+            for name, line, kind in records
+        ]
+
+    def workspace_symbol(self, params):
+        project = self.project
+        if project is None:
+            return []
+        query = (params.get("query") or "").lower()
+        results = []
+        for entries in (project.symbols, project.strings):
+            for name, entry in entries.items():
+                if query in name.lower():
+                    for p, line in bfme_core.entry_locations(entry):
+                        results.append({
+                            "name": name,
+                            "kind": symbol_kind(entry[2]),
+                            "containerName": entry[2],
+                            "location": location(p, line),
+                        })
+                        if len(results) >= WORKSPACE_SYMBOL_LIMIT:
+                            return results
+        return results
+
+
+def markdown(text):
+    return {"contents": {"kind": "markdown", "value": text}}
+
+
+def main():
+    reader = sys.stdin.buffer
+    writer = sys.stdout.buffer
+    # the core logs with print, keep stdout for the protocol
+    sys.stdout = sys.stderr
+    return LanguageServer(reader, writer).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())